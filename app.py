@@ -1,37 +1,170 @@
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for, flash, g
+from flask import (Flask, Blueprint, render_template, request, jsonify, session, redirect, url_for, flash, g,
+                   send_file, abort, has_app_context, has_request_context, current_app, stream_with_context)
 from flask_sqlalchemy import SQLAlchemy
+from flask_sock import Sock
+from sqlalchemy import MetaData, Table, event, text, table, column, literal_column
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as OrmSession, with_loader_criteria
+from sqlalchemy.schema import AddConstraint
 from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime, timedelta
+from jinja2 import nodes
+from jinja2.ext import Extension
+from collections import OrderedDict, deque
+import hashlib
+from datetime import datetime, date, timedelta
+import csv
+import io
+import math
 import json
 import random
+import re
 import logging
-import traceback
-from logging.handlers import RotatingFileHandler
-
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
-handler = RotatingFileHandler('app.log', maxBytes=10000, backupCount=3)
-handler.setLevel(logging.DEBUG)
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import sys
+import atexit
+import itertools
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
 import functools
-import requests
-from oauthlib.oauth2 import WebApplicationClient
+import importlib.util
+import queue
+import heapq
+import bisect
+import shutil
+import zipfile
+import zlib
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+import threading
+from array import array
 from werkzeug.utils import secure_filename
-# Optional OpenCV import for face detection
-OPENCV_AVAILABLE = False
-try:
-    import cv2
-    import numpy as np
-    OPENCV_AVAILABLE = True
-except ImportError:
-    pass
+from xml.sax.saxutils import escape as xml_escape
 
 import base64
+import click
+import time
+
+# Heavy optional dependencies (OpenCV/NumPy, requests, oauthlib) are imported on
+# first use so workers that never touch those features start quickly.
+def opencv_installed():
+    return importlib.util.find_spec('cv2') is not None
+
+@functools.lru_cache(maxsize=None)
+def load_opencv():
+    """Import OpenCV for face detection; returns (cv2, numpy) or None when not installed"""
+    try:
+        import cv2
+        import numpy as np
+    except ImportError:
+        return None
+    return cv2, np
+
+# Logging
+# Request threads only put records on a bounded queue; a listener thread
+# formats and writes them, so a slow disk or pipe never stalls a response.
+LOG_RECORD_FIELDS = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any ``extra`` fields"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.utcfromtimestamp(record.created).isoformat(timespec='milliseconds') + 'Z',
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        entry.update((key, value) for key, value in vars(record).items() if key not in LOG_RECORD_FIELDS)
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class RequestContextFilter(logging.Filter):
+    """Tag records with the request they were logged from (runs in the request thread)"""
+
+    def filter(self, record):
+        if has_request_context():
+            record.method = request.method
+            record.path = request.path
+            record.endpoint = request.endpoint
+            record.user_id = session.get('user_id')
+        return True
+
+class SamplingFilter(logging.Filter):
+    """Pass one in ``rate`` records below WARNING; warnings and errors always pass"""
+
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = max(1, rate)
+        self._counter = itertools.count()
+
+    def filter(self, record):
+        return record.levelno >= logging.WARNING or next(self._counter) % self.rate == 0
+
+class BackgroundQueueHandler(QueueHandler):
+    """Enqueue records without formatting them; drop instead of blocking when the queue is full"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Same-process queue: the listener thread formats, so %-args stay lazy here
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+_log_listener = None
+face_logger = logging.getLogger('app.face')
+
+def parse_log_levels(spec):
+    """'app=INFO,sqlalchemy.engine=WARNING' -> {'app': 'INFO', 'sqlalchemy.engine': 'WARNING'}"""
+    levels = {}
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        name, _, level = item.rpartition('=')
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+def configure_logging(app):
+    """Route all logging through a queue and a listener thread (once per process)"""
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    formatter = JsonFormatter() if app.config['LOG_FORMAT'] == 'json' else logging.Formatter(
+        '%(asctime)s %(levelname)s %(name)s: %(message)s')
+    handlers = [logging.StreamHandler(sys.stderr)]
+    if app.config['LOG_FILE']:
+        handlers.append(RotatingFileHandler(app.config['LOG_FILE'], maxBytes=10 * 1024 * 1024, backupCount=5))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    queue_handler = BackgroundQueueHandler(queue.Queue(app.config['LOG_QUEUE_SIZE']))
+    queue_handler.addFilter(RequestContextFilter())
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+
+    # An empty name sets the root level
+    for name, level in parse_log_levels(app.config['LOG_LEVELS']).items():
+        logging.getLogger(name or None).setLevel(level)
+    face_logger.addFilter(SamplingFilter(app.config['FACE_LOG_SAMPLE_RATE']))
+
+    _log_listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    def restart_after_fork():
+        # The listener thread does not survive fork, and the old queue's lock may be held
+        queue_handler.queue = _log_listener.queue = queue.Queue(app.config['LOG_QUEUE_SIZE'])
+        _log_listener._thread = None
+        _log_listener.start()
+    os.register_at_fork(after_in_child=restart_after_fork)
 
 # Google OAuth Configuration
 GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_OAUTH_CLIENT_ID")
@@ -42,21 +175,29 @@ GOOGLE_DISCOVERY_URL = "https://accounts.google.com/.well-known/openid-configura
 os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1'
 
 def get_google_provider_cfg():
+    import requests
     return requests.get(GOOGLE_DISCOVERY_URL).json()
 
-client = WebApplicationClient(GOOGLE_CLIENT_ID)
+@functools.lru_cache(maxsize=None)
+def get_oauth_client():
+    from oauthlib.oauth2 import WebApplicationClient
+    return WebApplicationClient(GOOGLE_CLIENT_ID)
 
-app = Flask(__name__)
-app.config['SECRET_KEY'] = 'your-secret-key-here'
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///college_erp.db'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['UPLOAD_FOLDER'] = 'static/uploads'
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+# Blueprints, one per subsystem; URLs are unchanged, endpoints are prefixed
+main_bp = Blueprint('main', __name__, cli_group=None)
+admin_bp = Blueprint('admin', __name__)
+student_bp = Blueprint('student', __name__)
+tests_bp = Blueprint('tests', __name__)
+wallet_bp = Blueprint('wallet', __name__)
+hostel_bp = Blueprint('hostel', __name__)
+face_bp = Blueprint('face', __name__)
 
-# Create upload directory if it doesn't exist
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+# Multi-tenancy: rows of tenant-scoped models belong to one Organization
+def current_tenant_id():
+    """Organization the current request is scoped to (None means unscoped)"""
+    return g.get('tenant_id') if has_app_context() else None
 
-db = SQLAlchemy(app)
+db = SQLAlchemy()
 
 # Database Models
 class User(db.Model):
@@ -88,12 +229,17 @@ class Application(db.Model):
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
     reviewed_at = db.Column(db.DateTime)
     reviewed_by = db.Column(db.Integer, db.ForeignKey('user.id'))
+    organization_id = db.Column(db.Integer, db.ForeignKey('organization.id'))
     
     # Relationships
     documents = db.relationship('Document', backref='application', lazy=True)
     user = db.relationship('User', foreign_keys=[user_id], backref='applications')
     reviewer = db.relationship('User', foreign_keys=[reviewed_by], backref='reviewed_applications')
 
+    __table_args__ = (
+        db.Index('idx_application_org_status', 'organization_id', 'status'),
+    )
+
 class Student(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     student_id = db.Column(db.String(20), unique=True, nullable=False)
@@ -107,6 +253,12 @@ class Student(db.Model):
     gpa = db.Column(db.Float, default=0.0)
     attendance_percentage = db.Column(db.Float, default=100.0)
     risk_score = db.Column(db.Float, default=0.0)
+    organization_id = db.Column(db.Integer, db.ForeignKey('organization.id'))
+
+    __table_args__ = (
+        db.Index('idx_student_org_email', 'organization_id', 'email'),
+        db.Index('idx_student_org_status', 'organization_id', 'status'),
+    )
 
 class Fee(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -116,15 +268,50 @@ class Fee(db.Model):
     payment_date = db.Column(db.DateTime, default=datetime.utcnow)
     status = db.Column(db.String(20), default='paid')
     receipt_number = db.Column(db.String(50), unique=True, nullable=False)
+    organization_id = db.Column(db.Integer, db.ForeignKey('organization.id'))
+
+    __table_args__ = (
+        db.Index('idx_fee_org_student', 'organization_id', 'student_id'),
+        db.Index('idx_fee_org_payment_date', 'organization_id', 'payment_date'),
+    )
+
+class IdSequence(db.Model):
+    name = db.Column(db.String(50), primary_key=True)
+    next_value = db.Column(db.Integer, nullable=False, default=1)
+
+class DataVersion(db.Model):
+    """Write counter per table; cached template fragments are keyed on it"""
+    table_name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+class RevenueRollup(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    granularity = db.Column(db.String(10), nullable=False)  # day, month
+    bucket_date = db.Column(db.Date, nullable=False)  # first day of the bucket
+    fee_type = db.Column(db.String(50), nullable=False)
+    course = db.Column(db.String(100), nullable=False)
+    total_amount = db.Column(db.Float, default=0.0)
+    payment_count = db.Column(db.Integer, default=0)
+    organization_id = db.Column(db.Integer, db.ForeignKey('organization.id'))
+
+    __table_args__ = (
+        db.UniqueConstraint('organization_id', 'granularity', 'bucket_date', 'fee_type', 'course',
+                            name='uq_revenue_bucket'),
+    )
 
 class Hostel(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    room_number = db.Column(db.String(10), unique=True, nullable=False)
+    room_number = db.Column(db.String(10), nullable=False)
     floor = db.Column(db.Integer, nullable=False)
     capacity = db.Column(db.Integer, default=2)
     occupied = db.Column(db.Integer, default=0)
     student_ids = db.Column(db.Text)  # JSON string of student IDs
     status = db.Column(db.String(20), default='available')  # available, occupied, maintenance
+    organization_id = db.Column(db.Integer, db.ForeignKey('organization.id'))
+
+    __table_args__ = (
+        db.UniqueConstraint('organization_id', 'room_number', name='uq_hostel_org_room'),
+    )
 
 class Exam(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -134,6 +321,24 @@ class Exam(db.Model):
     marks = db.Column(db.Integer)
     grade = db.Column(db.String(2))
     semester = db.Column(db.Integer, nullable=False)
+    organization_id = db.Column(db.Integer, db.ForeignKey('organization.id'))
+
+    __table_args__ = (
+        db.Index('idx_exam_org_student', 'organization_id', 'student_id'),
+        db.Index('idx_exam_org_date', 'organization_id', 'exam_date'),
+    )
+
+class ExamSeat(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    exam_id = db.Column(db.Integer, db.ForeignKey('exam.id'), nullable=False, unique=True)
+    room = db.Column(db.String(20), nullable=False)
+    seat_row = db.Column(db.Integer, nullable=False)  # 0 is the front row
+    seat_column = db.Column(db.Integer, nullable=False)
+    organization_id = db.Column(db.Integer, db.ForeignKey('organization.id'))
+
+    __table_args__ = (
+        db.Index('idx_exam_seat_room', 'organization_id', 'room', 'seat_row', 'seat_column'),
+    )
 
 class Attendance(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -141,6 +346,12 @@ class Attendance(db.Model):
     date = db.Column(db.Date, nullable=False)
     status = db.Column(db.String(10), nullable=False)  # present, absent
     subject = db.Column(db.String(100), nullable=False)
+    organization_id = db.Column(db.Integer, db.ForeignKey('organization.id'))
+
+    __table_args__ = (
+        db.Index('idx_attendance_org_student_date', 'organization_id', 'student_id', 'date'),
+        db.Index('idx_attendance_org_date', 'organization_id', 'date'),
+    )
 
 class Timetable(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -150,6 +361,12 @@ class Timetable(db.Model):
     teacher = db.Column(db.String(100), nullable=False)
     room = db.Column(db.String(20), nullable=False)
     year = db.Column(db.Integer, nullable=False)
+    section = db.Column(db.String(10), default='A')
+    organization_id = db.Column(db.Integer, db.ForeignKey('organization.id'))
+
+    __table_args__ = (
+        db.Index('idx_timetable_org_year', 'organization_id', 'year'),
+    )
 
 class Organization(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -160,6 +377,11 @@ class Organization(db.Model):
     location = db.Column(db.String(200))
     created_at = db.Column(db.DateTime, default=datetime.now)
     is_active = db.Column(db.Boolean, default=True)
+    seat_capacity = db.Column(db.Integer, default=0)  # 0 means not published
+    # Cached counters, refreshed on admission events
+    student_count = db.Column(db.Integer, default=0)
+    course_count = db.Column(db.Integer, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 class StudentWallet(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -187,6 +409,13 @@ class LibraryBook(db.Model):
     description = db.Column(db.Text)
     image_url = db.Column(db.String(500))
 
+    # Browsing without a search query pages in title order; stock makes the
+    # per-category facet counts an index-only scan
+    __table_args__ = (
+        db.Index('idx_library_book_title', 'title'),
+        db.Index('idx_library_book_category_title_stock', 'category', 'title', 'stock'),
+    )
+
 class LibraryPurchase(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     student_id = db.Column(db.String(20), nullable=False)
@@ -266,16 +495,163 @@ class FaceDetection(db.Model):
     detected_at = db.Column(db.DateTime, default=datetime.utcnow)
     confidence = db.Column(db.Float, default=0.0)
     image_path = db.Column(db.String(500))
+    # Set by server-side detection; the client's own claim is kept for comparison
+    verified = db.Column(db.Boolean, default=False)
+    face_count = db.Column(db.Integer, default=0)
+    client_confidence = db.Column(db.Float)
+    # Frames streamed during a test belong to that attempt
+    attempt_id = db.Column(db.Integer, db.ForeignKey('test_attempt.id'))
+
+    __table_args__ = (
+        db.Index('idx_face_detection_attempt', 'attempt_id', 'detected_at'),
+    )
+
+class ProctoringSummary(db.Model):
+    """Frames of one test attempt folded into counts and flagged intervals"""
+    id = db.Column(db.Integer, primary_key=True)
+    attempt_id = db.Column(db.Integer, db.ForeignKey('test_attempt.id'), nullable=False, unique=True)
+    student_id = db.Column(db.String(20), nullable=False)
+    frames = db.Column(db.Integer, default=0)
+    present_frames = db.Column(db.Integer, default=0)
+    multi_face_frames = db.Column(db.Integer, default=0)
+    absent_frames = db.Column(db.Integer, default=0)
+    face_present_ratio = db.Column(db.Float, default=0.0)
+    absent_seconds = db.Column(db.Float, default=0.0)
+    multi_face_seconds = db.Column(db.Float, default=0.0)
+    gap_seconds = db.Column(db.Float, default=0.0)
+    first_frame_at = db.Column(db.DateTime)
+    last_frame_at = db.Column(db.DateTime)
+    intervals = db.Column(db.Text)  # JSON list of flagged intervals and their keyframe ids
+    # Raw frames other than keyframes are deleted at compaction; keyframes later
+    compacted_at = db.Column(db.DateTime)
+    keyframes_purged_at = db.Column(db.DateTime)
+
+class FaceEmbedding(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    student_id = db.Column(db.String(20), nullable=False)
+    model = db.Column(db.String(20), nullable=False)  # embeddings of different models don't compare
+    vector = db.Column(db.LargeBinary, nullable=False)  # float32, L2-normalised
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    organization_id = db.Column(db.Integer, db.ForeignKey('organization.id'))
+
+    __table_args__ = (
+        db.Index('idx_face_embedding_org_student', 'organization_id', 'student_id'),
+    )
+
+TENANT_MODELS = (Application, Student, Fee, RevenueRollup, Hostel, Exam, ExamSeat, Attendance, Timetable, FaceEmbedding)
+
+@event.listens_for(OrmSession, 'do_orm_execute')
+def _scope_to_tenant(execute_state):
+    """Restrict ORM queries on tenant-scoped models to the current organization"""
+    tenant_id = current_tenant_id()
+    if tenant_id is None or execute_state.execution_options.get('all_tenants'):
+        return
+    if execute_state.is_column_load or execute_state.is_relationship_load:
+        return
+    if execute_state.is_select or execute_state.is_update or execute_state.is_delete:
+        execute_state.statement = execute_state.statement.options(*[
+            with_loader_criteria(model, lambda cls: cls.organization_id == tenant_id, include_aliases=True)
+            for model in TENANT_MODELS
+        ])
+
+@event.listens_for(OrmSession, 'before_flush')
+def _stamp_tenant(session, flush_context, instances):
+    """Assign new tenant-scoped rows to the current organization"""
+    tenant_id = current_tenant_id()
+    if tenant_id is None:
+        return
+    for obj in session.new:
+        if isinstance(obj, TENANT_MODELS) and obj.organization_id is None:
+            obj.organization_id = tenant_id
+
+@main_bp.before_app_request
+def load_tenant():
+    g.tenant_id = session.get('organization_id')
+
+def tenant_for_user(user):
+    """Default organization scope for a newly logged-in user"""
+    if user.role != 'admin':
+        return None
+    org = Organization.query.filter_by(admin_id=user.id, is_active=True).order_by(Organization.id).first()
+    return org.id if org else None
+
+def upgrade_schema():
+    """Add columns and indexes introduced after a database was created (create_all only adds tables)"""
+    inspector = db.inspect(db.engine)
+    with db.engine.begin() as connection:
+        for table in db.metadata.sorted_tables:
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    column_type = column.type.compile(dialect=db.engine.dialect)
+                    connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+            upgrade_unique_constraints(connection, inspector, table)
+        create_library_search_index(connection)
+
+def upgrade_unique_constraints(connection, inspector, table):
+    """Swap unique constraints of tables that declare named ones for the model's.
+
+    Hostel room numbers used to be unique across all organizations; the
+    model now makes them unique per organization.
+    """
+    declared = [constraint for constraint in table.constraints
+                if isinstance(constraint, db.UniqueConstraint) and constraint.name]
+    if not declared:
+        return
+    wanted = {tuple(column.name for column in constraint.columns) for constraint in declared}
+    wanted |= {(column.name,) for column in table.columns if column.unique}
+    existing = inspector.get_unique_constraints(table.name)
+    stale = [unique for unique in existing if tuple(unique['column_names']) not in wanted]
+    missing = [constraint for constraint in declared
+               if tuple(column.name for column in constraint.columns)
+               not in {tuple(unique['column_names']) for unique in existing}]
+    if not stale and not missing:
+        return
+
+    if connection.dialect.name == 'sqlite':
+        # SQLite cannot drop a constraint: rebuild the table and copy the rows over
+        # (nothing references these tables, so the rename leaves no dangling keys)
+        for index in inspector.get_indexes(table.name):
+            connection.execute(text(f'DROP INDEX {index["name"]}'))
+        old_columns = {column['name'] for column in inspector.get_columns(table.name)}
+        columns = ', '.join(column.name for column in table.columns if column.name in old_columns)
+        connection.execute(text(f'ALTER TABLE {table.name} RENAME TO {table.name}_before_upgrade'))
+        table.create(connection)
+        connection.execute(text(f'INSERT INTO {table.name} ({columns}) '
+                                f'SELECT {columns} FROM {table.name}_before_upgrade'))
+        connection.execute(text(f'DROP TABLE {table.name}_before_upgrade'))
+        return
+    for unique in stale:
+        drop = 'DROP INDEX' if connection.dialect.name == 'mysql' else 'DROP CONSTRAINT'
+        connection.execute(text(f'ALTER TABLE {table.name} {drop} {unique["name"]}'))
+    for constraint in missing:
+        connection.execute(AddConstraint(constraint))
+
+@main_bp.cli.command('assign-organization')
+@click.argument('code')
+def assign_organization_command(code):
+    """Assign rows created before multi-tenancy to the organization with CODE."""
+    org = Organization.query.filter_by(code=code).first()
+    if not org:
+        raise click.ClickException(f'No organization with code {code}')
+    for model in TENANT_MODELS:
+        updated = model.query.filter(model.organization_id.is_(None)).update(
+            {model.organization_id: org.id}, synchronize_session=False
+        )
+        print(f'{model.__tablename__}: {updated} rows assigned to {org.code}')
+    db.session.commit()
 
 # Role-based access control decorators
 def admin_required(f):
     @functools.wraps(f)
     def decorated_function(*args, **kwargs):
         if 'user_id' not in session:
-            return redirect(url_for('login'))
+            return redirect(url_for('main.login'))
         if session.get('role') != 'admin':
             flash('Access denied. Admin privileges required.')
-            return redirect(url_for('login'))
+            return redirect(url_for('main.login'))
         return f(*args, **kwargs)
     return decorated_function
 
@@ -284,17 +660,17 @@ def student_required(f):
     def decorated_function(*args, **kwargs):
         if 'user_id' not in session:
             flash('Please log in to continue')
-            return redirect(url_for('login'))
+            return redirect(url_for('main.login'))
 
         user = User.query.get(session['user_id'])
         if not user:
             session.clear()
             flash('Session expired. Please log in again')
-            return redirect(url_for('login'))
+            return redirect(url_for('main.login'))
 
         if user.role != 'student':
             flash('Access denied. Student privileges required.')
-            return redirect(url_for('login'))
+            return redirect(url_for('main.login'))
 
         # Store user in g for access in the view
         g.user = user
@@ -305,7 +681,7 @@ def login_required(f):
     @functools.wraps(f)
     def decorated_function(*args, **kwargs):
         if 'user_id' not in session:
-            return redirect(url_for('login'))
+            return redirect(url_for('main.login'))
         return f(*args, **kwargs)
     return decorated_function
 
@@ -323,16 +699,542 @@ def get_dropout_recommendations(risk_score, attendance, gpa):
     
     return recommendations
 
+# ID allocation
+class IdAllocator:
+    """Hands out monotonic sequence values from blocks reserved in IdSequence.
+
+    Each process reserves ``block_size`` values at a time in its own short
+    transaction, so concurrent workers never share a value and most calls
+    never touch the database. Values left in a block when a process exits are
+    skipped, so sequences may have gaps but never duplicates.
+    """
+
+    def __init__(self, block_size=100):
+        self.block_size = block_size
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._blocks = {}  # (database URL, sequence name) -> [next value, end of block]
+
+    def next_value(self, name):
+        return self.reserve(name, 1).start
+
+    def reserve(self, name, count):
+        """Return a range of ``count`` consecutive values for a sequence"""
+        if self._pid != os.getpid():
+            # Forked worker: blocks cached by the parent belong to the parent
+            self._reset()
+
+        # Blocks belong to one database; apps on other databases in this process reserve their own
+        key = (str(db.engine.url), name)
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is None or block[1] - block[0] < count:
+                start = self._reserve_block(name, max(count, self.block_size))
+                block = self._blocks[key] = [start, start + max(count, self.block_size)]
+            start = block[0]
+            block[0] += count
+            return range(start, start + count)
+
+    def _reserve_block(self, name, size):
+        # A separate transaction keeps the reservation even if the caller rolls back
+        sequences = IdSequence.__table__
+        # An upsert, so two first reservations of a name cannot both insert the row
+        insert = UPSERT_INSERTS[db.engine.dialect.name](sequences).values(name=name, next_value=1 + size)
+        with db.engine.begin() as connection:
+            connection.execute(insert.on_conflict_do_update(
+                index_elements=[sequences.c.name],
+                set_={'next_value': sequences.c.next_value + size}
+            ))
+            return connection.execute(
+                db.select(sequences.c.next_value).where(sequences.c.name == name)
+            ).scalar() - size
+
+id_allocator = IdAllocator()
+
+def format_student_id(value, day=None):
+    """``day`` (default today) is the date embedded in the ID"""
+    return f"STU{(day or date.today()).strftime('%Y%m%d')}{value:06d}"
+
+def format_receipt_number(value, day=None):
+    return f"RCP{(day or date.today()).strftime('%Y%m%d')}{value:08d}"
+
+def next_student_id():
+    """Allocate a unique student ID (call before writing in the current session)"""
+    return format_student_id(id_allocator.next_value('student_id'))
+
+def next_receipt_number():
+    """Allocate a unique fee receipt number (call before writing in the current session)"""
+    return format_receipt_number(id_allocator.next_value('receipt_number'))
+
+# Revenue ledger
+REVENUE_GRANULARITIES = ('day', 'month')
+
+def revenue_bucket(payment_date, granularity):
+    """Return the first day of the rollup bucket a payment falls into"""
+    bucket = payment_date.date() if isinstance(payment_date, datetime) else payment_date
+    return bucket.replace(day=1) if granularity == 'month' else bucket
+
+def record_fee_revenue(fee, course):
+    """Add a paid fee to its daily and monthly rollup buckets (caller commits)"""
+    if (fee.status or 'paid') != 'paid':
+        return
+
+    payment_date = fee.payment_date or datetime.utcnow()
+    course = course or 'Unknown'
+    organization_id = fee.organization_id if fee.organization_id is not None else current_tenant_id()
+    for granularity in REVENUE_GRANULARITIES:
+        bucket_date = revenue_bucket(payment_date, granularity)
+        updated = RevenueRollup.query.filter_by(
+            organization_id=organization_id,
+            granularity=granularity,
+            bucket_date=bucket_date,
+            fee_type=fee.fee_type,
+            course=course
+        ).update({
+            RevenueRollup.total_amount: RevenueRollup.total_amount + fee.amount,
+            RevenueRollup.payment_count: RevenueRollup.payment_count + 1
+        }, synchronize_session=False)
+
+        if not updated:
+            # Two first payments into a bucket can both miss the UPDATE; the upsert makes
+            # the second one add to the row the first inserted instead of failing
+            table = RevenueRollup.__table__
+            insert = UPSERT_INSERTS[db.engine.dialect.name](table).values(
+                organization_id=organization_id,
+                granularity=granularity,
+                bucket_date=bucket_date,
+                fee_type=fee.fee_type,
+                course=course,
+                total_amount=fee.amount,
+                payment_count=1
+            )
+            db.session.execute(insert.on_conflict_do_update(
+                index_elements=[table.c.organization_id, table.c.granularity, table.c.bucket_date,
+                                table.c.fee_type, table.c.course],
+                set_={'total_amount': table.c.total_amount + insert.excluded.total_amount,
+                      'payment_count': table.c.payment_count + insert.excluded.payment_count}
+            ))
+
+def backfill_revenue_rollups():
+    """Rebuild every rollup bucket from the fee ledger with grouped queries (caller commits)"""
+    RevenueRollup.query.delete()
+
+    course = db.func.coalesce(Student.course, 'Unknown')
+    day = db.func.date(Fee.payment_date)
+    grouped = db.session.query(
+        Fee.organization_id, day, Fee.fee_type, course,
+        db.func.sum(Fee.amount), db.func.count(Fee.id)
+    ).outerjoin(Student, Student.student_id == Fee.student_id).filter(
+        Fee.status == 'paid'
+    ).group_by(Fee.organization_id, day, Fee.fee_type, course)
+
+    # Daily groups are folded into months here, which avoids dialect-specific date formatting
+    buckets = {}
+    for organization_id, payment_day, fee_type, fee_course, total, count in grouped:
+        if not isinstance(payment_day, date):
+            payment_day = date.fromisoformat(payment_day)  # SQLite's date() returns text
+        for granularity in REVENUE_GRANULARITIES:
+            key = (organization_id, granularity, revenue_bucket(payment_day, granularity), fee_type, fee_course)
+            bucket = buckets.setdefault(key, [0, 0])
+            bucket[0] += total or 0
+            bucket[1] += count
+
+    db.session.bulk_insert_mappings(RevenueRollup, [{
+        'organization_id': organization_id,
+        'granularity': granularity,
+        'bucket_date': bucket_date,
+        'fee_type': fee_type,
+        'course': fee_course,
+        'total_amount': total,
+        'payment_count': count
+    } for (organization_id, granularity, bucket_date, fee_type, fee_course), (total, count) in buckets.items()])
+    return len(buckets)
+
+def revenue_total(since=None):
+    """Sum collected revenue from the monthly rollups, optionally from a month onwards"""
+    query = db.session.query(db.func.sum(RevenueRollup.total_amount)).filter(
+        RevenueRollup.granularity == 'month'
+    )
+    if since is not None:
+        query = query.filter(RevenueRollup.bucket_date >= revenue_bucket(since, 'month'))
+    return query.scalar() or 0
+
+@main_bp.cli.command('backfill-revenue')
+def backfill_revenue_command():
+    """Rebuild the revenue rollup tables from the fee ledger."""
+    buckets = backfill_revenue_rollups()
+    db.session.commit()
+    print(f'Rebuilt {buckets} revenue buckets')
+
+# Organization statistics
+def refresh_organization_stats(organization_ids=None):
+    """Recompute cached student and course counters for organizations (caller commits)"""
+    query = db.session.query(
+        Student.organization_id,
+        db.func.count(Student.id),
+        db.func.count(db.distinct(Student.course))
+    ).filter(Student.status == 'active', Student.organization_id.isnot(None))
+    orgs = Organization.query
+    if organization_ids is not None:
+        organization_ids = [org_id for org_id in organization_ids if org_id is not None]
+        if not organization_ids:
+            return
+        query = query.filter(Student.organization_id.in_(organization_ids))
+        orgs = orgs.filter(Organization.id.in_(organization_ids))
+
+    counts = {org_id: (students, courses) for org_id, students, courses in
+              query.group_by(Student.organization_id).execution_options(all_tenants=True)}
+    for org in orgs:
+        students, courses = counts.get(org.id, (0, 0))
+        # Only touch changed rows so updated_at (and the page cache) moves on real changes
+        if org.student_count != students or org.course_count != courses:
+            org.student_count = students
+            org.course_count = courses
+
+_organization_page = {}
+
+def organization_page_version():
+    """Changes whenever an organization is added, edited or has its counters refreshed"""
+    return tuple(db.session.query(
+        db.func.count(Organization.id), db.func.max(Organization.updated_at)
+    ).one())
+
+# Rendered fragment cache
+# Tables whose writes invalidate cached fragments that render them
+VERSIONED_TABLES = {'application', 'exam', 'face_embedding', 'fee', 'hostel', 'student', 'timetable'}
+
+def bump_data_versions(session, tables):
+    """Advance the version of each table when the caller's transaction commits"""
+    session.info.setdefault('changed_tables', set()).update(tables)
+
+@event.listens_for(OrmSession, 'after_flush')
+def _bump_flushed_versions(session, flush_context):
+    changed = {type(obj).__table__.name for obj in itertools.chain(
+        session.new, session.deleted, (obj for obj in session.dirty if session.is_modified(obj))
+    )}
+    if changed & VERSIONED_TABLES:
+        bump_data_versions(session, changed & VERSIONED_TABLES)
+
+@event.listens_for(OrmSession, 'do_orm_execute')
+def _bump_statement_versions(execute_state):
+    """ORM-enabled bulk UPDATE/DELETE/INSERT statements skip the flush"""
+    mapper = execute_state.bind_mapper
+    if mapper is None or not (execute_state.is_update or execute_state.is_delete or execute_state.is_insert):
+        return
+    if mapper.local_table.name in VERSIONED_TABLES:
+        bump_data_versions(execute_state.session, {mapper.local_table.name})
+
+@event.listens_for(OrmSession, 'before_commit')
+def _write_data_versions(session):
+    """Write the versions with the commit, so a rolled back transaction never moves them.
+
+    A version read inside a transaction that later rolls back would key a
+    fragment rendered from rows that were never committed.
+    """
+    session.flush()
+    tables = session.info.pop('changed_tables', None)
+    if not tables:
+        return
+    versions = DataVersion.__table__
+    for name in sorted(tables):
+        updated = session.execute(versions.update().where(versions.c.table_name == name).values(
+            version=versions.c.version + 1
+        )).rowcount
+        if not updated:
+            session.execute(versions.insert().values(table_name=name, version=1))
+    if has_app_context():
+        # Versions read earlier in this request are out of date now
+        g.pop('data_versions', None)
+
+@event.listens_for(OrmSession, 'after_soft_rollback')
+def _drop_data_versions(session, previous_transaction):
+    if not previous_transaction.nested:
+        session.info.pop('changed_tables', None)
+
+@main_bp.app_template_global()
+def data_version(*tables):
+    """Current versions of tables, read once per request"""
+    if 'data_versions' not in g:
+        g.data_versions = dict(db.session.query(DataVersion.table_name, DataVersion.version).all())
+    return tuple(g.data_versions.get(table, 0) for table in tables)
+
+class FragmentCache:
+    """Bounded LRU of rendered template fragments"""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_render(self, key, render, max_entries):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        # Render outside the lock; two requests may both render a cold fragment
+        html = render()
+        with self._lock:
+            self._entries[key] = html
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+        return html
+
+fragment_cache = FragmentCache()
+
+class FragmentCacheExtension(Extension):
+    """``{% cache 'name', key, ... %}...{% endcache %}`` renders the body once per key.
+
+    The role, organization and (for non-admins) user are always part of the
+    key; pass ``data_version(...)`` for the tables the fragment renders.
+    """
+    tags = {'cache'}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        parts = [parser.parse_expression()]
+        while parser.stream.skip_if('comma'):
+            parts.append(parser.parse_expression())
+        body = parser.parse_statements(['name:endcache'], drop_needle=True)
+        return nodes.CallBlock(self.call_method('_render', [nodes.List(parts)]), [], [], body).set_lineno(lineno)
+
+    def _render(self, parts, caller):
+        max_entries = current_app.config['FRAGMENT_CACHE_SIZE']
+        if not max_entries:
+            return caller()
+        role = session.get('role')
+        key = (tuple(parts), role, current_tenant_id(), None if role == 'admin' else session.get('user_id'))
+        return fragment_cache.get_or_render(key, caller, max_entries)
+
+# Fingerprinted static assets
+_asset_fingerprints = {}
+
+@main_bp.app_template_global()
+def asset_url(filename):
+    """Static URL with a content hash, so the file can be cached for a year"""
+    path = os.path.join(current_app.static_folder, filename)
+    mtime = os.path.getmtime(path)
+    cached = _asset_fingerprints.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, 'rb') as f:
+            cached = _asset_fingerprints[path] = (mtime, hashlib.sha256(f.read()).hexdigest()[:12])
+    return url_for('static', filename=filename, v=cached[1])
+
+@main_bp.after_app_request
+def cache_fingerprinted_assets(response):
+    if request.endpoint == 'static' and 'v' in request.args and response.status_code in (200, 304):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = 365 * 24 * 3600
+        response.cache_control.immutable = True
+    return response
+
+@main_bp.app_template_filter('from_json')
+def from_json(value):
+    return json.loads(value) if value else []
+
+# Health checks for the process manager and load balancer
+@main_bp.route('/healthz')
+def healthz():
+    return jsonify({'status': 'ok'})
+
+@main_bp.route('/readyz')
+def readyz():
+    checks = {}
+    try:
+        db.session.execute(text('SELECT 1'))
+        checks['database'] = 'ok'
+    except Exception as e:
+        current_app.logger.error('Readiness check failed: %s', e)
+        checks['database'] = 'unavailable'
+    checks['uploads'] = 'ok' if os.access(current_app.config['UPLOAD_FOLDER'], os.W_OK) else 'read-only'
+
+    ready = all(status == 'ok' for status in checks.values())
+    return jsonify({'status': 'ready' if ready else 'not ready', 'checks': checks}), 200 if ready else 503
+
+# Request metrics
+class LatencyHistogram:
+    """HDR-style histogram of non-negative integers.
+
+    Each power-of-two range is split into 16 linear sub-buckets, giving about
+    6% relative precision with a handful of sparse buckets per route.
+    """
+    SUB_BUCKETS = 16
+
+    def __init__(self, unit=1.0):
+        self.unit = unit  # value of one recorded step, e.g. 1e-6 for microseconds
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+
+    def record(self, value):
+        if value < 2 * self.SUB_BUCKETS:
+            index = value
+        else:
+            shift = value.bit_length() - 5
+            index = (shift + 1) * self.SUB_BUCKETS + (value >> shift) - self.SUB_BUCKETS
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+
+    def _upper_bound(self, index):
+        if index < 2 * self.SUB_BUCKETS:
+            return index
+        shift = index // self.SUB_BUCKETS - 1
+        return ((index % self.SUB_BUCKETS + self.SUB_BUCKETS + 1) << shift) - 1
+
+    def quantile(self, fraction):
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                return self._upper_bound(index) * self.unit
+        return self._upper_bound(max(self.buckets)) * self.unit
+
+class RouteMetrics:
+    def __init__(self):
+        self.duration = LatencyHistogram(unit=1e-6)
+        self.queries = LatencyHistogram()
+        self.sql_time = LatencyHistogram(unit=1e-6)
+        self.statuses = {}
+
+_route_metrics = {}
+_route_metrics_lock = threading.Lock()
+_request_stats = threading.local()
+METRIC_QUANTILES = (0.5, 0.9, 0.99)
+SLOW_STATEMENTS_LOGGED = 5
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if getattr(_request_stats, 'current', None) is not None and context is not None:
+        # On the execution context, not the pooled connection, so a statement that
+        # raises (and never reaches after_cursor_execute) leaves nothing behind
+        context.query_started = time.perf_counter()
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    stats = getattr(_request_stats, 'current', None)
+    started = getattr(context, 'query_started', None)
+    if stats is None or started is None:
+        return
+    elapsed = time.perf_counter() - started
+    stats['queries'] += 1
+    stats['sql_time'] += elapsed
+    # Keep only the slowest few statements for the slow-request log
+    slowest = stats['slowest']
+    if len(slowest) < SLOW_STATEMENTS_LOGGED:
+        heapq.heappush(slowest, (elapsed, statement))
+    elif elapsed > slowest[0][0]:
+        heapq.heapreplace(slowest, (elapsed, statement))
+
+@main_bp.before_app_request
+def start_request_metrics():
+    _request_stats.current = {'started': time.perf_counter(), 'queries': 0, 'sql_time': 0.0, 'slowest': []}
+
+def finish_request_metrics(status_code):
+    stats = getattr(_request_stats, 'current', None)
+    if stats is None or stats.get('streaming'):
+        return
+    _request_stats.current = None
+    record_metrics(current_app._get_current_object(), stats, request.endpoint or 'unmatched',
+                   request.method, request.path, status_code)
+
+def finish_streamed_metrics(app, stats, endpoint, method, path, status_code):
+    """Close-time counterpart of finish_request_metrics; the request context may be gone"""
+    if getattr(_request_stats, 'current', None) is stats:
+        _request_stats.current = None
+    record_metrics(app, stats, endpoint, method, path, status_code)
+
+def record_metrics(app, stats, endpoint, method, path, status_code):
+    elapsed = time.perf_counter() - stats['started']
+
+    with _route_metrics_lock:
+        metrics = _route_metrics.get(endpoint)
+        if metrics is None:
+            metrics = _route_metrics[endpoint] = RouteMetrics()
+        metrics.duration.record(int(elapsed * 1e6))
+        metrics.queries.record(stats['queries'])
+        metrics.sql_time.record(int(stats['sql_time'] * 1e6))
+        metrics.statuses[status_code] = metrics.statuses.get(status_code, 0) + 1
+
+    if elapsed >= app.config['SLOW_REQUEST_SECONDS']:
+        statements = '\n'.join(f'  {duration * 1000:.1f} ms: {" ".join(statement.split())[:500]}'
+                               for duration, statement in sorted(stats['slowest'], reverse=True))
+        app.logger.warning(
+            'Slow request %s %s (%s): %.3fs, %d queries in %.3fs\n%s',
+            method, path, endpoint, elapsed, stats['queries'], stats['sql_time'], statements,
+            extra={'duration_ms': round(elapsed * 1000, 1), 'queries': stats['queries']}
+        )
+
+@main_bp.after_app_request
+def record_request_metrics(response):
+    stats = getattr(_request_stats, 'current', None)
+    if response.is_streamed and not response.direct_passthrough and stats is not None:
+        # A generated body, and the export queries behind it, runs after this hook: keep
+        # counting until the server closes the response (files sent as-is run no queries)
+        stats['streaming'] = True
+        response.call_on_close(functools.partial(
+            finish_streamed_metrics, current_app._get_current_object(), stats, request.endpoint or 'unmatched',
+            request.method, request.path, response.status_code
+        ))
+        return response
+    finish_request_metrics(response.status_code)
+    return response
+
+@main_bp.teardown_app_request
+def record_failed_request_metrics(error):
+    # Only still pending when the view raised before a response was built
+    finish_request_metrics(500)
+
+@main_bp.route('/metrics')
+def metrics():
+    token = current_app.config.get('METRICS_TOKEN')
+    authorized = session.get('role') == 'admin' or (
+        token and request.headers.get('Authorization') == f'Bearer {token}'
+    )
+    if not authorized:
+        return jsonify({'error': 'Unauthorized'}), 401
+
+    summaries = (
+        ('erp_request_duration_seconds', 'Request wall time per endpoint', 'duration'),
+        ('erp_request_sql_queries', 'SQL statements executed per request', 'queries'),
+        ('erp_request_sql_seconds', 'Time spent in SQL per request', 'sql_time')
+    )
+    with _route_metrics_lock:
+        routes = sorted(_route_metrics.items())
+        lines = []
+        for name, description, attribute in summaries:
+            lines.append(f'# HELP {name} {description}')
+            lines.append(f'# TYPE {name} summary')
+            for endpoint, route in routes:
+                histogram = getattr(route, attribute)
+                for fraction in METRIC_QUANTILES:
+                    lines.append(f'{name}{{endpoint="{endpoint}",quantile="{fraction}"}} {histogram.quantile(fraction):.6g}')
+                lines.append(f'{name}_sum{{endpoint="{endpoint}"}} {histogram.total * histogram.unit:.6g}')
+                lines.append(f'{name}_count{{endpoint="{endpoint}"}} {histogram.count}')
+
+        lines.append('# HELP erp_requests_total Requests per endpoint and status code')
+        lines.append('# TYPE erp_requests_total counter')
+        for endpoint, route in routes:
+            for status_code, count in sorted(route.statuses.items()):
+                lines.append(f'erp_requests_total{{endpoint="{endpoint}",status="{status_code}"}} {count}')
+
+    return '\n'.join(lines) + '\n', 200, {'Content-Type': 'text/plain; version=0.0.4'}
+
 # Routes
-@app.route('/')
+@main_bp.route('/')
 def index():
     return render_template('home.html')
 
-@app.route('/home')
+@main_bp.route('/home')
 def home():
     return render_template('home.html')
 
-@app.route('/login', methods=['GET', 'POST'])
+@main_bp.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
         email = request.form['email']
@@ -343,16 +1245,17 @@ def login():
             session['user_id'] = user.id
             session['username'] = user.username
             session['role'] = user.role
+            session['organization_id'] = tenant_for_user(user)
             if user.role == 'student':
-                return redirect(url_for('organization_selection'))
+                return redirect(url_for('main.organization_selection'))
             else:
-                return redirect(url_for('dashboard'))
+                return redirect(url_for('admin.dashboard'))
         else:
             flash('Invalid email or password')
     
     return render_template('login.html')
 
-@app.route('/register', methods=['GET', 'POST'])
+@main_bp.route('/register', methods=['GET', 'POST'])
 def register():
     if request.method == 'POST':
         username = request.form['username']
@@ -392,11 +1295,11 @@ def register():
         db.session.commit()
         
         flash('Registration successful')
-        return redirect(url_for('login'))
+        return redirect(url_for('main.login'))
     
     return render_template('register.html')
 
-@app.route('/dashboard')
+@admin_bp.route('/dashboard')
 @admin_required
 def dashboard():
     # Get real-time dashboard statistics
@@ -406,11 +1309,9 @@ def dashboard():
     pending_applications = Application.query.filter_by(status='pending').count()
     approved_applications = Application.query.filter_by(status='approved').count()
     
-    # Revenue data
-    total_revenue = db.session.query(db.func.sum(Fee.amount)).scalar() or 0
-    monthly_revenue = db.session.query(db.func.sum(Fee.amount)).filter(
-        Fee.payment_date >= datetime.now().replace(day=1)
-    ).scalar() or 0
+    # Revenue data (pre-aggregated monthly buckets)
+    total_revenue = revenue_total()
+    monthly_revenue = revenue_total(since=datetime.now())
     
     # Hostel data
     hostel_occupancy = db.session.query(db.func.sum(Hostel.occupied)).scalar() or 0
@@ -426,6 +1327,8 @@ def dashboard():
     students = Student.query.all()
     high_risk_students = 0
     dropout_predictions = []
+    # One query for everyone with a payment instead of a COUNT per student
+    students_with_fees = {student_id for (student_id,) in db.session.query(Fee.student_id).distinct()}
     
     for student in students:
         # Calculate risk score based on attendance, GPA, and payment history
@@ -433,11 +1336,9 @@ def dashboard():
         gpa_risk = max(0, (6.0 - student.gpa) / 6.0) if student.gpa < 6.0 else 0
         
         # Check payment history
-        recent_fees_count = Fee.query.filter_by(student_id=student.student_id).count()
-        payment_risk = 0.3 if recent_fees_count == 0 else 0
+        payment_risk = 0.3 if student.student_id not in students_with_fees else 0
         
         risk_score = (attendance_risk * 0.4 + gpa_risk * 0.4 + payment_risk * 0.2)
-        student.risk_score = risk_score
         
         if risk_score > 0.7:
             high_risk_students += 1
@@ -473,19 +1374,19 @@ def dashboard():
                          dropout_predictions=dropout_predictions,
                          course_stats=course_stats)
 
-@app.route('/admissions')
+@admin_bp.route('/admissions')
 @admin_required
 def admissions():
     students = Student.query.all()
     return render_template('admissions.html', students=students)
 
-@app.route('/admissions/new', methods=['GET', 'POST'])
+@admin_bp.route('/admissions/new', methods=['GET', 'POST'])
 @admin_required
 def new_admission():
     
     if request.method == 'POST':
         # Generate unique student ID
-        student_id = f"STU{datetime.now().strftime('%Y%m%d')}{random.randint(1000, 9999)}"
+        student_id = next_student_id()
         
         student = Student(
             student_id=student_id,
@@ -497,20 +1398,22 @@ def new_admission():
         )
         
         db.session.add(student)
+        db.session.flush()
+        refresh_organization_stats([student.organization_id])
         db.session.commit()
         
         flash(f'Student {student_id} admitted successfully!')
-        return redirect(url_for('admissions'))
+        return redirect(url_for('admin.admissions'))
     
     return render_template('new_admission.html')
 
-@app.route('/fees')
+@admin_bp.route('/fees')
 @admin_required
 def fees():
     fees = Fee.query.order_by(Fee.payment_date.desc()).all()
     return render_template('fees.html', fees=fees)
 
-@app.route('/fees/pay', methods=['GET', 'POST'])
+@admin_bp.route('/fees/pay', methods=['GET', 'POST'])
 @admin_required
 def pay_fee():
     
@@ -520,31 +1423,38 @@ def pay_fee():
         fee_type = request.form['fee_type']
         
         # Generate receipt number
-        receipt_number = f"RCP{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        receipt_number = next_receipt_number()
+        student = Student.query.filter_by(student_id=student_id).first()
         
         fee = Fee(
             student_id=student_id,
             amount=amount,
             fee_type=fee_type,
-            receipt_number=receipt_number
+            payment_date=datetime.utcnow(),
+            status='paid',
+            receipt_number=receipt_number,
+            organization_id=student.organization_id if student else None
         )
         
         db.session.add(fee)
+
+        # Keep the revenue rollups in step with the ledger
+        record_fee_revenue(fee, student.course if student else None)
         db.session.commit()
         
         flash(f'Fee payment recorded! Receipt: {receipt_number}')
-        return redirect(url_for('fees'))
+        return redirect(url_for('admin.fees'))
     
     students = Student.query.filter_by(status='active').all()
     return render_template('pay_fee.html', students=students)
 
-@app.route('/hostel')
+@hostel_bp.route('/hostel')
 @admin_required
 def hostel():
     rooms = Hostel.query.all()
     return render_template('hostel.html', rooms=rooms)
 
-@app.route('/hostel/allocate', methods=['GET', 'POST'])
+@hostel_bp.route('/hostel/allocate', methods=['GET', 'POST'])
 @admin_required
 def allocate_hostel():
     
@@ -570,20 +1480,527 @@ def allocate_hostel():
         else:
             flash('Room is full or does not exist')
         
-        return redirect(url_for('hostel'))
+        return redirect(url_for('hostel.hostel'))
     
     students = Student.query.filter_by(status='active').all()
     available_rooms = Hostel.query.filter(Hostel.occupied < Hostel.capacity).all()
     
     return render_template('allocate_hostel.html', students=students, rooms=available_rooms)
 
-@app.route('/exams')
+# Exam seating
+# Candidates sitting an exam session are seated room by room so that no two
+# neighbours (side by side, or front and back) write the same subject. Plans
+# are stored as ExamSeat rows and exported as CSV streamed straight from the
+# database.
+EXAM_ROOM_COLUMNS = 6  # seats per row for rooms given only a capacity
+EXAM_SEAT_LOOKAHEAD = 8
+EXAM_SEATING_REPORT_LIMIT = 100
+EXPORT_CHUNK_ROWS = 1000
+# Leading characters that make spreadsheets read a CSV cell as a formula
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+def csv_chunks(rows, chunk_rows=EXPORT_CHUNK_ROWS):
+    """CSV text for an iterable of rows, a chunk of rows at a time"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for i, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if i % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+def csv_safe(rows):
+    """Rows with a quote before text a spreadsheet would run as a formula (CSV injection)"""
+    for row in rows:
+        yield [f"'{value}" if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES) else value
+               for value in row]
+
+def csv_response(rows, filename, gzip=False):
+    """Streamed CSV download; ``rows`` is consumed while the response is sent"""
+    chunks = csv_chunks(csv_safe(rows))
+    if gzip:
+        response = current_app.response_class(stream_with_context(gzip_chunks(chunks)), mimetype='application/gzip')
+        filename += '.gz'
+    else:
+        response = current_app.response_class(stream_with_context(chunks), mimetype='text/csv')
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+def exam_rooms(rooms):
+    """[(name, rows, columns, capacity)] from dicts with rows and columns, or just a capacity"""
+    if not isinstance(rooms, list):
+        raise ValueError('rooms must be a list')
+    parsed = []
+    for room in rooms:
+        if not isinstance(room, dict):
+            raise ValueError('Each room must be an object with a name and rows/columns or a capacity')
+        name = str(room.get('name') or '').strip()
+        try:
+            if room.get('rows') and room.get('columns'):
+                rows, columns = int(room['rows']), int(room['columns'])
+                capacity = min(int(room.get('capacity') or rows * columns), rows * columns)
+            else:
+                capacity = int(room.get('capacity') or 0)
+                columns = EXAM_ROOM_COLUMNS
+                rows = -(-capacity // columns)
+        except (TypeError, ValueError):
+            raise ValueError(f'Room {name or "without a name"}: rows, columns and capacity must be whole numbers')
+        if not name or rows <= 0 or columns <= 0 or capacity <= 0:
+            raise ValueError(f'Room {name or "without a name"} has no seats')
+        parsed.append((name, rows, columns, capacity))
+    return parsed
+
+def _spread(by_subject):
+    """Candidates of several subjects in one queue, each subject spread evenly along it"""
+    keyed = []
+    for subject, exam_ids in by_subject.items():
+        size = len(exam_ids)
+        keyed.extend(((i + 0.5) / size, subject, exam_id) for i, exam_id in enumerate(exam_ids))
+    keyed.sort()
+    return deque((exam_id, subject) for _, subject, exam_id in keyed)
+
+def _take(queue_, blocked):
+    """Pop the first of the next few candidates whose subject is not ``blocked``"""
+    skipped = []
+    pick = None
+    while queue_ and len(skipped) < EXAM_SEAT_LOOKAHEAD:
+        candidate = queue_.popleft()
+        if candidate[1] not in blocked:
+            pick = candidate
+            break
+        skipped.append(candidate)
+    queue_.extendleft(reversed(skipped))
+    return pick
+
+def assign_seats(candidates, rooms):
+    """Seat (exam_id, subject) candidates so no neighbours share a subject.
+
+    Seats are coloured like a chessboard, and two seats of one colour are
+    never neighbours. Subjects are split into two halves of about equal size,
+    one per colour, so a seat taken from its own half can never clash. When a
+    half runs out, the other fills in: each seat is checked against its left
+    and front neighbours (the ones already filled), looking a few candidates
+    ahead for a subject that fits, and stays empty if none does. After one
+    sort to spread subjects, seating is a single pass over the seats.
+    Returns ({exam_id: (room, row, column)}, unseated exam ids).
+    """
+    by_subject = {}
+    for exam_id, subject in candidates:
+        by_subject.setdefault(subject, []).append(exam_id)
+    halves, sizes = ({}, {}), [0, 0]
+    for subject in sorted(by_subject, key=lambda name: (-len(by_subject[name]), name)):
+        half = 0 if sizes[0] <= sizes[1] else 1
+        halves[half][subject] = by_subject[subject]
+        sizes[half] += len(by_subject[subject])
+    queues = [_spread(half) for half in halves]
+
+    seats = {}
+    for name, rows, columns, capacity in rooms:
+        if not queues[0] and not queues[1]:
+            break
+        taken = {}
+        for index in range(capacity):
+            row, column = divmod(index, columns)
+            blocked = {taken.get((row, column - 1)), taken.get((row - 1, column))}
+            colour = (row + column) % 2
+            pick = _take(queues[colour], blocked) or _take(queues[1 - colour], blocked)
+            if pick:
+                seats[pick[0]] = (name, row, column)
+                taken[(row, column)] = pick[1]
+    return seats, [exam_id for queue_ in queues for exam_id, _ in queue_]
+
+def seating_clashes(seats, subjects):
+    """Neighbouring seats with the same subject (0 for a valid plan)"""
+    occupied = {seat: subjects[exam_id] for exam_id, seat in seats.items()}
+    return sum(occupied.get((room, row, column + 1)) == subject for (room, row, column), subject in occupied.items()) \
+        + sum(occupied.get((room, row + 1, column)) == subject for (room, row, column), subject in occupied.items())
+
+def plan_exam_seating(day, rooms):
+    """Seat every exam session on ``day`` in ``rooms`` and store the plan (caller commits)"""
+    start = time.perf_counter()
+    rooms = exam_rooms(rooms)
+    day_start = datetime.combine(day, datetime.min.time())
+    exams = db.session.query(Exam.id, Exam.subject, Exam.exam_date, Exam.organization_id).filter(
+        Exam.exam_date >= day_start, Exam.exam_date < day_start + timedelta(days=1)
+    ).order_by(Exam.exam_date, Exam.id).all()
+
+    # Candidates sitting at the same time share the rooms; each session gets all of them
+    sessions = {}
+    for exam_id, subject, exam_date, organization_id in exams:
+        sessions.setdefault(exam_date, []).append((exam_id, subject, organization_id))
+    ExamSeat.query.filter(ExamSeat.exam_id.in_([exam_id for exam_id, _, _, _ in exams])) \
+        .delete(synchronize_session=False)
+
+    report = {'date': day.isoformat(), 'sessions': []}
+    for starts_at, candidates in sessions.items():
+        seats, unseated = assign_seats([(exam_id, subject) for exam_id, subject, _ in candidates], rooms)
+        subjects = {exam_id: subject for exam_id, subject, _ in candidates}
+        db.session.bulk_insert_mappings(ExamSeat, [{
+            'exam_id': exam_id, 'room': room, 'seat_row': row, 'seat_column': column,
+            'organization_id': organization_id
+        } for exam_id, _, organization_id in candidates if exam_id in seats
+            for room, row, column in (seats[exam_id],)])
+        report['sessions'].append({
+            'starts_at': starts_at.isoformat(),
+            'candidates': len(candidates),
+            'seated': len(seats),
+            'unseated': unseated[:EXAM_SEATING_REPORT_LIMIT],
+            'unseated_count': len(unseated),
+            'clashes': seating_clashes(seats, subjects)
+        })
+    report['seconds'] = round(time.perf_counter() - start, 3)
+    return report
+
+def seating_rows(day, layout='list'):
+    """CSV rows of a day's seating plan, read in chunks in session, room and seat order.
+
+    ``list`` gives one line per candidate; ``chart`` gives each room as a
+    grid, one line per row of seats, front row first.
+    """
+    day_start = datetime.combine(day, datetime.min.time())
+    query = db.session.query(
+        Exam.exam_date, ExamSeat.room, ExamSeat.seat_row, ExamSeat.seat_column, Exam.student_id, Exam.subject,
+        Exam.id
+    ).join(Exam, Exam.id == ExamSeat.exam_id).filter(
+        Exam.exam_date >= day_start, Exam.exam_date < day_start + timedelta(days=1)
+    ).order_by(Exam.exam_date, ExamSeat.room, ExamSeat.seat_row, ExamSeat.seat_column)
+
+    if layout == 'list':
+        yield ['session', 'room', 'seat', 'row', 'column', 'student_id', 'subject', 'exam_id']
+        for starts_at, room, row, column, student_id, subject, exam_id in query.yield_per(EXPORT_CHUNK_ROWS):
+            yield [starts_at.isoformat(sep=' '), room, f'{row + 1}-{column + 1}', row + 1, column + 1,
+                   student_id, subject, exam_id]
+        return
+
+    # Chart: only the seat row being built is held in memory
+    current_room, current_row, cells = None, None, []
+    for starts_at, room, row, column, student_id, subject, _ in query.yield_per(EXPORT_CHUNK_ROWS):
+        if (starts_at, room) != current_room:
+            if cells:
+                yield cells
+            if current_room:
+                yield []
+            current_room, current_row, cells = (starts_at, room), None, []
+            yield [f'Room {room}', starts_at.isoformat(sep=' ')]
+        if row != current_row:
+            if cells:
+                yield cells
+            current_row, cells = row, [f'Row {row + 1}']
+        cells.extend([''] * (column + 1 - len(cells)))
+        cells.append(f'{student_id} ({subject})')
+    if cells:
+        yield cells
+
+@admin_bp.route('/api/exams/seating', methods=['POST'])
+def exam_seating():
+    if session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 401
+    data = request.get_json(silent=True) or {}
+    try:
+        day = date.fromisoformat(data.get('date') or '')
+        report = plan_exam_seating(day, data.get('rooms') or [])
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    db.session.commit()
+    return jsonify(report)
+
+@admin_bp.route('/api/exams/seating/export')
+def exam_seating_export():
+    if session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 401
+    try:
+        day = date.fromisoformat(request.args.get('date') or '')
+    except ValueError:
+        return jsonify({'error': 'date must be YYYY-MM-DD'}), 400
+    layout = request.args.get('layout', 'list')
+    if layout not in ('list', 'chart'):
+        return jsonify({'error': 'layout must be list or chart'}), 400
+    return csv_response(seating_rows(day, layout), f'seating_{day.isoformat()}_{layout}.csv')
+
+@main_bp.cli.command('plan-seating')
+@click.argument('day', type=click.DateTime(formats=['%Y-%m-%d']))
+@click.argument('rooms', type=click.File('r'))
+def plan_seating_command(day, rooms):
+    """Seat the exams on DAY in the rooms listed in the ROOMS CSV (name and rows/columns or capacity)."""
+    try:
+        report = plan_exam_seating(day.date(), list(csv.DictReader(rooms)))
+    except (KeyError, ValueError) as e:
+        raise click.ClickException(str(e))
+    db.session.commit()
+    for plan in report['sessions']:
+        print(f"{plan['starts_at']}: {plan['seated']} of {plan['candidates']} seated, "
+              f"{plan['unseated_count']} without a seat, {plan['clashes']} clashes")
+    print(f"Planned in {report['seconds']}s")
+
+# Exports
+# Downloads are generators fed by server-side cursors (``yield_per``), so only
+# one chunk of rows is in memory however large the table. CSV can be gzipped
+# on the fly; XLSX is written as a zip stream, a worksheet at a time.
+EXPORT_GZIP_LEVEL = 6
+XLSX_MAX_ROWS = 1048576  # per worksheet, header included
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+XLSX_ILLEGAL = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+XLSX_MAIN = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+XLSX_RELS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+XLSX_DOC_RELS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+def gzip_chunks(chunks, level=EXPORT_GZIP_LEVEL):
+    """Gzip a stream of text chunks as they arrive"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+class _ZipStream:
+    """Write-only file for zipfile; ``drain`` hands back what was written since the last call"""
+    def __init__(self):
+        self.parts = []
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.parts)
+        self.parts = []
+        return data
+
+def _xlsx_column(index):
+    """Spreadsheet column letters for a 0-based index"""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+def _xlsx_row(number, row, columns):
+    cells = []
+    for index, value in enumerate(row):
+        if value is None or value == '':
+            continue
+        while len(columns) <= index:
+            columns.append(_xlsx_column(len(columns)))
+        ref = f'{columns[index]}{number}'
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value):
+            cells.append(f'<c r="{ref}"><v>{value!r}</v></c>')
+        else:
+            text = xml_escape(XLSX_ILLEGAL.sub('', str(value)))
+            space = ' xml:space="preserve"' if text != text.strip() else ''
+            cells.append(f'<c r="{ref}" t="inlineStr"><is><t{space}>{text}</t></is></c>')
+    return f'<row r="{number}">{"".join(cells)}</row>'
+
+def xlsx_chunks(rows, title, sheet_rows=XLSX_MAX_ROWS, chunk_rows=EXPORT_CHUNK_ROWS):
+    """XLSX workbook bytes for rows (header first), a chunk of rows at a time.
+
+    Worksheets are zip members written through a deflate stream, so nothing
+    but the current chunk is held. Rows past a worksheet's limit start a new
+    worksheet under the same header; the workbook part listing the sheets is
+    written last, once their number is known.
+    """
+    rows = iter(rows)
+    header = next(rows, [])
+    columns = []
+    sink = _ZipStream()
+    with zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as workbook:
+        sheets = 0
+        row = next(rows, None)
+        while not sheets or row is not None:
+            sheets += 1
+            with workbook.open(f'xl/worksheets/sheet{sheets}.xml', 'w', force_zip64=True) as sheet:
+                pending = [f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                           f'<worksheet xmlns="{XLSX_MAIN}"><sheetData>', _xlsx_row(1, header, columns)]
+                number = 1
+                while row is not None and number < sheet_rows:
+                    number += 1
+                    pending.append(_xlsx_row(number, row, columns))
+                    if len(pending) >= chunk_rows:
+                        sheet.write(''.join(pending).encode('utf-8'))
+                        pending = []
+                        yield sink.drain()
+                    row = next(rows, None)
+                pending.append('</sheetData></worksheet>')
+                sheet.write(''.join(pending).encode('utf-8'))
+            yield sink.drain()
+
+        numbers = range(1, sheets + 1)
+        workbook.writestr('[Content_Types].xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            + ''.join(f'<Override PartName="/xl/worksheets/sheet{n}.xml" '
+                      'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                      for n in numbers)
+            + '</Types>'))
+        workbook.writestr('_rels/.rels', (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<Relationships xmlns="{XLSX_RELS}">'
+            f'<Relationship Id="rId1" Type="{XLSX_DOC_RELS}/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'))
+        workbook.writestr('xl/_rels/workbook.xml.rels', (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<Relationships xmlns="{XLSX_RELS}">'
+            + ''.join(f'<Relationship Id="rId{n}" Type="{XLSX_DOC_RELS}/worksheet" Target="worksheets/sheet{n}.xml"/>'
+                      for n in numbers)
+            + '</Relationships>'))
+        workbook.writestr('xl/workbook.xml', (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<workbook xmlns="{XLSX_MAIN}" xmlns:r="{XLSX_DOC_RELS}"><sheets>'
+            + ''.join(f'<sheet name="{xml_escape(title[:25])}{f" {n}" if n > 1 else ""}" sheetId="{n}" r:id="rId{n}"/>'
+                      for n in numbers)
+            + '</sheets></workbook>'))
+    yield sink.drain()
+
+def xlsx_response(rows, filename, title):
+    """Streamed XLSX download; ``rows`` is consumed while the response is sent"""
+    response = current_app.response_class(stream_with_context(xlsx_chunks(rows, title)), mimetype=XLSX_MIMETYPE)
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+def export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ', timespec='seconds')
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+def export_day(name):
+    """A YYYY-MM-DD filter argument as a date, or None when it is not given"""
+    value = request.args.get(name, '').strip()
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f'{name} must be YYYY-MM-DD')
+
+def export_between(column, start, end):
+    """Filters for a DateTime column falling on the days from ``start`` to ``end``"""
+    filters = []
+    if start:
+        filters.append(column >= datetime.combine(start, datetime.min.time()))
+    if end:
+        filters.append(column < datetime.combine(end + timedelta(days=1), datetime.min.time()))
+    return filters
+
+def students_export():
+    """Students, filtered like the admissions and student pages: q (name or ID), course, year, status"""
+    filters = []
+    term = request.args.get('q', '').strip()
+    if term:
+        filters.append(db.or_(Student.name.ilike(f'%{term}%'), Student.student_id.ilike(f'%{term}%')))
+    for name in ('course', 'status'):
+        if request.args.get(name):
+            filters.append(getattr(Student, name) == request.args[name])
+    if request.args.get('year'):
+        try:
+            filters.append(Student.year == int(request.args['year']))
+        except ValueError:
+            raise ValueError('year must be a whole number')
+    columns = (Student.student_id, Student.name, Student.email, Student.phone, Student.course, Student.year,
+               Student.status, Student.admission_date, Student.gpa, Student.attendance_percentage)
+    return columns, filters, [Student.student_id]
+
+def fees_export():
+    """Fees, filtered like the fees page: q (student ID or receipt), status, fee_type, date, from, to"""
+    filters = []
+    term = request.args.get('q', '').strip()
+    if term:
+        filters.append(db.or_(Fee.student_id.ilike(f'%{term}%'), Fee.receipt_number.ilike(f'%{term}%')))
+    if request.args.get('status'):
+        filters.append(Fee.status == request.args['status'])
+    if request.args.get('fee_type'):
+        filters.append(db.func.lower(Fee.fee_type) == request.args['fee_type'].lower())
+    day = export_day('date')
+    filters += export_between(Fee.payment_date, day or export_day('from'), day or export_day('to'))
+    columns = (Fee.receipt_number, Fee.student_id, Fee.fee_type, Fee.amount, Fee.status, Fee.payment_date)
+    return columns, filters, [Fee.payment_date.desc(), Fee.id.desc()]
+
+def attendance_export():
+    """Attendance, newest first: student_id, subject, status, from, to"""
+    filters = []
+    for name in ('student_id', 'subject', 'status'):
+        if request.args.get(name):
+            filters.append(getattr(Attendance, name) == request.args[name])
+    start, end = export_day('from'), export_day('to')
+    if start:
+        filters.append(Attendance.date >= start)
+    if end:
+        filters.append(Attendance.date <= end)
+    columns = (Attendance.date, Attendance.student_id, Attendance.subject, Attendance.status)
+    return columns, filters, [Attendance.date.desc(), Attendance.id.desc()]
+
+def applications_export():
+    """Applications, filtered like the applications page: q (name or email), status, course"""
+    filters = []
+    term = request.args.get('q', '').strip()
+    if term:
+        full_name = Application.first_name + ' ' + Application.last_name
+        filters.append(db.or_(full_name.ilike(f'%{term}%'), Application.email.ilike(f'%{term}%')))
+    for name in ('status', 'course'):
+        if request.args.get(name):
+            filters.append(getattr(Application, name) == request.args[name])
+    columns = (Application.id, Application.first_name, Application.last_name, Application.email,
+               Application.phone, Application.course, Application.qualification, Application.marks,
+               Application.entrance_score, Application.status, Application.submitted_at, Application.reviewed_at)
+    return columns, filters, [Application.submitted_at.desc(), Application.id.desc()]
+
+EXPORTS = {
+    'students': students_export,
+    'fees': fees_export,
+    'attendance': attendance_export,
+    'applications': applications_export
+}
+
+def export_rows(columns, filters, order_by):
+    """Header and rows for an export, read from a server-side cursor a chunk at a time"""
+    yield [column.key for column in columns]
+    query = db.session.query(*columns).filter(*filters).order_by(*order_by)
+    # Only date columns need converting; other values go to the writer as they are
+    dates = [i for i, column in enumerate(columns) if isinstance(column.type, (db.Date, db.DateTime))]
+    for row in query.yield_per(EXPORT_CHUNK_ROWS):
+        if dates:
+            row = list(row)
+            for i in dates:
+                if row[i] is not None:
+                    row[i] = export_value(row[i])
+        yield row
+
+@admin_bp.route('/admin/exports/<dataset>.<any(csv, xlsx):fmt>')
+@admin_required
+def export(dataset, fmt):
+    if dataset not in EXPORTS:
+        abort(404)
+    gzip = request.args.get('gzip') in ('1', 'true')
+    if gzip and fmt == 'xlsx':
+        return jsonify({'error': 'XLSX files are already compressed; use gzip with CSV'}), 400
+    try:
+        columns, filters, order_by = EXPORTS[dataset]()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    filename = f'{dataset}_{date.today().isoformat()}.{fmt}'
+    current_app.logger.info('Exporting %s as %s', dataset, fmt)
+    rows = export_rows(columns, filters, order_by)
+    if fmt == 'xlsx':
+        return xlsx_response(rows, filename, dataset.title())
+    return csv_response(rows, filename, gzip=gzip)
+
+@admin_bp.route('/exams')
 @admin_required
 def exams():
     exams = Exam.query.all()
     return render_template('exams.html', exams=exams)
 
-@app.route('/attendance')
+@main_bp.route('/attendance')
 @login_required
 def attendance():
     # Admin view - show all attendance records
@@ -596,13 +2013,399 @@ def attendance():
         attendance_records = Attendance.query.filter_by(student_id=student_id).order_by(Attendance.date.desc()).all()
         return render_template('attendance.html', attendance=attendance_records, student_view=True)
 
-@app.route('/timetable')
+# Timetable engine
+# Slots are stored as free text ("09:00-10:00", "2pm - 3pm"), so they are parsed
+# into minutes of the week first. Clashes are then found with one sort and a
+# heap sweep per teacher, room and class (year and section), and the generator
+# places lessons on bitmasks of busy periods.
+TIMETABLE_DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+TIMETABLE_PERIODS = ['09:00-10:00', '10:00-11:00', '11:00-12:00', '12:00-13:00',
+                     '14:00-15:00', '15:00-16:00', '16:00-17:00']
+WEEKDAYS = TIMETABLE_DAYS + ['Sunday']
+WEEKDAY_INDEX = {day[:3].lower(): i for i, day in enumerate(WEEKDAYS)}
+TIME_SLOT_PATTERN = re.compile(
+    r'^\s*(\d{1,2})(?:[:.](\d{2}))?\s*([ap])?\.?m?\.?\s*(?:-|–|—|to)\s*(\d{1,2})(?:[:.](\d{2}))?\s*([ap])?\.?m?\.?\s*$',
+    re.IGNORECASE
+)
+# Clock hours below this without am/pm are afternoon hours ("2-3" is 14:00-15:00)
+TIMETABLE_AFTERNOON_BEFORE = 8
+# Repair moves tried per lesson the greedy pass could not place
+TIMETABLE_REPAIR_TRIES = 200
+
+@functools.lru_cache(maxsize=256)
+def parse_day(text):
+    """Day of the week from a name or abbreviation, Monday being 0"""
+    day = WEEKDAY_INDEX.get((text or '').strip()[:3].lower())
+    if day is None:
+        raise ValueError(f'Unknown day {text!r}')
+    return day
+
+def _clock_minutes(hour, minute, meridiem):
+    hour = int(hour)
+    if meridiem:
+        hour = hour % 12 + (12 if meridiem.lower() == 'p' else 0)
+    elif hour < TIMETABLE_AFTERNOON_BEFORE:
+        hour += 12
+    return hour * 60 + int(minute or 0)
+
+# A timetable uses a handful of distinct slot strings, so each is parsed once
+@functools.lru_cache(maxsize=1024)
+def parse_time_slot(text):
+    """(start, end) minutes after midnight from "09:00-10:00", "9.30 to 10.30", "2pm-3pm" and the like"""
+    match = TIME_SLOT_PATTERN.match(text or '')
+    if not match:
+        raise ValueError(f'Unreadable time slot {text!r}')
+    start_hour, start_minute, start_meridiem, end_hour, end_minute, end_meridiem = match.groups()
+    # "11-12pm" and "10:30-11:30 am": a single am/pm covers both ends
+    if end_meridiem and not start_meridiem and int(start_hour) % 12 <= int(end_hour) % 12:
+        start_meridiem = end_meridiem
+    start = _clock_minutes(start_hour, start_minute, start_meridiem)
+    end = _clock_minutes(end_hour, end_minute, end_meridiem)
+    if not start < end <= 24 * 60:
+        raise ValueError(f'Time slot {text!r} does not end after it starts')
+    return start, end
+
+def timetable_interval(day, time_slot):
+    """(start, end) minutes of the week for a day and time slot"""
+    start, end = parse_time_slot(time_slot)
+    offset = parse_day(day) * 24 * 60
+    return offset + start, offset + end
+
+def _resource_key(value):
+    return ' '.join(str(value).split()).casefold()
+
+def timetable_clashes(entries):
+    """Double bookings among entries of (id, day, time_slot, teacher, room, year, section).
+
+    Returns (clashes, invalid): each clash names the kind (teacher, room or
+    class), the shared resource, the overlapping minutes of the week and the
+    two entry ids; invalid lists entries whose day or slot cannot be parsed.
+    Each resource's intervals are sorted once and swept with a heap of the
+    ones still running, so the work is O(n log n) plus one step per clash.
+    """
+    by_resource = {}
+    invalid = []
+    for entry_id, day, time_slot, teacher, room, year, section in entries:
+        try:
+            start, end = timetable_interval(day, time_slot)
+        except ValueError as e:
+            invalid.append({'id': entry_id, 'error': str(e)})
+            continue
+        for key in (('teacher', _resource_key(teacher)), ('room', _resource_key(room)),
+                    ('class', f'{year}-{_resource_key(section or "A")}')):
+            by_resource.setdefault(key, []).append((start, end, entry_id))
+
+    clashes = []
+    for (kind, resource), intervals in by_resource.items():
+        if len(intervals) < 2:
+            continue
+        intervals.sort()
+        running = []  # heap of (end, start, id) still in progress
+        for start, end, entry_id in intervals:
+            while running and running[0][0] <= start:
+                heapq.heappop(running)
+            day, minute = divmod(start, 24 * 60)
+            for other_end, _, other_id in running:
+                clashes.append({
+                    'kind': kind, 'resource': resource, 'day': WEEKDAYS[day], 'start': minute,
+                    'end': min(end, other_end) - day * 24 * 60, 'entries': [other_id, entry_id]
+                })
+            heapq.heappush(running, (end, start, entry_id))
+    clashes.sort(key=lambda clash: (clash['kind'], clash['resource'], WEEKDAYS.index(clash['day']), clash['start']))
+    return clashes, invalid
+
+def find_timetable_clashes():
+    """timetable_clashes() over the current organization's timetable"""
+    rows = db.session.query(Timetable.id, Timetable.day, Timetable.time_slot, Timetable.teacher,
+                            Timetable.room, Timetable.year, Timetable.section)
+    return timetable_clashes(rows.yield_per(10000))
+
+def generate_timetable(requirements, rooms, days=TIMETABLE_DAYS, periods=TIMETABLE_PERIODS, seed=0):
+    """Place weekly lessons so no class, teacher or room is double-booked.
+
+    ``requirements`` are dicts with year, section, subject, teacher and
+    sessions (lessons a week). Lessons are placed greedily, hardest first
+    (busiest teacher and class), each in the free period that spreads its
+    subject over the most days. A lesson with no free period is placed by
+    moving one blocking lesson of its teacher to another period. Returns
+    (rows ready for Timetable, lessons that could not be placed).
+    """
+    rng = random.Random(seed)
+    slots = [(day, period) for day in range(len(days)) for period in range(len(periods))]
+    rooms = list(rooms)
+    teacher_load, class_load = {}, {}
+    lessons = []
+    for requirement in requirements:
+        teacher = requirement['teacher']
+        group = (requirement['year'], requirement.get('section') or 'A')
+        sessions = int(requirement.get('sessions', 1))
+        teacher_load[teacher] = teacher_load.get(teacher, 0) + sessions
+        class_load[group] = class_load.get(group, 0) + sessions
+        lessons.extend((group, requirement['subject'], teacher) for _ in range(sessions))
+    rng.shuffle(lessons)
+    lessons.sort(key=lambda lesson: -(teacher_load[lesson[2]] + class_load[lesson[0]]))
+
+    # Busy periods as bits, and the rooms still free in each period
+    teacher_busy, class_busy, subject_days = {}, {}, {}
+    free_rooms = [rooms[:] for _ in slots]
+    for free in free_rooms:
+        rng.shuffle(free)
+    placed = {}  # slot -> {teacher: (class, subject, room)}
+
+    def fits(slot, group, teacher):
+        bit = 1 << slot
+        return free_rooms[slot] and not (teacher_busy.get(teacher, 0) & bit) and not (class_busy.get(group, 0) & bit)
+
+    def place(slot, group, subject, teacher):
+        bit = 1 << slot
+        teacher_busy[teacher] = teacher_busy.get(teacher, 0) | bit
+        class_busy[group] = class_busy.get(group, 0) | bit
+        day_key = (group, subject)
+        subject_days[day_key] = subject_days.get(day_key, 0) + (1 << (slot // len(periods)) * 8)
+        placed.setdefault(slot, {})[teacher] = (group, subject, free_rooms[slot].pop())
+
+    def unplace(slot, teacher):
+        group, subject, room = placed[slot].pop(teacher)
+        bit = 1 << slot
+        teacher_busy[teacher] &= ~bit
+        class_busy[group] &= ~bit
+        subject_days[(group, subject)] -= 1 << (slot // len(periods)) * 8
+        free_rooms[slot].append(room)
+        return group, subject
+
+    def lessons_on_day(group, subject, slot):
+        return (subject_days.get((group, subject), 0) >> (slot // len(periods)) * 8) & 0xff
+
+    unplaced = []
+    for group, subject, teacher in lessons:
+        candidates = [slot for slot in range(len(slots)) if fits(slot, group, teacher)]
+        if candidates:
+            # Fewest lessons of this subject that day, then the emptiest period
+            slot = min(candidates, key=lambda s: (lessons_on_day(group, subject, s), -len(free_rooms[s]), s))
+            place(slot, group, subject, teacher)
+            continue
+
+        # Repair: free a period the class has open by moving the teacher's lesson there elsewhere
+        repaired = False
+        open_slots = [slot for slot in range(len(slots)) if not class_busy.get(group, 0) & (1 << slot)]
+        rng.shuffle(open_slots)
+        for slot in open_slots[:TIMETABLE_REPAIR_TRIES]:
+            if teacher not in placed.get(slot, {}):
+                continue
+            # The freed room goes back on top of the slot's free list, so it is reused either way
+            other_group, other_subject = unplace(slot, teacher)
+            moves = [s for s in range(len(slots)) if s != slot and fits(s, other_group, teacher)]
+            if moves:
+                place(rng.choice(moves), other_group, other_subject, teacher)
+                place(slot, group, subject, teacher)
+                repaired = True
+                break
+            place(slot, other_group, other_subject, teacher)
+        if not repaired:
+            unplaced.append({'year': group[0], 'section': group[1], 'subject': subject, 'teacher': teacher})
+
+    rows = [{
+        'day': days[slot // len(periods)], 'time_slot': periods[slot % len(periods)], 'subject': subject,
+        'teacher': teacher, 'room': room, 'year': group[0], 'section': group[1]
+    } for slot in sorted(placed) for teacher, (group, subject, room) in placed[slot].items()]
+    return rows, unplaced
+
+def timetable_requirements():
+    """Weekly lessons in the current timetable, as generate_timetable() requirements, and its rooms"""
+    requirements = [{'year': year, 'section': section, 'subject': subject, 'teacher': teacher, 'sessions': sessions}
+                    for year, section, subject, teacher, sessions in db.session.query(
+                        Timetable.year, Timetable.section, Timetable.subject, Timetable.teacher, db.func.count()
+                    ).group_by(Timetable.year, Timetable.section, Timetable.subject, Timetable.teacher)]
+    rooms = [room for (room,) in db.session.query(Timetable.room).distinct().order_by(Timetable.room)]
+    return requirements, rooms
+
+def replace_timetable(rows):
+    """Swap the current organization's timetable for ``rows`` (caller commits)"""
+    organization_id = current_tenant_id()
+    Timetable.query.delete(synchronize_session=False)
+    db.session.bulk_insert_mappings(Timetable, [dict(row, organization_id=organization_id) for row in rows])
+    # bulk_insert_mappings skips the flush hooks that bump data versions
+    bump_data_versions(db.session, {'timetable'})
+
+@main_bp.route('/api/timetable/clashes')
+def timetable_clashes_api():
+    if session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 401
+    clashes, invalid = find_timetable_clashes()
+    return jsonify({'clashes': clashes, 'invalid': invalid})
+
+@main_bp.route('/api/timetable/generate', methods=['POST'])
+def timetable_generate_api():
+    """Generate a clash-free timetable; without requirements, the current lessons are rescheduled"""
+    if session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 401
+    data = request.get_json(silent=True) or {}
+    requirements, rooms = timetable_requirements()
+    requirements = data.get('requirements') or requirements
+    rooms = data.get('rooms') or rooms
+    if not requirements or not rooms:
+        return jsonify({'error': 'Requirements and rooms are needed'}), 400
+    try:
+        start = time.perf_counter()
+        rows, unplaced = generate_timetable(requirements, rooms, seed=int(data.get('seed', 0)))
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({'error': f'Invalid requirements: {e}'}), 400
+    seconds = round(time.perf_counter() - start, 3)
+    # Never replace the timetable with one that drops lessons
+    applied = not unplaced and not data.get('dry_run')
+    if applied:
+        replace_timetable(rows)
+        db.session.commit()
+    return jsonify({'lessons': len(rows), 'unplaced': unplaced, 'applied': applied, 'seconds': seconds,
+                    'timetable': rows if data.get('dry_run') else None})
+
+@main_bp.cli.command('check-timetable')
+def check_timetable_command():
+    """List teacher, room and class double bookings in the timetable."""
+    clashes, invalid = find_timetable_clashes()
+    for entry in invalid:
+        print(f"Entry {entry['id']}: {entry['error']}")
+    for clash in clashes:
+        print(f"{clash['kind']} {clash['resource']}: {clash['day']} "
+              f"{clash['start'] // 60:02d}:{clash['start'] % 60:02d}-{clash['end'] // 60:02d}:{clash['end'] % 60:02d}, "
+              f"entries {clash['entries'][0]} and {clash['entries'][1]}")
+    print(f'{len(clashes)} clashes, {len(invalid)} unreadable entries')
+
+# Timetable views
+# Each class's week grid is built once per timetable data version and kept per
+# process. "Now" and "next" come from a bisect over the week's lesson
+# boundaries, and the answer only changes at a boundary, so pollers get 304s.
+WEEK_MINUTES = 7 * 24 * 60
+
+def format_time_slot(start, end):
+    return f'{start // 60:02d}:{start % 60:02d}-{end // 60:02d}:{end % 60:02d}'
+
+class TimetableWeek:
+    """One class's lessons as a week grid in day and time order, with a now/next lookup"""
+
+    def __init__(self, rows, year=None, section=None):
+        self.year = year
+        self.section = section
+        # Standard periods always get a row; other slots get one in time order
+        labels = {parse_time_slot(period): period for period in TIMETABLE_PERIODS}
+        lessons = []
+        for row in rows:
+            try:
+                start, end = timetable_interval(row.day, row.time_slot)
+            except ValueError:
+                continue  # check-timetable reports these
+            day, minute = divmod(start, 24 * 60)
+            times = (minute, end - day * 24 * 60)
+            period = labels.setdefault(times, format_time_slot(*times))
+            lessons.append((start, end, {
+                'id': row.id, 'day': WEEKDAYS[day], 'period': period, 'time_slot': row.time_slot,
+                'subject': row.subject, 'teacher': row.teacher, 'room': row.room,
+                'year': row.year, 'section': row.section or 'A'
+            }))
+        lessons.sort(key=lambda lesson: (lesson[0], lesson[1], lesson[2]['id']))
+        self.lessons = [lesson for _, _, lesson in lessons]
+
+        self.days = TIMETABLE_DAYS + (['Sunday'] if any(start >= 6 * 24 * 60 for start, _, _ in lessons) else [])
+        cells = {}
+        for start, _, lesson in lessons:
+            cells.setdefault((lesson['period'], lesson['day']), []).append(lesson)
+        self.rows = [{'time_slot': label, 'cells': [cells.get((label, day), []) for day in self.days]}
+                     for _, label in sorted(labels.items())]
+
+        # The week cut at every lesson start and end, with the lessons running in each piece
+        self.starts = [start for start, _, _ in lessons]
+        self.boundaries = sorted({start for start, _, _ in lessons} | {end for _, end, _ in lessons})
+        starting = {}
+        ending = {}
+        for start, end, lesson in lessons:
+            starting.setdefault(start, []).append(lesson)
+            ending.setdefault(end, set()).add(lesson['id'])
+        running = []
+        self.running = []
+        for boundary in self.boundaries:
+            running = [lesson for lesson in running if lesson['id'] not in ending.get(boundary, ())]
+            running += starting.get(boundary, [])
+            self.running.append(tuple(running))
+
+    def at(self, minute):
+        """(piece of the week, lessons running, next lesson, minute the answer changes) at a minute of the week"""
+        if not self.lessons:
+            return None, (), None, None
+        piece = bisect.bisect_right(self.boundaries, minute) - 1
+        upcoming = bisect.bisect_right(self.starts, minute)
+        # After the week's last lesson, the next one is the first of next week
+        following = self.lessons[upcoming % len(self.lessons)]
+        if piece < 0 or piece == len(self.boundaries) - 1:
+            changes_at = self.boundaries[0] + (WEEK_MINUTES if piece >= 0 else 0)
+            return None, (), following, changes_at
+        return piece, self.running[piece], following, self.boundaries[piece + 1]
+
+# Bounded like the fragment cache: year and section come from the query string
+_timetable_weeks = FragmentCache()
+
+def timetable_week(year=None, section=None):
+    """Cached TimetableWeek of a year (and section), or the whole timetable; rebuilt when it changes"""
+    key = (str(db.engine.url), current_tenant_id(), year, section, data_version('timetable'))
+
+    def build():
+        query = db.session.query(Timetable.id, Timetable.day, Timetable.time_slot, Timetable.subject,
+                                 Timetable.teacher, Timetable.room, Timetable.year, Timetable.section)
+        if year is not None:
+            query = query.filter(Timetable.year == year)
+        if section:
+            # Rows from before sections existed count as section A
+            query = query.filter(db.func.coalesce(Timetable.section, 'A') == section)
+        return TimetableWeek(query.all(), year, section)
+
+    return _timetable_weeks.get_or_render(key, build, current_app.config['TIMETABLE_CACHE_SIZE'])
+
+def timetable_filters():
+    """Year and section to show: a student's own year, otherwise the query string"""
+    year = request.args.get('year', type=int)
+    section = request.args.get('section') or None
+    if session.get('role') == 'student' and year is None:
+        user = User.query.get(session['user_id'])
+        student = Student.query.filter_by(email=user.email).first() if user else None
+        year = student.year if student else None
+    return year, section
+
+@main_bp.route('/timetable')
 @login_required
 def timetable():
-    timetable = Timetable.query.order_by(Timetable.day, Timetable.time_slot).all()
-    return render_template('timetable.html', timetable=timetable)
+    year, section = timetable_filters()
+    sections = [name for (name,) in db.session.query(db.func.coalesce(Timetable.section, 'A')).distinct().order_by(
+        db.func.coalesce(Timetable.section, 'A'))]
+    return render_template('timetable.html', week=timetable_week(year, section), sections=sections)
 
-@app.route('/analytics')
+@main_bp.route('/api/timetable/now')
+@login_required
+def timetable_now():
+    """Lessons running now and the next one; conditional GETs get a 304 until that changes"""
+    year, section = timetable_filters()
+    week = timetable_week(year, section)
+    now = datetime.now()
+    week_start = datetime.combine(now.date() - timedelta(days=now.weekday()), datetime.min.time())
+    piece, running, following, changes_at = week.at(int((now - week_start).total_seconds() // 60))
+
+    etag = hashlib.sha256(repr((data_version('timetable'), year, section, week_start, piece,
+                                following and following['id'])).encode()).hexdigest()[:16]
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = jsonify({
+            'year': year,
+            'section': section,
+            'now': list(running),
+            'next': following,
+            'changes_at': (week_start + timedelta(minutes=changes_at)).isoformat() if changes_at is not None else None
+        })
+    response.set_etag(etag)
+    # Browsers keep the answer but ask again on every poll
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+@admin_bp.route('/analytics')
 @admin_required
 def analytics():
     # Risk analysis data
@@ -619,12 +2422,12 @@ def analytics():
     
     return render_template('analytics.html', risk_data=risk_data)
 
-@app.route('/chatbot')
+@main_bp.route('/chatbot')
 @login_required
 def chatbot():
     return render_template('chatbot.html')
 
-@app.route('/api/chat', methods=['POST'])
+@main_bp.route('/api/chat', methods=['POST'])
 def chat_api():
     if 'user_id' not in session:
         return jsonify({'error': 'Unauthorized'}), 401
@@ -644,7 +2447,7 @@ def chat_api():
         # Get real-time data for admin
         total_students = Student.query.count()
         pending_applications = Application.query.filter_by(status='pending').count()
-        total_revenue = db.session.query(db.func.sum(Fee.amount)).filter_by(status='paid').scalar() or 0
+        total_revenue = revenue_total()
         
         responses = {
             'dashboard': f'Your admin dashboard shows real-time statistics: {total_students} students, {pending_applications} pending applications, and ₹{total_revenue:,.2f} total revenue.',
@@ -663,9 +2466,10 @@ def chat_api():
         student_data = {}
         if student:
             student_data = {
-                'attendance': student.attendance,
+                'attendance': student.attendance_percentage,
                 'gpa': student.gpa,
-                'fees_paid': student.total_fees_paid,
+                'fees_paid': db.session.query(db.func.coalesce(db.func.sum(Fee.amount), 0))
+                    .filter(Fee.student_id == student.student_id).scalar(),
                 'course': student.course,
                 'name': student.name
             }
@@ -742,7 +2546,7 @@ def chat_api():
     
     return jsonify({'response': response})
 
-@app.route('/api/dashboard_data')
+@main_bp.route('/api/dashboard_data')
 def dashboard_data():
     if 'user_id' not in session:
         return jsonify({'error': 'Unauthorized'}), 401
@@ -751,7 +2555,7 @@ def dashboard_data():
     data = {
         'total_students': Student.query.count(),
         'active_students': Student.query.filter_by(status='active').count(),
-        'total_revenue': db.session.query(db.func.sum(Fee.amount)).scalar() or 0,
+        'total_revenue': revenue_total(),
         'hostel_occupancy': db.session.query(db.func.sum(Hostel.occupied)).scalar() or 0,
         'total_capacity': db.session.query(db.func.sum(Hostel.capacity)).scalar() or 1,
         'high_risk_students': Student.query.filter(Student.risk_score > 0.7).count()
@@ -759,13 +2563,61 @@ def dashboard_data():
     
     return jsonify(data)
 
+@main_bp.route('/api/revenue_trend')
+def revenue_trend():
+    if session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 401
+
+    granularity = request.args.get('granularity', 'month')
+    group_by = request.args.get('group_by', 'fee_type')
+    periods = min(max(request.args.get('periods', 12, type=int), 1), 366)
+    if granularity not in REVENUE_GRANULARITIES or group_by not in ('fee_type', 'course'):
+        return jsonify({'error': 'Invalid granularity or group_by'}), 400
+
+    # Work out the first bucket of the requested window
+    today = datetime.utcnow().date()
+    if granularity == 'day':
+        start = today - timedelta(days=periods - 1)
+    else:
+        month_index = today.year * 12 + today.month - 1 - (periods - 1)
+        start = date(month_index // 12, month_index % 12 + 1, 1)
+
+    dimension = getattr(RevenueRollup, group_by)
+    rows = db.session.query(
+        RevenueRollup.bucket_date, dimension,
+        db.func.sum(RevenueRollup.total_amount), db.func.sum(RevenueRollup.payment_count)
+    ).filter(
+        RevenueRollup.granularity == granularity,
+        RevenueRollup.bucket_date >= start
+    ).group_by(RevenueRollup.bucket_date, dimension).order_by(RevenueRollup.bucket_date).all()
+
+    series = {}
+    for bucket_date, key, total, count in rows:
+        series.setdefault(key, []).append({
+            'bucket': bucket_date.isoformat(),
+            'total': total or 0,
+            'count': count or 0
+        })
+
+    return jsonify({
+        'granularity': granularity,
+        'group_by': group_by,
+        'start': start.isoformat(),
+        'series': series
+    })
+
 # Organization Selection Route
-@app.route('/organization_selection')
+@main_bp.route('/organization_selection')
 def organization_selection():
     if 'user_id' not in session:
-        return redirect(url_for('login'))
+        return redirect(url_for('main.login'))
     
-    # Get real organizations from database
+    # Serve the pre-rendered list until an organization or its counters change
+    version = organization_page_version()
+    cached = _organization_page.get('entry')
+    if cached and cached[0] == version:
+        return cached[1]
+
     organizations = Organization.query.filter_by(is_active=True).all()
     
     # Format organizations for template
@@ -777,14 +2629,17 @@ def organization_selection():
             'code': org.code,
             'description': org.description,
             'location': org.location,
-            'students': random.randint(5000, 20000),  # Simulated student count
-            'courses': random.randint(10, 50)  # Simulated course count
+            'student_count': org.student_count or 0,
+            'course_count': org.course_count or 0,
+            'open_seats': max(org.seat_capacity - (org.student_count or 0), 0) if org.seat_capacity else None
         })
     
-    return render_template('organization_selection.html', organizations=formatted_orgs)
+    html = render_template('organization_selection.html', organizations=formatted_orgs)
+    _organization_page['entry'] = (version, html)
+    return html
 
 # Student Portal Routes
-@app.route('/student_portal')
+@student_bp.route('/student_portal')
 @student_required
 def student_portal():
     try:
@@ -797,7 +2652,7 @@ def student_portal():
             try:
                 # Create a default student record if none exists
                 student = Student(
-                    student_id=f"STU{datetime.now().strftime('%Y%m%d')}{random.randint(1000, 9999)}",
+                    student_id=next_student_id(),
                     name=user.username,
                     email=user.email,
                     phone="+91 98765 43210",
@@ -807,13 +2662,15 @@ def student_portal():
                     attendance_percentage=95.0
                 )
                 db.session.add(student)
+                db.session.flush()
+                refresh_organization_stats([student.organization_id])
                 db.session.commit()
-                app.logger.info(f'Created new student record for user {user.email}')
+                current_app.logger.info('Created new student record for user %s', user.email)
             except Exception as e:
                 db.session.rollback()
-                app.logger.error(f'Error creating student record: {str(e)}\n{traceback.format_exc()}')
+                current_app.logger.error('Error creating student record: %s', e, exc_info=True)
                 flash('Error creating student profile. Please contact support.')
-                return redirect(url_for('login'))
+                return redirect(url_for('main.login'))
         
         # Initialize statistics
         total_fees_paid = 0
@@ -829,7 +2686,7 @@ def student_portal():
             total_fees_paid = db.session.query(db.func.sum(Fee.amount)).filter_by(student_id=student.student_id).scalar() or 0
             recent_payments = Fee.query.filter_by(student_id=student.student_id).order_by(Fee.payment_date.desc()).limit(3).all()
         except Exception as e:
-            app.logger.error(f'Error calculating fees: {str(e)}')
+            current_app.logger.error('Error calculating fees: %s', e)
             stats_errors.append('fees')
             # Initialize default values
             current_attendance = 0
@@ -848,7 +2705,7 @@ def student_portal():
             else:
                 current_attendance = 100  # Default for new students
         except Exception as e:
-            app.logger.error(f'Error calculating attendance: {str(e)}')
+            current_app.logger.error('Error calculating attendance: %s', e)
             stats_errors.append('attendance')
             current_attendance = 0
 
@@ -861,7 +2718,7 @@ def student_portal():
             else:
                 current_gpa = 0
         except Exception as e:
-            app.logger.error(f'Error calculating GPA: {str(e)}')
+            current_app.logger.error('Error calculating GPA: %s', e)
             stats_errors.append('GPA')
             current_gpa = 0
 
@@ -877,7 +2734,7 @@ def student_portal():
             if exam_records and len(exam_records) >= 5:
                 achievements += 1
         except Exception as e:
-            app.logger.error(f'Error calculating achievements: {str(e)}')
+            current_app.logger.error('Error calculating achievements: %s', e)
             stats_errors.append('achievements')
             achievements = 0
 
@@ -885,7 +2742,7 @@ def student_portal():
         try:
             points = int(current_attendance * 10 + current_gpa * 100 + total_fees_paid / 100)
         except Exception as e:
-            app.logger.error(f'Error calculating points: {str(e)}')
+            current_app.logger.error('Error calculating points: %s', e)
             stats_errors.append('points')
             points = 0
 
@@ -904,13 +2761,14 @@ def student_portal():
             'points': points,
             'achievements': achievements,
             'recent_payments': recent_payments,
-            'total_fees_paid': total_fees_paid
+            'total_fees_paid': total_fees_paid,
+            'risk_score': student.risk_score or 0
         }
         
         return render_template('student_portal.html', student=student_data)
 
     except Exception as e:
-        app.logger.error(f'Error calculating student statistics: {str(e)}\n{traceback.format_exc()}')
+        current_app.logger.error('Error calculating student statistics: %s', e, exc_info=True)
         # Return basic student data if statistics calculation fails
         student_data = {
             'name': student.name,
@@ -922,13 +2780,15 @@ def student_portal():
             'points': 0,
             'achievements': 0,
             'recent_payments': [],
-            'total_fees_paid': 0
+            'total_fees_paid': 0,
+            'risk_score': student.risk_score or 0
         }
         flash('Some student statistics are temporarily unavailable')
-        return render_template('student_portal.html', student=student_data)    except Exception as e:
-        app.logger.error(f'Error in student portal: {str(e)}\n{traceback.format_exc()}')
+        return render_template('student_portal.html', student=student_data)
+    except Exception as e:
+        current_app.logger.error('Error in student portal: %s', e, exc_info=True)
         flash('An error occurred while loading the student portal. Please try again.')
-        return redirect(url_for('login'))
+        return redirect(url_for('main.login'))
     
     # Calculate real-time statistics
     total_fees_paid = db.session.query(db.func.sum(Fee.amount)).filter_by(student_id=student.student_id).scalar() or 0
@@ -986,6 +2846,8 @@ def allowed_file(filename, allowed_extensions):
 
 def send_confirmation_email(application):
     """Send confirmation email to applicant"""
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
     try:
         subject = f"Application Received - {application.organization}"
         
@@ -1019,16 +2881,16 @@ def send_confirmation_email(application):
         # Configure this in production with actual SMTP settings
         return True
     except Exception as e:
-        app.logger.error(f"Error sending confirmation email: {str(e)}")
+        current_app.logger.error("Error sending confirmation email: %s", e)
         return False
 
-@app.route('/student/apply', methods=['GET', 'POST'])
+@student_bp.route('/student/apply', methods=['GET', 'POST'])
 @student_required
 def student_application():
     if request.method == 'POST':
-        app.logger.info('Starting application submission process')
-        app.logger.debug(f'Form data: {request.form}')
-        app.logger.debug(f'Files: {request.files}')
+        # Field names only: the form carries applicants' personal details
+        current_app.logger.info('Starting application submission for user %s', session.get('user_id'))
+        current_app.logger.debug('Form fields: %s; files: %s', sorted(request.form), sorted(request.files))
         try:
             # Validate file sizes before processing
             max_file_size = 5 * 1024 * 1024  # 5MB max per file
@@ -1070,6 +2932,7 @@ def student_application():
             org = Organization.query.filter_by(code=org_code).first()
             if org:
                 organization = org.name
+                g.tenant_id = session['organization_id'] = org.id
             
             # Validate required form fields
             required_form_fields = ['first_name', 'last_name', 'email', 'phone', 
@@ -1112,17 +2975,13 @@ def student_application():
 
             # Create application record with full error checking
             try:
-                app.logger.debug('Creating application record with data:')
-                app.logger.debug(f'User ID: {session.get("user_id")}')
-                app.logger.debug(f'Organization: {organization}')
-                app.logger.debug('Form data validation started')
+                current_app.logger.debug('Creating application record for organization %s', organization)
                 
                 # Validate and convert date of birth
                 try:
                     dob = datetime.strptime(request.form['date_of_birth'], '%Y-%m-%d').date()
-                    app.logger.debug(f'Parsed DOB: {dob}')
                 except (ValueError, KeyError) as e:
-                    app.logger.error(f'DOB parsing error: {str(e)}')
+                    current_app.logger.error('DOB parsing error: %s', e)
                     return jsonify({
                         'success': False,
                         'message': 'Invalid date of birth format. Please use YYYY-MM-DD format.',
@@ -1132,6 +2991,7 @@ def student_application():
                 application = Application(
                     user_id=session['user_id'],
                     organization=organization,
+                    organization_id=org.id if org else None,
                     first_name=request.form['first_name'].strip(),
                     last_name=request.form['last_name'].strip(),
                     email=request.form['email'].strip(),
@@ -1149,25 +3009,24 @@ def student_application():
                     submitted_at=datetime.utcnow()
                 )
                 
-                app.logger.info('Application record created successfully')
-                app.logger.debug(f'Application data: {application.__dict__}')
+                current_app.logger.info('Application record created successfully')
                 
             except KeyError as ke:
-                app.logger.error(f'Missing form field: {str(ke)}')
+                current_app.logger.error('Missing form field: %s', ke)
                 return jsonify({
                     'success': False,
                     'message': f'Missing required field: {str(ke)}',
                     'error_type': 'validation_error'
                 }), 400
             except (ValueError, TypeError) as ve:
-                app.logger.error(f'Data validation error: {str(ve)}')
+                current_app.logger.error('Data validation error: %s', ve)
                 return jsonify({
                     'success': False,
                     'message': f'Invalid data format: {str(ve)}',
                     'error_type': 'validation_error'
                 }), 400
             except Exception as e:
-                app.logger.error(f'Unexpected error creating application: {str(e)}\\n{traceback.format_exc()}')
+                current_app.logger.error('Unexpected error creating application: %s', e, exc_info=True)
                 return jsonify({
                     'success': False,
                     'message': 'An unexpected error occurred while creating your application.',
@@ -1184,8 +3043,8 @@ def student_application():
             upload_errors = []
             
             # Ensure upload directory exists
-            if not os.path.exists(app.config['UPLOAD_FOLDER']):
-                os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+            if not os.path.exists(current_app.config['UPLOAD_FOLDER']):
+                os.makedirs(current_app.config['UPLOAD_FOLDER'], exist_ok=True)
             
             for field_name in document_fields:
                 if field_name in request.files:
@@ -1203,7 +3062,7 @@ def student_application():
                                 
                                 filename = secure_filename(file.filename)
                                 unique_filename = f"{application.id}_{field_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{filename}"
-                                file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
+                                file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], unique_filename)
                                 
                                 # Ensure directory exists again (in case it was deleted)
                                 os.makedirs(os.path.dirname(file_path), exist_ok=True)
@@ -1212,7 +3071,7 @@ def student_application():
                                 try:
                                     file.save(file_path)
                                 except Exception as e:
-                                    app.logger.error(f"Error saving file {filename}: {str(e)}")
+                                    current_app.logger.error("Error saving file %s: %s", filename, e)
                                     upload_errors.append(f'Error saving file {filename}')
                                     continue
                                 
@@ -1235,7 +3094,7 @@ def student_application():
                                 db.session.add(document)
                                 
                             except Exception as e:
-                                app.logger.error(f"Error processing file {file.filename}: {str(e)}")
+                                current_app.logger.error("Error processing file %s: %s", file.filename, e)
                                 upload_errors.append(f'Error processing file {file.filename}')
                                 continue
             
@@ -1246,7 +3105,7 @@ def student_application():
                         if os.path.exists(doc.file_path):
                             os.remove(doc.file_path)
                     except Exception as e:
-                        app.logger.error(f"Error cleaning up file {doc.file_path}: {str(e)}")
+                        current_app.logger.error("Error cleaning up file %s: %s", doc.file_path, e)
                 
                 db.session.rollback()
                 return jsonify({
@@ -1266,11 +3125,16 @@ def student_application():
                 
                 db.session.commit()
                 
+                # Pre-generate previews for image documents off the request thread
+                for document in application.documents:
+                    if document.filename.rsplit('.', 1)[-1].lower() in THUMBNAIL_EXTENSIONS:
+                        queue_thumbnail(document.file_path)
+                
                 # Send confirmation email (in background)
                 try:
                     send_confirmation_email(application)
                 except Exception as e:
-                    app.logger.error(f"Error sending confirmation email: {str(e)}")
+                    current_app.logger.error("Error sending confirmation email: %s", e)
                 
                 return jsonify({
                     'success': True,
@@ -1284,10 +3148,10 @@ def student_application():
                         if os.path.exists(doc.file_path):
                             os.remove(doc.file_path)
                     except Exception as cleanup_error:
-                        app.logger.error(f"Error cleaning up file {doc.file_path}: {str(cleanup_error)}")
+                        current_app.logger.error("Error cleaning up file %s: %s", doc.file_path, cleanup_error)
                 
                 db.session.rollback()
-                app.logger.error(f"Error committing to database: {str(e)}")
+                current_app.logger.error("Error committing to database: %s", e)
                 return jsonify({
                     'success': False,
                     'message': 'Error saving application to database. Please try again.',
@@ -1295,7 +3159,7 @@ def student_application():
                 }), 500
             
         except Exception as e:
-            app.logger.error(f"Error in student application: {str(e)}")
+            current_app.logger.error("Error in student application: %s", e)
             if 'db' in locals():
                 db.session.rollback()
             return jsonify({
@@ -1309,7 +3173,7 @@ def student_application():
 def allowed_file(filename, allowed_extensions):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in allowed_extensions
 
-@app.route('/student/fees')
+@student_bp.route('/student/fees')
 @student_required
 def student_fees():
     # Get student fee data
@@ -1317,12 +3181,12 @@ def student_fees():
     fees = Fee.query.filter_by(student_id=student_id).all()
     return render_template('pay_fee.html', fees=fees, student_view=True)
 
-@app.route('/payment_gateway')
+@main_bp.route('/payment_gateway')
 @login_required
 def payment_gateway():
     return render_template('payment_gateway.html')
 
-@app.route('/student/hostel')
+@hostel_bp.route('/student/hostel')
 @student_required
 def student_hostel():
     # Get student hostel allocation
@@ -1339,37 +3203,37 @@ def student_hostel():
     
     return render_template('hostel.html', rooms=rooms, student_room=student_room, student_view=True)
 
-@app.route('/hostel_selection')
+@hostel_bp.route('/hostel_selection')
 @student_required
 def hostel_selection():
     return render_template('hostel_selection.html')
 
-@app.route('/student/exams')
+@student_bp.route('/student/exams')
 @student_required
 def student_exams():
     student_id = 'STU2024001'  # In real app, get from session
     exams = Exam.query.filter_by(student_id=student_id).all()
     return render_template('exams.html', exams=exams, student_view=True)
 
-@app.route('/student/timetable')
+@student_bp.route('/student/timetable')
 @student_required
 def student_timetable():
-    timetable = Timetable.query.order_by(Timetable.day, Timetable.time_slot).all()
-    return render_template('timetable.html', timetable=timetable, student_view=True)
+    year, section = timetable_filters()
+    return render_template('timetable.html', week=timetable_week(year, section), student_view=True)
 
-@app.route('/student/attendance')
+@student_bp.route('/student/attendance')
 @student_required
 def student_attendance():
     student_id = 'STU2024001'  # In real app, get from session
     attendance_records = Attendance.query.filter_by(student_id=student_id).order_by(Attendance.date.desc()).all()
     return render_template('attendance.html', attendance=attendance_records, student_view=True)
 
-@app.route('/student/chatbot')
+@student_bp.route('/student/chatbot')
 @student_required
 def student_chatbot():
     return render_template('chatbot.html', student_view=True)
 
-@app.route('/student/profile')
+@student_bp.route('/student/profile')
 @student_required
 def student_profile():
     # Get student profile data
@@ -1389,12 +3253,166 @@ def student_profile():
     
     return render_template('student_profile.html', student=student_data)
 
+# Document Routes
+THUMBNAIL_EXTENSIONS = {'jpg', 'jpeg', 'png'}
+thumbnail_queue = queue.Queue()
+_thumbnail_pending = set()
+_thumbnail_lock = threading.Lock()
+_thumbnail_worker = None
+
+def thumbnail_path(file_path):
+    # Keyed on the whole file name, so a.png and a.jpg get different previews
+    return os.path.join(current_app.config['THUMBNAIL_FOLDER'], f'{os.path.basename(file_path)}.jpg')
+
+def generate_thumbnail(file_path):
+    """Write a downscaled JPEG preview of an image upload and return its path"""
+    cv2, _ = load_opencv()
+    target = thumbnail_path(file_path)
+    image = cv2.imread(file_path, cv2.IMREAD_COLOR)
+    if image is None:
+        return None
+
+    height, width = image.shape[:2]
+    scale = current_app.config['THUMBNAIL_SIZE'] / max(height, width)
+    if scale < 1:
+        image = cv2.resize(image, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA)
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    temp_path = f'{target}.tmp.jpg'
+    cv2.imwrite(temp_path, image, [cv2.IMWRITE_JPEG_QUALITY, 80])
+    os.replace(temp_path, target)
+    return target
+
+def _run_thumbnail_worker():
+    while True:
+        flask_app, file_path = thumbnail_queue.get()
+        try:
+            with flask_app.app_context():
+                generate_thumbnail(file_path)
+        except Exception as e:
+            flask_app.logger.error('Error generating thumbnail for %s: %s', file_path, e)
+        finally:
+            with _thumbnail_lock:
+                _thumbnail_pending.discard(file_path)
+            thumbnail_queue.task_done()
+
+def queue_thumbnail(file_path):
+    """Schedule thumbnail generation on the background worker (once per file)"""
+    global _thumbnail_worker
+    if not opencv_installed():
+        return False
+
+    with _thumbnail_lock:
+        if file_path in _thumbnail_pending:
+            return True
+        _thumbnail_pending.add(file_path)
+        if _thumbnail_worker is None or not _thumbnail_worker.is_alive():
+            _thumbnail_worker = threading.Thread(target=_run_thumbnail_worker, name='thumbnail-worker', daemon=True)
+            _thumbnail_worker.start()
+    thumbnail_queue.put((current_app._get_current_object(), file_path))
+    return True
+
+def send_upload(file_path, mimetype=None, download_name=None):
+    """Send a file from the upload folder with Range, ETag and Last-Modified support"""
+    upload_root = os.path.abspath(current_app.config['UPLOAD_FOLDER'])
+    full_path = os.path.abspath(file_path)
+    if os.path.commonpath([upload_root, full_path]) != upload_root or not os.path.isfile(full_path):
+        abort(404)
+
+    # conditional=True answers If-None-Match/If-Modified-Since with 304 and Range with 206,
+    # and the WSGI file wrapper lets the server use sendfile for the body
+    response = send_file(full_path, mimetype=mimetype, download_name=download_name,
+                         conditional=True, etag=True, max_age=3600)
+    response.cache_control.public = False
+    response.cache_control.private = True
+    return response
+
+def review_documents(application_ids):
+    """Active documents per application id, with whether each has an image preview"""
+    documents = {}
+    if not application_ids:
+        return documents
+    for document in Document.query.filter(Document.application_id.in_(application_ids),
+                                          Document.status == 'active').order_by(Document.id):
+        documents.setdefault(document.application_id, []).append({
+            'id': document.id,
+            'type': document.document_type,
+            'name': document.original_filename,
+            'preview': document.filename.rsplit('.', 1)[-1].lower() in THUMBNAIL_EXTENSIONS
+        })
+    return documents
+
+@main_bp.route('/documents/<int:document_id>')
+@login_required
+def document_file(document_id):
+    document = Document.query.get_or_404(document_id)
+    if document.status != 'active':
+        abort(404)
+    if session.get('role') != 'admin' and document.application.user_id != session['user_id']:
+        abort(403)
+
+    if request.args.get('thumbnail'):
+        extension = document.filename.rsplit('.', 1)[-1].lower()
+        if extension in THUMBNAIL_EXTENSIONS:
+            preview = thumbnail_path(document.file_path)
+            if os.path.isfile(preview):
+                return send_upload(preview, mimetype='image/jpeg')
+            # Serve the original this time; the preview is ready for the next request
+            queue_thumbnail(document.file_path)
+            response = send_upload(document.file_path, mimetype=document.file_type)
+            response.cache_control.max_age = 0
+            response.cache_control.no_cache = True
+            return response
+
+    return send_upload(document.file_path, mimetype=document.file_type,
+                       download_name=document.original_filename)
+
+@main_bp.cli.command('move-uploads')
+def move_uploads_command():
+    """Move documents and face snapshots saved under static/uploads into UPLOAD_FOLDER."""
+    legacy_root = os.path.join(current_app.root_path, 'static', 'uploads')
+    upload_root = os.path.abspath(current_app.config['UPLOAD_FOLDER'])
+    os.makedirs(upload_root, exist_ok=True)
+    for model, column in ((Document, Document.file_path), (FaceDetection, FaceDetection.image_path)):
+        moved = missing = 0
+        rows = model.query.execution_options(all_tenants=True).filter(column.isnot(None)).all()
+        for row in rows:
+            path = getattr(row, column.key)
+            if os.path.commonpath([upload_root, os.path.abspath(path)]) == upload_root:
+                continue
+            source = path if os.path.isfile(path) else os.path.join(legacy_root, os.path.basename(path))
+            if not os.path.isfile(source):
+                missing += 1
+                continue
+            target = os.path.join(upload_root, os.path.basename(path))
+            shutil.move(source, target)
+            setattr(row, column.key, target)
+            moved += 1
+        db.session.commit()
+        print(f'{model.__tablename__}: {moved} files moved, {missing} missing')
+    # Old previews were keyed on the file stem; new ones are built on the next request
+    shutil.rmtree(os.path.join(legacy_root, 'thumbnails'), ignore_errors=True)
+
+@face_bp.route('/face-snapshots/<int:detection_id>')
+@login_required
+def face_snapshot(detection_id):
+    detection = FaceDetection.query.get_or_404(detection_id)
+    if session.get('role') != 'admin':
+        user = User.query.get(session['user_id'])
+        student = Student.query.filter_by(email=user.email).first()
+        if not student or student.student_id != detection.student_id:
+            abort(403)
+    if not detection.image_path:
+        abort(404)
+    return send_upload(detection.image_path, mimetype='image/jpeg')
+
 # Admin Routes for Managing Applications
-@app.route('/admin/applications')
+@admin_bp.route('/admin/applications')
 @admin_required
 def admin_applications():
     # Get real applications from database
     applications = Application.query.order_by(Application.submitted_at.desc()).all()
+    documents = review_documents([app.id for app in applications])
     
     # Format applications for template
     formatted_applications = []
@@ -1407,61 +3425,321 @@ def admin_applications():
             'course': app.course,
             'marks': app.marks,
             'status': app.status,
-            'submitted_at': app.submitted_at
+            'submitted_at': app.submitted_at,
+            'documents': documents.get(app.id, [])
         })
     
     return render_template('admin_applications.html', applications=formatted_applications)
 
-@app.route('/admin/applications/<int:app_id>/approve')
+@admin_bp.route('/admin/applications/<int:app_id>/approve')
 @admin_required
 def approve_application(app_id):
     application = Application.query.get_or_404(app_id)
+    student_id = next_student_id()
     
-    # Update application status
-    application.status = 'approved'
-    application.reviewed_at = datetime.utcnow()
-    application.reviewed_by = session['user_id']
+    # Update application status, unless another review got there first
+    updated = Application.query.filter(Application.id == app_id, Application.status == 'pending').update({
+        Application.status: 'approved',
+        Application.reviewed_at: datetime.utcnow(),
+        Application.reviewed_by: session['user_id']
+    }, synchronize_session=False)
+    if not updated:
+        db.session.rollback()
+        flash('This application has already been reviewed.')
+        return redirect(url_for('admin.admin_applications'))
     
     # Create student record
     student = Student(
-        student_id=f"STU{datetime.now().strftime('%Y%m%d')}{random.randint(1000, 9999)}",
+        student_id=student_id,
         name=f"{application.first_name} {application.last_name}",
         email=application.email,
         phone=application.phone,
         course=application.course,
         year=1,
         admission_date=datetime.utcnow(),
-        status='active'
+        status='active',
+        organization_id=application.organization_id
     )
     
     db.session.add(student)
+    db.session.flush()
+    refresh_organization_stats([student.organization_id])
     db.session.commit()
     
     flash(f'Application approved successfully! Student ID: {student.student_id}')
-    return redirect(url_for('admin_applications'))
+    return redirect(url_for('admin.admin_applications'))
+
+@admin_bp.route('/admin/applications/<int:app_id>/reject')
+@admin_required
+def reject_application(app_id):
+    application = Application.query.get_or_404(app_id)
+    
+    # Update application status
+    application.status = 'rejected'
+    application.reviewed_at = datetime.utcnow()
+    application.reviewed_by = session['user_id']
+    
+    db.session.commit()
+    
+    flash(f'Application rejected.')
+    return redirect(url_for('admin.admin_applications'))
+
+def bulk_review_applications(action, reviewer_id, application_ids=None, course=None,
+                             organization=None, min_marks=None, min_entrance_score=None):
+    """Approve or reject every pending application matching the filters in one transaction.
+
+    Approvals create the matching Student records with a single bulk insert.
+    Returns the number of applications transitioned.
+    """
+    query = db.session.query(
+        Application.id, Application.first_name, Application.last_name,
+        Application.email, Application.phone, Application.course, Application.organization_id
+    ).filter(Application.status == 'pending')
+    if application_ids is not None:
+        query = query.filter(Application.id.in_(application_ids))
+    if course:
+        query = query.filter(Application.course == course)
+    if organization:
+        query = query.filter(Application.organization == organization)
+    if min_marks is not None:
+        query = query.filter(Application.marks >= min_marks)
+    if min_entrance_score is not None:
+        query = query.filter(Application.entrance_score >= min_entrance_score)
+
+    # Locked where the database supports it, so a concurrent review waits for this one
+    rows = query.order_by(Application.id).with_for_update().all()
+    if not rows:
+        return 0
+
+    # Reserve IDs before this session starts writing; IDs of applications
+    # another review got to first are left unused
+    if action == 'approve':
+        student_ids = id_allocator.reserve('student_id', len(rows))
+
+    now = datetime.utcnow()
+    matched_ids = [row.id for row in rows]
+    returning = db.engine.dialect.update_returning
+    transitioned = set()
+    for i in range(0, len(matched_ids), 500):
+        statement = db.update(Application).where(
+            Application.id.in_(matched_ids[i:i + 500]),
+            Application.status == 'pending'
+        ).values({
+            Application.status: 'approved' if action == 'approve' else 'rejected',
+            Application.reviewed_at: now,
+            Application.reviewed_by: reviewer_id
+        }).execution_options(synchronize_session=False)
+        if returning:
+            # Only what this statement moved out of pending counts; a concurrent
+            # review may have taken some of the rows selected above
+            transitioned.update(db.session.execute(statement.returning(Application.id)).scalars())
+        else:
+            db.session.execute(statement)
+            transitioned.update(matched_ids[i:i + 500])
+    rows = [row for row in rows if row.id in transitioned]
+
+    if action == 'approve':
+        db.session.bulk_insert_mappings(Student, [{
+            'student_id': format_student_id(value),
+            'name': f"{row.first_name} {row.last_name}",
+            'email': row.email,
+            'phone': row.phone,
+            'course': row.course,
+            'year': 1,
+            'admission_date': now,
+            'status': 'active',
+            'organization_id': row.organization_id if row.organization_id is not None else current_tenant_id()
+        } for row, value in zip(rows, student_ids)])
+        if rows:
+            bump_data_versions(db.session, {'student'})
+            refresh_organization_stats({row.organization_id for row in rows} | {current_tenant_id()})
+
+    db.session.commit()
+    return len(rows)
+
+@admin_bp.route('/admin/applications/bulk-review', methods=['POST'])
+@admin_required
+def bulk_review():
+    data = request.get_json(silent=True) or {}
+    action = data.get('action')
+    if action not in ('approve', 'reject'):
+        return jsonify({'success': False, 'message': 'Action must be approve or reject'}), 400
+
+    filters = data.get('filter') or {}
+    application_ids = data.get('ids')
+    if application_ids is None and not any(filters.get(key) is not None for key in
+                                           ('course', 'organization', 'min_marks', 'min_entrance_score')):
+        return jsonify({'success': False, 'message': 'Provide application ids or at least one filter'}), 400
+
+    try:
+        if application_ids is not None:
+            application_ids = [int(app_id) for app_id in application_ids]
+        min_marks = filters.get('min_marks')
+        min_entrance_score = filters.get('min_entrance_score')
+        reviewed = bulk_review_applications(
+            action,
+            session['user_id'],
+            application_ids=application_ids,
+            course=filters.get('course'),
+            organization=filters.get('organization'),
+            min_marks=float(min_marks) if min_marks is not None else None,
+            min_entrance_score=float(min_entrance_score) if min_entrance_score is not None else None
+        )
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'message': 'Invalid ids or filter values'}), 400
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error('Bulk review failed: %s', e)
+        return jsonify({'success': False, 'message': 'Bulk review failed. No applications were changed.'}), 500
+
+    return jsonify({
+        'success': True,
+        'action': action,
+        'reviewed': reviewed,
+        'students_created': reviewed if action == 'approve' else 0
+    })
+
+# Merit ranking
+MERIT_WEIGHTS = {'marks': 0.6, 'entrance_score': 0.4}
+
+def select_merit_list(rows, weights=None, seats=None, default_seats=60):
+    """Pick the top applicants per course from (id, course, marks, entrance_score, submitted_ts) rows.
+
+    Keeps one bounded min-heap per course, so memory grows with the number of
+    seats rather than the number of applications. Ties on the composite score
+    go to the higher entrance score, then higher marks, then earlier submission.
+    """
+    weights = {**MERIT_WEIGHTS, **(weights or {})}
+    marks_weight = weights['marks']
+    entrance_weight = weights['entrance_score']
+    seats = seats or {}
+
+    heaps = {}
+    limits = {}
+    for app_id, course, marks, entrance_score, submitted_ts in rows:
+        heap = heaps.get(course)
+        if heap is None:
+            heap = heaps[course] = []
+            limits[course] = seats.get(course, default_seats)
+
+        score = marks_weight * marks + entrance_weight * entrance_score
+        if len(heap) < limits[course]:
+            heapq.heappush(heap, (score, entrance_score, marks, -submitted_ts, -app_id))
+        elif heap and score >= heap[0][0]:
+            key = (score, entrance_score, marks, -submitted_ts, -app_id)
+            if key > heap[0]:
+                heapq.heapreplace(heap, key)
+
+    return {
+        course: [{
+            'rank': rank,
+            'application_id': -key[4],
+            'score': round(key[0], 4)
+        } for rank, key in enumerate(sorted(heap, reverse=True), 1)]
+        for course, heap in heaps.items()
+    }
 
-@app.route('/admin/applications/<int:app_id>/reject')
+def merit_rows(status='pending', course=None, chunk_size=10000):
+    """Stream ranking columns for applications from the database in chunks"""
+    query = db.session.query(
+        Application.id, Application.course, Application.marks,
+        Application.entrance_score, Application.submitted_at
+    ).filter(Application.status == status)
+    if course:
+        query = query.filter(Application.course == course)
+
+    for app_id, app_course, marks, entrance_score, submitted_at in query.yield_per(chunk_size):
+        yield (app_id, app_course, marks or 0.0, entrance_score or 0.0,
+               submitted_at.timestamp() if submitted_at else 0.0)
+
+class MeritPool:
+    """Compact column-wise snapshot of applications for what-if re-ranking.
+
+    Rows are loaded once into typed arrays so ranking the same pool under
+    different weights never goes back to the database.
+    """
+
+    def __init__(self, rows=()):
+        self.ids = array('q')
+        self.courses = []
+        self.marks = array('d')
+        self.entrance_scores = array('d')
+        self.submitted = array('d')
+        self._course_names = {}
+        for row in rows:
+            self.add(*row)
+
+    def add(self, app_id, course, marks, entrance_score, submitted_ts):
+        self.ids.append(app_id)
+        # Share one string object per course across rows
+        self.courses.append(self._course_names.setdefault(course, course))
+        self.marks.append(marks)
+        self.entrance_scores.append(entrance_score)
+        self.submitted.append(submitted_ts)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def rank(self, weights=None, seats=None, default_seats=60):
+        rows = zip(self.ids, self.courses, self.marks, self.entrance_scores, self.submitted)
+        return select_merit_list(rows, weights, seats, default_seats)
+
+@admin_bp.route('/admin/applications/merit-list', methods=['POST'])
 @admin_required
-def reject_application(app_id):
-    application = Application.query.get_or_404(app_id)
-    
-    # Update application status
-    application.status = 'rejected'
-    application.reviewed_at = datetime.utcnow()
-    application.reviewed_by = session['user_id']
-    
-    db.session.commit()
-    
-    flash(f'Application rejected.')
-    return redirect(url_for('admin_applications'))
+def merit_list():
+    data = request.get_json(silent=True) or {}
+    scenarios = data.get('scenarios') or {'default': data.get('weights') or {}}
+
+    try:
+        seats = data.get('seats', 60)
+        if isinstance(seats, dict):
+            seats = {course: int(limit) for course, limit in seats.items()}
+            default_seats = int(data.get('default_seats', 60))
+        else:
+            seats, default_seats = {}, int(seats)
+        for weights in scenarios.values():
+            unknown = set(weights) - set(MERIT_WEIGHTS)
+            if unknown:
+                raise ValueError(f'Unknown weights: {", ".join(sorted(unknown))}')
+        scenarios = {name: {key: float(value) for key, value in weights.items()}
+                     for name, weights in scenarios.items()}
+    except (AttributeError, TypeError, ValueError) as e:
+        return jsonify({'success': False, 'message': f'Invalid seats or weights: {str(e)}'}), 400
+
+    rows = merit_rows(status=data.get('status', 'pending'), course=data.get('course'))
+    if len(scenarios) == 1:
+        # Single ranking: stream straight through the heaps
+        results = {name: select_merit_list(rows, weights, seats, default_seats)
+                   for name, weights in scenarios.items()}
+    else:
+        pool = MeritPool(rows)
+        results = {name: pool.rank(weights, seats, default_seats)
+                   for name, weights in scenarios.items()}
+
+    # Look up names only for the selected applicants
+    selected_ids = sorted({entry['application_id'] for ranking in results.values()
+                           for entries in ranking.values() for entry in entries})
+    names = {}
+    for i in range(0, len(selected_ids), 500):
+        names.update(db.session.query(
+            Application.id, Application.first_name + ' ' + Application.last_name
+        ).filter(Application.id.in_(selected_ids[i:i + 500])).all())
+
+    for ranking in results.values():
+        for entries in ranking.values():
+            for entry in entries:
+                entry['name'] = names.get(entry['application_id'])
+
+    return jsonify({'success': True, 'scenarios': results})
 
 # Google OAuth Routes
-@app.route('/google-login')
+@main_bp.route('/google-login')
 def google_login():
     cfg = get_google_provider_cfg()
     authorization_endpoint = cfg["authorization_endpoint"]
     redirect_uri = "http://localhost:5000/auth/google/callback"
 
+    client = get_oauth_client()
     request_uri = client.prepare_request_uri(
         authorization_endpoint,
         redirect_uri=redirect_uri,
@@ -1469,8 +3747,10 @@ def google_login():
     )
     return redirect(request_uri)
 
-@app.route('/auth/google/callback')
+@main_bp.route('/auth/google/callback')
 def google_callback():
+    import requests
+    client = get_oauth_client()
     code = request.args.get("code")
     if not code:
         return "Missing authorization code", 400
@@ -1545,17 +3825,18 @@ def google_callback():
     session['user_id'] = user.id
     session['username'] = user.username
     session['role'] = user.role
+    session['organization_id'] = tenant_for_user(user)
     session['google_sub'] = google_sub
     session['email'] = email
     session['name'] = name
     
     if user.role == 'student':
-        return redirect(url_for('organization_selection'))
+        return redirect(url_for('main.organization_selection'))
     else:
-        return redirect(url_for('dashboard'))
+        return redirect(url_for('admin.dashboard'))
 
 # Organization Management Routes
-@app.route('/admin/create-organization', methods=['GET', 'POST'])
+@admin_bp.route('/admin/create-organization', methods=['GET', 'POST'])
 @admin_required
 def create_organization():
     if request.method == 'POST':
@@ -1564,22 +3845,31 @@ def create_organization():
             code=request.form['code'],
             admin_id=session['user_id'],
             description=request.form['description'],
-            location=request.form['location']
+            location=request.form['location'],
+            seat_capacity=request.form.get('seat_capacity', 0, type=int) or 0
         )
         db.session.add(org)
         db.session.commit()
         flash('Organization created successfully!')
-        return redirect(url_for('admin_organizations'))
+        return redirect(url_for('admin.admin_organizations'))
     
     return render_template('create_organization.html')
 
-@app.route('/admin/organizations')
+@admin_bp.route('/admin/organizations')
 @admin_required
 def admin_organizations():
     organizations = Organization.query.filter_by(admin_id=session['user_id']).all()
     return render_template('admin_organizations.html', organizations=organizations)
 
-@app.route('/join-organization/<org_code>')
+@admin_bp.route('/admin/organizations/<int:org_id>/switch')
+@admin_required
+def switch_organization(org_id):
+    org = Organization.query.filter_by(id=org_id, admin_id=session['user_id']).first_or_404()
+    session['organization_id'] = org.id
+    flash(f'Now managing {org.name}')
+    return redirect(url_for('admin.dashboard'))
+
+@main_bp.route('/join-organization/<org_code>')
 @student_required
 def join_organization(org_code):
     org = Organization.query.filter_by(code=org_code).first()
@@ -1589,14 +3879,15 @@ def join_organization(org_code):
             'name': org.name,
             'code': org.code
         }
+        session['organization_id'] = org.id
         flash(f'Joined {org.name}!')
-        return redirect(url_for('student_application'))
+        return redirect(url_for('student.student_application'))
     else:
         flash('Invalid organization code!')
-        return redirect(url_for('organization_selection'))
+        return redirect(url_for('main.organization_selection'))
 
 # Student Wallet Routes
-@app.route('/student/wallet')
+@wallet_bp.route('/student/wallet')
 @student_required
 def student_wallet():
     user = User.query.get(session['user_id'])
@@ -1604,7 +3895,7 @@ def student_wallet():
     
     if not student:
         flash('Student record not found!')
-        return redirect(url_for('student_portal'))
+        return redirect(url_for('student.student_portal'))
     
     wallet = StudentWallet.query.filter_by(student_id=student.student_id).first()
     if not wallet:
@@ -1617,7 +3908,7 @@ def student_wallet():
     
     return render_template('student_wallet.html', wallet=wallet, transactions=transactions, rewards=rewards)
 
-@app.route('/student/wallet/add-money', methods=['POST'])
+@wallet_bp.route('/student/wallet/add-money', methods=['POST'])
 @student_required
 def add_money_to_wallet():
     amount = float(request.form['amount'])
@@ -1643,16 +3934,176 @@ def add_money_to_wallet():
     db.session.commit()
     
     flash(f'₹{amount} added to wallet successfully!')
-    return redirect(url_for('student_wallet'))
+    return redirect(url_for('wallet.student_wallet'))
+
+# Library catalogue search
+# library_book_fts is a contentless FTS5 index over the catalogue. Triggers on
+# library_book keep it current inside the writing transaction, so ORM writes,
+# bulk inserts and raw SQL all stay searchable without application hooks.
+LIBRARY_SEARCH_COLUMNS = ('title', 'author', 'category', 'isbn', 'description')
+# bm25 weight per column, in LIBRARY_SEARCH_COLUMNS order
+LIBRARY_SEARCH_WEIGHTS = (10.0, 6.0, 2.0, 8.0, 1.0)
+LIBRARY_PAGE_SIZE = 24
+LIBRARY_MAX_PAGE_SIZE = 100
+LIBRARY_MAX_TERMS = 8
+# Above this many matches a query is too broad for bm25 to order usefully, and
+# ranking every match costs more than the search; such results list in catalogue order
+LIBRARY_RANKED_MATCHES = 5000
+
+def _library_fts_values(row):
+    # ISBNs are indexed without hyphens so '978-81...' and '97881...' both match
+    return (f'{row}.title, {row}.author, {row}.category, '
+            f"replace({row}.isbn, '-', ''), {row}.description")
+
+LIBRARY_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS library_book_fts USING fts5("
+    f"{', '.join(LIBRARY_SEARCH_COLUMNS)}, content='', prefix='2 3', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS library_book_fts_insert AFTER INSERT ON library_book BEGIN "
+    f"INSERT INTO library_book_fts(rowid, {', '.join(LIBRARY_SEARCH_COLUMNS)}) "
+    f"VALUES (new.id, {_library_fts_values('new')}); END",
+    "CREATE TRIGGER IF NOT EXISTS library_book_fts_delete AFTER DELETE ON library_book BEGIN "
+    f"INSERT INTO library_book_fts(library_book_fts, rowid, {', '.join(LIBRARY_SEARCH_COLUMNS)}) "
+    f"VALUES ('delete', old.id, {_library_fts_values('old')}); END",
+    # Stock and price change often; only new searchable values reindex a row
+    f"CREATE TRIGGER IF NOT EXISTS library_book_fts_update AFTER UPDATE OF {', '.join(LIBRARY_SEARCH_COLUMNS)} "
+    f"ON library_book WHEN {' OR '.join(f'old.{name} IS NOT new.{name}' for name in LIBRARY_SEARCH_COLUMNS)} BEGIN "
+    f"INSERT INTO library_book_fts(library_book_fts, rowid, {', '.join(LIBRARY_SEARCH_COLUMNS)}) "
+    f"VALUES ('delete', old.id, {_library_fts_values('old')}); "
+    f"INSERT INTO library_book_fts(rowid, {', '.join(LIBRARY_SEARCH_COLUMNS)}) "
+    f"VALUES (new.id, {_library_fts_values('new')}); END",
+)
+
+library_book_fts = table('library_book_fts', column('rowid'))
+
+def create_library_search_index(connection, rebuild=False):
+    """Create the FTS5 index and its triggers, filling it from library_book when new"""
+    if connection.dialect.name != 'sqlite':
+        return False
+    exists = connection.execute(text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'library_book_fts'"
+    )).first() is not None
+    for statement in LIBRARY_FTS_DDL:
+        connection.execute(text(statement))
+    if rebuild and exists:
+        connection.execute(text("INSERT INTO library_book_fts(library_book_fts) VALUES ('delete-all')"))
+    if rebuild or not exists:
+        connection.execute(text(
+            f"INSERT INTO library_book_fts(rowid, {', '.join(LIBRARY_SEARCH_COLUMNS)}) "
+            f"SELECT id, {_library_fts_values('library_book')} FROM library_book"
+        ))
+    return True
+
+@main_bp.cli.command('rebuild-library-index')
+def rebuild_library_index_command():
+    """Rebuild the library search index from the catalogue."""
+    with db.engine.begin() as connection:
+        if not create_library_search_index(connection, rebuild=True):
+            raise click.ClickException('Full-text search needs SQLite; other databases fall back to LIKE')
+    print(f'Indexed {LibraryBook.query.count()} books')
+
+def library_search_terms(query):
+    """Lower-cased words of a search box query, hyphenated ISBNs joined up"""
+    query = re.sub(r'(?<=\d)-(?=\d)', '', query or '')
+    return re.findall(r'[^\W_]+', query.lower())[:LIBRARY_MAX_TERMS]
+
+def search_library(query='', category=None, page=1, per_page=LIBRARY_PAGE_SIZE):
+    """One page of in-stock books matching every word of ``query`` as a prefix.
+
+    Matches are ranked by bm25 with titles and ISBNs weighted highest, up to
+    LIBRARY_RANKED_MATCHES of them; without a query the catalogue is listed
+    by title. Facets count the matches per
+    category before ``category`` narrows them.
+    """
+    terms = library_search_terms(query)
+    per_page = min(max(per_page, 1), LIBRARY_MAX_PAGE_SIZE)
+    filters = [LibraryBook.stock > 0]
+    order_by = [LibraryBook.title, LibraryBook.id]
+    use_fts = terms and db.engine.dialect.name == 'sqlite'
+
+    def matching(*entities):
+        q = db.session.query(*entities)
+        if use_fts:
+            q = q.join(library_book_fts, library_book_fts.c.rowid == LibraryBook.id)
+        return q.filter(*filters)
+
+    if use_fts:
+        match = ' '.join(f'"{term}"*' for term in terms)
+        filters.append(literal_column('library_book_fts').op('MATCH')(match))
+        order_by = [db.func.bm25(literal_column('library_book_fts'), *LIBRARY_SEARCH_WEIGHTS), LibraryBook.id]
+    elif terms:
+        for term in terms:
+            pattern = f'%{term}%'
+            filters.append(db.or_(*(getattr(LibraryBook, name).ilike(pattern) for name in LIBRARY_SEARCH_COLUMNS)))
+
+    facets = matching(LibraryBook.category, db.func.count(LibraryBook.id)).group_by(
+        LibraryBook.category
+    ).order_by(LibraryBook.category).all()
+    if category:
+        filters.append(LibraryBook.category == category)
+        total = dict(facets).get(category, 0)
+    else:
+        total = sum(count for _, count in facets)
+
+    if use_fts and total > LIBRARY_RANKED_MATCHES:
+        # The index yields rowids in order, so LIMIT stops the scan early
+        order_by = [library_book_fts.c.rowid]
+
+    pages = max((total + per_page - 1) // per_page, 1)
+    page = min(max(page, 1), pages)
+    books = matching(LibraryBook).order_by(*order_by).limit(per_page).offset((page - 1) * per_page).all()
+    return {
+        'query': query or '',
+        'category': category or '',
+        'books': books,
+        'facets': facets,
+        'total': total,
+        'page': page,
+        'pages': pages,
+        'per_page': per_page
+    }
+
+def library_search_args():
+    return dict(
+        query=request.args.get('q', '').strip(),
+        category=request.args.get('category', '').strip() or None,
+        page=request.args.get('page', 1, type=int),
+        per_page=request.args.get('per_page', LIBRARY_PAGE_SIZE, type=int)
+    )
 
 # Library Routes
-@app.route('/student/library')
+@wallet_bp.route('/student/library')
 @student_required
 def student_library():
-    books = LibraryBook.query.filter(LibraryBook.stock > 0).all()
-    return render_template('student_library.html', books=books)
+    results = search_library(**library_search_args())
+    return render_template('student_library.html', results=results, books=results['books'])
 
-@app.route('/student/library/purchase/<int:book_id>')
+@wallet_bp.route('/api/library/search')
+@student_required
+def library_search():
+    results = search_library(**library_search_args())
+    return jsonify({
+        'query': results['query'],
+        'category': results['category'],
+        'total': results['total'],
+        'page': results['page'],
+        'pages': results['pages'],
+        'per_page': results['per_page'],
+        'facets': [{'category': name, 'count': count} for name, count in results['facets']],
+        'books': [{
+            'id': book.id,
+            'title': book.title,
+            'author': book.author,
+            'category': book.category,
+            'isbn': book.isbn,
+            'price': book.price,
+            'stock': book.stock,
+            'description': book.description,
+            'purchase_url': url_for('wallet.purchase_book', book_id=book.id)
+        } for book in results['books']]
+    })
+
+@wallet_bp.route('/student/library/purchase/<int:book_id>')
 @student_required
 def purchase_book(book_id):
     user = User.query.get(session['user_id'])
@@ -1694,7 +4145,209 @@ def purchase_book(book_id):
     else:
         flash('Insufficient wallet balance!')
     
-    return redirect(url_for('student_library'))
+    return redirect(url_for('wallet.student_library'))
+
+# Library catalogue import and restock
+# Imports upsert by ISBN and only rewrite rows whose metadata changed; stock of
+# existing books is left to restocking so a catalogue refresh never resets it.
+LIBRARY_IMPORT_FORMATS = ('csv', 'jsonl')
+LIBRARY_IMPORT_BATCH_SIZE = 2000
+LIBRARY_RESTOCK_BATCH_SIZE = 10000
+LIBRARY_UPSERT_COLUMNS = ('title', 'author', 'price', 'category', 'description', 'image_url')
+LIBRARY_REPORT_LIMIT = 100
+UPSERT_INSERTS = {'sqlite': sqlite_insert, 'postgresql': postgresql_insert}
+
+# Scratch table a restock batch is loaded into and the UPDATE joins against
+library_restock_batch = Table(
+    'library_restock_batch', MetaData(),
+    db.Column('isbn', db.String(20), primary_key=True),
+    db.Column('quantity', db.Integer, nullable=False),
+    prefixes=['TEMPORARY']
+)
+
+def catalogue_format(filename):
+    extension = os.path.splitext(filename or '')[1].lower().lstrip('.')
+    return 'jsonl' if extension in ('jsonl', 'ndjson') else 'csv'
+
+def read_catalogue(stream, fmt):
+    """Yield (line number, record) pairs from a CSV or JSON Lines text stream"""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record
+    elif fmt == 'jsonl':
+        for line_number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except ValueError:
+                yield line_number, None
+    else:
+        raise ValueError(f'Unknown catalogue format {fmt}')
+
+def catalogue_row(record):
+    """library_book values for one catalogue record; raises ValueError when it is unusable"""
+    if not isinstance(record, dict):
+        raise ValueError('not a JSON object')
+    record = {str(key).strip().lower(): value for key, value in record.items() if key is not None}
+    columns = LibraryBook.__table__.c
+    values = {}
+    for name in ('title', 'author', 'isbn', 'category', 'description', 'image_url'):
+        value = str(record.get(name) or '').strip()
+        if not value and name not in ('description', 'image_url'):
+            raise ValueError(f'missing {name}')
+        length = getattr(columns[name].type, 'length', None)
+        if length and len(value) > length:
+            raise ValueError(f'{name} longer than {length} characters')
+        values[name] = value or None
+    try:
+        values['price'] = float(record.get('price'))
+        values['stock'] = int(record.get('stock') or 0)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError('price and stock must be numbers')
+    if not math.isfinite(values['price']):
+        raise ValueError('price must be a finite number')
+    if values['price'] < 0 or values['stock'] < 0:
+        raise ValueError('price and stock cannot be negative')
+    return values
+
+def _upsert_catalogue_batch(rows, report):
+    table = LibraryBook.__table__
+    insert = UPSERT_INSERTS[db.engine.dialect.name](table)
+    statement = insert.on_conflict_do_update(
+        index_elements=[table.c.isbn],
+        set_={name: insert.excluded[name] for name in LIBRARY_UPSERT_COLUMNS},
+        where=db.or_(*(table.c[name].is_distinct_from(insert.excluded[name]) for name in LIBRARY_UPSERT_COLUMNS))
+    )
+    with db.engine.begin() as connection:
+        existing = connection.execute(
+            db.select(db.func.count()).where(table.c.isbn.in_([row['isbn'] for row in rows]))
+        ).scalar()
+        written = connection.execute(statement, rows).rowcount
+    inserted = len(rows) - existing
+    report['inserted'] += inserted
+    report['updated'] += written - inserted
+    report['unchanged'] += existing - (written - inserted)
+
+def import_catalogue(records, batch_size=LIBRARY_IMPORT_BATCH_SIZE):
+    """Upsert (line number, record) pairs by ISBN, one transaction per batch"""
+    report = {'rows': 0, 'inserted': 0, 'updated': 0, 'unchanged': 0, 'duplicates': 0, 'skipped': 0, 'errors': []}
+    start = time.perf_counter()
+    batch = {}
+    for line_number, record in records:
+        report['rows'] += 1
+        try:
+            values = catalogue_row(record)
+        except ValueError as e:
+            report['skipped'] += 1
+            if len(report['errors']) < LIBRARY_REPORT_LIMIT:
+                report['errors'].append({'line': line_number, 'error': str(e)})
+            continue
+        if values['isbn'] in batch:
+            # The later record for an ISBN wins
+            report['duplicates'] += 1
+        batch[values['isbn']] = values
+        if len(batch) >= batch_size:
+            _upsert_catalogue_batch(list(batch.values()), report)
+            batch = {}
+    if batch:
+        _upsert_catalogue_batch(list(batch.values()), report)
+
+    elapsed = time.perf_counter() - start
+    report['seconds'] = round(elapsed, 3)
+    report['rows_per_second'] = round(report['rows'] / elapsed) if elapsed else report['rows']
+    return report
+
+def restock_library(quantities, mode='add'):
+    """Add to (or with mode='set', replace) the stock of books by ISBN with set-based UPDATEs"""
+    table = LibraryBook.__table__
+    report = {'requested': len(quantities), 'updated': 0, 'unknown': []}
+    unknown = 0
+    start = time.perf_counter()
+    isbns = list(quantities)
+    for i in range(0, len(isbns), LIBRARY_RESTOCK_BATCH_SIZE):
+        chunk = isbns[i:i + LIBRARY_RESTOCK_BATCH_SIZE]
+        stock = library_restock_batch.c.quantity
+        if mode == 'add':
+            stock = db.func.coalesce(table.c.stock, 0) + stock
+        with db.engine.begin() as connection:
+            # Rolled back together with the transaction if anything fails
+            library_restock_batch.create(connection)
+            connection.execute(library_restock_batch.insert(), [{'isbn': isbn, 'quantity': quantities[isbn]} for isbn in chunk])
+            updated = set(connection.execute(
+                table.update().where(table.c.isbn == library_restock_batch.c.isbn)
+                .values(stock=db.case((stock < 0, 0), else_=stock))
+                .returning(table.c.isbn)
+            ).scalars())
+            library_restock_batch.drop(connection)
+        report['updated'] += len(updated)
+        for isbn in chunk:
+            if isbn not in updated:
+                unknown += 1
+                if len(report['unknown']) < LIBRARY_REPORT_LIMIT:
+                    report['unknown'].append(isbn)
+
+    elapsed = time.perf_counter() - start
+    report['unknown_count'] = unknown
+    report['seconds'] = round(elapsed, 3)
+    report['rows_per_second'] = round(len(isbns) / elapsed) if elapsed else len(isbns)
+    return report
+
+@main_bp.cli.command('import-catalogue')
+@click.argument('catalogue', type=click.File('r', encoding='utf-8-sig'))
+@click.option('--format', 'fmt', type=click.Choice(LIBRARY_IMPORT_FORMATS), help='default: from the file extension')
+@click.option('--batch-size', default=LIBRARY_IMPORT_BATCH_SIZE, show_default=True)
+def import_catalogue_command(catalogue, fmt, batch_size):
+    """Upsert library books by ISBN from a CSV or JSON Lines CATALOGUE ('-' for stdin)."""
+    report = import_catalogue(read_catalogue(catalogue, fmt or catalogue_format(catalogue.name)), batch_size)
+    for error in report['errors']:
+        print(f"line {error['line']}: {error['error']}", file=sys.stderr)
+    print(f"{report['rows']} rows in {report['seconds']}s ({report['rows_per_second']} rows/s): "
+          f"{report['inserted']} inserted, {report['updated']} updated, {report['unchanged']} unchanged, "
+          f"{report['duplicates']} duplicates, {report['skipped']} skipped")
+
+@wallet_bp.route('/api/library/import', methods=['POST'])
+def library_import():
+    if session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 401
+
+    upload = request.files.get('file')
+    if not upload or not upload.filename:
+        return jsonify({'error': 'No catalogue file uploaded'}), 400
+    fmt = request.form.get('format') or catalogue_format(upload.filename)
+    if fmt not in LIBRARY_IMPORT_FORMATS:
+        return jsonify({'error': f'Format must be one of {", ".join(LIBRARY_IMPORT_FORMATS)}'}), 400
+
+    report = import_catalogue(read_catalogue(io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline=''), fmt))
+    current_app.logger.info('Imported library catalogue %s: %d rows, %d inserted, %d updated (%d rows/s)',
+                            upload.filename, report['rows'], report['inserted'], report['updated'],
+                            report['rows_per_second'])
+    return jsonify(report)
+
+@wallet_bp.route('/api/library/restock', methods=['POST'])
+def library_restock():
+    if session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 401
+
+    payload = request.get_json(silent=True) or {}
+    mode = payload.get('mode', 'add')
+    if mode not in ('add', 'set'):
+        return jsonify({'error': 'mode must be add or set'}), 400
+    quantities = {}
+    for item in payload.get('items') or []:
+        try:
+            isbn = str(item['isbn']).strip()
+            quantity = int(item['quantity'])
+        except (KeyError, TypeError, ValueError):
+            return jsonify({'error': 'Each item needs an isbn and an integer quantity'}), 400
+        quantities[isbn] = quantities.get(isbn, 0) + quantity if mode == 'add' else quantity
+    if not quantities:
+        return jsonify({'error': 'No items to restock'}), 400
+
+    report = restock_library(quantities, mode)
+    current_app.logger.info('Restocked %d library books (%d unknown ISBNs)', report['updated'], report['unknown_count'])
+    return jsonify(report)
 
 # Reward System
 def check_and_award_cashback(student_id, fee_amount):
@@ -1721,11 +4374,490 @@ def check_and_award_cashback(student_id, fee_amount):
     return 0
 
 
+# Face attendance
+# Students enrol one or more photos. Each class (course and year) is matched
+# against one contiguous matrix of mean embeddings, so a classroom snapshot
+# costs a single matrix product however many faces it holds.
+# Cosine similarity; LBP scores are taken after centring on the class mean
+FACE_MATCH_THRESHOLDS = {'sface': 0.363, 'lbp': 0.15}
+# Frames are downscaled to this longest edge before detection; detection cost
+# grows with the pixel count while a 40px face at 960px is still found
+FACE_DETECTION_MAX_EDGE = 960
+HAAR_SCALE_FACTOR = 1.2
+HAAR_MIN_FACE = 40
+LBP_CROP_SIZE = 64
+LBP_GRID = 4
+LBP_NEIGHBOURS = ((-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1))
+
+def normalize_rows(np, matrix):
+    return matrix / np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+
+class FaceEmbedder:
+    """Finds faces in BGR images and turns them into L2-normalised float32 embeddings.
+
+    With YuNet and SFace ONNX files configured this runs OpenCV's DNN face
+    models; otherwise it uses the Haar cascade bundled with OpenCV and
+    spatial LBP histograms, which only tell apart faces under similar light.
+    """
+
+    def __init__(self, detector_model=None, recognizer_model=None):
+        self.cv2, self.np = load_opencv()
+        self._lock = threading.Lock()
+        if detector_model and recognizer_model:
+            self.name = 'sface'
+            self._detector = self.cv2.FaceDetectorYN.create(detector_model, '', (320, 320), 0.8)
+            self._recognizer = self.cv2.FaceRecognizerSF.create(recognizer_model, '')
+        else:
+            self.name = 'lbp'
+            self._detector = self.cv2.CascadeClassifier(
+                os.path.join(self.cv2.data.haarcascades, 'haarcascade_frontalface_default.xml'))
+
+    def detect(self, image, max_edge=FACE_DETECTION_MAX_EDGE):
+        """Faces as rows of x, y, w, h, ten landmark coordinates and a 0-1 score, in full-size pixels"""
+        cv2, np = self.cv2, self.np
+        height, width = image.shape[:2]
+        scale = min(1.0, max_edge / max(height, width))
+        small = cv2.resize(image, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA) \
+            if scale < 1 else image
+        with self._lock:
+            if self.name == 'sface':
+                self._detector.setInputSize((small.shape[1], small.shape[0]))
+                faces = self._detector.detect(small)[1]
+                faces = np.zeros((0, 15), np.float32) if faces is None else faces.astype(np.float32)
+            else:
+                gray = cv2.equalizeHist(cv2.cvtColor(small, cv2.COLOR_BGR2GRAY))
+                boxes, _, weights = self._detector.detectMultiScale3(
+                    gray, scaleFactor=HAAR_SCALE_FACTOR, minNeighbors=5, minSize=(HAAR_MIN_FACE, HAAR_MIN_FACE),
+                    outputRejectLevels=True)
+                faces = np.zeros((len(boxes), 15), np.float32)
+                if len(boxes):
+                    faces[:, :4] = boxes
+                    # Cascade level weights are unbounded; squash them into 0-1
+                    faces[:, 14] = 1 / (1 + np.exp(-np.asarray(weights, np.float32).ravel()))
+        faces[:, :14] /= scale
+        return faces
+
+    def embed(self, image, faces):
+        """One embedding row per detected face"""
+        np = self.np
+        if not len(faces):
+            return np.zeros((0, 128 if self.name == 'sface' else LBP_GRID * LBP_GRID * 256), np.float32)
+        if self.name == 'sface':
+            with self._lock:
+                features = [self._recognizer.feature(self._recognizer.alignCrop(image, face)) for face in faces]
+            return normalize_rows(np, np.vstack(features).astype(np.float32))
+        return self._lbp_histograms(image, faces)
+
+    def _lbp_histograms(self, image, faces):
+        cv2, np = self.cv2, self.np
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        size = LBP_CROP_SIZE + 2
+        crops = np.empty((len(faces), size, size), np.uint8)
+        for i, (x, y, w, h) in enumerate(faces[:, :4].astype(int)):
+            x, y = max(x, 0), max(y, 0)
+            crops[i] = cv2.equalizeHist(cv2.resize(gray[y:y + h, x:x + w], (size, size), interpolation=cv2.INTER_AREA))
+
+        # 8-neighbour local binary patterns for all faces at once
+        centre = crops[:, 1:-1, 1:-1]
+        codes = np.zeros(centre.shape, np.int32)
+        for bit, (dy, dx) in enumerate(LBP_NEIGHBOURS):
+            codes |= (crops[:, 1 + dy:size - 1 + dy, 1 + dx:size - 1 + dx] >= centre).astype(np.int32) << bit
+
+        # A 256-bin histogram per grid cell, concatenated; sqrt makes cosine a Hellinger similarity
+        cell = np.arange(LBP_CROP_SIZE) * LBP_GRID // LBP_CROP_SIZE
+        cells = cell[:, None] * LBP_GRID + cell[None, :]
+        bins = ((np.arange(len(faces))[:, None, None] * LBP_GRID * LBP_GRID + cells) << 8) + codes
+        histograms = np.bincount(bins.ravel(), minlength=len(faces) * LBP_GRID * LBP_GRID * 256)
+        return normalize_rows(np, np.sqrt(histograms.reshape(len(faces), -1).astype(np.float32)))
+
+@functools.lru_cache(maxsize=None)
+def load_face_embedder(detector_model, recognizer_model):
+    return FaceEmbedder(detector_model, recognizer_model)
+
+def face_embedder():
+    """The process-wide embedder for the configured models, or None without OpenCV"""
+    if not load_opencv():
+        return None
+    return load_face_embedder(current_app.config.get('FACE_DETECTOR_MODEL'),
+                              current_app.config.get('FACE_RECOGNIZER_MODEL'))
+
+def face_match_threshold(embedder):
+    return current_app.config.get('FACE_MATCH_THRESHOLD') or FACE_MATCH_THRESHOLDS[embedder.name]
+
+def decode_image(data):
+    """BGR image from encoded JPEG/PNG bytes, or None"""
+    cv2, np = load_opencv()
+    return cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR) if data else None
+
+class FaceIndex:
+    """Mean embedding of every enrolled student of a class, one matrix row each.
+
+    LBP histograms of different faces share most of their mass, so the
+    fallback model is compared after subtracting the class mean; that needs
+    at least two enrolled students.
+    """
+
+    def __init__(self, student_ids, matrix, centre=None):
+        self.student_ids = student_ids
+        self.matrix = matrix
+        self.centre = centre
+
+    @classmethod
+    def build(cls, rows, centred=False):
+        """From (student_id, vector bytes) rows; several samples per student are averaged"""
+        _, np = load_opencv()
+        if not rows:
+            return cls([], np.zeros((0, 0), np.float32))
+        vectors = np.frombuffer(b''.join(vector for _, vector in rows), np.float32).reshape(len(rows), -1)
+        student_ids, owners = np.unique([student_id for student_id, _ in rows], return_inverse=True)
+        sums = np.zeros((len(student_ids), vectors.shape[1]), np.float32)
+        np.add.at(sums, owners, vectors)
+        matrix = normalize_rows(np, sums)
+        centre = None
+        if centred:
+            if len(student_ids) < 2:
+                return cls([], np.zeros((0, 0), np.float32))
+            centre = matrix.mean(axis=0)
+            matrix = normalize_rows(np, matrix - centre)
+        return cls(student_ids.tolist(), np.ascontiguousarray(matrix), centre)
+
+    def match(self, embeddings, threshold):
+        """{student_id: similarity}, pairing faces and students one-to-one, most similar first"""
+        _, np = load_opencv()
+        if not self.student_ids or not len(embeddings) or embeddings.shape[1] != self.matrix.shape[1]:
+            return {}
+        if self.centre is not None:
+            embeddings = normalize_rows(np, embeddings - self.centre)
+        scores = embeddings @ self.matrix.T
+        faces, students = np.nonzero(scores >= threshold)
+        order = np.argsort(-scores[faces, students], kind='stable')
+        matched, used_faces = {}, set()
+        for face, student in zip(faces[order].tolist(), students[order].tolist()):
+            student_id = self.student_ids[student]
+            if face in used_faces or student_id in matched:
+                continue
+            matched[student_id] = float(scores[face, student])
+            used_faces.add(face)
+        return matched
+
+# Bounded like the timetable weeks: one matrix per tenant, class, model and version
+_face_indexes = FragmentCache()
+
+def class_face_index(course, year, model):
+    """Cached FaceIndex of a class, rebuilt after enrolments or student changes"""
+    key = (str(db.engine.url), current_tenant_id(), course, year, model, data_version('face_embedding', 'student'))
+
+    def build():
+        rows = db.session.query(FaceEmbedding.student_id, FaceEmbedding.vector).join(
+            Student, Student.student_id == FaceEmbedding.student_id
+        ).filter(
+            Student.course == course, Student.year == year, FaceEmbedding.model == model
+        ).order_by(FaceEmbedding.student_id, FaceEmbedding.id).all()
+        return FaceIndex.build(rows, centred=model == 'lbp')
+
+    return _face_indexes.get_or_render(key, build, current_app.config['FACE_INDEX_CACHE_SIZE'])
+
+def record_face_attendance(course, year, subject, day, present):
+    """Mark the whole class present or absent for one lesson (caller commits).
+
+    Students seen in an earlier snapshot of the same lesson stay present.
+    """
+    students = db.session.query(Student.student_id, Student.organization_id).filter(
+        Student.course == course, Student.year == year, Student.status == 'active'
+    ).all()
+    recorded = db.session.query(Attendance.student_id, Attendance.id, Attendance.status).join(
+        Student, Student.student_id == Attendance.student_id
+    ).filter(
+        Student.course == course, Student.year == year, Attendance.date == day, Attendance.subject == subject
+    ).all()
+    recorded_ids = {student_id for student_id, _, _ in recorded}
+
+    new_rows = [{
+        'student_id': student_id,
+        'date': day,
+        'subject': subject,
+        'status': 'present' if student_id in present else 'absent',
+        'organization_id': organization_id
+    } for student_id, organization_id in students if student_id not in recorded_ids]
+    db.session.bulk_insert_mappings(Attendance, new_rows)
+    upgraded = [attendance_id for student_id, attendance_id, status in recorded
+                if status == 'absent' and student_id in present]
+    for i in range(0, len(upgraded), 500):
+        Attendance.query.filter(Attendance.id.in_(upgraded[i:i + 500])).update(
+            {Attendance.status: 'present'}, synchronize_session=False)
+    return {'students': len(students), 'inserted': len(new_rows), 'marked_present': len(upgraded)}
+
+@face_bp.route('/admin/face-attendance')
+@admin_required
+def face_attendance_page():
+    classes = db.session.query(Student.course, Student.year).filter(
+        Student.status == 'active'
+    ).distinct().order_by(Student.course, Student.year).all()
+    embedder = face_embedder()
+    return render_template('student_attendance_face.html', classes=classes, today=date.today(),
+                           model=embedder.name if embedder else None)
+
+@face_bp.route('/api/face-attendance/enroll', methods=['POST'])
+def enroll_face():
+    if session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 401
+    embedder = face_embedder()
+    if not embedder:
+        return jsonify({'success': False, 'error': 'Face attendance not available. OpenCV not installed.'}), 503
+
+    student = Student.query.filter_by(student_id=request.form.get('student_id', '').strip()).first()
+    if not student:
+        return jsonify({'success': False, 'error': 'Student not found'}), 404
+
+    enrolled, errors = [], []
+    for photo in request.files.getlist('image'):
+        image = decode_image(photo.read())
+        faces = embedder.detect(image) if image is not None else []
+        if not len(faces):
+            errors.append({'file': photo.filename, 'error': 'not an image' if image is None else 'no face found'})
+            continue
+        # The student is the largest face; anything else is background or a false detection
+        face = faces[embedder.np.argmax(faces[:, 2] * faces[:, 3])][None]
+        enrolled.append(FaceEmbedding(
+            student_id=student.student_id,
+            model=embedder.name,
+            vector=embedder.embed(image, face)[0].tobytes(),
+            organization_id=student.organization_id
+        ))
+    db.session.add_all(enrolled)
+    db.session.commit()
+    return jsonify({'success': bool(enrolled), 'student_id': student.student_id, 'enrolled': len(enrolled),
+                    'errors': errors})
+
+@face_bp.route('/api/face-attendance/snapshot', methods=['POST'])
+def face_attendance_snapshot():
+    if session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 401
+    embedder = face_embedder()
+    if not embedder:
+        return jsonify({'success': False, 'error': 'Face attendance not available. OpenCV not installed.'}), 503
+
+    course = request.form.get('course', '').strip()
+    year = request.form.get('year', type=int)
+    subject = request.form.get('subject', '').strip()
+    try:
+        day = date.fromisoformat(request.form.get('date') or date.today().isoformat())
+    except ValueError:
+        return jsonify({'success': False, 'error': 'date must be YYYY-MM-DD'}), 400
+    if not course or not year or not subject:
+        return jsonify({'success': False, 'error': 'course, year and subject are required'}), 400
+
+    started = time.perf_counter()
+    embeddings = []
+    for frame in request.files.getlist('image'):
+        image = decode_image(frame.read())
+        if image is not None:
+            embeddings.append(embedder.embed(image, embedder.detect(image)))
+    if not embeddings:
+        return jsonify({'success': False, 'error': 'No readable classroom image uploaded'}), 400
+    embeddings = embedder.np.vstack(embeddings)
+    detected = time.perf_counter()
+
+    index = class_face_index(course, year, embedder.name)
+    present = index.match(embeddings, face_match_threshold(embedder))
+    matched = time.perf_counter()
+
+    counts = record_face_attendance(course, year, subject, day, present)
+    db.session.commit()
+    finished = time.perf_counter()
+    current_app.logger.info('Face attendance for %s year %d %s: %d faces, %d of %d students present in %.0f ms',
+                            course, year, subject, len(embeddings), len(present), counts['students'],
+                            (finished - started) * 1000)
+    return jsonify({
+        'success': True,
+        'faces': len(embeddings),
+        'enrolled': len(index.student_ids),
+        'present': sorted(present),
+        'unknown_faces': len(embeddings) - len(present),
+        'attendance': counts,
+        'timings_ms': {
+            'detect_and_embed': round((detected - started) * 1000, 1),
+            'match': round((matched - detected) * 1000, 1),
+            'record': round((finished - matched) * 1000, 1)
+        }
+    })
+
+# Face verification
+# Proctoring frames are checked in a small process pool so OpenCV never competes
+# with request threads for the GIL. Each pool process loads its detector once;
+# while every process is busy, frames from concurrent requests queue up and are
+# sent over as one batch.
+FACE_VERIFY_MAX_EDGE = 320
+
+class FaceVerifierBusy(Exception):
+    """The frame queue is full; the client should retry later"""
+
+_worker_embedder = None
+
+def _init_face_worker(detector_model, recognizer_model, nice):
+    global _worker_embedder
+    if nice:
+        os.nice(nice)
+    cv2, _ = load_opencv()
+    # One core per pool process, so a pool takes at most FACE_POOL_WORKERS cores
+    cv2.setNumThreads(1)
+    _worker_embedder = FaceEmbedder(detector_model, recognizer_model)
+
+def detect_faces(frames, embedder=None):
+    """[x, y, width, height, score] of each face per encoded frame, best first; None if unreadable"""
+    embedder = embedder or _worker_embedder
+    results = []
+    for data in frames:
+        image = decode_image(data)
+        if image is None:
+            results.append(None)
+            continue
+        faces = embedder.detect(image, FACE_VERIFY_MAX_EDGE)
+        faces = faces[embedder.np.argsort(-faces[:, 14])]
+        results.append([[round(float(value), 1) for value in face[:4]] + [round(float(face[14]), 3)]
+                        for face in faces])
+    return results
+
+class FaceVerifier:
+    """Feeds frames to the detection pool, batching whatever queued while it was busy"""
+
+    def __init__(self, workers, batch_size, queue_size, nice, detector_model=None, recognizer_model=None):
+        self.batch_size = batch_size
+        self.pending = queue.Queue(maxsize=queue_size)
+        self.pool_args = (workers, nice, detector_model, recognizer_model)
+        self.executor = self._start_pool()
+        self.slots = threading.Semaphore(workers)
+        self.dispatcher = threading.Thread(target=self._dispatch, name='face-verifier', daemon=True)
+        self.dispatcher.start()
+
+    def _start_pool(self):
+        workers, nice, detector_model, recognizer_model = self.pool_args
+        # spawn: forking a process that already runs threads can copy held locks
+        return ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_face_worker, initargs=(detector_model, recognizer_model, nice)
+        )
+
+    def submit(self, frame):
+        """Future resolving to detect_faces() output for one encoded frame"""
+        future = Future()
+        try:
+            self.pending.put_nowait((frame, future))
+        except queue.Full:
+            raise FaceVerifierBusy()
+        return future
+
+    def _dispatch(self):
+        while True:
+            self.slots.acquire()
+            batch = [self.pending.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                task = self.executor.submit(detect_faces, [frame for frame, _ in batch])
+            except BrokenProcessPool as e:
+                # A pool process died (e.g. killed for memory); fail this batch and start a fresh pool
+                face_logger.error('Face detection pool broke, restarting it: %s', e)
+                self.executor = self._start_pool()
+                self.slots.release()
+                self._settle(batch, error=e)
+                continue
+            except RuntimeError as e:
+                # Pool shut down at interpreter exit
+                self._settle(batch, error=e)
+                return
+            task.add_done_callback(functools.partial(self._finish, batch))
+
+    def _finish(self, batch, task):
+        self.slots.release()
+        try:
+            self._settle(batch, results=task.result())
+        except Exception as e:
+            self._settle(batch, error=e)
+
+    @staticmethod
+    def _settle(batch, results=None, error=None):
+        for i, (_, future) in enumerate(batch):
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(results[i])
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+_face_verifier = None
+_face_verifier_pid = None
+_face_verifier_lock = threading.Lock()
+
+def face_verifier():
+    """This process's FaceVerifier, created on first use (after any fork)"""
+    global _face_verifier, _face_verifier_pid
+    if _face_verifier is None or _face_verifier_pid != os.getpid():
+        with _face_verifier_lock:
+            if _face_verifier is None or _face_verifier_pid != os.getpid():
+                config = current_app.config
+                _face_verifier = FaceVerifier(
+                    config['FACE_POOL_WORKERS'], config['FACE_BATCH_SIZE'], config['FACE_QUEUE_SIZE'],
+                    config['FACE_WORKER_NICE'], config.get('FACE_DETECTOR_MODEL'), config.get('FACE_RECOGNIZER_MODEL')
+                )
+                _face_verifier_pid = os.getpid()
+                atexit.register(_face_verifier.shutdown)
+    return _face_verifier
+
+def submit_frame(frame):
+    """Future for the faces in one encoded frame; already resolved when FACE_POOL_WORKERS is 0"""
+    if current_app.config['FACE_POOL_WORKERS']:
+        return face_verifier().submit(frame)
+    future = Future()
+    future.set_result(detect_faces([frame], face_embedder())[0])
+    return future
+
+def verify_frame(frame):
+    """Faces found in one encoded frame by the pool, or in this thread when FACE_POOL_WORKERS is 0"""
+    return submit_frame(frame).result(timeout=current_app.config['FACE_VERIFY_TIMEOUT'])
+
+def record_face_frame(student_id, frame, faces, client_confidence=None, client_coordinates=None, attempt_id=None,
+                      keep_image=True):
+    """Save an encoded frame as received and add its FaceDetection row; the caller commits"""
+    image_path = None
+    if keep_image:
+        # Written without decoding and re-encoding it
+        image_filename = f"face_detection_{student_id}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jpg"
+        image_path = os.path.join(current_app.config['UPLOAD_FOLDER'], image_filename)
+        with open(image_path, 'wb') as f:
+            f.write(frame)
+
+    best = faces[0] if faces else None
+    detection = FaceDetection(
+        student_id=student_id,
+        attempt_id=attempt_id,
+        coordinates=json.dumps(dict(zip(('x', 'y', 'width', 'height'), best[:4])) if best else client_coordinates or {}),
+        confidence=best[4] if best else 0.0,
+        verified=len(faces) == 1,
+        face_count=len(faces),
+        client_confidence=client_confidence,
+        image_path=image_path
+    )
+    db.session.add(detection)
+    face_logger.info('Face frame from %s: %d faces, confidence %.2f (client %s)',
+                     student_id, len(faces), detection.confidence, client_confidence)
+    return detection
+
+def face_frame_error(faces):
+    """Why a frame does not verify the student, or None"""
+    if len(faces) == 1:
+        return None
+    return 'No face detected in the frame' if not faces else 'More than one face in the frame'
+
 # Face Detection Routes
-@app.route('/api/face-detection', methods=['POST'])
+@face_bp.route('/api/face-detection', methods=['POST'])
 @login_required
 def face_detection():
-    if not OPENCV_AVAILABLE:
+    if not load_opencv():
         return jsonify({'success': False, 'error': 'Face detection not available. OpenCV not installed.'})
     
     try:
@@ -1734,43 +4866,44 @@ def face_detection():
         coordinates = data.get('coordinates', {})
         confidence = data.get('confidence', 0.0)
         
-        # Decode base64 image
+        # Decode base64 image; the pool decodes and downscales it for detection
         image_bytes = base64.b64decode(image_data.split(',')[1])
-        nparr = np.frombuffer(image_bytes, np.uint8)
-        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-        
-        # Save image
-        image_filename = f"face_detection_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg"
-        image_path = os.path.join(app.config['UPLOAD_FOLDER'], image_filename)
-        cv2.imwrite(image_path, image)
+        try:
+            faces = verify_frame(image_bytes)
+        except (FaceVerifierBusy, FutureTimeoutError, BrokenProcessPool):
+            return jsonify({'success': False, 'error': 'Face detection is busy, please try again'}), 503
+        if faces is None:
+            return jsonify({'success': False, 'error': 'Could not read the image'}), 400
         
         # Get student ID from session
         user = User.query.get(session['user_id'])
         student = Student.query.filter_by(email=user.email).first()
         student_id = student.student_id if student else 'UNKNOWN'
         
-        # Save detection record
-        detection = FaceDetection(
-            student_id=student_id,
-            coordinates=json.dumps(coordinates),
-            confidence=confidence,
-            image_path=image_path
-        )
-        db.session.add(detection)
+        # Frames count towards the test the student is sitting, if any, so compaction
+        # folds them into its summary; like streamed frames, only flagged ones keep the image
+        attempt = TestAttempt.query.filter_by(student_id=student_id, is_submitted=False) \
+            .order_by(TestAttempt.id.desc()).first()
+        detection = record_face_frame(student_id, image_bytes, faces, confidence, coordinates,
+                                      attempt_id=attempt.id if attempt else None, keep_image=len(faces) != 1)
         db.session.commit()
         
-        return jsonify({'success': True, 'message': 'Face detection recorded'})
+        error = face_frame_error(faces)
+        if error:
+            return jsonify({'success': False, 'error': error, 'faces': len(faces)})
+        return jsonify({'success': True, 'message': 'Face detection recorded', 'faces': 1,
+                        'confidence': detection.confidence, 'coordinates': json.loads(detection.coordinates)})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
 # Test Management Routes
-@app.route('/admin/tests')
+@tests_bp.route('/admin/tests')
 @admin_required
 def admin_tests():
     tests = Test.query.filter_by(created_by=session['user_id']).order_by(Test.created_at.desc()).all()
     return render_template('admin_tests.html', tests=tests)
 
-@app.route('/admin/tests/create', methods=['GET', 'POST'])
+@tests_bp.route('/admin/tests/create', methods=['GET', 'POST'])
 @admin_required
 def create_test():
     if request.method == 'POST':
@@ -1806,90 +4939,425 @@ def create_test():
         
         db.session.commit()
         flash('Test created successfully!')
-        return redirect(url_for('admin_tests'))
+        return redirect(url_for('tests.admin_tests'))
     
     return render_template('create_test.html')
 
-@app.route('/student/tests')
+@tests_bp.route('/student/tests')
 @student_required
 def student_tests():
     tests = Test.query.filter(Test.is_active == True).all()
     return render_template('student_tests.html', tests=tests)
 
-@app.route('/student/tests/<int:test_id>')
+@tests_bp.route('/student/tests/<int:test_id>')
 @student_required
 def take_test(test_id):
     test = Test.query.get_or_404(test_id)
     questions = Question.query.filter_by(test_id=test_id).order_by(Question.order).all()
-    return render_template('take_test.html', test=test, questions=questions)
+    
+    # The attempt starts when the test is opened so proctoring frames can refer to it
+    attempt = None
+    student = Student.query.filter_by(email=g.user.email).first()
+    if student:
+        attempt = open_attempt(test_id, student.student_id)
+        if not attempt:
+            attempt = TestAttempt(test_id=test_id, student_id=student.student_id)
+            db.session.add(attempt)
+            db.session.commit()
+    return render_template('take_test.html', test=test, questions=questions, attempt=attempt)
+
+def open_attempt(test_id, student_id):
+    """The student's started but unsubmitted attempt at a test, if any"""
+    return TestAttempt.query.filter_by(test_id=test_id, student_id=student_id, is_submitted=False) \
+        .order_by(TestAttempt.id.desc()).first()
 
-@app.route('/student/face-detection')
+@face_bp.route('/student/face-detection')
 @student_required
 def face_detection_page():
     return render_template('face_detection.html')
 
-@app.route('/student/tests/<int:test_id>/submit', methods=['POST'])
+@tests_bp.route('/student/tests/<int:test_id>/submit', methods=['POST'])
 @student_required
 def submit_test(test_id):
     test = Test.query.get_or_404(test_id)
     user = User.query.get(session['user_id'])
     student = Student.query.filter_by(email=user.email).first()
     
-    # Create test attempt
-    attempt = TestAttempt(
-        test_id=test_id,
-        student_id=student.student_id,
-        submitted_at=datetime.utcnow(),
-        is_submitted=True
-    )
-    db.session.add(attempt)
+    # Finish the attempt opened by take_test, or create one
+    attempt = open_attempt(test_id, student.student_id)
+    if not attempt:
+        attempt = TestAttempt(test_id=test_id, student_id=student.student_id)
+        db.session.add(attempt)
+    attempt.submitted_at = datetime.utcnow()
+    attempt.is_submitted = True
     db.session.flush()
     
     # Process answers
     total_points = 0
     earned_points = 0
+    answers = []
     
     for question in Question.query.filter_by(test_id=test_id):
         answer_text = request.form.get(f'question_{question.id}', '')
         is_correct = answer_text.lower().strip() == question.correct_answer.lower().strip()
         points_earned = question.points if is_correct else 0
         
-        answer = Answer(
-            attempt_id=attempt.id,
-            question_id=question.id,
-            answer_text=answer_text,
-            is_correct=is_correct,
-            points_earned=points_earned
-        )
-        db.session.add(answer)
+        answers.append({
+            'attempt_id': attempt.id,
+            'question_id': question.id,
+            'answer_text': answer_text,
+            'is_correct': is_correct,
+            'points_earned': points_earned
+        })
         
         total_points += question.points
         earned_points += points_earned
     
+    # A single executemany instead of an INSERT per answer
+    db.session.bulk_insert_mappings(Answer, answers)
     attempt.total_points = total_points
     attempt.score = earned_points
     db.session.commit()
     
     flash(f'Test submitted! Your score: {earned_points}/{total_points}')
-    return redirect(url_for('student_tests'))
+    return redirect(url_for('tests.student_tests'))
+
+# Proctoring stream
+# While a test is open the page keeps one WebSocket per attempt and sends each
+# webcam frame as a binary JPEG message. The server tells the page how many
+# frames a second to send and halves the rate whenever verification falls behind.
+sock = Sock()
+
+PROCTOR_MIN_FPS = 0.2
+
+class FrameRate:
+    """Frames per second the server asks one proctoring stream for"""
+
+    def __init__(self, fps, max_fps):
+        self.fps = fps
+        self.max_fps = max_fps
+        self.quick = 0
+
+    def slow_down(self):
+        """Halve the rate; True when it changed"""
+        fps, self.quick = max(PROCTOR_MIN_FPS, self.fps / 2), 0
+        changed, self.fps = fps != self.fps, fps
+        return changed
+
+    def update(self, latency, backlog):
+        """Adjust after a verified frame; True when the rate changed"""
+        interval = 1 / self.fps
+        if backlog > 1 or latency > interval:
+            return self.slow_down()
+        if latency > interval / 4:
+            self.quick = 0
+            return False
+        # Speed up by a quarter after five frames that took under a quarter of the interval
+        self.quick += 1
+        if self.quick < 5:
+            return False
+        fps, self.quick = min(self.max_fps, round(self.fps * 1.25, 2)), 0
+        changed, self.fps = fps != self.fps, fps
+        return changed
+
+@sock.route('/ws/tests/attempts/<int:attempt_id>/proctor', bp=tests_bp)
+@student_required
+def proctor_stream(ws, attempt_id):
+    student = Student.query.filter_by(email=g.user.email).first()
+    attempt = TestAttempt.query.get(attempt_id)
+    if not student or not attempt or attempt.student_id != student.student_id or attempt.is_submitted:
+        ws.close(reason=1008, message='No open attempt')
+        return
+    if not load_opencv():
+        ws.close(reason=1011, message='Face detection not available')
+        return
+    
+    config = current_app.config
+    rate = FrameRate(config['PROCTOR_START_FPS'], config['PROCTOR_MAX_FPS'])
+    ws.send(json.dumps({'type': 'rate', 'fps': rate.fps}))
+    # (sequence number, frame bytes, submitted at, future) in arrival order
+    in_flight = deque()
+    sequence = 0
+    while True:
+        # Poll while frames are being verified; otherwise wait for the next one
+        message = ws.receive(timeout=0.05 if in_flight else config['PROCTOR_IDLE_TIMEOUT'])
+        if message is None and not in_flight:
+            ws.close(reason=1000, message='Idle')
+            return
+        if isinstance(message, str):
+            try:
+                control = json.loads(message)
+            except ValueError:
+                control = None
+            # A malformed control message is skipped; it must not end the proctoring session
+            if not isinstance(control, dict):
+                current_app.logger.warning('Ignoring malformed proctoring message on attempt %s', attempt.id)
+            elif control.get('type') == 'stop':
+                return
+        elif message is not None:
+            sequence += 1
+            future = None
+            if len(in_flight) < config['PROCTOR_MAX_IN_FLIGHT']:
+                try:
+                    # The message bytes go to the decode queue as they are
+                    future = submit_frame(message)
+                except FaceVerifierBusy:
+                    pass
+            if future is None:
+                ws.send(json.dumps({'type': 'dropped', 'seq': sequence}))
+                if rate.slow_down():
+                    ws.send(json.dumps({'type': 'rate', 'fps': rate.fps}))
+            else:
+                in_flight.append((sequence, message, time.monotonic(), future))
+        
+        # Report finished frames in order; give up on any stuck past FACE_VERIFY_TIMEOUT
+        while in_flight:
+            frame_sequence, frame, submitted, future = in_flight[0]
+            latency = time.monotonic() - submitted
+            if not future.done() and latency < config['FACE_VERIFY_TIMEOUT']:
+                break
+            in_flight.popleft()
+            try:
+                faces = future.result(timeout=0)
+            except (FutureTimeoutError, BrokenProcessPool):
+                ws.send(json.dumps({'type': 'dropped', 'seq': frame_sequence}))
+                if rate.slow_down():
+                    ws.send(json.dumps({'type': 'rate', 'fps': rate.fps}))
+                continue
+            if faces is None:
+                ws.send(json.dumps({'type': 'result', 'seq': frame_sequence, 'error': 'Could not read the image'}))
+                continue
+            # Only frames that may end up as keyframes of a flagged interval keep their image
+            detection = record_face_frame(student.student_id, frame, faces, attempt_id=attempt.id,
+                                          keep_image=len(faces) != 1)
+            db.session.commit()
+            ws.send(json.dumps({
+                'type': 'result', 'seq': frame_sequence, 'faces': len(faces), 'verified': detection.verified,
+                'confidence': detection.confidence, 'error': face_frame_error(faces)
+            }))
+            if rate.update(latency, len(in_flight)):
+                ws.send(json.dumps({'type': 'rate', 'fps': rate.fps}))
+
+# Proctoring summary
+# Nobody reads proctoring frames one by one, so once an attempt has been quiet
+# for PROCTOR_RAW_RETENTION_HOURS its frames are folded into a ProctoringSummary.
+# Only one keyframe per flagged interval survives that; the keyframes go too
+# after PROCTOR_KEYFRAME_RETENTION_DAYS. Run `flask --app app compact-proctoring`
+# from cron.
+class ProctoringFold:
+    """Folds one attempt's frames, oldest first, into counts and flagged intervals.
+
+    An interval is a run of frames without a face or with several faces that
+    lasts at least ``flag_seconds``, or a pause of more than ``gap_seconds``
+    between two frames (camera off or connection lost).
+    """
+
+    def __init__(self, flag_seconds, gap_seconds):
+        self.flag_seconds = flag_seconds
+        self.gap_seconds = gap_seconds
+        self.frames = self.present = self.multiple = self.absent = 0
+        self.seconds = {'absent': 0.0, 'multiple': 0.0, 'gap': 0.0}
+        self.first = self.last = None
+        self.run = None
+        self.intervals = []
+
+    def add(self, detection_id, detected_at, face_count, has_image):
+        if self.last is not None and (detected_at - self.last).total_seconds() > self.gap_seconds:
+            self._close(self.last)
+            self._flag('gap', self.last, detected_at, 0, None)
+        kind = 'absent' if not face_count else 'multiple' if face_count > 1 else None
+        if self.run and self.run['kind'] != kind:
+            self._close(detected_at)
+        if kind and not self.run:
+            self.run = {'kind': kind, 'start': detected_at, 'frames': 0, 'keyframe': None, 'faces': -1}
+        if self.run:
+            self.run['frames'] += 1
+            # The first frame of the run with an image, or the one with the most faces
+            if has_image and face_count > self.run['faces']:
+                self.run['keyframe'], self.run['faces'] = detection_id, face_count
+        self.frames += 1
+        self.present += bool(face_count)
+        self.multiple += face_count > 1
+        self.absent += not face_count
+        self.first = self.first or detected_at
+        self.last = detected_at
+
+    def _close(self, end):
+        run, self.run = self.run, None
+        if run:
+            self._flag(run['kind'], run['start'], end, run['frames'], run['keyframe'])
+
+    def _flag(self, kind, start, end, frames, keyframe):
+        seconds = (end - start).total_seconds()
+        self.seconds[kind] += seconds
+        if seconds >= self.flag_seconds:
+            self.intervals.append({'kind': kind, 'start': start.isoformat(), 'end': end.isoformat(),
+                                   'seconds': round(seconds, 1), 'frames': frames, 'keyframe_id': keyframe})
+
+    def finish(self):
+        """Summary column values"""
+        self._close(self.last)
+        return {
+            'frames': self.frames,
+            'present_frames': self.present,
+            'multi_face_frames': self.multiple,
+            'absent_frames': self.absent,
+            'face_present_ratio': round(self.present / self.frames, 4) if self.frames else 0.0,
+            'absent_seconds': round(self.seconds['absent'], 1),
+            'multi_face_seconds': round(self.seconds['multiple'], 1),
+            'gap_seconds': round(self.seconds['gap'], 1),
+            'first_frame_at': self.first,
+            'last_frame_at': self.last,
+            'intervals': json.dumps(self.intervals)
+        }
+
+def summarize_attempt(attempt, chunk_size=5000):
+    """Fold the attempt's frames into its ProctoringSummary (caller commits).
+
+    A compacted summary is returned as it is; its raw frames are gone.
+    """
+    summary = ProctoringSummary.query.filter_by(attempt_id=attempt.id).first()
+    if summary and summary.compacted_at:
+        return summary
+    config = current_app.config
+    fold = ProctoringFold(config['PROCTOR_FLAG_SECONDS'], config['PROCTOR_GAP_SECONDS'])
+    rows = db.session.query(
+        FaceDetection.id, FaceDetection.detected_at, FaceDetection.face_count, FaceDetection.image_path
+    ).filter(FaceDetection.attempt_id == attempt.id).order_by(FaceDetection.detected_at, FaceDetection.id)
+    for detection_id, detected_at, face_count, image_path in rows.yield_per(chunk_size):
+        fold.add(detection_id, detected_at, face_count or 0, image_path is not None)
+    if not summary:
+        summary = ProctoringSummary(attempt_id=attempt.id, student_id=attempt.student_id)
+        db.session.add(summary)
+    for name, value in fold.finish().items():
+        setattr(summary, name, value)
+    return summary
+
+def remove_face_frames(query, chunk_size=5000):
+    """Delete FaceDetection rows matched by ``query`` and their image files; returns (rows, files)"""
+    files = 0
+    for (image_path,) in query.filter(FaceDetection.image_path.isnot(None)) \
+            .with_entities(FaceDetection.image_path).yield_per(chunk_size):
+        try:
+            os.remove(image_path)
+            files += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            current_app.logger.error("Error removing face frame %s: %s", image_path, e)
+    return query.delete(synchronize_session=False), files
+
+def compact_proctoring(now=None):
+    """Summarize and compact attempts past raw retention, purge keyframes past theirs"""
+    now = now or datetime.utcnow()
+    config = current_app.config
+    report = {'attempts': 0, 'keyframes_purged': 0, 'orphans_deleted': 0, 'rows_deleted': 0, 'files_deleted': 0}
+    start = time.perf_counter()
+
+    # Attempts whose newest frame is older than the raw retention, submitted or abandoned;
+    # compacted attempts still hold their keyframes and are skipped
+    raw_cutoff = now - timedelta(hours=config['PROCTOR_RAW_RETENTION_HOURS'])
+    compacted = db.session.query(ProctoringSummary.attempt_id).filter(ProctoringSummary.compacted_at.isnot(None))
+    quiet = db.session.query(FaceDetection.attempt_id).filter(
+        FaceDetection.attempt_id.isnot(None), FaceDetection.attempt_id.notin_(compacted.scalar_subquery())
+    ).group_by(FaceDetection.attempt_id).having(db.func.max(FaceDetection.detected_at) < raw_cutoff)
+    for attempt in TestAttempt.query.filter(TestAttempt.id.in_(quiet.scalar_subquery())).all():
+        summary = summarize_attempt(attempt)
+        keyframes = [interval['keyframe_id'] for interval in json.loads(summary.intervals or '[]')
+                     if interval['keyframe_id']]
+        rows, files = remove_face_frames(FaceDetection.query.filter(
+            FaceDetection.attempt_id == attempt.id, FaceDetection.id.notin_(keyframes)
+        ))
+        summary.compacted_at = now
+        # One transaction per attempt keeps locks short and progress durable
+        db.session.commit()
+        report['attempts'] += 1
+        report['rows_deleted'] += rows
+        report['files_deleted'] += files
+
+    # Frames checked outside any test have no attempt to summarize them; they expire with raw frames
+    rows, files = remove_face_frames(FaceDetection.query.filter(
+        FaceDetection.attempt_id.is_(None), FaceDetection.detected_at < raw_cutoff
+    ))
+    db.session.commit()
+    report['orphans_deleted'] = rows
+    report['rows_deleted'] += rows
+    report['files_deleted'] += files
+
+    keyframe_cutoff = now - timedelta(days=config['PROCTOR_KEYFRAME_RETENTION_DAYS'])
+    for summary in ProctoringSummary.query.filter(
+        ProctoringSummary.compacted_at < keyframe_cutoff, ProctoringSummary.keyframes_purged_at.is_(None)
+    ).all():
+        rows, files = remove_face_frames(FaceDetection.query.filter_by(attempt_id=summary.attempt_id))
+        intervals = json.loads(summary.intervals or '[]')
+        for interval in intervals:
+            interval['keyframe_id'] = None
+        summary.intervals = json.dumps(intervals)
+        summary.keyframes_purged_at = now
+        db.session.commit()
+        report['keyframes_purged'] += 1
+        report['rows_deleted'] += rows
+        report['files_deleted'] += files
+
+    report['seconds'] = round(time.perf_counter() - start, 3)
+    return report
+
+@main_bp.cli.command('compact-proctoring')
+def compact_proctoring_command():
+    """Fold old proctoring frames into per-attempt summaries and drop expired keyframes."""
+    report = compact_proctoring()
+    print(f"Compacted {report['attempts']} attempts, purged keyframes of {report['keyframes_purged']} "
+          f"and expired {report['orphans_deleted']} frames from outside tests: "
+          f"{report['rows_deleted']} rows and {report['files_deleted']} files deleted in {report['seconds']}s")
+
+@tests_bp.route('/api/tests/attempts/<int:attempt_id>/proctoring')
+def attempt_proctoring(attempt_id):
+    if session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 401
+    attempt = TestAttempt.query.get_or_404(attempt_id)
+    # Attempts not compacted yet are folded on request, so the numbers are current
+    summary = summarize_attempt(attempt)
+    db.session.commit()
+    intervals = json.loads(summary.intervals or '[]')
+    for interval in intervals:
+        interval['keyframe_url'] = url_for('face.face_snapshot', detection_id=interval['keyframe_id']) \
+            if interval['keyframe_id'] else None
+    return jsonify({
+        'attempt_id': attempt.id,
+        'student_id': attempt.student_id,
+        'frames': summary.frames,
+        'present_frames': summary.present_frames,
+        'multi_face_frames': summary.multi_face_frames,
+        'absent_frames': summary.absent_frames,
+        'face_present_ratio': summary.face_present_ratio,
+        'absent_seconds': summary.absent_seconds,
+        'multi_face_seconds': summary.multi_face_seconds,
+        'gap_seconds': summary.gap_seconds,
+        'first_frame_at': summary.first_frame_at.isoformat() if summary.first_frame_at else None,
+        'last_frame_at': summary.last_frame_at.isoformat() if summary.last_frame_at else None,
+        'intervals': intervals,
+        'compacted': summary.compacted_at is not None
+    })
 
 # Student Management Routes
-@app.route('/admin/students')
+@admin_bp.route('/admin/students')
 @admin_required
 def admin_students():
     # Get all students with their details
     students = Student.query.all()
+    fees_paid = dict(db.session.query(Fee.student_id, db.func.sum(Fee.amount)).group_by(Fee.student_id).all())
     
     # Format student data for template
     formatted_students = []
     for student in students:
+        total_fees_paid = fees_paid.get(student.student_id, 0)
         # Calculate risk score
         risk_score = 0
-        if student.attendance < 75:
+        if student.attendance_percentage < 75:
             risk_score += 0.3
         if student.gpa < 6.0:
             risk_score += 0.2
-        if student.total_fees_paid == 0:
+        if total_fees_paid == 0:
             risk_score += 0.3
         
         # Determine risk level
@@ -1906,9 +5374,9 @@ def admin_students():
             'student_id': student.student_id,
             'email': student.email,
             'course': student.course,
-            'attendance': student.attendance,
+            'attendance': student.attendance_percentage,
             'gpa': student.gpa,
-            'fees_paid': student.total_fees_paid,
+            'fees_paid': total_fees_paid,
             'status': 'active',
             'risk_level': risk_level,
             'risk_score': risk_score
@@ -1916,16 +5384,21 @@ def admin_students():
     
     return render_template('admin_students.html', students=formatted_students)
 
-@app.route('/admin/students/<student_id>')
+@admin_bp.route('/admin/students/<student_id>')
 @admin_required
 def student_details(student_id):
     student = Student.query.filter_by(student_id=student_id).first_or_404()
+    total_fees_paid = db.session.query(db.func.coalesce(db.func.sum(Fee.amount), 0)) \
+        .filter(Fee.student_id == student.student_id).scalar()
+    # Date of birth and address are kept on the application the student was admitted from
+    application = Application.query.filter_by(email=student.email, status='approved') \
+        .order_by(Application.id.desc()).first()
     
     # Calculate risk score and recommendations
     risk_score = 0
     recommendations = []
     
-    if student.attendance < 75:
+    if student.attendance_percentage < 75:
         risk_score += 0.3
         recommendations.append("Improve attendance to maintain academic standing")
     
@@ -1933,7 +5406,7 @@ def student_details(student_id):
         risk_score += 0.2
         recommendations.append("Focus on improving academic performance")
     
-    if student.total_fees_paid == 0:
+    if total_fees_paid == 0:
         risk_score += 0.3
         recommendations.append("Complete pending fee payments")
     
@@ -1946,27 +5419,113 @@ def student_details(student_id):
         'phone': student.phone,
         'course': student.course,
         'year': student.year,
-        'attendance': student.attendance,
+        'attendance': student.attendance_percentage,
         'gpa': student.gpa,
-        'fees_paid': student.total_fees_paid,
+        'fees_paid': total_fees_paid,
         'status': 'active',
-        'dob': student.dob,
-        'address': student.address,
+        'dob': application.date_of_birth if application else None,
+        'address': application.address if application else None,
         'risk_score': risk_score,
-        'recommendations': recommendations
+        'recommendations': recommendations,
+        'documents': review_documents([application.id]).get(application.id, []) if application else []
     }
     
     return render_template('admin_student_detail.html', student=formatted_student)
 
-@app.route('/logout')
+@main_bp.route('/logout')
 def logout():
     session.clear()
-    return redirect(url_for('index'))
+    return redirect(url_for('main.index'))
+
+# Application factory
+def create_app(config=None):
+    """Build the Flask app; heavy dependencies stay unimported until a route needs them"""
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = 'your-secret-key-here'
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///college_erp.db')
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # Outside static/, so uploads are only reachable through the access-checked routes
+    app.config['UPLOAD_FOLDER'] = os.environ.get('UPLOAD_FOLDER', os.path.join(app.instance_path, 'uploads'))
+    app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+    app.config['THUMBNAIL_SIZE'] = 320  # longest edge in pixels
+    # Requests slower than this are logged with their slowest SQL statements
+    app.config['SLOW_REQUEST_SECONDS'] = float(os.environ.get('SLOW_REQUEST_SECONDS', 1.0))
+    # Lets a Prometheus scraper read /metrics without an admin session
+    app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN')
+    # Logging: json or text lines, optional rotating file, per-logger levels
+    app.config['LOG_FORMAT'] = os.environ.get('LOG_FORMAT', 'json')
+    app.config['LOG_FILE'] = os.environ.get('LOG_FILE')
+    app.config['LOG_LEVELS'] = os.environ.get('LOG_LEVELS', '=INFO,sqlalchemy.engine=WARNING')
+    app.config['LOG_QUEUE_SIZE'] = int(os.environ.get('LOG_QUEUE_SIZE', 10000))
+    # Face-frame logs arrive several times a second per student; keep one in N
+    app.config['FACE_LOG_SAMPLE_RATE'] = int(os.environ.get('FACE_LOG_SAMPLE_RATE', 100))
+    # Optional YuNet detector and SFace recognizer ONNX files for face attendance;
+    # without them the Haar cascade bundled with OpenCV and LBP histograms are used
+    app.config['FACE_DETECTOR_MODEL'] = os.environ.get('FACE_DETECTOR_MODEL')
+    app.config['FACE_RECOGNIZER_MODEL'] = os.environ.get('FACE_RECOGNIZER_MODEL')
+    # Cosine similarity a face needs to count as a student (default depends on the model)
+    app.config['FACE_MATCH_THRESHOLD'] = float(os.environ['FACE_MATCH_THRESHOLD']) \
+        if os.environ.get('FACE_MATCH_THRESHOLD') else None
+    # Server-side face verification: pool processes per web worker (0 runs
+    # detection in the request thread), each limited to one core at this nice level.
+    # Every web worker starts its own pool, so the host runs up to
+    # WEB_CONCURRENCY x FACE_POOL_WORKERS of them; size the two together
+    app.config['FACE_POOL_WORKERS'] = int(os.environ.get('FACE_POOL_WORKERS', 1))
+    app.config['FACE_WORKER_NICE'] = int(os.environ.get('FACE_WORKER_NICE', 10))
+    app.config['FACE_BATCH_SIZE'] = int(os.environ.get('FACE_BATCH_SIZE', 8))
+    app.config['FACE_QUEUE_SIZE'] = int(os.environ.get('FACE_QUEUE_SIZE', 64))
+    app.config['FACE_VERIFY_TIMEOUT'] = float(os.environ.get('FACE_VERIFY_TIMEOUT', 5))
+    # Proctoring WebSocket: starting and highest frame rate the server asks for,
+    # frames one stream may have waiting for verification, and the largest frame
+    app.config['PROCTOR_START_FPS'] = float(os.environ.get('PROCTOR_START_FPS', 1))
+    app.config['PROCTOR_MAX_FPS'] = float(os.environ.get('PROCTOR_MAX_FPS', 2))
+    app.config['PROCTOR_MAX_IN_FLIGHT'] = int(os.environ.get('PROCTOR_MAX_IN_FLIGHT', 2))
+    app.config['PROCTOR_IDLE_TIMEOUT'] = float(os.environ.get('PROCTOR_IDLE_TIMEOUT', 60))
+    # Proctoring summaries: how long a no-face/multi-face run or a pause between
+    # frames must last to be flagged, and how long raw frames and keyframes are kept
+    app.config['PROCTOR_FLAG_SECONDS'] = float(os.environ.get('PROCTOR_FLAG_SECONDS', 3))
+    app.config['PROCTOR_GAP_SECONDS'] = float(os.environ.get('PROCTOR_GAP_SECONDS', 15))
+    app.config['PROCTOR_RAW_RETENTION_HOURS'] = float(os.environ.get('PROCTOR_RAW_RETENTION_HOURS', 24))
+    app.config['PROCTOR_KEYFRAME_RETENTION_DAYS'] = float(os.environ.get('PROCTOR_KEYFRAME_RETENTION_DAYS', 180))
+    app.config['SOCK_SERVER_OPTIONS'] = {
+        'ping_interval': 25,
+        'max_message_size': int(os.environ.get('PROCTOR_MAX_FRAME_BYTES', 512 * 1024))
+    }
+    # Rendered template fragments kept per process (0 disables the cache)
+    app.config['FRAGMENT_CACHE_SIZE'] = int(os.environ.get('FRAGMENT_CACHE_SIZE', 512))
+    # Timetable week grids kept per process, one per tenant, class and timetable version
+    app.config['TIMETABLE_CACHE_SIZE'] = int(os.environ.get('TIMETABLE_CACHE_SIZE', 128))
+    # Class face matrices kept per process, one per tenant, class, model and enrolment version
+    app.config['FACE_INDEX_CACHE_SIZE'] = int(os.environ.get('FACE_INDEX_CACHE_SIZE', 64))
+    if config:
+        app.config.update(config)
+    # Image previews sit with the uploads they are made from
+    app.config.setdefault('THUMBNAIL_FOLDER', os.path.join(app.config['UPLOAD_FOLDER'], 'thumbnails'))
+
+    configure_logging(app)
+
+    # Create upload directory if it doesn't exist
+    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+
+    db.init_app(app)
+    sock.init_app(app)
+    app.jinja_env.add_extension(FragmentCacheExtension)
+    for blueprint in (main_bp, admin_bp, student_bp, tests_bp, wallet_bp, hostel_bp, face_bp):
+        app.register_blueprint(blueprint)
+
+    return app
 
 # Initialize database and sample data
-def init_db():
+def init_db(app, seed=None):
+    """Create tables and the sample data; ``seed`` makes the random sample values repeatable"""
+    rng = random.Random(seed)
     with app.app_context():
         db.create_all()
+        upgrade_schema()
+        
+        # Version rows exist up front so concurrent writers only ever UPDATE them
+        existing_versions = {version.table_name for version in DataVersion.query}
+        db.session.add_all(DataVersion(table_name=name) for name in sorted(VERSIONED_TABLES - existing_versions))
         
         # Create admin user if not exists
         if not User.query.filter_by(username='admin').first():
@@ -1988,38 +5547,6 @@ def init_db():
             )
             db.session.add(student_user)
         
-        # Create sample hostel rooms
-        if not Hostel.query.first():
-            for floor in range(1, 4):
-                for room in range(1, 21):
-                    room_number = f"{floor}{room:02d}"
-                    hostel = Hostel(
-                        room_number=room_number,
-                        floor=floor,
-                        capacity=2,
-                        occupied=random.randint(0, 2)
-                    )
-                    db.session.add(hostel)
-        
-        # Create sample timetable
-        if not Timetable.query.first():
-            days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-            subjects = ['Mathematics', 'Physics', 'Chemistry', 'English', 'Computer Science']
-            teachers = ['Dr. Smith', 'Prof. Johnson', 'Dr. Brown', 'Ms. Davis', 'Mr. Wilson']
-            time_slots = ['09:00-10:00', '10:00-11:00', '11:00-12:00', '14:00-15:00', '15:00-16:00']
-            
-            for day in days:
-                for i, time_slot in enumerate(time_slots):
-                    timetable = Timetable(
-                        day=day,
-                        time_slot=time_slot,
-                        subject=subjects[i % len(subjects)],
-                        teacher=teachers[i % len(teachers)],
-                        room=f"R{i+1:02d}",
-                        year=1
-                    )
-                    db.session.add(timetable)
-        
         # Create real colleges/organizations
         if not Organization.query.first():
             real_colleges = [
@@ -2061,6 +5588,38 @@ def init_db():
             ]
             for college in real_colleges:
                 db.session.add(college)
+            db.session.flush()
+        
+        # Sample campus data belongs to the first organization
+        default_org = Organization.query.order_by(Organization.id).first()
+        
+        # Create sample hostel rooms
+        if not Hostel.query.first():
+            for floor in range(1, 4):
+                for room in range(1, 21):
+                    room_number = f"{floor}{room:02d}"
+                    hostel = Hostel(
+                        room_number=room_number,
+                        floor=floor,
+                        capacity=2,
+                        occupied=rng.randint(0, 2),
+                        organization_id=default_org.id
+                    )
+                    db.session.add(hostel)
+        
+        # Create sample timetable
+        if not Timetable.query.first():
+            days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+            subjects = ['Mathematics', 'Physics', 'Chemistry', 'English', 'Computer Science']
+            teachers = ['Dr. Smith', 'Prof. Johnson', 'Dr. Brown', 'Ms. Davis', 'Mr. Wilson']
+            time_slots = ['09:00-10:00', '10:00-11:00', '11:00-12:00', '14:00-15:00', '15:00-16:00']
+            
+            # Five lessons a week of each subject, scheduled without clashes
+            requirements = [{'year': 1, 'section': 'A', 'subject': subject, 'teacher': teacher, 'sessions': len(days)}
+                            for subject, teacher in zip(subjects, teachers)]
+            rows, _ = generate_timetable(requirements, [f'R{i:02d}' for i in range(1, 6)], days, time_slots)
+            for row in rows:
+                db.session.add(Timetable(organization_id=default_org.id, **row))
         
         # Create sample library books
         if not LibraryBook.query.first():
@@ -2114,8 +5673,23 @@ def init_db():
             for book in sample_books:
                 db.session.add(book)
         
+        # Fill organization counters for databases created before they existed
+        refresh_organization_stats()
+        
+        # Build revenue rollups for ledgers created before they existed
+        if Fee.query.first() and not RevenueRollup.query.first():
+            backfill_revenue_rollups()
+        
         db.session.commit()
 
+@main_bp.cli.command('init-db')
+def init_db_command():
+    """Create tables and load the sample data."""
+    init_db(current_app._get_current_object())
+    print('Database initialized')
+
 if __name__ == '__main__':
-    init_db()
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Development server; production runs wsgi:app under gunicorn (see gunicorn.conf.py)
+    app = create_app()
+    init_db(app)
+    app.run(debug=os.environ.get('FLASK_DEBUG', '1') == '1', host='0.0.0.0', port=5000)
@@ -0,0 +1,787 @@
+"""Benchmarks for the College ERP hot paths.
+
+Run ``python benchmarks.py`` to run everything, or pass benchmark names to
+run a subset. Benchmarks use throwaway SQLite databases (``DATABASE_URL``)
+so the development database is never touched.
+
+    python benchmarks.py routes --scale tiny --scale small --output results.json
+    python benchmarks.py --output baseline.json           # on the reference machine
+    python benchmarks.py --baseline baseline.json         # exits 1 on regressions
+    python benchmarks.py --compare baseline.json results.json
+
+The ``routes`` benchmark generates each ``datagen`` profile into its own
+database and times the hot routes against it.
+"""
+import argparse
+import base64
+import io
+import json
+import logging
+import logging.handlers
+import multiprocessing
+import queue
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+os.environ.setdefault(
+    'DATABASE_URL',
+    'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='erp-bench-'), 'bench.db')
+)
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app import (create_app, db, load_opencv, BackgroundQueueHandler, JsonFormatter, Application, Attendance,
+                 FaceDetection,
+                 FaceEmbedding, Hostel, IdAllocator, IdSequence, LibraryBook, face_embedder,
+                 MeritPool, Organization, Question, Student, StudentWallet, Test, TestAttempt, User,
+                 compact_proctoring, import_catalogue, init_db, merit_rows, read_catalogue, restock_library,
+                 search_library, select_merit_list, summarize_attempt, generate_timetable, timetable_clashes,
+                 verify_frame, Exam, assign_seats, exam_rooms, plan_exam_seating, seating_clashes, seating_rows,
+                 TIMETABLE_DAYS, TIMETABLE_PERIODS)
+from datagen import PROFILES, books, generate, insert_stream
+
+app = create_app()
+
+BENCHMARKS = {}
+
+def benchmark(f):
+    BENCHMARKS[f.__name__] = f
+    return f
+
+def _allocate_ids(args):
+    block_size, count = args
+    allocator = IdAllocator(block_size=block_size)
+    with app.app_context():
+        return [allocator.next_value('benchmark') for _ in range(count)]
+
+@benchmark
+def id_allocation(workers=8, per_worker=500):
+    """Concurrent ID allocation from worker processes, with and without block pre-allocation"""
+    results = {}
+    for block_size in (1, 100):
+        with app.app_context():
+            IdSequence.query.filter_by(name='benchmark').delete()
+            db.session.commit()
+
+        start = time.perf_counter()
+        with multiprocessing.Pool(workers) as pool:
+            chunks = pool.map(_allocate_ids, [(block_size, per_worker)] * workers)
+        elapsed = time.perf_counter() - start
+
+        values = [value for chunk in chunks for value in chunk]
+        assert len(set(values)) == len(values), 'duplicate IDs allocated'
+        assert all(chunk == sorted(chunk) for chunk in chunks), 'IDs not monotonic per worker'
+
+        results[f'block_size_{block_size}'] = {
+            'ids': len(values),
+            'seconds': round(elapsed, 4),
+            'ids_per_second': round(len(values) / elapsed, 1)
+        }
+    return results
+
+def _seed_applications(count, chunk_size=50000):
+    rng = random.Random(29)
+    courses = ['Computer Science Engineering', 'Mechanical Engineering', 'Civil Engineering',
+               'Electrical Engineering', 'Electronics Engineering', 'Information Technology']
+    submitted = datetime(2025, 1, 1)
+    with app.app_context():
+        Application.query.delete()
+        for offset in range(0, count, chunk_size):
+            db.session.execute(Application.__table__.insert(), [{
+                'user_id': 1,
+                'organization': 'Benchmark University',
+                'first_name': f'Applicant{i}',
+                'last_name': 'Bench',
+                'email': f'applicant{i}@bench.edu',
+                'phone': '9999999999',
+                'date_of_birth': date(2005, 1, 1),
+                'gender': 'other',
+                'address': 'Benchmark',
+                'course': rng.choice(courses),
+                'qualification': '12th',
+                'previous_institution': 'Benchmark School',
+                'marks': round(rng.uniform(35, 100), 1),
+                'passing_year': 2024,
+                'entrance_score': round(rng.uniform(0, 100), 1),
+                'status': 'pending',
+                'submitted_at': submitted + timedelta(seconds=i)
+            } for i in range(offset, min(offset + chunk_size, count))])
+        db.session.commit()
+
+@benchmark
+def merit_ranking(applications=500000, seats=120):
+    """Per-course top-K merit selection streamed from the database, plus what-if re-ranking"""
+    _seed_applications(applications)
+    scenarios = [
+        {'marks': 0.6, 'entrance_score': 0.4},
+        {'marks': 0.5, 'entrance_score': 0.5},
+        {'marks': 0.8, 'entrance_score': 0.2}
+    ]
+
+    with app.app_context():
+        start = time.perf_counter()
+        select_merit_list(merit_rows(), scenarios[0], default_seats=seats)
+        streamed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pool = MeritPool(merit_rows())
+        loaded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for weights in scenarios:
+        pool.rank(weights, default_seats=seats)
+    reranked = (time.perf_counter() - start) / len(scenarios)
+
+    return {
+        'applications': applications,
+        'stream_and_rank_seconds': round(streamed, 4),
+        'pool_load_seconds': round(loaded, 4),
+        'rerank_seconds': round(reranked, 4)
+    }
+
+STARTUP_PREAMBLES = {
+    # What importing app.py used to cost: OpenCV, NumPy, requests and oauthlib up front
+    'eager_heavy_imports': (
+        'try:\n'
+        '    import cv2, numpy\n'
+        'except ImportError:\n'
+        '    pass\n'
+        'import requests, oauthlib.oauth2, smtplib\n'
+    ),
+    'lazy': ''
+}
+
+@benchmark
+def startup(runs=5):
+    """Cold-start latency of importing app.py and calling create_app() in a fresh interpreter"""
+    repo_dir = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONPATH=repo_dir)
+    results = {}
+    for name, preamble in STARTUP_PREAMBLES.items():
+        code = (
+            'import time\n'
+            'start = time.perf_counter()\n'
+            f'{preamble}'
+            'import app\n'
+            'app.create_app()\n'
+            'print(time.perf_counter() - start)\n'
+        )
+        timings = []
+        for _ in range(runs):
+            output = subprocess.run([sys.executable, '-c', code], cwd=tempfile.gettempdir(), env=env,
+                                    capture_output=True, text=True, check=True).stdout
+            timings.append(float(output.strip().splitlines()[-1]))
+        results[name] = {
+            'median_seconds': round(statistics.median(timings), 4),
+            'min_seconds': round(min(timings), 4)
+        }
+    return results
+
+@benchmark
+def logging_overhead(records=20000):
+    """Cost per log call on the request thread: synchronous file handler vs the background queue"""
+    directory = tempfile.mkdtemp(prefix='erp-bench-logs-')
+    payload = {'student_id': 'STU20250101000001', 'confidence': 0.93, 'coordinates': [120, 80, 64, 64]}
+    results = {}
+
+    def run(logger, call):
+        start = time.perf_counter()
+        for i in range(records):
+            call(logger, i)
+        return round((time.perf_counter() - start) / records * 1e6, 2)
+
+    for name in ('sync_file', 'queue'):
+        logger = logging.getLogger(f'benchmark.{name}')
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        file_handler = logging.FileHandler(os.path.join(directory, f'{name}.log'))
+        file_handler.setFormatter(JsonFormatter())
+        listener = None
+        if name == 'queue':
+            handler = BackgroundQueueHandler(queue.Queue(records + 1))
+            listener = logging.handlers.QueueListener(handler.queue, file_handler)
+            listener.start()
+        else:
+            handler = file_handler
+        logger.addHandler(handler)
+
+        results[f'{name}_us_per_call'] = run(logger, lambda log, i: log.info('Face frame %d: %s', i, payload))
+        if listener:
+            start = time.perf_counter()
+            listener.stop()
+            results['queue_drain_seconds'] = round(time.perf_counter() - start, 4)
+        logger.removeHandler(handler)
+        file_handler.close()
+
+    # Disabled DEBUG calls: an f-string is built every time, %-args never are
+    logger = logging.getLogger('benchmark.disabled')
+    logger.setLevel(logging.INFO)
+    results['disabled_fstring_us_per_call'] = run(logger, lambda log, i: log.debug(f'Face frame {i}: {payload}'))
+    results['disabled_lazy_us_per_call'] = run(logger, lambda log, i: log.debug('Face frame %d: %s', i, payload))
+    return results
+
+ROUTE_SCALES = ('tiny', 'small')
+
+_queries = {'count': 0}
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    _queries['count'] += 1
+
+def _scale_app(profile):
+    """A fresh app and database holding one generated datagen profile"""
+    directory = tempfile.mkdtemp(prefix=f'erp-bench-{profile}-')
+    scale_app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(directory, 'bench.db'),
+        'UPLOAD_FOLDER': os.path.join(directory, 'uploads')
+    })
+    generate(scale_app, PROFILES[profile])
+    return scale_app
+
+def _face_frame():
+    """A 640x480 JPEG data URL like the proctoring page sends, or None without OpenCV"""
+    opencv = load_opencv()
+    if not opencv:
+        return None
+    cv2, np = opencv
+    frame = np.random.default_rng(38).integers(0, 255, (480, 640, 3), dtype=np.uint8)
+    encoded = cv2.imencode('.jpg', frame)[1].tobytes()
+    return 'data:image/jpeg;base64,' + base64.b64encode(encoded).decode()
+
+def _route_requests(scale_app):
+    """Hot routes as name -> (role, request factory); factories take the iteration number"""
+    with scale_app.app_context():
+        org = Organization.query.order_by(Organization.id).first()
+        test = Test.query.order_by(Test.id).first()
+        question_ids = [q.id for q in Question.query.filter_by(test_id=test.id)]
+        book = LibraryBook.query.order_by(LibraryBook.id).first()
+        # Purchases must not run out of stock or balance mid-benchmark
+        book.stock = 10 ** 6
+        rooms = [room.room_number for room in Hostel.query.filter(
+            Hostel.organization_id == org.id, Hostel.occupied < Hostel.capacity
+        ).order_by(Hostel.id)]
+        student_ids = [s.student_id for s in Student.query.filter_by(organization_id=org.id).limit(1000)]
+        org_id, test_id, book_id = org.id, test.id, book.id
+        db.session.commit()
+
+    frame = _face_frame()
+    requests = {
+        'dashboard': ('admin', lambda i: ('GET', '/dashboard', {})),
+        'dashboard_data': ('admin', lambda i: ('GET', '/api/dashboard_data', {})),
+        'chat': ('admin', lambda i: ('POST', '/api/chat', {'json': {'message': 'revenue'}})),
+        'allocate_hostel': ('admin', lambda i: ('POST', '/hostel/allocate', {'data': {
+            'student_id': student_ids[i % len(student_ids)],
+            'room_number': rooms[i % len(rooms)] if rooms else 'none'
+        }})),
+        'student_portal': ('student', lambda i: ('GET', '/student_portal', {})),
+        'submit_test': ('student', lambda i: ('POST', f'/student/tests/{test_id}/submit', {'data': {
+            f'question_{question_id}': 'A' for question_id in question_ids
+        }})),
+        'purchase_book': ('student', lambda i: ('GET', f'/student/library/purchase/{book_id}', {})),
+        'library_search': ('student', lambda i: ('GET', '/api/library/search', {'query_string': {'q': 'vol'}})),
+        'timetable': ('admin', lambda i: ('GET', '/timetable', {'query_string': {'year': 1 + i % 4}})),
+        'timetable_now': ('student', lambda i: ('GET', '/api/timetable/now', {}))
+    }
+    if frame:
+        requests['face_detection'] = ('student', lambda i: ('POST', '/api/face-detection', {'json': {
+            'image': frame, 'coordinates': {'x': 200, 'y': 120, 'width': 180, 'height': 180}, 'confidence': 0.9
+        }}))
+    return org_id, requests
+
+def _client(scale_app, role, org_id):
+    client = scale_app.test_client()
+    with scale_app.app_context():
+        user = User.query.filter_by(username=role).first()
+    with client.session_transaction() as session:
+        session['user_id'] = user.id
+        session['role'] = role
+        session['username'] = user.username
+        if role == 'admin':
+            session['organization_id'] = org_id
+    if role == 'student':
+        # The portal creates the student record the other student routes look up
+        client.get('/student_portal')
+        with scale_app.app_context():
+            student = Student.query.filter_by(email=user.email).first()
+            db.session.add(StudentWallet(student_id=student.student_id, balance=10.0 ** 9))
+            db.session.commit()
+    return client
+
+@benchmark
+def routes(scales=ROUTE_SCALES, iterations=50, warmup=5):
+    """Latency and query count of the hot routes against generated datasets of several sizes"""
+    results = {}
+    for profile in scales:
+        scale_app = _scale_app(profile)
+        org_id, requests = _route_requests(scale_app)
+        clients = {role: _client(scale_app, role, org_id) for role in ('admin', 'student')}
+
+        results[profile] = {}
+        for name, (role, make_request) in requests.items():
+            client = clients[role]
+            timings = []
+            for i in range(warmup + iterations):
+                method, url, kwargs = make_request(i)
+                _queries['count'] = 0
+                start = time.perf_counter()
+                response = client.open(url, method=method, **kwargs)
+                if i >= warmup:
+                    timings.append(time.perf_counter() - start)
+            timings.sort()
+            results[profile][name] = {
+                'status': response.status_code,
+                'queries': _queries['count'],
+                'median_ms': round(statistics.median(timings) * 1000, 2),
+                'p95_ms': round(timings[int(0.95 * (len(timings) - 1))] * 1000, 2)
+            }
+    return results
+
+LIBRARY_QUERIES = {
+    'browse': {},
+    'browse_deep_page': {'page': 2000},
+    'category': {'category': 'Physics'},
+    'broad_prefix': {'query': 'vol'},
+    'word': {'query': 'engineering'},
+    'author_prefix': {'query': 'sha'},
+    'two_words': {'query': 'physics volume 12'},
+    'isbn_prefix': {'query': '979-00000-12'},
+    'word_in_category': {'query': 'kum', 'category': 'Mathematics'}
+}
+
+@benchmark
+def library_search(books_total=200000, iterations=30):
+    """Catalogue search latency over a generated catalogue, against loading every in-stock book"""
+    directory = tempfile.mkdtemp(prefix='erp-bench-library-')
+    library_app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(directory, 'bench.db')})
+    init_db(library_app)
+    results = {'books': books_total}
+    with library_app.app_context():
+        with db.engine.connect() as connection:
+            start = time.perf_counter()
+            # The FTS triggers index each row as part of the insert
+            insert_stream(connection, LibraryBook, books(random.Random('41:books'), books_total))
+            results['indexed_books_per_second'] = round(books_total / (time.perf_counter() - start))
+
+        for name, options in LIBRARY_QUERIES.items():
+            timings = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                found = search_library(**options)
+                timings.append(time.perf_counter() - start)
+                db.session.remove()
+            timings.sort()
+            results[name] = {
+                'matches': found['total'],
+                'median_ms': round(statistics.median(timings) * 1000, 2),
+                'p95_ms': round(timings[int(0.95 * (len(timings) - 1))] * 1000, 2)
+            }
+
+        # What the library page did before: every in-stock book, filtered in the browser
+        start = time.perf_counter()
+        loaded = len(LibraryBook.query.filter(LibraryBook.stock > 0).all())
+        results['load_all'] = {'matches': loaded, 'median_ms': round((time.perf_counter() - start) * 1000, 2)}
+    return results
+
+@benchmark
+def library_import(rows=200000):
+    """Catalogue import and restock throughput: fresh load, unchanged re-import, price refresh"""
+    directory = tempfile.mkdtemp(prefix='erp-bench-import-')
+    import_app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(directory, 'bench.db')})
+    init_db(import_app)
+    catalogue = list(books(random.Random('42:books'), rows))
+    paths = {}
+    for name, price_change in (('fresh', 0), ('refresh', 50)):
+        paths[name] = os.path.join(directory, f'{name}.jsonl')
+        with open(paths[name], 'w') as f:
+            for book in catalogue:
+                f.write(json.dumps(dict(book, price=book['price'] + price_change)) + '\n')
+
+    results = {'rows': rows}
+    with import_app.app_context():
+        for name, path in (('insert', paths['fresh']), ('unchanged', paths['fresh']), ('update', paths['refresh'])):
+            with open(path) as f:
+                report = import_catalogue(read_catalogue(f, 'jsonl'))
+            results[name] = {key: report[key] for key in ('inserted', 'updated', 'unchanged', 'rows_per_second')}
+        report = restock_library({book['isbn']: 5 for book in catalogue})
+        results['restock'] = {'updated': report['updated'], 'rows_per_second': report['rows_per_second']}
+    return results
+
+def _drawn_face(cv2, np, seed, shot, size=200):
+    """A cartoon face the Haar cascade detects; ``shot`` varies lighting, noise and framing"""
+    rng = np.random.default_rng(seed)
+    image = np.full((size, size, 3), 90, np.uint8)
+    c = size // 2
+    skin = int(rng.integers(170, 210))
+    cv2.ellipse(image, (c, c - 10), (int(size * 0.36), int(size * 0.44)), 0, 0, 360, (30, 30, 40), -1)
+    cv2.ellipse(image, (c, c + 10), (int(size * 0.31), int(size * 0.40)), 0, 0, 360, (skin - 30, skin - 5, skin + 20), -1)
+    eye_y, eye_dx = int(size * 0.45) + int(rng.integers(-4, 4)), int(size * 0.14) + int(rng.integers(-3, 4))
+    for side in (-1, 1):
+        cv2.ellipse(image, (c + side * eye_dx, eye_y - 15), (int(size * 0.09), 5), 0, 180, 360, (30, 30, 30), 5)
+        cv2.ellipse(image, (c + side * eye_dx, eye_y), (int(rng.integers(11, 15)), 7), 0, 0, 360, (20, 20, 20), -1)
+    cv2.line(image, (c, eye_y + 10), (c - 6, eye_y + 38), (skin - 70, skin - 50, skin - 40), 3)
+    cv2.ellipse(image, (c, int(size * 0.75)), (int(rng.integers(16, 26)), 8), 0, 0, 180, (50, 30, 110), -1)
+    image = cv2.GaussianBlur(image, (5, 5), 0).astype(np.float32)
+    # Per-student skin texture, then per-shot lighting, noise, shift and zoom
+    texture = cv2.resize(rng.integers(-25, 26, (size // 10, size // 10)).astype(np.float32), (size, size))
+    image += texture[..., None]
+    shot_rng = np.random.default_rng(seed * 100 + shot)
+    image = image * shot_rng.uniform(0.85, 1.15) + shot_rng.normal(0, 6, image.shape)
+    transform = np.float32([[1, 0, shot_rng.integers(-6, 7)], [0, 1, shot_rng.integers(-6, 7)]])
+    transform[:, :2] *= shot_rng.uniform(0.93, 1.07)
+    image = np.clip(image, 0, 255).astype(np.uint8)
+    return cv2.warpAffine(image, transform, (size, size), borderMode=cv2.BORDER_REPLICATE)
+
+@benchmark
+def face_attendance(students=100, strangers=10, iterations=5):
+    """Classroom snapshot latency: one 2000x2000 photo of a class, matched against enrolled embeddings"""
+    opencv = load_opencv()
+    if not opencv:
+        return {'skipped': 'OpenCV not installed'}
+    cv2, np = opencv
+    directory = tempfile.mkdtemp(prefix='erp-bench-faces-')
+    face_app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(directory, 'bench.db')})
+    init_db(face_app)
+
+    with face_app.test_request_context():
+        embedder = face_embedder()
+        for i in range(students):
+            image = _drawn_face(cv2, np, i, 0)
+            faces = embedder.detect(image)
+            db.session.add(Student(student_id=f'FACE{i:05d}', name=f'Student {i}', email=f'face{i}@example.edu',
+                                   phone='0', course='Face Benchmark', year=1, status='active'))
+            if len(faces):
+                db.session.add(FaceEmbedding(student_id=f'FACE{i:05d}', model=embedder.name,
+                                             vector=embedder.embed(image, faces[:1])[0].tobytes()))
+        db.session.commit()
+
+    # The whole class except the last ``strangers`` seats, who are not enrolled
+    seats = list(range(students - strangers)) + list(range(10 ** 6, 10 ** 6 + strangers))
+    side = int(np.ceil(np.sqrt(len(seats))))
+    room = np.full((side * 200, side * 200, 3), 90, np.uint8)
+    for seat, seed in enumerate(seats):
+        row, column = divmod(seat, side)
+        room[row * 200:(row + 1) * 200, column * 200:(column + 1) * 200] = _drawn_face(cv2, np, seed, 1)
+    photo = cv2.imencode('.jpg', room)[1].tobytes()
+
+    client = face_app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+        session['role'] = 'admin'
+    timings, stages = [], []
+    for i in range(iterations):
+        start = time.perf_counter()
+        response = client.post('/api/face-attendance/snapshot', data={
+            'course': 'Face Benchmark', 'year': '1', 'subject': f'Lesson {i}', 'image': (io.BytesIO(photo), 'room.jpg')
+        }, content_type='multipart/form-data')
+        timings.append(time.perf_counter() - start)
+        result = response.get_json()
+        stages.append(result['timings_ms'])
+    expected = {f'FACE{i:05d}' for i in range(students - strangers)}
+    return {
+        'students': students,
+        'faces_found': result['faces'],
+        'recognised': len(expected & set(result['present'])),
+        'false_matches': len(set(result['present']) - expected),
+        'median_ms': round(statistics.median(timings) * 1000, 1),
+        'detect_and_embed_ms': statistics.median(stage['detect_and_embed'] for stage in stages),
+        'match_ms': statistics.median(stage['match'] for stage in stages),
+        'record_ms': statistics.median(stage['record'] for stage in stages)
+    }
+
+@benchmark
+def face_verification(frames=64, concurrency=(1, 8)):
+    """Per-frame latency of server-side face checks, in the request thread and in the detection pool"""
+    opencv = load_opencv()
+    if not opencv:
+        return {'skipped': 'OpenCV not installed'}
+    cv2, np = opencv
+    jpegs = []
+    for i in range(8):
+        # A 640x480 webcam frame with one face somewhere in it
+        frame = np.full((480, 640, 3), 90, np.uint8)
+        x, y = 120 + 40 * i, 100 + 20 * (i % 4)
+        frame[y:y + 220, x:x + 220] = _drawn_face(cv2, np, i, 2, size=220)
+        jpegs.append(cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])[1].tobytes())
+
+    results = {}
+    for workers in (0, 1):
+        verify_app = create_app({'FACE_POOL_WORKERS': workers})
+        with verify_app.app_context():
+            verify_frame(jpegs[0])  # load the detector / start the pool
+            for threads in concurrency:
+                def verify(i):
+                    with verify_app.app_context():
+                        start = time.perf_counter()
+                        faces = verify_frame(jpegs[i % len(jpegs)])
+                        return time.perf_counter() - start, len(faces) == 1
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=threads) as executor:
+                    timings = list(executor.map(verify, range(frames)))
+                elapsed = time.perf_counter() - start
+                latencies = sorted(latency for latency, _ in timings)
+                results[f"{'pool' if workers else 'inline'}_x{threads}"] = {
+                    'median_ms': round(statistics.median(latencies) * 1000, 1),
+                    'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1),
+                    'frames_per_second': round(frames / elapsed, 1),
+                    'verified': sum(ok for _, ok in timings)
+                }
+    return results
+
+@benchmark
+def proctoring_compaction(frames=108000):
+    """Fold a 3-hour, 10 frames a second attempt into its summary and compact it"""
+    directory = tempfile.mkdtemp(prefix='erp-bench-proctor-')
+    proctor_app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(directory, 'bench.db'),
+                              'UPLOAD_FOLDER': directory})
+    init_db(proctor_app)
+    rng = random.Random(46)
+    started = datetime(2025, 1, 6, 9, 0)
+    with proctor_app.app_context():
+        attempt = TestAttempt(test_id=1, student_id='PROCTOR1', started_at=started, is_submitted=True)
+        db.session.add(attempt)
+        db.session.flush()
+        rows, face_count = [], 1
+        for i in range(frames):
+            # Mostly one face, with the occasional run of no face or two faces
+            if rng.random() < 0.002:
+                face_count = rng.choice((0, 2))
+            elif face_count != 1 and rng.random() < 0.05:
+                face_count = 1
+            rows.append({'student_id': 'PROCTOR1', 'attempt_id': attempt.id, 'face_count': face_count,
+                         'verified': face_count == 1, 'detected_at': started + timedelta(seconds=i / 10),
+                         'image_path': os.path.join(directory, f'{i}.jpg') if face_count != 1 else None})
+        db.session.bulk_insert_mappings(FaceDetection, rows)
+        db.session.commit()
+
+        start = time.perf_counter()
+        summary = summarize_attempt(attempt)
+        db.session.commit()
+        summarize_seconds = time.perf_counter() - start
+        report = compact_proctoring(now=started + timedelta(days=2))
+        return {
+            'frames': frames,
+            'intervals': len(json.loads(summary.intervals)),
+            'summarize_seconds': round(summarize_seconds, 3),
+            'frames_per_second': round(frames / summarize_seconds),
+            'compact_seconds': report['seconds'],
+            'rows_left': FaceDetection.query.count()
+        }
+
+def _department(rng, sections, subjects=6, sessions=4, sections_per_teacher=6, room_slack=1.1):
+    """Timetable requirements for a department: every section takes each subject from one teacher"""
+    groups = [(1 + i % 4, f'S{i // 4 + 1}') for i in range(sections)]
+    requirements = []
+    for subject in range(subjects):
+        rng.shuffle(groups)
+        for start in range(0, sections, sections_per_teacher):
+            teacher = f'Teacher {subject}-{start // sections_per_teacher}'
+            requirements.extend({'year': year, 'section': section, 'subject': f'Subject {subject}',
+                                 'teacher': teacher, 'sessions': sessions}
+                                for year, section in groups[start:start + sections_per_teacher])
+    periods = len(TIMETABLE_DAYS) * len(TIMETABLE_PERIODS)
+    rooms = [f'R{i:03d}' for i in range(int(sections * subjects * sessions / periods * room_slack) + 1)]
+    return requirements, rooms
+
+@benchmark
+def timetable_engine(sections=(100, 300, 600), clash_rows=100000):
+    """Generate clash-free timetables for whole departments, and check a large timetable for clashes"""
+    rng = random.Random(47)
+    results = {}
+    for count in sections:
+        requirements, rooms = _department(rng, count)
+        start = time.perf_counter()
+        rows, unplaced = generate_timetable(requirements, rooms)
+        elapsed = time.perf_counter() - start
+        clashes, _ = timetable_clashes((i, row['day'], row['time_slot'], row['teacher'], row['room'], row['year'],
+                                        row['section']) for i, row in enumerate(rows))
+        results[f'sections_{count}'] = {
+            'lessons': len(rows) + len(unplaced), 'rooms': len(rooms), 'unplaced': len(unplaced),
+            'clashes': len(clashes), 'generate_seconds': round(elapsed, 3)
+        }
+
+    # A timetable typed in by hand: loads like a real one (24 lessons a week per teacher
+    # and class) but random slots, so every teacher, room and class has a few clashes
+    teachers, rooms, classes = clash_rows // 24, clash_rows // 38, clash_rows // 24
+    entries = [(i, rng.choice(TIMETABLE_DAYS), rng.choice(TIMETABLE_PERIODS), f'Teacher {rng.randrange(teachers)}',
+                f'R{rng.randrange(rooms):04d}', 1 + i % 4, f'S{rng.randrange(classes // 4)}')
+               for i in range(clash_rows)]
+    start = time.perf_counter()
+    clashes, _ = timetable_clashes(entries)
+    elapsed = time.perf_counter() - start
+    results['clash_check'] = {'rows': clash_rows, 'clashes': len(clashes), 'check_seconds': round(elapsed, 3),
+                              'rows_per_second': round(clash_rows / elapsed)}
+    return results
+
+@benchmark
+def exam_seating(candidates=(5000, 20000, 80000), plan_candidates=20000):
+    """Seat an exam day's candidates with no same-subject neighbours, and store and export a 20k plan"""
+    rng = random.Random(49)
+    # A few big papers and a long tail, like a real exam day
+    subjects = [f'Paper {i}' for i in range(15)]
+    weights = [40, 25, 20, 15, 10, 8, 6, 5, 4, 3, 2, 2, 1, 1, 1]
+    results = {}
+    for count in candidates:
+        sitting = [(i, rng.choices(subjects, weights)[0]) for i in range(count)]
+        rooms = exam_rooms({'name': f'H{i}', 'rows': 8, 'columns': 6} for i in range(count // 45 + 1))
+        start = time.perf_counter()
+        seats, unseated = assign_seats(sitting, rooms)
+        elapsed = time.perf_counter() - start
+        results[f'candidates_{count}'] = {
+            'seated': len(seats), 'unseated': len(unseated), 'clashes': seating_clashes(seats, dict(sitting)),
+            'assign_seconds': round(elapsed, 3), 'candidates_per_second': round(count / elapsed)
+        }
+
+    directory = tempfile.mkdtemp(prefix='erp-bench-seating-')
+    seating_app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(directory, 'bench.db')})
+    init_db(seating_app)
+    day = date(2025, 3, 3)
+    with seating_app.app_context():
+        organization_id = Organization.query.first().id
+        db.session.bulk_insert_mappings(Exam, [{
+            'student_id': f'SEAT{i:06d}', 'subject': rng.choices(subjects, weights)[0],
+            'exam_date': datetime(2025, 3, 3, 10 if i % 4 else 14), 'semester': 1, 'organization_id': organization_id
+        } for i in range(plan_candidates)])
+        db.session.commit()
+        rooms = [{'name': f'H{i}', 'capacity': 48} for i in range(plan_candidates // 45)]
+        start = time.perf_counter()
+        report = plan_exam_seating(day, rooms)
+        db.session.commit()
+        plan_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        lines = sum(1 for _ in seating_rows(day, 'chart'))
+        results['plan'] = {
+            'candidates': plan_candidates, 'sessions': len(report['sessions']),
+            'clashes': sum(plan['clashes'] for plan in report['sessions']),
+            'plan_seconds': round(plan_seconds, 3), 'chart_lines': lines,
+            'export_seconds': round(time.perf_counter() - start, 3)
+        }
+    return results
+
+@benchmark
+def exports(sizes=(100000, 400000)):
+    """Stream attendance exports as CSV, gzipped CSV and XLSX; peak Python memory should not grow with rows"""
+    results = {}
+    for rows in sizes:
+        directory = tempfile.mkdtemp(prefix='erp-bench-export-')
+        export_app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(directory, 'bench.db')})
+        init_db(export_app)
+        with export_app.app_context():
+            organization_id = Organization.query.first().id
+            first_day = date(2024, 6, 1)
+            for offset in range(0, rows, 50000):
+                db.session.bulk_insert_mappings(Attendance, [{
+                    'student_id': f'EXP{i % 5000:05d}', 'date': first_day + timedelta(days=i // 5000 % 365),
+                    'status': 'present' if i % 9 else 'absent', 'subject': f'Subject {i % 6}',
+                    'organization_id': organization_id
+                } for i in range(offset, min(offset + 50000, rows))])
+            db.session.commit()
+
+        client = export_app.test_client()
+        with client.session_transaction() as session:
+            session['user_id'] = 1
+            session['role'] = 'admin'
+        results[f'rows_{rows}'] = measured = {}
+        for name, url in (('csv', '/admin/exports/attendance.csv'), ('csv_gzip', '/admin/exports/attendance.csv?gzip=1'),
+                          ('xlsx', '/admin/exports/attendance.xlsx')):
+            start = time.perf_counter()
+            response = client.get(url, buffered=False)
+            size = sum(len(chunk) for chunk in response.response)
+            response.close()
+            elapsed = time.perf_counter() - start
+            measured[name] = {'bytes': size, 'export_seconds': round(elapsed, 3),
+                                  'rows_per_second': round(rows / elapsed)}
+
+        # Traced separately: tracemalloc slows the export down several times
+        tracemalloc.start()
+        response = client.get('/admin/exports/attendance.csv', buffered=False)
+        for _ in response.response:
+            pass
+        response.close()
+        measured['csv']['peak_mb'] = round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 2)
+        tracemalloc.stop()
+    return results
+
+def compare(baseline, results, tolerance=0.2):
+    """Metrics in ``results`` that are worse than ``baseline`` by more than ``tolerance``"""
+    regressions = []
+
+    def walk(path, old, new):
+        if isinstance(old, dict) and isinstance(new, dict):
+            for key in sorted(old.keys() & new.keys()):
+                walk(path + [key], old[key], new[key])
+            return
+        if isinstance(old, bool) or not isinstance(old, (int, float)) or not isinstance(new, (int, float)):
+            return
+        name = path[-1]
+        if name == 'queries':
+            # Query counts are deterministic, so any increase counts
+            worse = new > old
+        elif name.endswith('_per_second'):
+            worse = new < old * (1 - tolerance)
+        elif name.endswith('_ms'):
+            # Ignore sub-millisecond jitter on very fast routes
+            worse = new > old * (1 + tolerance) and new - old > 1
+        elif name.endswith('_seconds'):
+            worse = new > old * (1 + tolerance) and new - old > 0.001
+        else:
+            return
+        if worse:
+            regressions.append(('.'.join(path), old, new))
+
+    walk([], baseline, results)
+    return regressions
+
+def report_regressions(baseline_path, results, tolerance):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    regressions = compare(baseline, results, tolerance)
+    for path, old, new in regressions:
+        print(f'REGRESSION {path}: {old} -> {new}')
+    print(f'{len(regressions)} regression(s) against {baseline_path} (tolerance {tolerance:.0%})')
+    return regressions
+
+def main(names, scales=None):
+    with app.app_context():
+        db.create_all()
+
+    results = {}
+    for name in names or BENCHMARKS:
+        if name not in BENCHMARKS:
+            sys.exit(f'Unknown benchmark: {name}')
+        options = {'scales': scales} if name == 'routes' and scales else {}
+        results[name] = BENCHMARKS[name](**options)
+        print(f'{name}: {json.dumps(results[name])}')
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('names', nargs='*', help='benchmarks to run (default: all)')
+    parser.add_argument('--scale', action='append', dest='scales', choices=sorted(PROFILES),
+                        help='datagen profile for the routes benchmark (repeatable)')
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--baseline', help='compare results against this JSON file and exit 1 on regressions')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'RESULTS'),
+                        help='compare two stored result files without running anything')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown before flagging (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[1]) as f:
+            stored = json.load(f)
+        sys.exit(1 if report_regressions(args.compare[0], stored, args.tolerance) else 0)
+
+    results = main(args.names, args.scales)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.baseline and report_regressions(args.baseline, results, args.tolerance):
+        sys.exit(1)
@@ -0,0 +1,344 @@
+"""Deterministic synthetic data for load tests and benchmarks.
+
+    python datagen.py --profile medium --seed 37
+
+Runs ``init_db`` and then bulk-inserts a scale profile of students, fees,
+attendance, exams, applications, hostel rooms, timetable slots, library
+books and tests into the configured database (``DATABASE_URL``). Rows are
+produced by streaming generators and inserted in chunks over one
+connection, so memory stays flat even for the ``large`` profile (20M
+attendance rows). The same seed and ``--today`` on a fresh database give
+the same data.
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from itertools import islice
+
+from sqlalchemy import text
+
+from app import (create_app, db, init_db, backfill_revenue_rollups, bump_data_versions, format_receipt_number,
+                 format_student_id, id_allocator, refresh_organization_stats, VERSIONED_TABLES, Application,
+                 Attendance, Exam, Fee, Hostel, LibraryBook, Organization, Question, Student, Test, Timetable, User)
+
+# Row totals per table; per-student tables are spread evenly over the students
+PROFILES = {
+    'tiny': {
+        'students': 200, 'fees': 400, 'attendance': 10000, 'exams': 800, 'applications': 1000,
+        'hostel_rooms': 100, 'timetable': 200, 'books': 200, 'tests': 10, 'questions_per_test': 10
+    },
+    'small': {
+        'students': 2000, 'fees': 20000, 'attendance': 200000, 'exams': 8000, 'applications': 10000,
+        'hostel_rooms': 1000, 'timetable': 500, 'books': 2000, 'tests': 100, 'questions_per_test': 10
+    },
+    'medium': {
+        'students': 20000, 'fees': 200000, 'attendance': 2000000, 'exams': 80000, 'applications': 50000,
+        'hostel_rooms': 5000, 'timetable': 2000, 'books': 10000, 'tests': 1000, 'questions_per_test': 10
+    },
+    'large': {
+        'students': 100000, 'fees': 2000000, 'attendance': 20000000, 'exams': 400000, 'applications': 500000,
+        'hostel_rooms': 25000, 'timetable': 5000, 'books': 50000, 'tests': 10000, 'questions_per_test': 10
+    }
+}
+
+CHUNK_SIZE = 20000
+
+FIRST_NAMES = ['Aarav', 'Vivaan', 'Aditya', 'Vihaan', 'Arjun', 'Sai', 'Reyansh', 'Krishna', 'Ishaan', 'Rohan',
+               'Ananya', 'Diya', 'Aadhya', 'Saanvi', 'Pari', 'Anika', 'Navya', 'Myra', 'Sara', 'Kavya']
+LAST_NAMES = ['Sharma', 'Verma', 'Gupta', 'Singh', 'Kumar', 'Patel', 'Reddy', 'Iyer', 'Nair', 'Joshi',
+              'Mehta', 'Chopra', 'Malhotra', 'Bose', 'Das', 'Rao', 'Kulkarni', 'Pillai', 'Mishra', 'Yadav']
+COURSES = ['Computer Science Engineering', 'Mechanical Engineering', 'Civil Engineering',
+           'Electrical Engineering', 'Electronics Engineering', 'Information Technology']
+SUBJECTS = ['Mathematics', 'Physics', 'Chemistry', 'English', 'Computer Science', 'Data Structures',
+            'Algorithms', 'Database Systems', 'Operating Systems', 'Computer Networks']
+TEACHERS = ['Dr. Smith', 'Prof. Johnson', 'Dr. Brown', 'Ms. Davis', 'Mr. Wilson', 'Dr. Rao', 'Prof. Iyer',
+            'Dr. Mehta', 'Ms. Kapoor', 'Mr. Das']
+FEE_AMOUNTS = {'tuition': 75000.0, 'hostel': 30000.0, 'exam': 2500.0, 'library': 1000.0, 'transport': 8000.0}
+BOOK_CATEGORIES = ['Technology', 'Mathematics', 'Physics', 'Literature', 'Management', 'Engineering']
+DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+TIME_SLOTS = ['09:00-10:00', '10:00-11:00', '11:00-12:00', '12:00-13:00',
+              '14:00-15:00', '15:00-16:00', '16:00-17:00']
+
+def scaled(profile, factor):
+    """Copy of a profile with every row total multiplied by ``factor``"""
+    return {name: value if name == 'questions_per_test' else max(1, int(value * factor))
+            for name, value in profile.items()}
+
+def _share(total, count, i):
+    """Rows owed to the i-th of ``count`` owners when ``total`` rows are spread evenly"""
+    return total // count + (1 if i < total % count else 0)
+
+def _grade(marks):
+    for floor, grade in ((90, 'A+'), (80, 'A'), (70, 'B+'), (60, 'B'), (50, 'C'), (40, 'D')):
+        if marks >= floor:
+            return grade
+    return 'F'
+
+class Cohort:
+    """Per-student attributes the dependent tables need, kept in compact lists"""
+
+    def __init__(self, rng, count, org_ids, first_student_number, anchor):
+        self.student_ids = [format_student_id(first_student_number + i, anchor) for i in range(count)]
+        # Contiguous blocks per organization keep (organization_id, student_id) index inserts sequential
+        self.org_ids = [org_ids[i * len(org_ids) // count] for i in range(count)]
+        self.courses = [rng.randrange(len(COURSES)) for _ in range(count)]
+        self.years = [rng.randint(1, 4) for _ in range(count)]
+        self.attendance = [round(min(100.0, rng.gauss(82, 10)), 1) for _ in range(count)]
+        self.gpa = [round(min(10.0, max(3.0, rng.gauss(7.2, 1.3))), 2) for _ in range(count)]
+
+def students(rng, cohort, anchor):
+    for i, student_id in enumerate(cohort.student_ids):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        yield {
+            'student_id': student_id,
+            'name': f'{first} {last}',
+            'email': f'{first.lower()}.{last.lower()}.{i}@students.college.edu',
+            'phone': f'+91 9{rng.randrange(10 ** 9):09d}',
+            'course': COURSES[cohort.courses[i]],
+            'year': cohort.years[i],
+            'admission_date': datetime.combine(anchor, datetime.min.time()) - timedelta(days=365 * cohort.years[i]),
+            'status': 'active' if rng.random() > 0.03 else 'dropped_out',
+            'gpa': cohort.gpa[i],
+            'attendance_percentage': cohort.attendance[i],
+            'organization_id': cohort.org_ids[i]
+        }
+
+def fees(rng, cohort, total, first_receipt, anchor):
+    fee_types = list(FEE_AMOUNTS)
+    receipt = first_receipt
+    for i, student_id in enumerate(cohort.student_ids):
+        for n in range(_share(total, len(cohort.student_ids), i)):
+            fee_type = fee_types[n % len(fee_types)]
+            yield {
+                'student_id': student_id,
+                'amount': FEE_AMOUNTS[fee_type],
+                'fee_type': fee_type,
+                'payment_date': datetime.combine(anchor, datetime.min.time())
+                                - timedelta(days=rng.randrange(730), seconds=rng.randrange(86400)),
+                'status': 'paid' if rng.random() > 0.05 else 'pending',
+                'receipt_number': format_receipt_number(receipt, anchor),
+                'organization_id': cohort.org_ids[i]
+            }
+            receipt += 1
+
+def attendance(rng, cohort, total, anchor):
+    for i, student_id in enumerate(cohort.student_ids):
+        present_rate = cohort.attendance[i] / 100
+        classes = _share(total, len(cohort.student_ids), i)
+        # Five classes per weekday, walking back from the anchor date
+        for n in range(classes):
+            day = anchor - timedelta(days=(n // 5) // 5 * 7 + (n // 5) % 5)
+            yield {
+                'student_id': student_id,
+                'date': day,
+                'status': 'present' if rng.random() < present_rate else 'absent',
+                'subject': SUBJECTS[(n + cohort.courses[i]) % len(SUBJECTS)],
+                'organization_id': cohort.org_ids[i]
+            }
+
+def exams(rng, cohort, total, anchor):
+    for i, student_id in enumerate(cohort.student_ids):
+        for n in range(_share(total, len(cohort.student_ids), i)):
+            marks = max(0, min(100, int(rng.gauss(cohort.gpa[i] * 10, 12))))
+            yield {
+                'student_id': student_id,
+                'subject': SUBJECTS[(n + cohort.courses[i]) % len(SUBJECTS)],
+                'exam_date': datetime.combine(anchor, datetime.min.time()) + timedelta(days=rng.randrange(-120, 60),
+                                                                                       hours=rng.choice([9, 14])),
+                'marks': marks,
+                'grade': _grade(marks),
+                'semester': min(8, cohort.years[i] * 2 - rng.randint(0, 1)),
+                'organization_id': cohort.org_ids[i]
+            }
+
+def applications(rng, total, orgs, user_id, anchor):
+    for i in range(total):
+        org_id, org_name = orgs[i * len(orgs) // total]
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        status = rng.choices(['pending', 'approved', 'rejected'], weights=[70, 20, 10])[0]
+        submitted = datetime.combine(anchor, datetime.min.time()) - timedelta(seconds=rng.randrange(180 * 86400))
+        yield {
+            'user_id': user_id,
+            'organization': org_name,
+            'first_name': first,
+            'last_name': last,
+            'email': f'{first.lower()}.{last.lower()}.{i}@applicants.college.edu',
+            'phone': f'9{rng.randrange(10 ** 9):09d}',
+            'date_of_birth': date(2004, 1, 1) + timedelta(days=rng.randrange(1095)),
+            'gender': rng.choice(['male', 'female', 'other']),
+            'address': f'{rng.randint(1, 999)} Main Road, New Delhi',
+            'course': rng.choice(COURSES),
+            'qualification': '12th',
+            'previous_institution': f'Senior Secondary School {rng.randint(1, 500)}',
+            'marks': round(min(100.0, max(35.0, rng.gauss(75, 12))), 1),
+            'passing_year': anchor.year - rng.randint(0, 1),
+            'entrance_score': round(min(100.0, max(0.0, rng.gauss(60, 18))), 1),
+            'status': status,
+            'submitted_at': submitted,
+            'reviewed_at': submitted + timedelta(days=rng.randint(1, 14)) if status != 'pending' else None,
+            'reviewed_by': user_id if status != 'pending' else None,
+            'organization_id': org_id
+        }
+
+def hostel_rooms(rng, cohort, total):
+    # Occupants are handed out in order from each organization's students
+    next_student = {}
+    for i, student_org in enumerate(cohort.org_ids):
+        next_student.setdefault(student_org, i)
+    org_ids = sorted(next_student)
+    for i in range(total):
+        org_id = org_ids[i * len(org_ids) // total]
+        capacity = rng.choice([1, 2, 2, 3])
+        occupants = []
+        for _ in range(rng.randint(0, capacity)):
+            n = next_student[org_id]
+            if n < len(cohort.org_ids) and cohort.org_ids[n] == org_id:
+                occupants.append(cohort.student_ids[n])
+                next_student[org_id] = n + 1
+        yield {
+            'room_number': f'G{i:06d}',
+            'floor': 1 + i % 10,
+            'capacity': capacity,
+            'occupied': len(occupants),
+            'student_ids': json.dumps(occupants),
+            'status': 'occupied' if len(occupants) == capacity else 'available',
+            'organization_id': org_id
+        }
+
+def timetable(rng, total, org_ids):
+    for i in range(total):
+        slot = i % (len(DAYS) * len(TIME_SLOTS))
+        yield {
+            'day': DAYS[slot // len(TIME_SLOTS)],
+            'time_slot': TIME_SLOTS[slot % len(TIME_SLOTS)],
+            'subject': rng.choice(SUBJECTS),
+            'teacher': rng.choice(TEACHERS),
+            'room': f'R{rng.randint(1, 60):02d}',
+            'year': 1 + (i // (len(DAYS) * len(TIME_SLOTS))) % 4,
+            'organization_id': org_ids[i * len(org_ids) // total]
+        }
+
+def books(rng, total):
+    for i in range(total):
+        category = rng.choice(BOOK_CATEGORIES)
+        yield {
+            'title': f'{category} Volume {i + 1}',
+            'author': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'isbn': f'979{i:010d}',
+            'price': float(rng.choice([149, 199, 249, 299, 399, 499, 799])),
+            'category': category,
+            'stock': rng.randint(0, 60),
+            'description': f'A {category.lower()} title for undergraduate courses'
+        }
+
+def tests(rng, total, user_id, anchor):
+    for i in range(total):
+        start = datetime.combine(anchor, datetime.min.time()) + timedelta(days=rng.randrange(-60, 30), hours=10)
+        yield {
+            'title': f'{rng.choice(SUBJECTS)} Quiz {i + 1}',
+            'description': 'Generated assessment',
+            'created_by': user_id,
+            'created_at': start - timedelta(days=7),
+            'start_time': start,
+            'end_time': start + timedelta(hours=2),
+            'duration_minutes': rng.choice([30, 45, 60]),
+            'max_attempts': 1,
+            'is_active': True
+        }
+
+def questions(rng, test_ids, per_test):
+    for test_id in test_ids:
+        for n in range(per_test):
+            options = ['A', 'B', 'C', 'D']
+            yield {
+                'test_id': test_id,
+                'question_text': f'Question {n + 1}',
+                'question_type': 'multiple_choice',
+                'options': json.dumps(options),
+                'correct_answer': rng.choice(options),
+                'points': rng.choice([1, 1, 2]),
+                'order': n
+            }
+
+def insert_stream(connection, model, rows, chunk_size=CHUNK_SIZE):
+    """Insert a row generator in executemany chunks, committing after each chunk"""
+    table = model.__table__
+    count = 0
+    start = time.perf_counter()
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        connection.execute(table.insert(), chunk)
+        connection.commit()
+        count += len(chunk)
+    elapsed = time.perf_counter() - start
+    print(f'{table.name}: {count} rows in {elapsed:.1f}s ({count / elapsed if elapsed else 0:.0f} rows/s)',
+          file=sys.stderr)
+    return count
+
+def generate(app, profile, seed=37, anchor=None):
+    """Seed the sample data (init_db) and bulk-generate ``profile`` on top of it"""
+    anchor = anchor or date.today()
+    init_db(app, seed=f'{seed}:init')
+    with app.app_context():
+        orgs = [(org.id, org.name) for org in Organization.query.order_by(Organization.id)]
+        org_ids = [org_id for org_id, _ in orgs]
+        admin_id = User.query.filter_by(username='admin').first().id
+        # Reserve ID ranges up front so later next_student_id()/next_receipt_number() calls never collide
+        first_student = id_allocator.reserve('student_id', profile['students']).start
+        first_receipt = id_allocator.reserve('receipt_number', profile['fees']).start
+        db.session.remove()
+
+        cohort = Cohort(random.Random(f'{seed}:cohort'), profile['students'], org_ids, first_student, anchor)
+        counts = {}
+        with db.engine.connect() as connection:
+            if connection.dialect.name == 'sqlite':
+                # Generated data can be regenerated, so trade crash safety for load speed
+                connection.execute(text('PRAGMA synchronous=OFF'))
+            streams = [
+                (Student, students(random.Random(f'{seed}:students'), cohort, anchor)),
+                (Fee, fees(random.Random(f'{seed}:fees'), cohort, profile['fees'], first_receipt, anchor)),
+                (Attendance, attendance(random.Random(f'{seed}:attendance'), cohort, profile['attendance'], anchor)),
+                (Exam, exams(random.Random(f'{seed}:exams'), cohort, profile['exams'], anchor)),
+                (Application, applications(random.Random(f'{seed}:applications'), profile['applications'],
+                                           orgs, admin_id, anchor)),
+                (Hostel, hostel_rooms(random.Random(f'{seed}:hostel'), cohort, profile['hostel_rooms'])),
+                (Timetable, timetable(random.Random(f'{seed}:timetable'), profile['timetable'], org_ids)),
+                (LibraryBook, books(random.Random(f'{seed}:books'), profile['books'])),
+                (Test, tests(random.Random(f'{seed}:tests'), profile['tests'], admin_id, anchor))
+            ]
+            for model, rows in streams:
+                counts[model.__tablename__] = insert_stream(connection, model, rows)
+
+            test_ids = [test_id for (test_id,) in connection.execute(
+                db.select(Test.id).order_by(Test.id.desc()).limit(profile['tests'])
+            )]
+            counts['question'] = insert_stream(connection, Question, questions(
+                random.Random(f'{seed}:questions'), sorted(test_ids), profile['questions_per_test']))
+
+        # Derived tables the bulk inserts bypassed
+        backfill_revenue_rollups()
+        refresh_organization_stats()
+        bump_data_versions(db.session, VERSIONED_TABLES)
+        db.session.commit()
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='small')
+    parser.add_argument('--scale', type=float, default=1.0, help='multiply every row total in the profile')
+    parser.add_argument('--seed', type=int, default=37)
+    parser.add_argument('--today', type=date.fromisoformat, help='anchor date for generated dates (YYYY-MM-DD)')
+    args = parser.parse_args()
+
+    app = create_app()
+    start = time.perf_counter()
+    counts = generate(app, scaled(PROFILES[args.profile], args.scale), seed=args.seed, anchor=args.today)
+    print(f'Generated {sum(counts.values())} rows in {time.perf_counter() - start:.1f}s')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Gunicorn settings for the College ERP.
+
+Sync workers (the default) suit the database-bound admin and student pages.
+Set GUNICORN_WORKER_CLASS=gevent for a second pool that serves the I/O-bound
+routes (Google OAuth callback, face uploads, application submission,
+proctoring WebSockets); see README.md for the proxy split and zero-downtime
+reloads.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 200))  # async workers only
+threads = int(os.environ.get('GUNICORN_THREADS', 1))
+
+# Import the app once in the master so workers fork with it already loaded
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') == '1'
+
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers now and then so slow leaks never build up
+max_requests = 2000
+max_requests_jitter = 200
+
+accesslog = '-'
+errorlog = '-'
+
+
+def post_fork(server, worker):
+    # Connections opened in the master must not be shared with forked workers
+    from app import db
+    from wsgi import app
+
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
@@ -0,0 +1,116 @@
+"""Load-test harness for a running College ERP server.
+
+    python loadtest.py http://localhost:8000 --duration 30 --concurrency 16
+
+Each worker thread logs in once (as the sample admin by default) and then
+requests the routes round-robin until the duration is up. Requests/second
+and latency percentiles are reported per route.
+"""
+import argparse
+import http.cookiejar
+import json
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+DEFAULT_ROUTES = [
+    '/healthz',
+    '/readyz',
+    '/dashboard',
+    '/api/dashboard_data',
+    '/admin/applications',
+    '/admissions',
+    '/fees',
+    '/hostel',
+    '/timetable',
+    '/organization_selection'
+]
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def run_worker(base_url, routes, deadline, credentials, offset, results, lock):
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+    if credentials:
+        form = urllib.parse.urlencode({'email': credentials[0], 'password': credentials[1]}).encode()
+        opener.open(f'{base_url}/login', data=form, timeout=30).read()
+
+    latencies = {route: [] for route in routes}
+    errors = {route: 0 for route in routes}
+    i = offset
+    while time.perf_counter() < deadline:
+        route = routes[i % len(routes)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            with opener.open(f'{base_url}{route}', timeout=30) as response:
+                response.read()
+        except urllib.error.HTTPError as e:
+            e.read()
+            errors[route] += 1
+        except (urllib.error.URLError, OSError):
+            errors[route] += 1
+        latencies[route].append(time.perf_counter() - start)
+
+    with lock:
+        for route in routes:
+            results[route]['latencies'].extend(latencies[route])
+            results[route]['errors'] += errors[route]
+
+def run(base_url, routes, duration, concurrency, credentials):
+    results = {route: {'latencies': [], 'errors': 0} for route in routes}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+    workers = [
+        threading.Thread(target=run_worker, args=(base_url, routes, deadline, credentials, n, results, lock))
+        for n in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    report = {}
+    for route, result in results.items():
+        latencies = sorted(result['latencies'])
+        report[route] = {
+            'requests': len(latencies),
+            'errors': result['errors'],
+            'requests_per_second': round(len(latencies) / elapsed, 1),
+            'p50_ms': round(percentile(latencies, 0.50) * 1000, 1),
+            'p99_ms': round(percentile(latencies, 0.99) * 1000, 1)
+        }
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('base_url', help='server to test, e.g. http://localhost:8000')
+    parser.add_argument('--route', action='append', dest='routes', help='route to request (repeatable)')
+    parser.add_argument('--duration', type=float, default=30, help='seconds to run')
+    parser.add_argument('--concurrency', type=int, default=8, help='parallel clients')
+    parser.add_argument('--email', default='admin@college.edu')
+    parser.add_argument('--password', default='admin123')
+    parser.add_argument('--anonymous', action='store_true', help='do not log in first')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args()
+
+    credentials = None if args.anonymous else (args.email, args.password)
+    report = run(args.base_url.rstrip('/'), args.routes or DEFAULT_ROUTES, args.duration, args.concurrency, credentials)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{'route':<32} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    for route, row in report.items():
+        print(f"{route:<32} {row['requests']:>9} {row['errors']:>7} {row['requests_per_second']:>9} "
+              f"{row['p50_ms']:>9} {row['p99_ms']:>9}")
+
+if __name__ == '__main__':
+    main()
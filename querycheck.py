@@ -0,0 +1,294 @@
+"""N+1 query check for every College ERP route.
+
+    python querycheck.py --rows 200 --factor 5
+
+Seeds two throwaway SQLite databases, one with ``--rows`` students (plus
+fees, attendance, applications, hostel rooms, books and test questions in
+proportion) and one ``--factor`` times larger. Every route is then requested
+as the sample admin and the sample student, and the SQL statements each
+request executes are counted. Routes that run a fixed number of queries
+pass; a route whose query count grows with the data (a query per row) or
+that returns a server error fails, and the script exits with status 1.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app import (create_app, db, init_db, Application, Attendance, Exam, Fee, Hostel, LibraryBook,
+                 Organization, Question, Student, Test, Timetable, User)
+
+# Routes that leave the app (OAuth) or end the session
+SKIPPED_ENDPOINTS = {'static', 'main.google_login', 'main.google_callback', 'main.logout'}
+
+COURSES = ['Computer Science Engineering', 'Mechanical Engineering', 'Civil Engineering',
+           'Electrical Engineering', 'Electronics Engineering', 'Information Technology']
+SUBJECTS = ['Data Structures', 'Algorithms', 'Database Systems', 'Operating Systems', 'Computer Networks']
+SAMPLE_STUDENT_ID = 'STU2024001'  # hardcoded by the student routes
+
+# Sample bodies for routes that only accept POST
+POST_REQUESTS = {
+    'admin.bulk_review': lambda sample: {'json': {'action': 'approve', 'ids': sample['application_ids'][:10]}},
+    'admin.merit_list': lambda sample: {'json': {'seats': 10}},
+    'main.chat_api': lambda sample: {'json': {'message': 'dashboard'}},
+    'tests.submit_test': lambda sample: {'data': {f'question_{question_id}': 'A'
+                                                  for question_id in sample['question_ids']}},
+    'wallet.add_money_to_wallet': lambda sample: {'data': {'amount': '100'}}
+}
+
+_counters = {'queries': 0, 'rows': 0}
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    _counters['queries'] += 1
+
+def _count_loaded_row(target, context):
+    _counters['rows'] += 1
+
+def seed(app, rows):
+    """Sample data from init_db plus ``rows`` students and proportional related rows"""
+    rng = random.Random(36)
+    init_db(app)
+    with app.app_context():
+        org_id = Organization.query.order_by(Organization.id).first().id
+        admin_id = User.query.filter_by(username='admin').first().id
+        today = date.today()
+
+        students = [{
+            'student_id': SAMPLE_STUDENT_ID if i == 0 else f'STU{i:09d}',
+            'name': f'Student {i}',
+            'email': 'student@college.edu' if i == 0 else f'student{i}@college.edu',
+            'phone': '9999999999',
+            'course': rng.choice(COURSES),
+            'year': rng.randint(1, 4),
+            'gpa': round(rng.uniform(4, 10), 2),
+            'attendance_percentage': round(rng.uniform(50, 100), 1),
+            'organization_id': org_id
+        } for i in range(rows)]
+        db.session.execute(Student.__table__.insert(), students)
+
+        db.session.execute(Fee.__table__.insert(), [{
+            'student_id': students[i % rows]['student_id'],
+            'amount': rng.choice([25000.0, 50000.0, 75000.0]),
+            'fee_type': rng.choice(['tuition', 'hostel', 'exam']),
+            'payment_date': datetime.now() - timedelta(days=rng.randint(0, 365)),
+            'receipt_number': f'SEED{i:010d}',
+            'organization_id': org_id
+        } for i in range(rows * 2)])
+
+        # Every student gets a few records and the sample student a share that grows with rows
+        db.session.execute(Attendance.__table__.insert(), [{
+            'student_id': SAMPLE_STUDENT_ID if i % 4 == 0 else students[i % rows]['student_id'],
+            'date': today - timedelta(days=i // 4),
+            'status': rng.choice(['present', 'present', 'present', 'absent']),
+            'subject': rng.choice(SUBJECTS),
+            'organization_id': org_id
+        } for i in range(rows * 4)])
+
+        db.session.execute(Exam.__table__.insert(), [{
+            'student_id': SAMPLE_STUDENT_ID if i % 4 == 0 else students[i % rows]['student_id'],
+            'subject': rng.choice(SUBJECTS),
+            'exam_date': datetime.now() + timedelta(days=i % 30),
+            'marks': rng.randint(30, 100),
+            'semester': rng.randint(1, 8),
+            'organization_id': org_id
+        } for i in range(rows)])
+
+        db.session.execute(Application.__table__.insert(), [{
+            'user_id': admin_id,
+            'organization': 'Indian Institute of Technology Delhi',
+            'first_name': f'Applicant{i}',
+            'last_name': 'Seed',
+            'email': f'applicant{i}@college.edu',
+            'phone': '9999999999',
+            'date_of_birth': date(2005, 1, 1),
+            'gender': 'other',
+            'address': 'Seed',
+            'course': rng.choice(COURSES),
+            'qualification': '12th',
+            'previous_institution': 'Seed School',
+            'marks': round(rng.uniform(35, 100), 1),
+            'passing_year': 2024,
+            'entrance_score': round(rng.uniform(0, 100), 1),
+            'status': 'pending',
+            'submitted_at': datetime.now() - timedelta(minutes=i),
+            'organization_id': org_id
+        } for i in range(rows)])
+
+        db.session.execute(Hostel.__table__.insert(), [{
+            'room_number': f'S{i:05d}',
+            'floor': 4 + i // 50,
+            'capacity': 2,
+            'occupied': occupied,
+            'student_ids': json.dumps([students[(2 * i + n) % rows]['student_id'] for n in range(occupied)]),
+            'status': 'occupied' if occupied == 2 else 'available',
+            'organization_id': org_id
+        } for i, occupied in ((i, rng.randint(0, 2)) for i in range(rows // 2))])
+
+        db.session.execute(Timetable.__table__.insert(), [{
+            'day': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'][i % 5],
+            'time_slot': f'{9 + i % 8:02d}:00-{10 + i % 8:02d}:00',
+            'subject': rng.choice(SUBJECTS),
+            'teacher': f'Teacher {i % 20}',
+            'room': f'R{i % 30}',
+            'year': 1 + i % 4,
+            'organization_id': org_id
+        } for i in range(rows // 5)])
+
+        db.session.execute(LibraryBook.__table__.insert(), [{
+            'title': f'Book {i}',
+            'author': f'Author {i % 50}',
+            'isbn': f'978{i:010d}',
+            'price': rng.choice([199.0, 299.0, 499.0]),
+            'category': rng.choice(['Programming', 'Mathematics', 'Physics']),
+            'stock': 5,
+            'description': 'Seeded book'
+        } for i in range(rows // 10)])
+
+        test = Test(title='Seeded Test', created_by=admin_id, start_time=datetime.now() - timedelta(days=1),
+                    end_time=datetime.now() + timedelta(days=1), duration_minutes=60, max_attempts=1000)
+        db.session.add(test)
+        db.session.flush()
+        db.session.execute(Question.__table__.insert(), [{
+            'test_id': test.id,
+            'question_text': f'Question {i}',
+            'question_type': 'multiple_choice',
+            'options': json.dumps(['A', 'B', 'C', 'D']),
+            'correct_answer': rng.choice('ABCD'),
+            'points': 1,
+            'order': i
+        } for i in range(max(1, rows // 10))])
+        db.session.commit()
+
+        return {
+            'org_id': org_id,
+            'org_code': db.session.get(Organization, org_id).code,
+            'test_id': test.id,
+            'question_ids': [q.id for q in Question.query.filter_by(test_id=test.id)],
+            'application_ids': [a.id for a in Application.query.order_by(Application.id).limit(20)],
+            'book_id': LibraryBook.query.order_by(LibraryBook.id).first().id
+        }
+
+def route_requests(app, sample):
+    """(endpoint, method, url, request kwargs) for every route the app serves"""
+    url_args = {
+        'app_id': sample['application_ids'][-1],
+        'org_id': sample['org_id'],
+        'org_code': sample['org_code'],
+        'student_id': SAMPLE_STUDENT_ID,
+        'book_id': sample['book_id'],
+        'test_id': sample['test_id']
+    }
+    requests = []
+    for rule in sorted(app.url_map.iter_rules(), key=lambda rule: rule.rule):
+        if rule.endpoint in SKIPPED_ENDPOINTS:
+            continue
+        if any(arg not in url_args for arg in rule.arguments):
+            requests.append((rule.endpoint, None, rule.rule, None))
+            continue
+        url = rule.build({arg: url_args[arg] for arg in rule.arguments}, append_unknown=False)[1]
+        if 'GET' in rule.methods:
+            requests.append((rule.endpoint, 'GET', url, {}))
+        elif rule.endpoint in POST_REQUESTS:
+            requests.append((rule.endpoint, 'POST', url, POST_REQUESTS[rule.endpoint](sample)))
+        else:
+            requests.append((rule.endpoint, None, rule.rule, None))
+    return requests
+
+def login(client, app, role, org_id):
+    with app.app_context():
+        user = User.query.filter_by(username=role).first()
+    with client.session_transaction() as session:
+        session['user_id'] = user.id
+        session['role'] = role
+        session['username'] = user.username
+        if role == 'admin':
+            session['organization_id'] = org_id
+        else:
+            session.pop('organization_id', None)
+
+def measure(rows):
+    """Query count, loaded rows and latency per (endpoint, role) at one data scale"""
+    path = os.path.join(tempfile.mkdtemp(prefix='erp-querycheck-'), 'querycheck.db')
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}'})
+    sample = seed(app, rows)
+
+    results = {}
+    client = app.test_client()
+    for endpoint, method, url, kwargs in route_requests(app, sample):
+        for role in ('admin', 'student'):
+            if method is None:
+                results[endpoint, role] = {'url': url, 'status': 'skipped'}
+                continue
+            # First request warms per-process caches; the second is measured
+            for _ in range(2):
+                login(client, app, role, sample['org_id'])
+                _counters.update(queries=0, rows=0)
+                start = time.perf_counter()
+                response = client.open(url, method=method, **kwargs)
+                elapsed = time.perf_counter() - start
+            results[endpoint, role] = {
+                'url': url,
+                'status': response.status_code,
+                'queries': _counters['queries'],
+                'rows': _counters['rows'],
+                'ms': round(elapsed * 1000, 1)
+            }
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200, help='students in the small dataset')
+    parser.add_argument('--factor', type=int, default=5, help='size of the large dataset relative to the small one')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args()
+
+    event.listen(db.Model, 'load', _count_loaded_row, propagate=True)
+    small = measure(args.rows)
+    large = measure(args.rows * args.factor)
+
+    report = []
+    for key, before in small.items():
+        after = large.get(key, before)
+        row = {'endpoint': key[0], 'role': key[1], 'url': before['url'], 'status': after['status']}
+        if before['status'] != 'skipped':
+            row.update({
+                'queries': [before['queries'], after['queries']],
+                'rows': [before['rows'], after['rows']],
+                'ms': [before['ms'], after['ms']],
+                'grows': after['queries'] > before['queries']
+            })
+        report.append(row)
+    failures = [row for row in report if row.get('grows')]
+    errors = [row for row in report if row['status'] != 'skipped' and row['status'] >= 500]
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{'endpoint':<32} {'role':<8} {'status':>7} {'queries':>11} {'rows':>13} {'ms':>15}")
+        for row in report:
+            if row['status'] == 'skipped':
+                print(f"{row['endpoint']:<32} {row['role']:<8} {'skipped':>7}")
+                continue
+            queries = '{} -> {}'.format(*row['queries'])
+            rows = '{} -> {}'.format(*row['rows'])
+            ms = '{} -> {}'.format(*row['ms'])
+            flag = '  GROWS' if row['grows'] else ''
+            print(f"{row['endpoint']:<32} {row['role']:<8} {row['status']:>7} {queries:>11} {rows:>13} {ms:>15}{flag}")
+        print(f'\n{len(failures)} route(s) run more queries with {args.factor}x the data')
+        if errors:
+            # A view that raises stops counting at the error, which can hide a per-row loop
+            print(f'{len(errors)} route(s) returned a server error: '
+                  + ', '.join(f"{row['endpoint']} ({row['role']})" for row in errors))
+
+    sys.exit(1 if failures or errors else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Search functionality
+    const searchInput = document.getElementById('searchInput');
+    const statusFilter = document.getElementById('statusFilter');
+    const courseFilter = document.getElementById('courseFilter');
+    const tableBody = document.getElementById('applicationsTableBody');
+    const rows = tableBody.querySelectorAll('tr');
+
+    function filterApplications() {
+        const searchTerm = searchInput.value.toLowerCase();
+        const statusValue = statusFilter.value;
+        const courseValue = courseFilter.value;
+
+        rows.forEach(row => {
+            const name = row.dataset.name.toLowerCase();
+            const email = row.dataset.email.toLowerCase();
+            const status = row.dataset.status;
+            const course = row.dataset.course;
+
+            const matchesSearch = name.includes(searchTerm) || email.includes(searchTerm);
+            const matchesStatus = !statusValue || status === statusValue;
+            const matchesCourse = !courseValue || course === courseValue;
+
+            if (matchesSearch && matchesStatus && matchesCourse) {
+                row.style.display = '';
+            } else {
+                row.style.display = 'none';
+            }
+        });
+        updateExportLinks({ q: searchInput.value.trim(), status: statusValue, course: courseValue });
+    }
+
+    // Point the export links at the same filters as the table
+    function updateExportLinks(filters) {
+        const params = new URLSearchParams();
+        Object.entries(filters).forEach(([name, value]) => {
+            if (value) params.set(name, value);
+        });
+        document.querySelectorAll('.export-link').forEach(link => {
+            link.href = link.dataset.base + (params.toString() ? '?' + params.toString() : '');
+        });
+    }
+
+    searchInput.addEventListener('input', filterApplications);
+    statusFilter.addEventListener('change', filterApplications);
+    courseFilter.addEventListener('change', filterApplications);
+
+    // Add hover effects to action buttons
+    document.querySelectorAll('.btn-action').forEach(btn => {
+        btn.addEventListener('mouseenter', function() {
+            this.style.transform = 'translateY(-3px) scale(1.05)';
+        });
+
+        btn.addEventListener('mouseleave', function() {
+            this.style.transform = 'translateY(-2px) scale(1)';
+        });
+    });
+
+    // Animate table rows on load
+    rows.forEach((row, index) => {
+        row.style.opacity = '0';
+        row.style.transform = 'translateY(20px)';
+        setTimeout(() => {
+            row.style.transition = 'all 0.3s ease';
+            row.style.opacity = '1';
+            row.style.transform = 'translateY(0)';
+        }, index * 100);
+    });
+
+    // Real-time updates simulation
+    setInterval(() => {
+        // Simulate new application notifications
+        if (Math.random() > 0.95) {
+            showNotification('New application received!', 'info');
+        }
+    }, 10000);
+});
+
+function viewApplication(appId) {
+    // In real app, show detailed application view
+    alert(`Viewing application ${appId} details...`);
+}
+
+function showNotification(message, type = 'info') {
+    const notification = document.createElement('div');
+    notification.innerHTML = `
+        <i class="fas fa-${type === 'info' ? 'info-circle' : 'check-circle'}"></i>
+        ${message}
+    `;
+    notification.style.cssText = `
+        position: fixed;
+        top: 20px;
+        right: 20px;
+        background: linear-gradient(135deg, #56ab2f, #a8e6cf);
+        color: white;
+        padding: 1rem 2rem;
+        border-radius: 10px;
+        font-weight: bold;
+        z-index: 1000;
+        animation: slideIn 0.5s ease;
+        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
+    `;
+    document.body.appendChild(notification);
+
+    setTimeout(() => {
+        notification.style.animation = 'slideOut 0.5s ease';
+        setTimeout(() => notification.remove(), 500);
+    }, 3000);
+}
+
+// Add CSS for notification animations
+const style = document.createElement('style');
+style.textContent = `
+    @keyframes slideIn {
+        from {
+            transform: translateX(100%);
+            opacity: 0;
+        }
+        to {
+            transform: translateX(0);
+            opacity: 1;
+        }
+    }
+    @keyframes slideOut {
+        from {
+            transform: translateX(0);
+            opacity: 1;
+        }
+        to {
+            transform: translateX(100%);
+            opacity: 0;
+        }
+    }
+`;
+document.head.appendChild(style);
@@ -0,0 +1,54 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const searchInput = document.getElementById('searchInput');
+    const courseFilter = document.getElementById('courseFilter');
+    const statusFilter = document.getElementById('statusFilter');
+    const studentsGrid = document.getElementById('studentsGrid');
+
+    function filterStudents() {
+        const searchTerm = searchInput.value.toLowerCase();
+        const courseValue = courseFilter.value;
+        const statusValue = statusFilter.value;
+
+        const studentCards = studentsGrid.querySelectorAll('.student-card');
+
+        studentCards.forEach(card => {
+            const name = card.querySelector('h3').textContent.toLowerCase();
+            const course = card.dataset.course;
+            const status = card.dataset.status;
+
+            const matchesSearch = name.includes(searchTerm);
+            const matchesCourse = !courseValue || course === courseValue;
+            const matchesStatus = !statusValue || status === statusValue;
+
+            if (matchesSearch && matchesCourse && matchesStatus) {
+                card.style.display = 'block';
+                card.classList.add('fade-in');
+            } else {
+                card.style.display = 'none';
+            }
+        });
+        updateExportLinks({ q: searchInput.value.trim(), course: courseValue, status: statusValue });
+    }
+
+    // Point the export links at the same filters as the cards
+    function updateExportLinks(filters) {
+        const params = new URLSearchParams();
+        Object.entries(filters).forEach(([name, value]) => {
+            if (value) params.set(name, value);
+        });
+        document.querySelectorAll('.export-link').forEach(link => {
+            link.href = link.dataset.base + (params.toString() ? '?' + params.toString() : '');
+        });
+    }
+
+    searchInput.addEventListener('input', filterStudents);
+    courseFilter.addEventListener('change', filterStudents);
+    statusFilter.addEventListener('change', filterStudents);
+
+    // Add animation to cards
+    const cards = document.querySelectorAll('.student-card');
+    cards.forEach((card, index) => {
+        card.style.animationDelay = `${index * 0.1}s`;
+        card.classList.add('fade-in');
+    });
+});
@@ -0,0 +1,201 @@
+// Filter and search functionality
+function filterStudents() {
+    const searchTerm = document.getElementById('searchInput').value.toLowerCase();
+    const courseFilter = document.getElementById('courseFilter').value;
+    const yearFilter = document.getElementById('yearFilter').value;
+    const statusFilter = document.getElementById('statusFilter').value;
+
+    const rows = document.querySelectorAll('.student-row');
+    let visibleCount = 0;
+
+    rows.forEach(row => {
+        const name = row.dataset.name;
+        const course = row.dataset.course;
+        const year = row.dataset.year;
+        const status = row.dataset.status;
+
+        const matchesSearch = name.includes(searchTerm) || 
+                            row.querySelector('.student-id').textContent.toLowerCase().includes(searchTerm);
+        const matchesCourse = !courseFilter || course === courseFilter;
+        const matchesYear = !yearFilter || year === yearFilter;
+        const matchesStatus = !statusFilter || status === statusFilter;
+
+        if (matchesSearch && matchesCourse && matchesYear && matchesStatus) {
+            row.style.display = '';
+            visibleCount++;
+            // Add animation
+            row.style.animation = 'fadeInUp 0.3s ease-out';
+        } else {
+            row.style.display = 'none';
+        }
+    });
+
+    updateExportLinks({
+        q: document.getElementById('searchInput').value.trim(),
+        course: courseFilter,
+        year: yearFilter,
+        status: statusFilter
+    });
+
+    // Update badge count
+    const badge = document.querySelector('.badge');
+    if (badge) {
+        badge.textContent = `${visibleCount} Students`;
+    }
+
+    // Show empty state if no results
+    const tableBody = document.getElementById('studentsTableBody');
+    if (visibleCount === 0) {
+        if (!document.querySelector('.no-results')) {
+            const noResults = document.createElement('tr');
+            noResults.className = 'no-results';
+            noResults.innerHTML = `
+                <td colspan="9" style="text-align: center; padding: 3rem; color: #666;">
+                    <i class="fas fa-search" style="font-size: 3rem; margin-bottom: 1rem; color: #ccc;"></i>
+                    <h3>No students found matching your criteria</h3>
+                    <p>Try adjusting your search terms or filters</p>
+                </td>
+            `;
+            tableBody.appendChild(noResults);
+        }
+    } else {
+        const noResults = document.querySelector('.no-results');
+        if (noResults) {
+            noResults.remove();
+        }
+    }
+}
+
+// Real-time search
+document.getElementById('searchInput').addEventListener('input', filterStudents);
+document.getElementById('courseFilter').addEventListener('change', filterStudents);
+document.getElementById('yearFilter').addEventListener('change', filterStudents);
+document.getElementById('statusFilter').addEventListener('change', filterStudents);
+
+// View student details
+function viewStudent(studentId) {
+    // Find the student data
+    const row = document.querySelector(`tr[data-name*="${studentId}"]`) || 
+               Array.from(document.querySelectorAll('.student-row')).find(row => 
+                   row.querySelector('.student-id').textContent === studentId);
+
+    if (row) {
+        const studentIdEl = row.querySelector('.student-id').textContent;
+        const name = row.querySelector('td:nth-child(2) div div').textContent;
+        const email = row.querySelector('td:nth-child(2) div div:nth-child(2)').textContent;
+        const course = row.querySelector('td:nth-child(3) span').textContent;
+        const year = row.querySelector('td:nth-child(4) span').textContent;
+        const gpa = row.querySelector('td:nth-child(5) span').textContent;
+        const attendance = row.querySelector('td:nth-child(6) span').textContent;
+        const status = row.querySelector('td:nth-child(7) span').textContent;
+        const admissionDate = row.querySelector('td:nth-child(8) span').textContent;
+
+        const modalContent = `
+            <h2 style="color: #333; margin-bottom: 1.5rem; display: flex; align-items: center; gap: 0.5rem;">
+                <i class="fas fa-user-graduate"></i> Student Details
+            </h2>
+            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin-bottom: 2rem;">
+                <div>
+                    <label style="font-weight: 600; color: #666; font-size: 0.9rem;">Student ID</label>
+                    <div style="background: rgba(102, 126, 234, 0.1); padding: 0.5rem; border-radius: 8px; margin-top: 0.25rem;">${studentIdEl}</div>
+                </div>
+                <div>
+                    <label style="font-weight: 600; color: #666; font-size: 0.9rem;">Name</label>
+                    <div style="background: rgba(102, 126, 234, 0.1); padding: 0.5rem; border-radius: 8px; margin-top: 0.25rem;">${name}</div>
+                </div>
+                <div>
+                    <label style="font-weight: 600; color: #666; font-size: 0.9rem;">Email</label>
+                    <div style="background: rgba(102, 126, 234, 0.1); padding: 0.5rem; border-radius: 8px; margin-top: 0.25rem;">${email}</div>
+                </div>
+                <div>
+                    <label style="font-weight: 600; color: #666; font-size: 0.9rem;">Course</label>
+                    <div style="background: rgba(102, 126, 234, 0.1); padding: 0.5rem; border-radius: 8px; margin-top: 0.25rem;">${course}</div>
+                </div>
+                <div>
+                    <label style="font-weight: 600; color: #666; font-size: 0.9rem;">Year</label>
+                    <div style="background: rgba(102, 126, 234, 0.1); padding: 0.5rem; border-radius: 8px; margin-top: 0.25rem;">${year}</div>
+                </div>
+                <div>
+                    <label style="font-weight: 600; color: #666; font-size: 0.9rem;">GPA</label>
+                    <div style="background: rgba(102, 126, 234, 0.1); padding: 0.5rem; border-radius: 8px; margin-top: 0.25rem;">${gpa}</div>
+                </div>
+                <div>
+                    <label style="font-weight: 600; color: #666; font-size: 0.9rem;">Attendance</label>
+                    <div style="background: rgba(102, 126, 234, 0.1); padding: 0.5rem; border-radius: 8px; margin-top: 0.25rem;">${attendance}</div>
+                </div>
+                <div>
+                    <label style="font-weight: 600; color: #666; font-size: 0.9rem;">Status</label>
+                    <div style="background: rgba(102, 126, 234, 0.1); padding: 0.5rem; border-radius: 8px; margin-top: 0.25rem;">${status}</div>
+                </div>
+            </div>
+            <div style="text-align: center;">
+                <button onclick="closeModal()" class="btn btn-primary">
+                    <i class="fas fa-times"></i> Close
+                </button>
+            </div>
+        `;
+
+        document.getElementById('modalContent').innerHTML = modalContent;
+        document.getElementById('studentModal').style.display = 'block';
+    }
+}
+
+// Edit student
+function editStudent(studentId) {
+    // In a real application, this would redirect to an edit form
+    alert(`Edit functionality for student ${studentId} would be implemented here.`);
+}
+
+// Delete student
+function deleteStudent(studentId) {
+    if (confirm(`Are you sure you want to delete student ${studentId}? This action cannot be undone.`)) {
+        // In a real application, this would make an API call to delete the student
+        alert(`Delete functionality for student ${studentId} would be implemented here.`);
+    }
+}
+
+// Close modal
+function closeModal() {
+    document.getElementById('studentModal').style.display = 'none';
+}
+
+// Close modal when clicking outside
+window.onclick = function(event) {
+    const modal = document.getElementById('studentModal');
+    if (event.target === modal) {
+        closeModal();
+    }
+}
+
+// Add animations to table rows
+document.addEventListener('DOMContentLoaded', function() {
+    const rows = document.querySelectorAll('.student-row');
+    rows.forEach((row, index) => {
+        row.style.animationDelay = `${index * 0.05}s`;
+        row.classList.add('animate-fadeInUp');
+    });
+});
+
+// Add hover effects
+document.querySelectorAll('.student-row').forEach(row => {
+    row.addEventListener('mouseenter', function() {
+        this.style.transform = 'translateY(-2px)';
+        this.style.boxShadow = '0 8px 25px rgba(0, 0, 0, 0.15)';
+    });
+
+    row.addEventListener('mouseleave', function() {
+        this.style.transform = 'translateY(0)';
+        this.style.boxShadow = 'none';
+    });
+});
+
+// Point the export links at the same filters as the table
+function updateExportLinks(filters) {
+    const params = new URLSearchParams();
+    Object.entries(filters).forEach(([name, value]) => {
+        if (value) params.set(name, value);
+    });
+    document.querySelectorAll('.export-link').forEach(link => {
+        link.href = link.dataset.base + (params.toString() ? '?' + params.toString() : '');
+    });
+}
@@ -0,0 +1,180 @@
+let currentStep = 1;
+let selectedStudent = null;
+let selectedRoom = null;
+let selectedPreferences = [];
+
+// Step navigation
+function goToStep(step) {
+    // Hide all sections
+    document.querySelectorAll('.form-section').forEach(section => {
+        section.classList.remove('active');
+    });
+
+    // Show target section
+    document.getElementById(`section${step}`).classList.add('active');
+    currentStep = step;
+}
+
+// Load student info
+function loadStudentInfo() {
+    const studentSelect = document.getElementById('studentSelect');
+    const selectedOption = studentSelect.options[studentSelect.selectedIndex];
+
+    if (!selectedOption.value) {
+        document.getElementById('studentValidation').textContent = 'Please select a student';
+        document.getElementById('studentValidation').className = 'validation-message validation-error';
+        return;
+    }
+
+    // Parse student info from option text
+    const optionText = selectedOption.text;
+    const studentId = selectedOption.value;
+    const name = optionText.split(' - ')[1].split(' (')[0];
+    const course = optionText.split(' (')[1].replace(')', '');
+
+    selectedStudent = {
+        id: studentId,
+        name: name,
+        course: course,
+        year: '2' // Default year, in real app this would come from database
+    };
+
+    // Display student info
+    document.getElementById('studentId').textContent = studentId;
+    document.getElementById('studentName').textContent = name;
+    document.getElementById('studentCourse').textContent = course;
+    document.getElementById('studentYear').textContent = `Year ${selectedStudent.year}`;
+    document.getElementById('studentAvatar').textContent = name[0].toUpperCase();
+
+    document.getElementById('studentInfo').classList.add('show');
+    document.getElementById('studentValidation').textContent = '✓ Student selected';
+    document.getElementById('studentValidation').className = 'validation-message validation-success';
+
+    setTimeout(() => {
+        goToStep(2);
+    }, 1000);
+}
+
+// Room selection
+function selectRoom(roomNumber) {
+    // Remove selection from all rooms
+    document.querySelectorAll('.room-option').forEach(option => {
+        option.classList.remove('selected');
+    });
+
+    // Add selection to clicked room
+    event.target.closest('.room-option').classList.add('selected');
+
+    selectedRoom = roomNumber;
+    document.getElementById('selectedRoom').value = roomNumber;
+    document.getElementById('validateRoomBtn').disabled = false;
+
+    // Add animation
+    event.target.closest('.room-option').style.animation = 'pulse 0.5s ease-out';
+}
+
+function validateRoomSelection() {
+    if (!selectedRoom) {
+        alert('Please select a room');
+        return;
+    }
+
+    goToStep(3);
+}
+
+// Preferences
+function togglePreference(element, preference) {
+    element.classList.toggle('selected');
+
+    if (element.classList.contains('selected')) {
+        if (!selectedPreferences.includes(preference)) {
+            selectedPreferences.push(preference);
+        }
+    } else {
+        selectedPreferences = selectedPreferences.filter(p => p !== preference);
+    }
+}
+
+function validatePreferences() {
+    goToStep(4);
+    updateSummary();
+}
+
+// Update summary
+function updateSummary() {
+    if (selectedStudent && selectedRoom) {
+        document.getElementById('summaryStudent').textContent = `${selectedStudent.name} (${selectedStudent.id})`;
+        document.getElementById('summaryRoom').textContent = `Room ${selectedRoom}`;
+        document.getElementById('summaryFloor').textContent = `Floor ${Math.floor(parseInt(selectedRoom) / 100)}`;
+        document.getElementById('summaryDate').textContent = new Date().toLocaleDateString();
+    }
+}
+
+// Form submission
+document.getElementById('allocationForm').addEventListener('submit', function(e) {
+    e.preventDefault();
+
+    const submitBtn = document.getElementById('confirmAllocationBtn');
+    submitBtn.innerHTML = '<span class="spinner"></span> Processing...';
+    submitBtn.disabled = true;
+
+    // Simulate allocation processing
+    setTimeout(() => {
+        document.querySelector('.form-container').style.display = 'none';
+        document.getElementById('successAnimation').classList.add('show');
+    }, 2000);
+});
+
+// Go back function
+function goBack() {
+    window.history.back();
+}
+
+// Real-time validation
+document.addEventListener('DOMContentLoaded', function() {
+    // Student selection validation
+    document.getElementById('studentSelect').addEventListener('change', function() {
+        if (this.value) {
+            this.classList.add('valid');
+            this.classList.remove('invalid');
+        }
+    });
+
+    // Add animations to room options
+    document.querySelectorAll('.room-option').forEach(option => {
+        option.addEventListener('mouseenter', function() {
+            this.style.transform = 'translateY(-5px) scale(1.02)';
+        });
+
+        option.addEventListener('mouseleave', function() {
+            if (!this.classList.contains('selected')) {
+                this.style.transform = 'translateY(0) scale(1)';
+            }
+        });
+    });
+});
+
+// Add animations
+document.addEventListener('DOMContentLoaded', function() {
+    const sections = document.querySelectorAll('.form-section');
+    sections.forEach((section, index) => {
+        section.style.animationDelay = `${index * 0.2}s`;
+        section.classList.add('animate-fadeInUp');
+    });
+
+    // Animate room options
+    const roomOptions = document.querySelectorAll('.room-option');
+    roomOptions.forEach((option, index) => {
+        option.style.animationDelay = `${index * 0.1}s`;
+        option.classList.add('animate-fadeInUp');
+    });
+});
+
+// Auto-refresh available rooms
+function refreshRooms() {
+    // In a real application, this would fetch updated room data
+    console.log('Refreshing room availability...');
+}
+
+// Refresh rooms every 30 seconds
+setInterval(refreshRooms, 30000);
@@ -0,0 +1,175 @@
+// Tab navigation
+function showAnalyticsTab(tabName) {
+    // Hide all management content
+    document.querySelectorAll('.management-content').forEach(content => {
+        content.classList.remove('active');
+    });
+
+    // Remove active class from all tabs
+    document.querySelectorAll('.management-tab').forEach(tab => {
+        tab.classList.remove('active');
+    });
+
+    // Show selected tab content
+    document.getElementById(`${tabName}Tab`).classList.add('active');
+
+    // Add active class to clicked tab
+    event.target.classList.add('active');
+}
+
+// Analytics actions
+function refreshAnalytics() {
+    const btn = event.target;
+    const originalText = btn.innerHTML;
+
+    btn.innerHTML = '<span class="spinner"></span> Refreshing...';
+    btn.disabled = true;
+
+    // Simulate data refresh
+    setTimeout(() => {
+        btn.innerHTML = originalText;
+        btn.disabled = false;
+
+        // Update risk scores randomly
+        updateRiskScores();
+
+        // Update performance charts
+        updatePerformanceCharts();
+
+        alert('Analytics data refreshed successfully!');
+    }, 2000);
+}
+
+function updateRiskScores() {
+    const riskScores = document.querySelectorAll('.risk-score');
+    riskScores.forEach(score => {
+        const currentScore = parseFloat(score.textContent);
+        const change = (Math.random() - 0.5) * 10; // -5 to 5
+        const newScore = Math.max(0, Math.min(100, currentScore + change));
+
+        score.textContent = newScore.toFixed(1) + '%';
+
+        // Update risk level
+        const card = score.closest('.risk-card');
+        card.classList.remove('high-risk', 'medium-risk', 'low-risk');
+        score.classList.remove('high', 'medium', 'low');
+
+        if (newScore > 70) {
+            card.classList.add('high-risk');
+            score.classList.add('high');
+        } else if (newScore > 40) {
+            card.classList.add('medium-risk');
+            score.classList.add('medium');
+        } else {
+            card.classList.add('low-risk');
+            score.classList.add('low');
+        }
+    });
+}
+
+function updatePerformanceCharts() {
+    // Update attendance trend bars
+    const trendBars = document.querySelectorAll('.trend-bar');
+    trendBars.forEach(bar => {
+        const currentHeight = parseFloat(bar.style.height);
+        const change = (Math.random() - 0.5) * 20; // -10 to 10
+        const newHeight = Math.max(20, Math.min(100, currentHeight + change));
+
+        bar.style.height = newHeight + '%';
+        bar.setAttribute('data-value', Math.round(newHeight) + '%');
+    });
+
+    // Update GPA distribution
+    const gpaCounts = document.querySelectorAll('.gpa-range-count');
+    gpaCounts.forEach(count => {
+        const currentCount = parseInt(count.textContent);
+        const change = Math.floor((Math.random() - 0.5) * 6); // -3 to 3
+        const newCount = Math.max(0, currentCount + change);
+
+        count.textContent = newCount;
+    });
+}
+
+function generateReport() {
+    alert('Generating comprehensive analytics report... This would create a detailed PDF report with all analytics data.');
+}
+
+function exportData() {
+    alert('Exporting analytics data to CSV/JSON format... This would allow further analysis in external tools.');
+}
+
+function scheduleInterventions() {
+    alert('Scheduling intervention programs for at-risk students... This would create calendar events and notify relevant staff.');
+}
+
+// Add animations to elements
+document.addEventListener('DOMContentLoaded', function() {
+    // Animate risk cards
+    const riskCards = document.querySelectorAll('.risk-card');
+    riskCards.forEach((card, index) => {
+        card.style.animationDelay = `${index * 0.1}s`;
+        card.classList.add('animate-fadeInUp');
+    });
+
+    // Animate chart containers
+    const chartContainers = document.querySelectorAll('.chart-container');
+    chartContainers.forEach((container, index) => {
+        container.style.animationDelay = `${index * 0.2}s`;
+        container.classList.add('animate-fadeInUp');
+    });
+
+    // Animate prediction items
+    const predictionItems = document.querySelectorAll('.prediction-item');
+    predictionItems.forEach((item, index) => {
+        item.style.animationDelay = `${index * 0.1}s`;
+        item.classList.add('animate-fadeInUp');
+    });
+
+    // Add hover effects to trend bars
+    const trendBars = document.querySelectorAll('.trend-bar');
+    trendBars.forEach(bar => {
+        bar.addEventListener('mouseenter', function() {
+            this.style.transform = 'scaleY(1.1)';
+            this.style.boxShadow = '0 8px 25px rgba(102, 126, 234, 0.3)';
+        });
+
+        bar.addEventListener('mouseleave', function() {
+            this.style.transform = 'scaleY(1)';
+            this.style.boxShadow = 'none';
+        });
+    });
+
+    // Add hover effects to GPA ranges
+    const gpaRanges = document.querySelectorAll('.gpa-range');
+    gpaRanges.forEach(range => {
+        range.addEventListener('mouseenter', function() {
+            this.style.transform = 'translateY(-5px)';
+            this.style.boxShadow = '0 8px 25px rgba(102, 126, 234, 0.2)';
+        });
+
+        range.addEventListener('mouseleave', function() {
+            this.style.transform = 'translateY(0)';
+            this.style.boxShadow = 'none';
+        });
+    });
+});
+
+// Real-time updates simulation
+function simulateLiveUpdates() {
+    setInterval(() => {
+        // Randomly update some risk scores
+        if (Math.random() < 0.3) { // 30% chance
+            updateRiskScores();
+        }
+
+        // Randomly update performance charts
+        if (Math.random() < 0.2) { // 20% chance
+            updatePerformanceCharts();
+        }
+    }, 30000); // Update every 30 seconds
+}
+
+// Start live updates
+document.addEventListener('DOMContentLoaded', function() {
+    simulateLiveUpdates();
+});
@@ -0,0 +1,24 @@
+// Auto-hide flash messages
+setTimeout(() => {
+    const messages = document.querySelectorAll('.flash-message');
+    messages.forEach(message => {
+        message.style.animation = 'slideOutRight 0.5s ease';
+        setTimeout(() => message.remove(), 500);
+    });
+}, 5000);
+
+// Add slideOutRight animation
+const style = document.createElement('style');
+style.textContent = `
+    @keyframes slideOutRight {
+        from {
+            transform: translateX(0);
+            opacity: 1;
+        }
+        to {
+            transform: translateX(100%);
+            opacity: 0;
+        }
+    }
+`;
+document.head.appendChild(style);
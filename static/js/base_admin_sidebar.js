@@ -0,0 +1,16 @@
+// Update pending applications count
+function updatePendingCount() {
+    fetch('/api/dashboard_data')
+        .then(response => response.json())
+        .then(data => {
+            const pendingCount = document.getElementById('pendingCount');
+            if (pendingCount && data.pending_applications) {
+                pendingCount.textContent = data.pending_applications;
+            }
+        })
+        .catch(error => console.error('Error fetching data:', error));
+}
+
+// Update count on page load and every 30 seconds
+document.addEventListener('DOMContentLoaded', updatePendingCount);
+setInterval(updatePendingCount, 30000);
@@ -0,0 +1,52 @@
+// Sidebar toggle functionality
+document.getElementById('sidebarToggle').addEventListener('click', function() {
+    const sidebar = document.getElementById('sidebar');
+    const mainContent = document.getElementById('mainContent');
+
+    sidebar.classList.toggle('collapsed');
+    mainContent.classList.toggle('sidebar-collapsed');
+});
+
+// Mobile sidebar toggle
+if (window.innerWidth <= 768) {
+    document.getElementById('sidebarToggle').addEventListener('click', function() {
+        document.getElementById('sidebar').classList.toggle('mobile-open');
+    });
+}
+
+// Auto-hide flash messages
+setTimeout(() => {
+    const messages = document.querySelectorAll('.flash-message');
+    messages.forEach(message => {
+        message.style.animation = 'slideOutRight 0.5s ease';
+        setTimeout(() => message.remove(), 500);
+    });
+}, 5000);
+
+// Add slideOutRight animation
+const style = document.createElement('style');
+style.textContent = `
+    @keyframes slideOutRight {
+        from {
+            transform: translateX(0);
+            opacity: 1;
+        }
+        to {
+            transform: translateX(100%);
+            opacity: 0;
+        }
+    }
+`;
+document.head.appendChild(style);
+
+// Add active class to current page
+document.addEventListener('DOMContentLoaded', function() {
+    const currentPath = window.location.pathname;
+    const navItems = document.querySelectorAll('.nav-item');
+
+    navItems.forEach(item => {
+        if (item.getAttribute('href') === currentPath) {
+            item.classList.add('active');
+        }
+    });
+});
@@ -0,0 +1,202 @@
+let isTyping = false;
+
+// Send message function
+function sendMessage() {
+    const messageInput = document.getElementById('messageInput');
+    const message = messageInput.value.trim();
+
+    if (message === '') return;
+
+    // Add user message to chat
+    addMessage(message, 'user');
+
+    // Clear input
+    messageInput.value = '';
+    messageInput.style.height = 'auto';
+
+    // Show typing indicator
+    showTypingIndicator();
+
+    // Simulate bot response
+    setTimeout(() => {
+        hideTypingIndicator();
+        const botResponse = generateBotResponse(message);
+        addMessage(botResponse, 'bot');
+    }, 1500);
+}
+
+// Send quick message
+function sendQuickMessage(message) {
+    document.getElementById('messageInput').value = message;
+    sendMessage();
+}
+
+// Add message to chat
+function addMessage(text, sender) {
+    const chatMessages = document.getElementById('chatMessages');
+
+    // Remove welcome message if it exists
+    const welcomeMessage = chatMessages.querySelector('.welcome-message');
+    if (welcomeMessage) {
+        welcomeMessage.remove();
+    }
+
+    // Remove quick actions if it's the first user message
+    const quickActions = chatMessages.querySelector('.quick-actions');
+    if (quickActions && sender === 'user') {
+        quickActions.remove();
+    }
+
+    const messageDiv = document.createElement('div');
+    messageDiv.className = `message ${sender}`;
+
+    const avatar = sender === 'user' ? 
+        '<div class="message-avatar">' + (session.username ? session.username[0].toUpperCase() : 'U') + '</div>' :
+        '<div class="message-avatar"><i class="fas fa-robot"></i></div>';
+
+    const time = new Date().toLocaleTimeString('en-US', { 
+        hour12: true, 
+        hour: '2-digit', 
+        minute: '2-digit' 
+    });
+
+    messageDiv.innerHTML = `
+        ${avatar}
+        <div class="message-content">
+            <p class="message-text">${text}</p>
+            <div class="message-time">${time}</div>
+        </div>
+    `;
+
+    chatMessages.appendChild(messageDiv);
+    chatMessages.scrollTop = chatMessages.scrollHeight;
+}
+
+// Generate bot response
+function generateBotResponse(userMessage) {
+    const message = userMessage.toLowerCase();
+
+    // Fee-related responses
+    if (message.includes('fee') || message.includes('payment')) {
+        return "I can help you with fee-related queries! You can pay your fees online through the fee collection section, or visit the finance office. The current fee structure and due dates are available in your dashboard. Would you like me to show you how to make a payment?";
+    }
+
+    // Attendance-related responses
+    if (message.includes('attendance') || message.includes('present')) {
+        return "Your attendance is tracked automatically through our smart attendance system. You can view your attendance records in the attendance section. The minimum attendance required is 75% to appear for exams. Is there anything specific about attendance you'd like to know?";
+    }
+
+    // Hostel-related responses
+    if (message.includes('hostel') || message.includes('room')) {
+        return "For hostel-related queries, you can check room allocation, occupancy status, and submit maintenance requests through the hostel management section. Hostel fees and rules are also available there. What specific hostel information do you need?";
+    }
+
+    // Exam-related responses
+    if (message.includes('exam') || message.includes('schedule')) {
+        return "Exam schedules and timetables are available in the examination section. You can view upcoming exams, check results, and access academic calendars. The timetable is updated regularly, so make sure to check for any changes. Need help with something specific about exams?";
+    }
+
+    // Academic-related responses
+    if (message.includes('course') || message.includes('subject') || message.includes('academic')) {
+        return "For academic information, you can check your course details, subject information, and academic calendar in the respective sections. Course materials and announcements are also available. Is there a specific academic query I can help you with?";
+    }
+
+    // Technical support
+    if (message.includes('login') || message.includes('password') || message.includes('technical')) {
+        return "For technical issues, you can reset your password using the 'Forgot Password' option on the login page. If you're experiencing other technical problems, please contact the IT support team or try refreshing the page. What specific technical issue are you facing?";
+    }
+
+    // General greetings
+    if (message.includes('hello') || message.includes('hi') || message.includes('hey')) {
+        return "Hello! I'm your AI assistant for the College ERP System. I can help you with admissions, fees, hostel, exams, attendance, and general queries. What can I assist you with today?";
+    }
+
+    // Default response
+    const responses = [
+        "I understand you're asking about: '" + userMessage + "'. While I can help with most college-related queries, could you please provide more specific details? I'm here to assist with admissions, fees, hostel, exams, attendance, and general information.",
+        "That's an interesting question! I'm designed to help with college ERP system queries. If you need information about fees, attendance, hostel, exams, or academic matters, I can provide detailed assistance. Could you rephrase your question?",
+        "I'm here to help with your college queries! I can assist with admissions, fee payments, hostel information, exam schedules, attendance tracking, and general college policies. What specific information are you looking for?",
+        "Thank you for your question! I specialize in helping students with college ERP system queries. For the best assistance, please ask about specific topics like fees, attendance, hostel, exams, or academic matters. How can I help you further?"
+    ];
+
+    return responses[Math.floor(Math.random() * responses.length)];
+}
+
+// Show typing indicator
+function showTypingIndicator() {
+    isTyping = true;
+    document.getElementById('typingIndicator').classList.add('show');
+    document.getElementById('chatMessages').scrollTop = document.getElementById('chatMessages').scrollHeight;
+}
+
+// Hide typing indicator
+function hideTypingIndicator() {
+    isTyping = false;
+    document.getElementById('typingIndicator').classList.remove('show');
+}
+
+// Handle key press
+function handleKeyPress(event) {
+    if (event.key === 'Enter' && !event.shiftKey) {
+        event.preventDefault();
+        sendMessage();
+    }
+}
+
+// Auto-resize textarea
+document.getElementById('messageInput').addEventListener('input', function() {
+    this.style.height = 'auto';
+    this.style.height = Math.min(this.scrollHeight, 100) + 'px';
+});
+
+// Add some sample conversations on load
+document.addEventListener('DOMContentLoaded', function() {
+    // Add welcome message after a delay
+    setTimeout(() => {
+        if (document.querySelector('.welcome-message')) {
+            addMessage("Hello! I'm your AI assistant. I can help you with various college-related queries. Feel free to ask me anything about admissions, fees, hostel, exams, or attendance!", 'bot');
+        }
+    }, 2000);
+});
+
+// Add animations to elements
+document.addEventListener('DOMContentLoaded', function() {
+    // Animate feature cards
+    const featureCards = document.querySelectorAll('.feature-card');
+    featureCards.forEach((card, index) => {
+        card.style.animationDelay = `${index * 0.1}s`;
+        card.classList.add('animate-fadeInUp');
+    });
+
+    // Add hover effects to quick actions
+    const quickActions = document.querySelectorAll('.quick-action');
+    quickActions.forEach(action => {
+        action.addEventListener('mouseenter', function() {
+            this.style.transform = 'translateY(-2px) scale(1.05)';
+        });
+
+        action.addEventListener('mouseleave', function() {
+            this.style.transform = 'translateY(0) scale(1)';
+        });
+    });
+});
+
+// Simulate online status
+function updateOnlineStatus() {
+    const statusIndicator = document.querySelector('.status-indicator');
+    const statusText = document.querySelector('.chat-status span');
+
+    // Randomly change status (simulation)
+    if (Math.random() < 0.1) { // 10% chance
+        statusIndicator.style.background = '#ffc107';
+        statusText.textContent = 'Away';
+
+        setTimeout(() => {
+            statusIndicator.style.background = '#56ab2f';
+            statusText.textContent = 'Online';
+        }, 3000);
+    }
+}
+
+// Update status every 30 seconds
+setInterval(updateOnlineStatus, 30000);
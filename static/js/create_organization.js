@@ -0,0 +1,48 @@
+function generateCode() {
+    const codes = ['TECH', 'EDU', 'INNO', 'LEARN', 'CAMPUS', 'UNI', 'COLLEGE', 'ACAD'];
+    const randomCode = codes[Math.floor(Math.random() * codes.length)] + 
+                      Math.floor(Math.random() * 1000).toString().padStart(3, '0');
+    document.querySelector('input[name="code"]').value = randomCode;
+    updatePreview();
+}
+
+function updatePreview() {
+    const name = document.querySelector('input[name="name"]').value;
+    const code = document.querySelector('input[name="code"]').value;
+    const location = document.querySelector('input[name="location"]').value;
+    const description = document.querySelector('textarea[name="description"]').value;
+
+    if (name || code || location || description) {
+        document.getElementById('orgPreview').style.display = 'block';
+        document.getElementById('previewName').textContent = name || '-';
+        document.getElementById('previewCode').textContent = code || '-';
+        document.getElementById('previewLocation').textContent = location || '-';
+        document.getElementById('previewDescription').textContent = description || '-';
+    } else {
+        document.getElementById('orgPreview').style.display = 'none';
+    }
+}
+
+// Add event listeners
+document.querySelector('input[name="name"]').addEventListener('input', updatePreview);
+document.querySelector('input[name="code"]').addEventListener('input', updatePreview);
+document.querySelector('input[name="location"]').addEventListener('input', updatePreview);
+document.querySelector('textarea[name="description"]').addEventListener('input', updatePreview);
+
+// Form validation
+document.getElementById('orgForm').addEventListener('submit', function(e) {
+    const name = document.querySelector('input[name="name"]').value;
+    const code = document.querySelector('input[name="code"]').value;
+
+    if (!name || !code) {
+        e.preventDefault();
+        alert('Please fill in all required fields');
+        return;
+    }
+
+    if (code.length < 3) {
+        e.preventDefault();
+        alert('Organization code must be at least 3 characters long');
+        return;
+    }
+});
@@ -0,0 +1,196 @@
+let questionCount = 0;
+
+function addQuestion() {
+    questionCount++;
+    const questionsContainer = document.getElementById('questionsContainer');
+
+    const questionHTML = `
+        <div class="question-item" data-question="${questionCount}">
+            <div class="question-header">
+                <span class="question-number">Question ${questionCount}</span>
+                <div class="question-actions">
+                    <button type="button" class="action-btn btn-success" onclick="duplicateQuestion(${questionCount})">
+                        <i class="fas fa-copy"></i>
+                        Duplicate
+                    </button>
+                    <button type="button" class="action-btn btn-danger" onclick="removeQuestion(${questionCount})">
+                        <i class="fas fa-trash"></i>
+                        Remove
+                    </button>
+                </div>
+            </div>
+            <div class="question-content">
+                <div class="form-group question-text-group">
+                    <label class="form-label required-field">Question Text</label>
+                    <textarea name="question_text" class="form-textarea" placeholder="Enter your question here..." required></textarea>
+                </div>
+                <div class="form-group question-type-select">
+                    <label class="form-label required-field">Question Type</label>
+                    <select name="question_type" class="form-select" onchange="toggleQuestionOptions(${questionCount})" required>
+                        <option value="">Select question type</option>
+                        <option value="multiple_choice">Multiple Choice</option>
+                        <option value="true_false">True/False</option>
+                        <option value="short_answer">Short Answer</option>
+                        <option value="essay">Essay</option>
+                    </select>
+                </div>
+                <div class="question-options" id="options-${questionCount}">
+                    <!-- Options will be added based on question type -->
+                </div>
+                <div class="form-grid">
+                    <div class="form-group">
+                        <label class="form-label required-field">Correct Answer</label>
+                        <input type="text" name="correct_answer" class="form-input" placeholder="Enter correct answer" required>
+                    </div>
+                    <div class="form-group">
+                        <label class="form-label required-field">Points</label>
+                        <input type="number" name="points" class="form-input points-input" placeholder="1" min="1" value="1" required>
+                    </div>
+                </div>
+            </div>
+        </div>
+    `;
+
+    questionsContainer.insertAdjacentHTML('beforeend', questionHTML);
+
+    // Add animation
+    const newQuestion = questionsContainer.lastElementChild;
+    newQuestion.style.opacity = '0';
+    newQuestion.style.transform = 'translateY(20px)';
+    setTimeout(() => {
+        newQuestion.style.transition = 'all 0.3s ease';
+        newQuestion.style.opacity = '1';
+        newQuestion.style.transform = 'translateY(0)';
+    }, 100);
+}
+
+function toggleQuestionOptions(questionNum) {
+    const questionType = document.querySelector(`[data-question="${questionNum}"] select[name="question_type"]`).value;
+    const optionsContainer = document.getElementById(`options-${questionNum}`);
+
+    let optionsHTML = '';
+
+    if (questionType === 'multiple_choice') {
+        optionsHTML = `
+            <div class="form-group">
+                <label class="form-label">Option A</label>
+                <input type="text" name="option_a" class="form-input" placeholder="Option A">
+            </div>
+            <div class="form-group">
+                <label class="form-label">Option B</label>
+                <input type="text" name="option_b" class="form-input" placeholder="Option B">
+            </div>
+            <div class="form-group">
+                <label class="form-label">Option C</label>
+                <input type="text" name="option_c" class="form-input" placeholder="Option C">
+            </div>
+            <div class="form-group">
+                <label class="form-label">Option D</label>
+                <input type="text" name="option_d" class="form-input" placeholder="Option D">
+            </div>
+        `;
+    } else if (questionType === 'true_false') {
+        optionsHTML = `
+            <div class="form-group">
+                <label class="form-label">Options</label>
+                <div style="display: flex; gap: 1rem;">
+                    <label style="color: white; display: flex; align-items: center; gap: 0.5rem;">
+                        <input type="radio" name="tf_option_${questionNum}" value="True" style="margin: 0;">
+                        True
+                    </label>
+                    <label style="color: white; display: flex; align-items: center; gap: 0.5rem;">
+                        <input type="radio" name="tf_option_${questionNum}" value="False" style="margin: 0;">
+                        False
+                    </label>
+                </div>
+            </div>
+        `;
+    }
+
+    optionsContainer.innerHTML = optionsHTML;
+}
+
+function removeQuestion(questionNum) {
+    const questionElement = document.querySelector(`[data-question="${questionNum}"]`);
+    if (questionElement) {
+        questionElement.style.transition = 'all 0.3s ease';
+        questionElement.style.opacity = '0';
+        questionElement.style.transform = 'translateX(-100%)';
+        setTimeout(() => {
+            questionElement.remove();
+            updateQuestionNumbers();
+        }, 300);
+    }
+}
+
+function duplicateQuestion(questionNum) {
+    const questionElement = document.querySelector(`[data-question="${questionNum}"]`);
+    if (questionElement) {
+        const clonedQuestion = questionElement.cloneNode(true);
+        questionCount++;
+        clonedQuestion.setAttribute('data-question', questionCount);
+        clonedQuestion.querySelector('.question-number').textContent = `Question ${questionCount}`;
+
+        // Clear input values
+        clonedQuestion.querySelectorAll('input, textarea, select').forEach(input => {
+            if (input.type !== 'radio' && input.type !== 'checkbox') {
+                input.value = '';
+            }
+        });
+
+        questionElement.parentNode.insertBefore(clonedQuestion, questionElement.nextSibling);
+
+        // Add animation
+        clonedQuestion.style.opacity = '0';
+        clonedQuestion.style.transform = 'translateY(20px)';
+        setTimeout(() => {
+            clonedQuestion.style.transition = 'all 0.3s ease';
+            clonedQuestion.style.opacity = '1';
+            clonedQuestion.style.transform = 'translateY(0)';
+        }, 100);
+    }
+}
+
+function updateQuestionNumbers() {
+    const questions = document.querySelectorAll('.question-item');
+    questions.forEach((question, index) => {
+        const questionNum = index + 1;
+        question.setAttribute('data-question', questionNum);
+        question.querySelector('.question-number').textContent = `Question ${questionNum}`;
+    });
+}
+
+function previewTest() {
+    // Collect form data
+    const formData = new FormData(document.querySelector('form'));
+    const testData = {};
+
+    for (let [key, value] of formData.entries()) {
+        if (testData[key]) {
+            if (Array.isArray(testData[key])) {
+                testData[key].push(value);
+            } else {
+                testData[key] = [testData[key], value];
+            }
+        } else {
+            testData[key] = value;
+        }
+    }
+
+    // Show preview (simplified)
+    alert('Test preview would show here. This is a demo implementation.');
+}
+
+// Initialize with one question
+document.addEventListener('DOMContentLoaded', function() {
+    addQuestion();
+
+    // Set default start time to now
+    const now = new Date();
+    now.setMinutes(now.getMinutes() - now.getTimezoneOffset());
+    document.querySelector('input[name="start_time"]').value = now.toISOString().slice(0, 16);
+
+    // Set default end time to 1 hour from now
+    const endTime = new Date(now.getTime() + 60 * 60 * 1000);
+    document.querySelector('input[name="end_time"]').value = endTime.toISOString().slice(0, 16);
+});
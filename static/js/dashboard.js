@@ -0,0 +1,102 @@
+// Counter animation
+function animateCounters() {
+    const counters = document.querySelectorAll('.stat-number[data-count]');
+
+    counters.forEach(counter => {
+        const target = parseInt(counter.getAttribute('data-count'));
+        const duration = 2000; // 2 seconds
+        const increment = target / (duration / 16); // 60fps
+        let current = 0;
+
+        const timer = setInterval(() => {
+            current += increment;
+            if (current >= target) {
+                counter.textContent = target;
+                clearInterval(timer);
+            } else {
+                counter.textContent = Math.floor(current);
+            }
+        }, 16);
+    });
+}
+
+// Progress bar animation
+function animateProgressBars() {
+    const progressBars = document.querySelectorAll('.progress-bar');
+
+    progressBars.forEach(bar => {
+        const width = bar.style.width;
+        bar.style.width = '0%';
+
+        setTimeout(() => {
+            bar.style.width = width;
+        }, 500);
+    });
+}
+
+// Real-time updates simulation
+function simulateLiveUpdates() {
+    setInterval(() => {
+        // Update some random stats
+        const stats = document.querySelectorAll('.stat-number[data-count]');
+        stats.forEach(stat => {
+            const current = parseInt(stat.textContent.replace(/[^\d]/g, ''));
+            const change = Math.floor(Math.random() * 3) - 1; // -1, 0, or 1
+            const newValue = Math.max(0, current + change);
+
+            if (change !== 0) {
+                stat.textContent = stat.textContent.replace(/\d+/, newValue);
+
+                // Add pulse effect
+                stat.style.animation = 'none';
+                setTimeout(() => {
+                    stat.style.animation = 'pulse 0.5s ease-out';
+                }, 10);
+            }
+        });
+    }, 10000); // Update every 10 seconds
+}
+
+// Initialize animations
+document.addEventListener('DOMContentLoaded', function() {
+    // Stagger the animation of stat cards
+    const statCards = document.querySelectorAll('.stat-card');
+    statCards.forEach((card, index) => {
+        card.style.animationDelay = `${index * 0.1}s`;
+    });
+
+    // Start animations
+    setTimeout(animateCounters, 500);
+    setTimeout(animateProgressBars, 1000);
+
+    // Start live updates
+    simulateLiveUpdates();
+
+    // Add hover effects to activity items
+    const activityItems = document.querySelectorAll('.activity-item');
+    activityItems.forEach(item => {
+        item.addEventListener('mouseenter', function() {
+            this.style.transform = 'translateX(10px)';
+        });
+
+        item.addEventListener('mouseleave', function() {
+            this.style.transform = 'translateX(0)';
+        });
+    });
+});
+
+// Add click effects to stat cards
+document.querySelectorAll('.stat-card').forEach(card => {
+    card.addEventListener('click', function() {
+        this.style.transform = 'scale(0.95)';
+        setTimeout(() => {
+            this.style.transform = 'translateY(-10px) scale(1.02)';
+        }, 150);
+    });
+});
+
+// Add loading states and transitions
+window.addEventListener('beforeunload', function() {
+    document.body.style.opacity = '0.5';
+    document.body.style.transition = 'opacity 0.3s ease';
+});
@@ -0,0 +1,119 @@
+// Tab navigation
+function showExamTab(tabName) {
+    // Hide all management content
+    document.querySelectorAll('.management-content').forEach(content => {
+        content.classList.remove('active');
+    });
+
+    // Remove active class from all tabs
+    document.querySelectorAll('.management-tab').forEach(tab => {
+        tab.classList.remove('active');
+    });
+
+    // Show selected tab content
+    document.getElementById(`${tabName}Tab`).classList.add('active');
+
+    // Add active class to clicked tab
+    event.target.classList.add('active');
+}
+
+// Add exam modal
+function showAddExamModal() {
+    document.getElementById('addExamModal').style.display = 'block';
+}
+
+function closeAddExamModal() {
+    document.getElementById('addExamModal').style.display = 'none';
+}
+
+// Close modal when clicking outside
+window.onclick = function(event) {
+    const modal = document.getElementById('addExamModal');
+    if (event.target === modal) {
+        closeAddExamModal();
+    }
+}
+
+// Add exam form submission
+document.getElementById('addExamForm').addEventListener('submit', function(e) {
+    e.preventDefault();
+
+    // In a real application, this would make an API call
+    alert('Exam record would be added here. This is a prototype.');
+    closeAddExamModal();
+});
+
+// Exam actions
+function viewExamDetails(examId) {
+    alert(`View exam details for ID: ${examId}`);
+}
+
+function editExamRecord(examId) {
+    alert(`Edit exam record for ID: ${examId}`);
+}
+
+function deleteExamRecord(examId) {
+    if (confirm('Are you sure you want to delete this exam record?')) {
+        alert(`Delete exam record for ID: ${examId}`);
+    }
+}
+
+// Add animations to elements
+document.addEventListener('DOMContentLoaded', function() {
+    // Animate stat cards
+    const statCards = document.querySelectorAll('.stat-card');
+    statCards.forEach((card, index) => {
+        card.style.animationDelay = `${index * 0.1}s`;
+        card.classList.add('animate-fadeInUp');
+    });
+
+    // Animate performance bars
+    setTimeout(() => {
+        document.querySelectorAll('.performance-bar').forEach((bar, index) => {
+            setTimeout(() => {
+                bar.style.width = bar.style.width || '0%';
+            }, index * 100);
+        });
+    }, 1000);
+
+    // Add hover effects to table rows
+    document.querySelectorAll('.exams-table tr').forEach(row => {
+        row.addEventListener('mouseenter', function() {
+            this.style.transform = 'translateY(-2px)';
+            this.style.boxShadow = '0 8px 25px rgba(0, 0, 0, 0.15)';
+        });
+
+        row.addEventListener('mouseleave', function() {
+            this.style.transform = 'translateY(0)';
+            this.style.boxShadow = 'none';
+        });
+    });
+});
+
+// Real-time updates simulation
+function simulateLiveUpdates() {
+    setInterval(() => {
+        // Update stats randomly
+        const statNumbers = document.querySelectorAll('.stat-number');
+        statNumbers.forEach((stat, index) => {
+            if (index === 2) { // Average score
+                const current = parseFloat(stat.textContent);
+                const change = (Math.random() - 0.5) * 2; // -1 to 1
+                const newValue = Math.max(0, Math.min(100, current + change));
+
+                stat.textContent = newValue.toFixed(1);
+
+                // Add pulse effect
+                stat.style.animation = 'none';
+                setTimeout(() => {
+                    stat.style.animation = 'pulse 0.5s ease-out';
+                }, 10);
+            }
+        });
+    }, 15000); // Update every 15 seconds
+}
+
+// Start live updates
+document.addEventListener('DOMContentLoaded', function() {
+    simulateLiveUpdates();
+});
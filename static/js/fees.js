@@ -0,0 +1,253 @@
+// Filter and search functionality
+function filterFees() {
+    const searchTerm = document.getElementById('searchInput').value.toLowerCase();
+    const statusFilter = document.getElementById('statusFilter').value;
+    const feeTypeFilter = document.getElementById('feeTypeFilter').value;
+    const dateFilter = document.getElementById('dateFilter').value;
+
+    const rows = document.querySelectorAll('.fee-row');
+    let visibleCount = 0;
+
+    rows.forEach(row => {
+        const student = row.dataset.student;
+        const status = row.dataset.status;
+        const type = row.dataset.type;
+        const date = row.dataset.date;
+
+        const matchesSearch = student.includes(searchTerm) || 
+                            row.querySelector('.receipt-number').textContent.toLowerCase().includes(searchTerm);
+        const matchesStatus = !statusFilter || status === statusFilter;
+        const matchesType = !feeTypeFilter || type === feeTypeFilter.toLowerCase();
+        const matchesDate = !dateFilter || date === dateFilter;
+
+        if (matchesSearch && matchesStatus && matchesType && matchesDate) {
+            row.style.display = '';
+            visibleCount++;
+            // Add animation
+            row.style.animation = 'fadeInUp 0.3s ease-out';
+        } else {
+            row.style.display = 'none';
+        }
+    });
+
+    updateExportLinks({
+        q: document.getElementById('searchInput').value.trim(),
+        status: statusFilter,
+        fee_type: feeTypeFilter,
+        date: dateFilter
+    });
+
+    // Update badge count
+    const badge = document.querySelector('.badge');
+    if (badge) {
+        badge.textContent = `${visibleCount} Records`;
+    }
+
+    // Show empty state if no results
+    const tableBody = document.getElementById('feesTableBody');
+    if (visibleCount === 0) {
+        if (!document.querySelector('.no-results')) {
+            const noResults = document.createElement('tr');
+            noResults.className = 'no-results';
+            noResults.innerHTML = `
+                <td colspan="7" style="text-align: center; padding: 3rem; color: #666;">
+                    <i class="fas fa-search" style="font-size: 3rem; margin-bottom: 1rem; color: #ccc;"></i>
+                    <h3>No fee records found matching your criteria</h3>
+                    <p>Try adjusting your search terms or filters</p>
+                </td>
+            `;
+            tableBody.appendChild(noResults);
+        }
+    } else {
+        const noResults = document.querySelector('.no-results');
+        if (noResults) {
+            noResults.remove();
+        }
+    }
+}
+
+// Real-time search
+document.getElementById('searchInput').addEventListener('input', filterFees);
+document.getElementById('statusFilter').addEventListener('change', filterFees);
+document.getElementById('feeTypeFilter').addEventListener('change', filterFees);
+document.getElementById('dateFilter').addEventListener('change', filterFees);
+
+// View receipt
+function viewReceipt(receiptNumber) {
+    // Find the fee data
+    const row = Array.from(document.querySelectorAll('.fee-row')).find(row => 
+        row.querySelector('.receipt-number').textContent === receiptNumber);
+
+    if (row) {
+        const receiptNum = row.querySelector('.receipt-number').textContent;
+        const studentId = row.querySelector('td:nth-child(2) span').textContent;
+        const feeType = row.querySelector('.fee-type-badge').textContent;
+        const amount = row.querySelector('.amount-display').textContent;
+        const status = row.querySelector('.status-badge').textContent;
+        const paymentDate = row.querySelector('.payment-date').textContent.trim();
+
+        const receiptContent = `
+            <div class="receipt-header">
+                <div class="receipt-logo">
+                    <i class="fas fa-graduation-cap"></i>
+                </div>
+                <div class="receipt-title">College ERP System</div>
+                <div class="receipt-subtitle">Fee Payment Receipt</div>
+            </div>
+
+            <div class="receipt-details">
+                <div class="receipt-item">
+                    <div class="receipt-label">Receipt Number</div>
+                    <div class="receipt-value">${receiptNum}</div>
+                </div>
+                <div class="receipt-item">
+                    <div class="receipt-label">Student ID</div>
+                    <div class="receipt-value">${studentId}</div>
+                </div>
+                <div class="receipt-item">
+                    <div class="receipt-label">Fee Type</div>
+                    <div class="receipt-value">${feeType}</div>
+                </div>
+                <div class="receipt-item">
+                    <div class="receipt-label">Payment Date</div>
+                    <div class="receipt-value">${paymentDate}</div>
+                </div>
+            </div>
+
+            <div class="receipt-amount">
+                <div class="receipt-amount-label">Amount Paid</div>
+                <div class="receipt-amount-value">${amount}</div>
+            </div>
+
+            <div class="receipt-footer">
+                <p>This is a computer generated receipt and does not require signature.</p>
+                <p>Thank you for your payment!</p>
+            </div>
+        `;
+
+        document.getElementById('receiptContent').innerHTML = receiptContent;
+        document.getElementById('receiptModal').style.display = 'block';
+    }
+}
+
+// Print receipt
+function printReceipt(receiptNumber) {
+    viewReceipt(receiptNumber);
+    setTimeout(() => {
+        window.print();
+    }, 500);
+}
+
+// Send receipt via email
+function sendReceipt(receiptNumber) {
+    // In a real application, this would make an API call to send email
+    alert(`Email functionality for receipt ${receiptNumber} would be implemented here.`);
+}
+
+// Close receipt modal
+function closeReceipt() {
+    document.getElementById('receiptModal').style.display = 'none';
+}
+
+// Close modal when clicking outside
+window.onclick = function(event) {
+    const modal = document.getElementById('receiptModal');
+    if (event.target === modal) {
+        closeReceipt();
+    }
+}
+
+// Add animations to table rows
+document.addEventListener('DOMContentLoaded', function() {
+    const rows = document.querySelectorAll('.fee-row');
+    rows.forEach((row, index) => {
+        row.style.animationDelay = `${index * 0.05}s`;
+        row.classList.add('animate-fadeInUp');
+    });
+
+    // Animate stats cards
+    const statCards = document.querySelectorAll('.stat-card');
+    statCards.forEach((card, index) => {
+        card.style.animationDelay = `${index * 0.1}s`;
+        card.classList.add('animate-fadeInUp');
+    });
+});
+
+// Add hover effects
+document.querySelectorAll('.fee-row').forEach(row => {
+    row.addEventListener('mouseenter', function() {
+        this.style.transform = 'translateY(-2px)';
+        this.style.boxShadow = '0 8px 25px rgba(0, 0, 0, 0.15)';
+    });
+
+    row.addEventListener('mouseleave', function() {
+        this.style.transform = 'translateY(0)';
+        this.style.boxShadow = 'none';
+    });
+});
+
+// Real-time updates simulation
+function simulateLiveUpdates() {
+    setInterval(() => {
+        // Update stats randomly
+        const statNumbers = document.querySelectorAll('.stat-number');
+        statNumbers.forEach(stat => {
+            const current = parseInt(stat.textContent.replace(/[^\d]/g, ''));
+            const change = Math.floor(Math.random() * 2); // 0 or 1
+            const newValue = current + change;
+
+            if (change > 0) {
+                stat.textContent = stat.textContent.replace(/\d+/, newValue);
+
+                // Add pulse effect
+                stat.style.animation = 'none';
+                setTimeout(() => {
+                    stat.style.animation = 'pulse 0.5s ease-out';
+                }, 10);
+            }
+        });
+    }, 15000); // Update every 15 seconds
+}
+
+// Start live updates
+document.addEventListener('DOMContentLoaded', function() {
+    simulateLiveUpdates();
+});
+
+// Print styles for receipt
+const printStyles = `
+    @media print {
+        body * {
+            visibility: hidden;
+        }
+        .receipt-content, .receipt-content * {
+            visibility: visible;
+        }
+        .receipt-content {
+            position: absolute;
+            left: 0;
+            top: 0;
+            width: 100%;
+            box-shadow: none;
+            margin: 0;
+        }
+        .close-receipt {
+            display: none;
+        }
+    }
+`;
+
+const styleSheet = document.createElement('style');
+styleSheet.textContent = printStyles;
+document.head.appendChild(styleSheet);
+
+// Point the export links at the same filters as the table
+function updateExportLinks(filters) {
+    const params = new URLSearchParams();
+    Object.entries(filters).forEach(([name, value]) => {
+        if (value) params.set(name, value);
+    });
+    document.querySelectorAll('.export-link').forEach(link => {
+        link.href = link.dataset.base + (params.toString() ? '?' + params.toString() : '');
+    });
+}
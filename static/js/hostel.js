@@ -0,0 +1,253 @@
+// Floor navigation
+function showFloor(floorNumber) {
+    // Hide all floor plans
+    document.querySelectorAll('.floor-plan').forEach(plan => {
+        plan.classList.remove('active');
+    });
+
+    // Remove active class from all tabs
+    document.querySelectorAll('.floor-tab').forEach(tab => {
+        tab.classList.remove('active');
+    });
+
+    // Show selected floor
+    document.getElementById(`floor${floorNumber}`).classList.add('active');
+
+    // Add active class to clicked tab
+    event.target.classList.add('active');
+}
+
+// Management tabs
+function showManagementTab(tabName) {
+    // Hide all management content
+    document.querySelectorAll('.management-content').forEach(content => {
+        content.classList.remove('active');
+    });
+
+    // Remove active class from all tabs
+    document.querySelectorAll('.management-tab').forEach(tab => {
+        tab.classList.remove('active');
+    });
+
+    // Show selected tab content
+    document.getElementById(`${tabName}Tab`).classList.add('active');
+
+    // Add active class to clicked tab
+    event.target.classList.add('active');
+}
+
+// Room details modal
+function showRoomDetails(roomNumber) {
+    // Find room data
+    const roomData = {
+        '101': {
+            room_number: '101',
+            floor: 1,
+            capacity: 2,
+            occupied: 2,
+            status: 'occupied',
+            occupants: ['STU202412011', 'STU202412012']
+        },
+        '102': {
+            room_number: '102',
+            floor: 1,
+            capacity: 2,
+            occupied: 1,
+            status: 'available',
+            occupants: ['STU202412013']
+        },
+        '201': {
+            room_number: '201',
+            floor: 2,
+            capacity: 2,
+            occupied: 0,
+            status: 'available',
+            occupants: []
+        }
+    };
+
+    const room = roomData[roomNumber] || {
+        room_number: roomNumber,
+        floor: Math.floor(parseInt(roomNumber) / 100),
+        capacity: 2,
+        occupied: Math.floor(Math.random() * 3),
+        status: ['available', 'occupied', 'maintenance'][Math.floor(Math.random() * 3)],
+        occupants: []
+    };
+
+    const modalContent = `
+        <div class="room-details">
+            <div class="room-detail-item">
+                <div class="room-detail-label">Room Number</div>
+                <div class="room-detail-value">${room.room_number}</div>
+            </div>
+            <div class="room-detail-item">
+                <div class="room-detail-label">Floor</div>
+                <div class="room-detail-value">Floor ${room.floor}</div>
+            </div>
+            <div class="room-detail-item">
+                <div class="room-detail-label">Capacity</div>
+                <div class="room-detail-value">${room.capacity} Beds</div>
+            </div>
+            <div class="room-detail-item">
+                <div class="room-detail-label">Occupancy</div>
+                <div class="room-detail-value">${room.occupied}/${room.capacity}</div>
+            </div>
+            <div class="room-detail-item">
+                <div class="room-detail-label">Status</div>
+                <div class="room-detail-value">
+                    <span class="status-badge status-${room.status}">${room.status.charAt(0).toUpperCase() + room.status.slice(1)}</span>
+                </div>
+            </div>
+            <div class="room-detail-item">
+                <div class="room-detail-label">Availability</div>
+                <div class="room-detail-value">${room.capacity - room.occupied} beds available</div>
+            </div>
+        </div>
+
+        ${room.occupants.length > 0 ? `
+        <div class="room-occupants">
+            <h4 style="margin-bottom: 1rem; color: #333; font-weight: 700;">Current Occupants</h4>
+            ${room.occupants.map(occupant => `
+                <div class="occupant-item">
+                    <div class="occupant-avatar">${occupant.slice(-2)}</div>
+                    <div class="occupant-info">
+                        <div class="occupant-name">Student ${occupant}</div>
+                        <div class="occupant-id">ID: ${occupant}</div>
+                    </div>
+                </div>
+            `).join('')}
+        </div>
+        ` : `
+        <div style="text-align: center; padding: 2rem; color: #666;">
+            <i class="fas fa-user-slash" style="font-size: 3rem; margin-bottom: 1rem; color: #ccc;"></i>
+            <h4>No Occupants</h4>
+            <p>This room is currently vacant and available for allocation.</p>
+        </div>
+        `}
+
+        <div style="text-align: center; margin-top: 2rem;">
+            <button class="btn btn-primary" onclick="allocateRoom('${room.room_number}')" style="margin-right: 1rem;">
+                <i class="fas fa-user-plus"></i> Allocate Room
+            </button>
+            <button class="btn btn-secondary" onclick="closeRoomModal()">
+                <i class="fas fa-times"></i> Close
+            </button>
+        </div>
+    `;
+
+    document.getElementById('roomModalContent').innerHTML = modalContent;
+    document.getElementById('roomModal').style.display = 'block';
+}
+
+// Close room modal
+function closeRoomModal() {
+    document.getElementById('roomModal').style.display = 'none';
+}
+
+// Allocate room
+function allocateRoom(roomNumber) {
+    closeRoomModal();
+    // In a real application, this would redirect to the allocation form
+    alert(`Room allocation functionality for room ${roomNumber} would be implemented here.`);
+}
+
+// Set maintenance
+function setMaintenance(roomNumber) {
+    if (confirm(`Set room ${roomNumber} under maintenance?`)) {
+        // In a real application, this would make an API call
+        alert(`Maintenance mode set for room ${roomNumber}.`);
+    }
+}
+
+// Close modal when clicking outside
+window.onclick = function(event) {
+    const modal = document.getElementById('roomModal');
+    if (event.target === modal) {
+        closeRoomModal();
+    }
+}
+
+// Add animations to elements
+document.addEventListener('DOMContentLoaded', function() {
+    // Animate stat cards
+    const statCards = document.querySelectorAll('.stat-card');
+    statCards.forEach((card, index) => {
+        card.style.animationDelay = `${index * 0.1}s`;
+        card.classList.add('animate-fadeInUp');
+    });
+
+    // Add hover effects to rooms
+    document.querySelectorAll('.room').forEach(room => {
+        room.addEventListener('mouseenter', function() {
+            this.style.transform = 'translateY(-5px) scale(1.05)';
+        });
+
+        room.addEventListener('mouseleave', function() {
+            this.style.transform = 'translateY(0) scale(1)';
+        });
+    });
+
+    // Add hover effects to table rows
+    document.querySelectorAll('.rooms-table tr').forEach(row => {
+        row.addEventListener('mouseenter', function() {
+            this.style.transform = 'translateY(-2px)';
+            this.style.boxShadow = '0 8px 25px rgba(0, 0, 0, 0.15)';
+        });
+
+        row.addEventListener('mouseleave', function() {
+            this.style.transform = 'translateY(0)';
+            this.style.boxShadow = 'none';
+        });
+    });
+});
+
+// Real-time updates simulation
+function simulateLiveUpdates() {
+    setInterval(() => {
+        // Update occupancy stats randomly
+        const statNumbers = document.querySelectorAll('.stat-number');
+        statNumbers.forEach((stat, index) => {
+            if (index === 1 || index === 2) { // Occupied and Available stats
+                const current = parseInt(stat.textContent);
+                const change = Math.floor(Math.random() * 2) - 1; // -1, 0, or 1
+                const newValue = Math.max(0, current + change);
+
+                if (change !== 0) {
+                    stat.textContent = newValue;
+
+                    // Add pulse effect
+                    stat.style.animation = 'none';
+                    setTimeout(() => {
+                        stat.style.animation = 'pulse 0.5s ease-out';
+                    }, 10);
+                }
+            }
+        });
+
+        // Update room statuses randomly
+        const rooms = document.querySelectorAll('.room');
+        rooms.forEach(room => {
+            if (Math.random() < 0.1) { // 10% chance to change status
+                const statuses = ['available', 'occupied', 'maintenance'];
+                const currentStatus = room.classList.contains('available') ? 'available' : 
+                                    room.classList.contains('occupied') ? 'occupied' : 'maintenance';
+                const newStatus = statuses[Math.floor(Math.random() * statuses.length)];
+
+                if (newStatus !== currentStatus) {
+                    room.className = `room ${newStatus}`;
+                    room.querySelector('.room-status').textContent = newStatus.charAt(0).toUpperCase() + newStatus.slice(1);
+                    room.querySelector('.room-status').className = `room-status room-${newStatus}`;
+
+                    // Add animation
+                    room.style.animation = 'pulse 0.5s ease-out';
+                }
+            }
+        });
+    }, 10000); // Update every 10 seconds
+}
+
+// Start live updates
+document.addEventListener('DOMContentLoaded', function() {
+    simulateLiveUpdates();
+});
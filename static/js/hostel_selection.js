@@ -0,0 +1,244 @@
+let selectedHostel = null;
+
+function selectHostel(hostelId, hostelName, status) {
+    // Remove previous selection
+    document.querySelectorAll('.hostel-card').forEach(card => {
+        card.classList.remove('selected');
+    });
+
+    // Add selection to clicked card
+    const selectedCard = document.querySelector(`[data-hostel="${hostelId}"]`);
+    selectedCard.classList.add('selected');
+
+    // Update selected hostel info
+    selectedHostel = { id: hostelId, name: hostelName, status: status };
+
+    const selectedInfo = document.getElementById('selectedHostelInfo');
+    const selectedDetails = document.getElementById('selectedHostelDetails');
+
+    selectedDetails.innerHTML = `
+        <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1rem;">
+            <div style="
+                width: 60px;
+                height: 60px;
+                border-radius: 50%;
+                background: linear-gradient(135deg, #56ab2f, #a8e6cf);
+                display: flex;
+                align-items: center;
+                justify-content: center;
+                font-size: 1.5rem;
+                font-weight: bold;
+                color: white;
+            ">${hostelName.charAt(0)}</div>
+            <div>
+                <h3 style="font-size: 1.5rem; margin-bottom: 0.5rem;">${hostelName}</h3>
+                <span class="hostel-status status-${status.toLowerCase().replace(' ', '-')}">${status}</span>
+            </div>
+        </div>
+        <div style="background: rgba(255, 255, 255, 0.05); padding: 1rem; border-radius: 10px;">
+            <p style="margin-bottom: 1rem;"><strong>Monthly Rent:</strong> ₹8,000</p>
+            <p style="margin-bottom: 1rem;"><strong>Distance from Campus:</strong> 0.5 km</p>
+            <p style="margin-bottom: 1rem;"><strong>Available Rooms:</strong> 35</p>
+            <p><strong>Amenities:</strong> WiFi, AC, Laundry, Cafeteria, Gym</p>
+        </div>
+    `;
+
+    selectedInfo.classList.add('show');
+
+    // Highlight marker on map
+    document.querySelectorAll('.map-marker').forEach(marker => {
+        marker.style.opacity = '0.5';
+    });
+    document.querySelector(`[data-hostel="${hostelId}"]`).style.opacity = '1';
+
+    // Show notification
+    showNotification(`Selected: ${hostelName}`, 'success');
+}
+
+function applyForHostel() {
+    if (!selectedHostel) {
+        alert('Please select a hostel first');
+        return;
+    }
+
+    // Show application processing
+    const applyBtn = document.querySelector('.apply-btn');
+    const originalText = applyBtn.innerHTML;
+    applyBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Processing Application...';
+    applyBtn.disabled = true;
+
+    // Simulate application processing
+    setTimeout(() => {
+        showNotification('Hostel application submitted successfully!', 'success');
+        setTimeout(() => {
+            window.location.href = '/student_portal';
+        }, 2000);
+    }, 2000);
+}
+
+function showNotification(message, type = 'info') {
+    const notification = document.createElement('div');
+    notification.innerHTML = `
+        <i class="fas fa-${type === 'success' ? 'check-circle' : 'info-circle'}"></i>
+        ${message}
+    `;
+    notification.style.cssText = `
+        position: fixed;
+        top: 20px;
+        right: 20px;
+        background: linear-gradient(135deg, #56ab2f, #a8e6cf);
+        color: white;
+        padding: 1rem 2rem;
+        border-radius: 10px;
+        font-weight: bold;
+        z-index: 1000;
+        animation: slideIn 0.5s ease;
+        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
+    `;
+    document.body.appendChild(notification);
+
+    setTimeout(() => {
+        notification.style.animation = 'slideOut 0.5s ease';
+        setTimeout(() => notification.remove(), 500);
+    }, 3000);
+}
+
+// Add CSS for animations
+const style = document.createElement('style');
+style.textContent = `
+    @keyframes slideIn {
+        from {
+            transform: translateX(100%);
+            opacity: 0;
+        }
+        to {
+            transform: translateX(0);
+            opacity: 1;
+        }
+    }
+    @keyframes slideOut {
+        from {
+            transform: translateX(0);
+            opacity: 1;
+        }
+        to {
+            transform: translateX(100%);
+            opacity: 0;
+        }
+    }
+`;
+document.head.appendChild(style);
+
+// Map marker interactions
+document.querySelectorAll('.map-marker').forEach(marker => {
+    marker.addEventListener('click', function() {
+        const hostelId = this.dataset.hostel;
+        const hostelCard = document.querySelector(`[data-hostel="${hostelId}"]`);
+        if (hostelCard && !hostelCard.querySelector('.select-btn').disabled) {
+            hostelCard.scrollIntoView({ behavior: 'smooth' });
+            hostelCard.querySelector('.select-btn').click();
+        }
+    });
+});
+
+// Real-time updates simulation
+setInterval(() => {
+    // Simulate occupancy changes
+    if (Math.random() > 0.95) {
+        showNotification('Hostel occupancy updated in real-time', 'info');
+    }
+}, 10000);
+
+// Google Maps integration
+let map;
+let markers = [];
+
+function initMap() {
+    // Initialize map centered on college campus
+    map = new google.maps.Map(document.getElementById('map'), {
+        zoom: 15,
+        center: { lat: 28.6139, lng: 77.2090 }, // Delhi coordinates
+        mapTypeId: 'satellite'
+    });
+
+    // Add hostel markers
+    const hostels = [
+        {
+            name: 'Boys Hostel A',
+            position: { lat: 28.6140, lng: 77.2095 },
+            capacity: 200,
+            occupied: 150,
+            facilities: ['WiFi', 'AC', 'Laundry', 'Gym'],
+            price: 15000
+        },
+        {
+            name: 'Boys Hostel B',
+            position: { lat: 28.6145, lng: 77.2100 },
+            capacity: 150,
+            occupied: 120,
+            facilities: ['WiFi', 'Laundry', 'Cafeteria'],
+            price: 12000
+        },
+        {
+            name: 'Girls Hostel A',
+            position: { lat: 28.6142, lng: 77.2085 },
+            capacity: 180,
+            occupied: 160,
+            facilities: ['WiFi', 'AC', 'Security', 'Laundry'],
+            price: 18000
+        },
+        {
+            name: 'Girls Hostel B',
+            position: { lat: 28.6148, lng: 77.2080 },
+            capacity: 120,
+            occupied: 100,
+            facilities: ['WiFi', 'Laundry', 'Study Room'],
+            price: 14000
+        }
+    ];
+
+    // Create markers for each hostel
+    hostels.forEach(hostel => {
+        const marker = new google.maps.Marker({
+            position: hostel.position,
+            map: map,
+            title: hostel.name,
+            icon: {
+                url: 'data:image/svg+xml;charset=UTF-8,' + encodeURIComponent(`
+                    <svg width="40" height="40" viewBox="0 0 40 40" xmlns="http://www.w3.org/2000/svg">
+                        <circle cx="20" cy="20" r="18" fill="#667eea" stroke="#fff" stroke-width="2"/>
+                        <text x="20" y="25" text-anchor="middle" fill="white" font-size="12" font-weight="bold">🏠</text>
+                    </svg>
+                `),
+                scaledSize: new google.maps.Size(40, 40)
+            }
+        });
+
+        const infoWindow = new google.maps.InfoWindow({
+            content: `
+                <div style="padding: 10px; min-width: 200px;">
+                    <h3 style="margin: 0 0 10px 0; color: #333;">${hostel.name}</h3>
+                    <p style="margin: 5px 0; color: #666;"><strong>Capacity:</strong> ${hostel.capacity}</p>
+                    <p style="margin: 5px 0; color: #666;"><strong>Occupied:</strong> ${hostel.occupied}</p>
+                    <p style="margin: 5px 0; color: #666;"><strong>Available:</strong> ${hostel.capacity - hostel.occupied}</p>
+                    <p style="margin: 5px 0; color: #666;"><strong>Price:</strong> ₹${hostel.price}/month</p>
+                    <p style="margin: 5px 0; color: #666;"><strong>Facilities:</strong> ${hostel.facilities.join(', ')}</p>
+                    <button onclick="selectHostel('${hostel.name}')" style="background: #667eea; color: white; border: none; padding: 8px 16px; border-radius: 5px; cursor: pointer; margin-top: 10px;">
+                        Select Hostel
+                    </button>
+                </div>
+            `
+        });
+
+        marker.addListener('click', () => {
+            infoWindow.open(map, marker);
+        });
+
+        markers.push({ marker, infoWindow, hostel });
+    });
+}
+
+function selectHostel(hostelName) {
+    alert(`Selected ${hostelName}! You will be redirected to the application form.`);
+    window.location.href = '/student/apply';
+}
@@ -0,0 +1,86 @@
+// Add loading state to login form
+document.getElementById('loginForm').addEventListener('submit', function() {
+    const container = document.querySelector('.login-container');
+    const loginBtn = document.getElementById('loginBtn');
+    const googleBtn = document.getElementById('googleBtn');
+
+    container.classList.add('loading');
+    loginBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Logging in...';
+    loginBtn.disabled = true;
+    googleBtn.style.pointerEvents = 'none';
+    googleBtn.style.opacity = '0.5';
+});
+
+// Add loading state to Google login
+document.getElementById('googleBtn').addEventListener('click', function() {
+    const container = document.querySelector('.login-container');
+    const googleBtn = document.getElementById('googleBtn');
+    const loginBtn = document.getElementById('loginBtn');
+
+    container.classList.add('loading');
+    googleBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Redirecting...';
+    googleBtn.style.pointerEvents = 'none';
+    loginBtn.style.pointerEvents = 'none';
+    loginBtn.style.opacity = '0.5';
+});
+
+// Auto-fill demo credentials on click
+document.getElementById('demoCredentials').addEventListener('click', function() {
+    const emailInput = document.querySelector('input[name="email"]');
+    const passwordInput = document.querySelector('input[name="password"]');
+
+    // Add pulse effect
+    this.style.animation = 'pulse 0.5s ease-out';
+    setTimeout(() => {
+        this.style.animation = '';
+    }, 500);
+
+    // Fill with admin credentials by default
+    emailInput.value = 'admin@college.edu';
+    passwordInput.value = 'admin123';
+
+    // Add focus effects
+    emailInput.focus();
+    emailInput.style.borderColor = '#667eea';
+    passwordInput.style.borderColor = '#667eea';
+});
+
+// Add floating animation to form elements
+document.addEventListener('DOMContentLoaded', function() {
+    const inputs = document.querySelectorAll('.form-control');
+    inputs.forEach((input, index) => {
+        input.style.animationDelay = `${index * 0.1}s`;
+        input.classList.add('animate-fadeInUp');
+    });
+});
+
+// Add fadeInUp animation
+const style = document.createElement('style');
+style.textContent = `
+    .animate-fadeInUp {
+        animation: fadeInUp 0.6s ease-out forwards;
+    }
+
+    @keyframes fadeInUp {
+        from {
+            opacity: 0;
+            transform: translateY(20px);
+        }
+        to {
+            opacity: 1;
+            transform: translateY(0);
+        }
+    }
+`;
+document.head.appendChild(style);
+
+// Add input focus animations
+document.querySelectorAll('.form-control').forEach(input => {
+    input.addEventListener('focus', function() {
+        this.parentElement.style.transform = 'scale(1.02)';
+    });
+
+    input.addEventListener('blur', function() {
+        this.parentElement.style.transform = 'scale(1)';
+    });
+});
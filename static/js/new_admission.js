@@ -0,0 +1,225 @@
+let currentStep = 1;
+const totalSteps = 4;
+
+// Form validation
+function validateField(field, rules) {
+    const value = field.value.trim();
+    const validationDiv = document.getElementById(field.name + 'Validation');
+
+    for (let rule of rules) {
+        if (!rule.test(value)) {
+            validationDiv.textContent = rule.message;
+            validationDiv.className = 'validation-message validation-error';
+            field.classList.add('invalid');
+            return false;
+        }
+    }
+
+    validationDiv.textContent = '✓ Valid';
+    validationDiv.className = 'validation-message validation-success';
+    field.classList.remove('invalid');
+    field.classList.add('valid');
+    return true;
+}
+
+// Validation rules
+const validationRules = {
+    name: [
+        { test: (val) => val.length >= 2, message: 'Name must be at least 2 characters' },
+        { test: (val) => /^[a-zA-Z\s]+$/.test(val), message: 'Name can only contain letters and spaces' }
+    ],
+    email: [
+        { test: (val) => val.length > 0, message: 'Email is required' },
+        { test: (val) => /^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(val), message: 'Please enter a valid email address' }
+    ],
+    phone: [
+        { test: (val) => val.length > 0, message: 'Phone number is required' },
+        { test: (val) => /^[0-9]{10}$/.test(val), message: 'Phone number must be 10 digits' }
+    ],
+    course: [
+        { test: (val) => val.length > 0, message: 'Please select a course' }
+    ],
+    year: [
+        { test: (val) => val.length > 0, message: 'Please select a year' }
+    ]
+};
+
+// Real-time validation
+document.addEventListener('DOMContentLoaded', function() {
+    // Add event listeners for real-time validation
+    Object.keys(validationRules).forEach(fieldName => {
+        const field = document.querySelector(`[name="${fieldName}"]`);
+        if (field) {
+            field.addEventListener('blur', function() {
+                validateField(this, validationRules[fieldName]);
+            });
+
+            field.addEventListener('input', function() {
+                if (this.classList.contains('invalid')) {
+                    validateField(this, validationRules[fieldName]);
+                }
+            });
+        }
+    });
+
+    // File upload handling
+    setupFileUploads();
+
+    // Form submission
+    document.getElementById('admissionForm').addEventListener('submit', function(e) {
+        e.preventDefault();
+        submitForm();
+    });
+});
+
+// File upload setup
+function setupFileUploads() {
+    const fileInputs = document.querySelectorAll('input[type="file"]');
+
+    fileInputs.forEach(input => {
+        input.addEventListener('change', function() {
+            const file = this.files[0];
+            if (file) {
+                const uploadDiv = this.parentElement;
+                uploadDiv.innerHTML = `
+                    <i class="fas fa-check-circle" style="color: #56ab2f;"></i>
+                    <div class="file-upload-text" style="color: #56ab2f;">${file.name}</div>
+                    <div class="file-upload-subtext">File uploaded successfully</div>
+                `;
+                uploadDiv.style.borderColor = '#56ab2f';
+                uploadDiv.style.background = 'rgba(86, 171, 47, 0.1)';
+            }
+        });
+    });
+}
+
+// Progress indicator update
+function updateProgress(step) {
+    for (let i = 1; i <= totalSteps; i++) {
+        const stepElement = document.getElementById(`step${i}`);
+        if (i < step) {
+            stepElement.className = 'step completed';
+        } else if (i === step) {
+            stepElement.className = 'step active';
+        } else {
+            stepElement.className = 'step';
+        }
+    }
+    currentStep = step;
+}
+
+// Go back function
+function goBack() {
+    window.history.back();
+}
+
+// Form submission
+function submitForm() {
+    const submitBtn = document.getElementById('submitBtn');
+    const form = document.getElementById('admissionForm');
+
+    // Show loading state
+    submitBtn.innerHTML = '<span class="spinner"></span> Processing...';
+    submitBtn.disabled = true;
+
+    // Validate all required fields
+    let isValid = true;
+    Object.keys(validationRules).forEach(fieldName => {
+        const field = document.querySelector(`[name="${fieldName}"]`);
+        if (field && !validateField(field, validationRules[fieldName])) {
+            isValid = false;
+        }
+    });
+
+    if (!isValid) {
+        submitBtn.innerHTML = '<i class="fas fa-user-plus"></i> Submit Admission';
+        submitBtn.disabled = false;
+        alert('Please fix the validation errors before submitting.');
+        return;
+    }
+
+    // Submit the form
+    setTimeout(() => {
+        form.submit();
+    }, 1000);
+}
+
+// Drag and drop for file uploads
+document.querySelectorAll('.file-upload').forEach(uploadDiv => {
+    uploadDiv.addEventListener('dragover', function(e) {
+        e.preventDefault();
+        this.classList.add('dragover');
+    });
+
+    uploadDiv.addEventListener('dragleave', function(e) {
+        e.preventDefault();
+        this.classList.remove('dragover');
+    });
+
+    uploadDiv.addEventListener('drop', function(e) {
+        e.preventDefault();
+        this.classList.remove('dragover');
+
+        const files = e.dataTransfer.files;
+        if (files.length > 0) {
+            const input = this.querySelector('input[type="file"]');
+            input.files = files;
+            input.dispatchEvent(new Event('change'));
+        }
+    });
+});
+
+// Animate form sections on load
+document.addEventListener('DOMContentLoaded', function() {
+    const sections = document.querySelectorAll('.form-section');
+    sections.forEach((section, index) => {
+        section.style.animationDelay = `${index * 0.2}s`;
+        section.classList.add('animate-fadeInUp');
+    });
+});
+
+// Add smooth scrolling to form sections
+function scrollToSection(sectionId) {
+    document.getElementById(sectionId).scrollIntoView({
+        behavior: 'smooth',
+        block: 'start'
+    });
+}
+
+// Auto-save form data to localStorage
+function autoSave() {
+    const formData = new FormData(document.getElementById('admissionForm'));
+    const data = {};
+
+    for (let [key, value] of formData.entries()) {
+        data[key] = value;
+    }
+
+    localStorage.setItem('admissionFormData', JSON.stringify(data));
+}
+
+// Load saved form data
+function loadSavedData() {
+    const savedData = localStorage.getItem('admissionFormData');
+    if (savedData) {
+        const data = JSON.parse(savedData);
+
+        Object.keys(data).forEach(key => {
+            const field = document.querySelector(`[name="${key}"]`);
+            if (field && data[key]) {
+                field.value = data[key];
+            }
+        });
+    }
+}
+
+// Auto-save on input change
+document.getElementById('admissionForm').addEventListener('input', autoSave);
+
+// Load saved data on page load
+document.addEventListener('DOMContentLoaded', loadSavedData);
+
+// Clear saved data on successful submission
+document.getElementById('admissionForm').addEventListener('submit', function() {
+    localStorage.removeItem('admissionFormData');
+});
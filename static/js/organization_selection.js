@@ -0,0 +1,119 @@
+let selectedOrganization = null;
+
+function selectOrganization(orgCode, orgName) {
+    // Remove previous selection
+    document.querySelectorAll('.organization-card').forEach(card => {
+        card.classList.remove('selected');
+    });
+
+    // Add selection to clicked card
+    const selectedCard = document.querySelector(`[data-org="${orgCode}"]`);
+    selectedCard.classList.add('selected');
+
+    // Update selected organization info
+    selectedOrganization = { code: orgCode, name: orgName };
+    document.getElementById('selectedOrgName').textContent = orgName;
+    document.getElementById('selectedOrgInfo').style.display = 'block';
+
+    // Enable continue button
+    const continueBtn = document.getElementById('continueBtn');
+    continueBtn.classList.add('active');
+
+    // Add selection animation
+    selectedCard.style.animation = 'pulse 0.5s ease';
+    setTimeout(() => {
+        selectedCard.style.animation = '';
+    }, 500);
+
+    // Show notification
+    showNotification(`Selected: ${orgName}`, 'success');
+}
+
+function continueToApplication() {
+    if (!selectedOrganization) {
+        alert('Please select an organization first');
+        return;
+    }
+
+    // Store selected organization in sessionStorage
+    sessionStorage.setItem('selectedOrganization', JSON.stringify(selectedOrganization));
+
+    // Redirect to application form
+    window.location.href = '/student/apply';
+}
+
+function showNotification(message, type = 'info') {
+    const notification = document.createElement('div');
+    notification.innerHTML = `
+        <i class="fas fa-${type === 'success' ? 'check-circle' : 'info-circle'}"></i>
+        ${message}
+    `;
+    notification.style.cssText = `
+        position: fixed;
+        top: 20px;
+        right: 20px;
+        background: linear-gradient(135deg, #56ab2f, #a8e6cf);
+        color: white;
+        padding: 1rem 2rem;
+        border-radius: 10px;
+        font-weight: bold;
+        z-index: 1000;
+        animation: slideIn 0.5s ease;
+        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
+    `;
+    document.body.appendChild(notification);
+
+    setTimeout(() => {
+        notification.style.animation = 'slideOut 0.5s ease';
+        setTimeout(() => notification.remove(), 500);
+    }, 3000);
+}
+
+// Add CSS for animations
+const style = document.createElement('style');
+style.textContent = `
+    @keyframes pulse {
+        0%, 100% {
+            transform: scale(1);
+        }
+        50% {
+            transform: scale(1.05);
+        }
+    }
+    @keyframes slideIn {
+        from {
+            transform: translateX(100%);
+            opacity: 0;
+        }
+        to {
+            transform: translateX(0);
+            opacity: 1;
+        }
+    }
+    @keyframes slideOut {
+        from {
+            transform: translateX(0);
+            opacity: 1;
+        }
+        to {
+            transform: translateX(100%);
+            opacity: 0;
+        }
+    }
+`;
+document.head.appendChild(style);
+
+// Add hover effects
+document.querySelectorAll('.organization-card').forEach(card => {
+    card.addEventListener('mouseenter', function() {
+        if (!this.classList.contains('selected')) {
+            this.style.transform = 'translateY(-10px) scale(1.02)';
+        }
+    });
+
+    card.addEventListener('mouseleave', function() {
+        if (!this.classList.contains('selected')) {
+            this.style.transform = 'translateY(0) scale(1)';
+        }
+    });
+});
@@ -0,0 +1,224 @@
+let currentStep = 1;
+let selectedStudent = null;
+let selectedPaymentMethod = null;
+
+// Step navigation
+function goToStep(step) {
+    // Hide all sections
+    document.querySelectorAll('.form-section').forEach(section => {
+        section.classList.remove('active');
+    });
+
+    // Show target section
+    document.getElementById(`section${step}`).classList.add('active');
+
+    // Update step indicators
+    updateStepIndicators(step);
+    currentStep = step;
+}
+
+function updateStepIndicators(step) {
+    for (let i = 1; i <= 4; i++) {
+        const stepCircle = document.getElementById(`step${i}`);
+        const connector = document.getElementById(`connector${i}`);
+
+        if (i < step) {
+            stepCircle.className = 'step-circle completed';
+            if (connector) connector.className = 'step-connector completed';
+        } else if (i === step) {
+            stepCircle.className = 'step-circle active';
+            if (connector) connector.className = 'step-connector active';
+        } else {
+            stepCircle.className = 'step-circle';
+            if (connector) connector.className = 'step-connector';
+        }
+    }
+}
+
+// Student validation
+function validateStudent() {
+    const studentId = document.getElementById('studentId').value.trim();
+    const validationDiv = document.getElementById('studentIdValidation');
+
+    if (!studentId) {
+        validationDiv.textContent = 'Please enter a student ID';
+        validationDiv.className = 'validation-message validation-error';
+        return;
+    }
+
+    // Simulate student lookup
+    const studentData = {
+        'STU202412011': {
+            name: 'John Doe',
+            course: 'Computer Science',
+            year: '2',
+            status: 'Active',
+            email: 'john.doe@college.edu'
+        },
+        'STU202412012': {
+            name: 'Jane Smith',
+            course: 'Electronics',
+            year: '1',
+            status: 'Active',
+            email: 'jane.smith@college.edu'
+        }
+    };
+
+    if (studentData[studentId]) {
+        selectedStudent = studentData[studentId];
+        displayStudentInfo(studentData[studentId]);
+        validationDiv.textContent = '✓ Student found';
+        validationDiv.className = 'validation-message validation-success';
+
+        setTimeout(() => {
+            goToStep(2);
+        }, 1000);
+    } else {
+        validationDiv.textContent = 'Student not found. Please check the ID and try again.';
+        validationDiv.className = 'validation-message validation-error';
+    }
+}
+
+function displayStudentInfo(student) {
+    document.getElementById('studentName').textContent = student.name;
+    document.getElementById('studentCourse').textContent = student.course;
+    document.getElementById('studentYear').textContent = `Year ${student.year}`;
+    document.getElementById('studentStatus').textContent = student.status;
+    document.getElementById('studentAvatar').textContent = student.name[0].toUpperCase();
+
+    document.getElementById('studentInfo').classList.add('show');
+}
+
+// Fee validation
+function validateFeeDetails() {
+    const feeType = document.getElementById('feeType').value;
+    const amount = parseFloat(document.getElementById('amount').value);
+
+    if (!feeType) {
+        document.getElementById('feeTypeValidation').textContent = 'Please select a fee type';
+        document.getElementById('feeTypeValidation').className = 'validation-message validation-error';
+        return;
+    }
+
+    if (!amount || amount <= 0) {
+        document.getElementById('amountValidation').textContent = 'Please enter a valid amount';
+        document.getElementById('amountValidation').className = 'validation-message validation-error';
+        return;
+    }
+
+    calculateFeeBreakdown(feeType, amount);
+    document.getElementById('feeBreakdown').classList.add('show');
+
+    setTimeout(() => {
+        goToStep(3);
+    }, 1000);
+}
+
+function calculateFeeBreakdown(feeType, amount) {
+    const processingFee = amount * 0.02;
+    const gstAmount = amount * 0.18;
+    const totalAmount = amount + processingFee + gstAmount;
+
+    document.getElementById('breakdownLabel').textContent = feeType;
+    document.getElementById('breakdownAmount').textContent = `₹${amount.toLocaleString()}`;
+    document.getElementById('processingFee').textContent = `₹${processingFee.toLocaleString()}`;
+    document.getElementById('gstAmount').textContent = `₹${gstAmount.toLocaleString()}`;
+    document.getElementById('totalAmount').textContent = `₹${totalAmount.toLocaleString()}`;
+}
+
+// Payment method selection
+document.querySelectorAll('.payment-method').forEach(method => {
+    method.addEventListener('click', function() {
+        // Remove selection from all methods
+        document.querySelectorAll('.payment-method').forEach(m => {
+            m.classList.remove('selected');
+        });
+
+        // Add selection to clicked method
+        this.classList.add('selected');
+        selectedPaymentMethod = this.dataset.method;
+        document.getElementById('paymentMethod').value = selectedPaymentMethod;
+    });
+});
+
+function validatePaymentMethod() {
+    if (!selectedPaymentMethod) {
+        alert('Please select a payment method');
+        return;
+    }
+
+    updateReceiptPreview();
+    document.getElementById('receiptPreview').classList.add('show');
+
+    setTimeout(() => {
+        goToStep(4);
+    }, 1000);
+}
+
+function updateReceiptPreview() {
+    const studentId = document.getElementById('studentId').value;
+    const feeType = document.getElementById('feeType').value;
+    const amount = document.getElementById('amount').value;
+    const totalAmount = document.getElementById('totalAmount').textContent;
+
+    document.getElementById('receiptStudentId').textContent = studentId;
+    document.getElementById('receiptFeeType').textContent = feeType;
+    document.getElementById('receiptPaymentMethod').textContent = selectedPaymentMethod.charAt(0).toUpperCase() + selectedPaymentMethod.slice(1);
+    document.getElementById('receiptDate').textContent = new Date().toLocaleDateString();
+    document.getElementById('receiptAmount').textContent = totalAmount;
+}
+
+// Form submission
+document.getElementById('paymentForm').addEventListener('submit', function(e) {
+    e.preventDefault();
+
+    const submitBtn = document.getElementById('submitPaymentBtn');
+    submitBtn.innerHTML = '<span class="spinner"></span> Processing...';
+    submitBtn.disabled = true;
+
+    // Simulate payment processing
+    setTimeout(() => {
+        document.querySelector('.form-container').style.display = 'none';
+        document.getElementById('successAnimation').classList.add('show');
+    }, 2000);
+});
+
+// Go back function
+function goBack() {
+    window.history.back();
+}
+
+// Real-time validation
+document.addEventListener('DOMContentLoaded', function() {
+    // Student ID validation
+    document.getElementById('studentId').addEventListener('input', function() {
+        const value = this.value.trim();
+        if (value.length > 0) {
+            this.classList.add('valid');
+            this.classList.remove('invalid');
+        }
+    });
+
+    // Amount validation
+    document.getElementById('amount').addEventListener('input', function() {
+        const value = parseFloat(this.value);
+        if (value > 0) {
+            this.classList.add('valid');
+            this.classList.remove('invalid');
+        }
+    });
+
+    // Auto-fill academic year
+    const currentYear = new Date().getFullYear();
+    const nextYear = currentYear + 1;
+    document.getElementById('academicYear').value = `${currentYear}-${nextYear.toString().slice(-2)}`;
+});
+
+// Add animations
+document.addEventListener('DOMContentLoaded', function() {
+    const sections = document.querySelectorAll('.form-section');
+    sections.forEach((section, index) => {
+        section.style.animationDelay = `${index * 0.2}s`;
+        section.classList.add('animate-fadeInUp');
+    });
+});
@@ -0,0 +1,174 @@
+let selectedPaymentMethod = 'card';
+
+// Payment method selection
+document.querySelectorAll('.payment-method').forEach(method => {
+    method.addEventListener('click', function() {
+        document.querySelectorAll('.payment-method').forEach(m => m.classList.remove('selected'));
+        this.classList.add('selected');
+
+        selectedPaymentMethod = this.dataset.method;
+
+        // Show/hide forms
+        document.getElementById('cardForm').style.display = 'none';
+        document.getElementById('upiForm').style.display = 'none';
+        document.getElementById('netbankingForm').style.display = 'none';
+
+        document.getElementById(selectedPaymentMethod + 'Form').style.display = 'block';
+    });
+});
+
+// Card number formatting
+document.getElementById('cardNumber').addEventListener('input', function(e) {
+    let value = e.target.value.replace(/\s/g, '').replace(/[^0-9]/gi, '');
+    let formattedValue = value.match(/.{1,4}/g)?.join(' ') || value;
+    e.target.value = formattedValue;
+});
+
+// Expiry date formatting
+document.getElementById('expiry').addEventListener('input', function(e) {
+    let value = e.target.value.replace(/\D/g, '');
+    if (value.length >= 2) {
+        value = value.substring(0, 2) + '/' + value.substring(2, 4);
+    }
+    e.target.value = value;
+});
+
+// CVV validation
+document.getElementById('cvv').addEventListener('input', function(e) {
+    e.target.value = e.target.value.replace(/[^0-9]/g, '');
+});
+
+function processPayment() {
+    // Validate form
+    if (!validatePaymentForm()) {
+        return;
+    }
+
+    // Show processing overlay
+    document.getElementById('processingOverlay').style.display = 'flex';
+
+    // Simulate payment processing
+    setTimeout(() => {
+        // Hide processing overlay
+        document.getElementById('processingOverlay').style.display = 'none';
+
+        // Show success message
+        showPaymentResult('success', 'Payment Successful!', 'Your payment has been processed successfully. Receipt has been sent to your email.');
+    }, 3000);
+}
+
+function validatePaymentForm() {
+    let isValid = true;
+    let errorMessage = '';
+
+    if (selectedPaymentMethod === 'card') {
+        const cardNumber = document.getElementById('cardNumber').value;
+        const cardName = document.getElementById('cardName').value;
+        const expiry = document.getElementById('expiry').value;
+        const cvv = document.getElementById('cvv').value;
+
+        if (!cardNumber || cardNumber.replace(/\s/g, '').length < 16) {
+            errorMessage = 'Please enter a valid card number';
+            isValid = false;
+        } else if (!cardName) {
+            errorMessage = 'Please enter cardholder name';
+            isValid = false;
+        } else if (!expiry || expiry.length < 5) {
+            errorMessage = 'Please enter valid expiry date';
+            isValid = false;
+        } else if (!cvv || cvv.length < 3) {
+            errorMessage = 'Please enter valid CVV';
+            isValid = false;
+        }
+    } else if (selectedPaymentMethod === 'upi') {
+        const upiId = document.getElementById('upiId').value;
+        if (!upiId || !upiId.includes('@')) {
+            errorMessage = 'Please enter a valid UPI ID';
+            isValid = false;
+        }
+    } else if (selectedPaymentMethod === 'netbanking') {
+        const bankSelect = document.getElementById('bankSelect').value;
+        if (!bankSelect) {
+            errorMessage = 'Please select your bank';
+            isValid = false;
+        }
+    }
+
+    if (!isValid) {
+        alert(errorMessage);
+    }
+
+    return isValid;
+}
+
+function showPaymentResult(type, title, message) {
+    const resultOverlay = document.createElement('div');
+    resultOverlay.style.cssText = `
+        position: fixed;
+        top: 0;
+        left: 0;
+        right: 0;
+        bottom: 0;
+        background: rgba(0, 0, 0, 0.8);
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        z-index: 1001;
+    `;
+
+    resultOverlay.innerHTML = `
+        <div style="
+            background: rgba(255, 255, 255, 0.1);
+            backdrop-filter: blur(20px);
+            border-radius: 20px;
+            padding: 3rem;
+            text-align: center;
+            border: 1px solid rgba(255, 255, 255, 0.2);
+            max-width: 400px;
+        ">
+            <div style="
+                width: 80px;
+                height: 80px;
+                border-radius: 50%;
+                background: ${type === 'success' ? 'linear-gradient(135deg, #56ab2f, #a8e6cf)' : 'linear-gradient(135deg, #dc3545, #e83e8c)'};
+                display: flex;
+                align-items: center;
+                justify-content: center;
+                margin: 0 auto 1rem;
+                font-size: 2rem;
+                color: white;
+            ">
+                <i class="fas fa-${type === 'success' ? 'check' : 'times'}"></i>
+            </div>
+            <h3 style="margin-bottom: 1rem; color: ${type === 'success' ? '#56ab2f' : '#dc3545'};">${title}</h3>
+            <p style="margin-bottom: 2rem; opacity: 0.9;">${message}</p>
+            <button onclick="closeResult()" style="
+                background: linear-gradient(135deg, #56ab2f, #a8e6cf);
+                color: white;
+                padding: 1rem 2rem;
+                border: none;
+                border-radius: 10px;
+                font-weight: bold;
+                cursor: pointer;
+                transition: all 0.3s ease;
+            ">
+                Continue
+            </button>
+        </div>
+    `;
+
+    document.body.appendChild(resultOverlay);
+}
+
+function closeResult() {
+    document.querySelector('[style*="position: fixed"][style*="z-index: 1001"]').remove();
+    // Redirect to dashboard
+    window.location.href = '/student_portal';
+}
+
+// Add some realistic payment processing simulation
+setTimeout(() => {
+    if (Math.random() > 0.8) {
+        showNotification('Payment gateway is secure and encrypted', 'info');
+    }
+}, 2000);
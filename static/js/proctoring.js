@@ -0,0 +1,89 @@
+// Streams webcam frames for the open test attempt over a WebSocket.
+// Each frame is sent as a binary JPEG message; the server decides the frame rate.
+document.addEventListener('DOMContentLoaded', function() {
+    const panel = document.getElementById('proctorPanel');
+    if (!panel) return;
+    const video = document.getElementById('proctorVideo');
+    const status = document.getElementById('proctorStatus');
+    const canvas = document.createElement('canvas');
+    const maxWidth = 640;
+    let socket = null;
+    let fps = 1;
+    let timer = null;
+    let retryDelay = 1000;
+
+    function setStatus(text, type) {
+        status.textContent = text;
+        status.className = 'proctor-value' + (type ? ' ' + type : '');
+    }
+
+    navigator.mediaDevices.getUserMedia({ video: { width: 640, height: 480, facingMode: 'user' } })
+        .then(stream => {
+            video.srcObject = stream;
+            connect();
+        })
+        .catch(err => setStatus('Camera unavailable: ' + err.message, 'error'));
+
+    function connect() {
+        const url = new URL(panel.dataset.socket, window.location.href);
+        url.protocol = url.protocol === 'https:' ? 'wss:' : 'ws:';
+        socket = new WebSocket(url);
+        socket.binaryType = 'arraybuffer';
+
+        socket.addEventListener('open', () => {
+            retryDelay = 1000;
+            setStatus('Connected');
+        });
+        socket.addEventListener('message', event => {
+            const message = JSON.parse(event.data);
+            if (message.type === 'rate') {
+                fps = message.fps;
+                schedule();
+            } else if (message.type === 'result') {
+                if (message.verified) {
+                    setStatus('Face verified', 'success');
+                } else {
+                    setStatus(message.error, 'error');
+                }
+            }
+        });
+        socket.addEventListener('close', event => {
+            clearTimeout(timer);
+            // 1008: the attempt is submitted or not ours; anything else is retried
+            if (event.code === 1008) {
+                setStatus('Proctoring ended');
+                return;
+            }
+            setStatus('Reconnecting...', 'error');
+            setTimeout(connect, retryDelay);
+            retryDelay = Math.min(retryDelay * 2, 30000);
+        });
+    }
+
+    function schedule() {
+        clearTimeout(timer);
+        timer = setTimeout(sendFrame, 1000 / fps);
+    }
+
+    function sendFrame() {
+        // Skip a frame rather than queue it while the previous one is still uploading
+        if (socket.readyState !== WebSocket.OPEN || socket.bufferedAmount > 0 || !video.videoWidth) {
+            schedule();
+            return;
+        }
+        const scale = Math.min(1, maxWidth / video.videoWidth);
+        canvas.width = Math.round(video.videoWidth * scale);
+        canvas.height = Math.round(video.videoHeight * scale);
+        canvas.getContext('2d').drawImage(video, 0, 0, canvas.width, canvas.height);
+        canvas.toBlob(blob => {
+            if (blob && socket.readyState === WebSocket.OPEN) socket.send(blob);
+            schedule();
+        }, 'image/jpeg', 0.7);
+    }
+
+    window.addEventListener('pagehide', () => {
+        if (socket && socket.readyState === WebSocket.OPEN) {
+            socket.send(JSON.stringify({ type: 'stop' }));
+        }
+    });
+});
@@ -0,0 +1,82 @@
+// Add loading state to registration form
+document.querySelector('form').addEventListener('submit', function () {
+    const submitBtn = document.querySelector('button[type="submit"]');
+    submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Creating Account...';
+    submitBtn.disabled = true;
+});
+
+// Password strength indicator
+const passwordInput = document.querySelector('input[name="password"]');
+passwordInput.addEventListener('input', function () {
+    const password = this.value;
+    const strength = getPasswordStrength(password);
+
+    // Remove existing strength indicator
+    const existingIndicator = document.querySelector('.password-strength');
+    if (existingIndicator) {
+        existingIndicator.remove();
+    }
+
+    // Create new strength indicator
+    const indicator = document.createElement('div');
+    indicator.className = 'password-strength';
+    indicator.style.marginTop = '0.5rem';
+    indicator.style.fontSize = '0.8rem';
+    indicator.style.fontWeight = '500';
+
+    if (password.length > 0) {
+        if (strength < 2) {
+            indicator.innerHTML = '<i class="fas fa-times-circle" style="color: #ff416c;"></i> Weak password';
+            indicator.style.color = '#ff416c';
+        } else if (strength < 4) {
+            indicator.innerHTML = '<i class="fas fa-exclamation-triangle" style="color: #ffa726;"></i> Medium strength';
+            indicator.style.color = '#ffa726';
+        } else {
+            indicator.innerHTML = '<i class="fas fa-check-circle" style="color: #56ab2f;"></i> Strong password';
+            indicator.style.color = '#56ab2f';
+        }
+
+        this.parentNode.appendChild(indicator);
+    }
+});
+
+function getPasswordStrength(password) {
+    let strength = 0;
+
+    if (password.length >= 8) strength++;
+    if (/[a-z]/.test(password)) strength++;
+    if (/[A-Z]/.test(password)) strength++;
+    if (/[0-9]/.test(password)) strength++;
+    if (/[^A-Za-z0-9]/.test(password)) strength++;
+
+    return strength;
+}
+
+// Add floating animation to form elements
+document.addEventListener('DOMContentLoaded', function () {
+    const inputs = document.querySelectorAll('.form-control');
+    inputs.forEach((input, index) => {
+        input.style.animationDelay = `${index * 0.1}s`;
+        input.classList.add('animate-fadeInUp');
+    });
+});
+
+// Add fadeInUp animation
+const style = document.createElement('style');
+style.textContent = `
+    .animate-fadeInUp {
+        animation: fadeInUp 0.6s ease-out forwards;
+    }
+
+    @keyframes fadeInUp {
+        from {
+            opacity: 0;
+            transform: translateY(20px);
+        }
+        to {
+            opacity: 1;
+            transform: translateY(0);
+        }
+    }
+`;
+document.head.appendChild(style);
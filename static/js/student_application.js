@@ -0,0 +1,249 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Form validation
+    const form = document.getElementById('applicationForm');
+    const inputs = form.querySelectorAll('input, select, textarea');
+
+    inputs.forEach(input => {
+        input.addEventListener('blur', validateField);
+        input.addEventListener('input', clearError);
+    });
+
+    function validateField(e) {
+        const field = e.target;
+        const value = field.value.trim();
+
+        // Remove previous validation classes
+        field.classList.remove('error', 'success');
+        const errorMsg = field.parentNode.querySelector('.error-message');
+        if (errorMsg) errorMsg.remove();
+
+        // Validate required fields
+        if (field.hasAttribute('required') && !value) {
+            showError(field, 'This field is required');
+            return false;
+        }
+
+        // Email validation
+        if (field.type === 'email' && value) {
+            const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+            if (!emailRegex.test(value)) {
+                showError(field, 'Please enter a valid email address');
+                return false;
+            }
+        }
+
+        // Phone validation
+        if (field.type === 'tel' && value) {
+            const phoneRegex = /^[\+]?[0-9\s\-\(\)]{10,}$/;
+            if (!phoneRegex.test(value)) {
+                showError(field, 'Please enter a valid phone number');
+                return false;
+            }
+        }
+
+        // Marks validation
+        if (field.name === 'marks' && value) {
+            const marks = parseInt(value);
+            if (marks < 0 || marks > 100) {
+                showError(field, 'Marks must be between 0 and 100');
+                return false;
+            }
+        }
+
+        // Show success state
+        if (value) {
+            field.classList.add('success');
+        }
+        return true;
+    }
+
+    function showError(field, message) {
+        field.classList.add('error');
+        const errorDiv = document.createElement('div');
+        errorDiv.className = 'error-message';
+        errorDiv.textContent = message;
+        field.parentNode.appendChild(errorDiv);
+    }
+
+    function clearError(e) {
+        const field = e.target;
+        field.classList.remove('error');
+        const errorMsg = field.parentNode.querySelector('.error-message');
+        if (errorMsg) errorMsg.remove();
+    }
+
+    // File upload handling
+    const fileInputs = document.querySelectorAll('input[type="file"]');
+    fileInputs.forEach(input => {
+        const fileUpload = input.closest('.file-upload');
+        const fileNameDiv = fileUpload.querySelector('.file-name');
+        const label = fileUpload.querySelector('.file-upload-label');
+
+        // Handle keyboard accessibility
+        label.addEventListener('keydown', function(e) {
+            if (e.key === 'Enter' || e.key === ' ') {
+                e.preventDefault();
+                input.click();
+            }
+        });
+
+        input.addEventListener('change', function(e) {
+            const files = e.target.files;
+
+            if (files.length > 0) {
+                fileUpload.classList.add('has-file');
+                if (files.length === 1) {
+                    const fileName = files[0].name;
+                    fileNameDiv.innerHTML = `
+                        <i class="fas fa-check-circle" style="color: #56ab2f; margin-right: 5px;"></i>
+                        ${fileName}
+                    `;
+                } else {
+                    fileNameDiv.innerHTML = `
+                        <i class="fas fa-check-circle" style="color: #56ab2f; margin-right: 5px;"></i>
+                        ${files.length} files selected
+                    `;
+                }
+            } else {
+                fileUpload.classList.remove('has-file');
+                fileNameDiv.textContent = '';
+            }
+        });
+
+        // Prevent the default drag behavior
+        ['dragenter', 'dragover', 'dragleave', 'drop'].forEach(eventName => {
+            fileUpload.addEventListener(eventName, preventDefaults, false);
+        });
+
+        function preventDefaults(e) {
+            e.preventDefault();
+            e.stopPropagation();
+        }
+
+        // Handle drag and drop
+        fileUpload.addEventListener('dragenter', () => fileUpload.classList.add('drag-over'));
+        fileUpload.addEventListener('dragleave', () => fileUpload.classList.remove('drag-over'));
+        fileUpload.addEventListener('drop', function(e) {
+            fileUpload.classList.remove('drag-over');
+            const dt = e.dataTransfer;
+            const files = dt.files;
+            input.files = files;
+
+            // Trigger change event
+            const event = new Event('change');
+            input.dispatchEvent(event);
+        });
+    });
+
+    // Progress indicator animation
+    const progressSteps = document.querySelectorAll('.progress-step');
+    let currentStep = 0;
+
+    function updateProgress() {
+        progressSteps.forEach((step, index) => {
+            step.classList.remove('active', 'completed');
+            if (index < currentStep) {
+                step.classList.add('completed');
+            } else if (index === currentStep) {
+                step.classList.add('active');
+            }
+        });
+    }
+
+    // Simulate progress updates
+    setInterval(() => {
+        if (currentStep < progressSteps.length - 1) {
+            currentStep++;
+            updateProgress();
+        }
+    }, 2000);
+
+    // Form submission
+    form.addEventListener('submit', function(e) {
+        e.preventDefault();
+
+        // Validate all fields
+        let isValid = true;
+        inputs.forEach(input => {
+            if (!validateField({ target: input })) {
+                isValid = false;
+            }
+        });
+
+        // Validate file uploads
+        fileInputs.forEach(input => {
+            if (input.hasAttribute('required') && (!input.files || input.files.length === 0)) {
+                const fieldName = input.name.replace('_', ' ');
+                showError(input, `Please upload your ${fieldName}`);
+                isValid = false;
+            }
+        });
+
+        if (isValid) {
+            // Show loading state
+            const submitBtn = form.querySelector('.btn-submit');
+            const originalText = submitBtn.innerHTML;
+            submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Submitting...';
+            submitBtn.disabled = true;
+
+            // Create FormData object
+            const formData = new FormData(form);
+
+            // Submit form data
+            fetch('/student/apply', {
+                method: 'POST',
+                body: formData
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    alert('Application submitted successfully! You will receive a confirmation email shortly.');
+                    window.location.href = '/student_portal';
+                } else {
+                    alert(data.message || 'Error submitting application. Please try again.');
+                    submitBtn.innerHTML = originalText;
+                    submitBtn.disabled = false;
+                }
+            })
+            .catch(error => {
+                console.error('Error:', error);
+                alert('Error submitting application. Please try again.');
+                submitBtn.innerHTML = originalText;
+                submitBtn.disabled = false;
+            });
+        } else {
+            alert('Please fill all required fields correctly.');
+        }
+    });
+
+    // Auto-save functionality
+    let autoSaveTimeout;
+    inputs.forEach(input => {
+        input.addEventListener('input', function() {
+            clearTimeout(autoSaveTimeout);
+            autoSaveTimeout = setTimeout(() => {
+                // Save form data to localStorage
+                const formData = new FormData(form);
+                const data = {};
+                for (let [key, value] of formData.entries()) {
+                    if (input.type !== 'file') {
+                        data[key] = value;
+                    }
+                }
+                localStorage.setItem('applicationForm', JSON.stringify(data));
+            }, 1000);
+        });
+    });
+
+    // Load saved data
+    const savedData = localStorage.getItem('applicationForm');
+    if (savedData) {
+        const data = JSON.parse(savedData);
+        Object.keys(data).forEach(key => {
+            const input = form.querySelector(`[name="${key}"]`);
+            if (input && input.type !== 'file') {
+                input.value = data[key];
+            }
+        });
+    }
+});
@@ -0,0 +1,64 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const result = document.getElementById('faceResult');
+    const snapshotForm = document.getElementById('snapshotForm');
+    const enrollForm = document.getElementById('enrollForm');
+    if (!snapshotForm) return;
+
+    function show(title, lines, isError) {
+        result.hidden = false;
+        result.replaceChildren();
+        const heading = document.createElement('h3');
+        heading.textContent = title;
+        if (isError) heading.className = 'error';
+        result.appendChild(heading);
+        const list = document.createElement('ul');
+        lines.forEach(line => {
+            const item = document.createElement('li');
+            item.textContent = line;
+            list.appendChild(item);
+        });
+        result.appendChild(list);
+    }
+
+    function post(form, body) {
+        const button = form.querySelector('button[type="submit"]');
+        button.disabled = true;
+        return fetch(form.dataset.api, { method: 'POST', body: body })
+            .then(response => response.json())
+            .finally(() => { button.disabled = false; });
+    }
+
+    snapshotForm.addEventListener('submit', function(event) {
+        event.preventDefault();
+        const body = new FormData(snapshotForm);
+        const [year, course] = body.get('class').split('|');
+        body.delete('class');
+        body.set('course', course);
+        body.set('year', year);
+
+        post(snapshotForm, body).then(data => {
+            if (!data.success) {
+                show('Attendance not recorded', [data.error], true);
+                return;
+            }
+            show('Attendance recorded', [
+                `${data.faces} faces found, ${data.present.length} matched of ${data.enrolled} enrolled students`,
+                `Present: ${data.present.join(', ') || 'none'}`,
+                `${data.unknown_faces} unrecognised faces`,
+                `${data.attendance.inserted} new records, ${data.attendance.marked_present} changed to present`,
+                `Took ${data.timings_ms.detect_and_embed + data.timings_ms.match + data.timings_ms.record} ms`
+            ]);
+        }).catch(error => show('Attendance not recorded', [error.message], true));
+    });
+
+    enrollForm.addEventListener('submit', function(event) {
+        event.preventDefault();
+        post(enrollForm, new FormData(enrollForm)).then(data => {
+            const lines = (data.errors || []).map(error => `${error.file}: ${error.error}`);
+            if (data.enrolled) {
+                lines.unshift(`${data.enrolled} photo(s) enrolled for ${data.student_id}`);
+            }
+            show(data.success ? 'Student enrolled' : 'Enrolment failed', data.error ? [data.error] : lines, !data.success);
+        }).catch(error => show('Enrolment failed', [error.message], true));
+    });
+});
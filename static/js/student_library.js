@@ -0,0 +1,154 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const searchForm = document.getElementById('searchForm');
+    const searchInput = document.getElementById('searchInput');
+    const categoryInput = document.getElementById('categoryInput');
+    const facets = document.getElementById('categoryFacets');
+    const booksGrid = document.getElementById('booksGrid');
+    const pagination = document.getElementById('pagination');
+    const apiUrl = searchForm.dataset.api;
+    let debounceTimer = null;
+    let latestRequest = 0;
+
+    // Search as you type; the server does the matching and ranking
+    searchInput.addEventListener('input', function() {
+        clearTimeout(debounceTimer);
+        debounceTimer = setTimeout(function() { search(1); }, 250);
+    });
+
+    searchForm.addEventListener('submit', function(event) {
+        event.preventDefault();
+        clearTimeout(debounceTimer);
+        search(1);
+    });
+
+    // Category facets
+    facets.addEventListener('click', function(event) {
+        const link = event.target.closest('.filter-btn');
+        if (!link) return;
+        event.preventDefault();
+        categoryInput.value = link.dataset.category;
+        search(1);
+    });
+
+    pagination.addEventListener('click', function(event) {
+        const link = event.target.closest('[data-page]');
+        if (!link) return;
+        event.preventDefault();
+        search(parseInt(link.dataset.page, 10));
+    });
+
+    booksGrid.addEventListener('click', function(event) {
+        const link = event.target.closest('.purchase-btn');
+        if (link && !confirm(link.dataset.confirm)) {
+            event.preventDefault();
+        }
+    });
+
+    function search(page) {
+        const params = new URLSearchParams();
+        if (searchInput.value.trim()) params.set('q', searchInput.value.trim());
+        if (categoryInput.value) params.set('category', categoryInput.value);
+        if (page > 1) params.set('page', page);
+
+        const requestId = ++latestRequest;
+        fetch(apiUrl + '?' + params.toString(), { headers: { 'Accept': 'application/json' } })
+            .then(response => response.json())
+            .then(data => {
+                // Drop responses that arrive after a newer search
+                if (requestId !== latestRequest) return;
+                renderFacets(data);
+                renderBooks(data.books);
+                renderPagination(data);
+                document.getElementById('bookCount').textContent = data.total;
+                document.getElementById('categoryCount').textContent = data.facets.length;
+                history.replaceState(null, '', searchForm.action + (params.toString() ? '?' + params.toString() : ''));
+            })
+            .catch(error => console.error('Library search failed:', error));
+    }
+
+    function element(tag, className, text) {
+        const node = document.createElement(tag);
+        if (className) node.className = className;
+        if (text !== undefined) node.textContent = text;
+        return node;
+    }
+
+    function renderFacets(data) {
+        facets.replaceChildren();
+        const all = element('a', 'filter-btn' + (data.category ? '' : ' active'), 'All Books');
+        all.href = '#';
+        all.dataset.category = '';
+        facets.appendChild(all);
+        data.facets.forEach(facet => {
+            const link = element('a', 'filter-btn' + (facet.category === data.category ? ' active' : ''), facet.category + ' ');
+            link.href = '#';
+            link.dataset.category = facet.category;
+            link.appendChild(element('span', 'facet-count', facet.count));
+            facets.appendChild(link);
+        });
+    }
+
+    function renderBooks(books) {
+        booksGrid.replaceChildren();
+        if (!books.length) {
+            booksGrid.appendChild(element('div', 'no-results', 'No books match your search.'));
+            return;
+        }
+        books.forEach(book => {
+            const card = element('div', 'book-card');
+            const image = element('div', 'book-image');
+            image.appendChild(element('i', 'fas fa-book'));
+            card.appendChild(image);
+            card.appendChild(element('div', 'book-title', book.title));
+            card.appendChild(element('div', 'book-author', 'by ' + book.author));
+            card.appendChild(element('div', 'book-category', book.category));
+            card.appendChild(element('div', 'book-description',
+                book.description || 'A comprehensive guide for students and professionals.'));
+            card.appendChild(element('div', 'book-price', '₹' + book.price));
+            card.appendChild(element('div', 'book-stock', book.stock + ' copies available'));
+
+            const purchase = element('a', 'purchase-btn');
+            purchase.href = book.purchase_url;
+            purchase.dataset.confirm = 'Purchase ' + book.title + ' for ₹' + book.price + '?';
+            purchase.appendChild(element('i', 'fas fa-shopping-cart'));
+            purchase.appendChild(document.createTextNode(' Purchase Book'));
+            card.appendChild(purchase);
+
+            card.style.animation = 'fadeInUp 0.5s ease';
+            booksGrid.appendChild(card);
+        });
+    }
+
+    function renderPagination(data) {
+        pagination.replaceChildren();
+        if (data.page > 1) {
+            const previous = element('a', 'filter-btn', 'Previous');
+            previous.href = '#';
+            previous.dataset.page = data.page - 1;
+            pagination.appendChild(previous);
+        }
+        pagination.appendChild(element('span', 'page-info', 'Page ' + data.page + ' of ' + data.pages));
+        if (data.page < data.pages) {
+            const next = element('a', 'filter-btn', 'Next');
+            next.href = '#';
+            next.dataset.page = data.page + 1;
+            pagination.appendChild(next);
+        }
+    }
+
+    // Add fadeInUp animation
+    const style = document.createElement('style');
+    style.textContent = `
+        @keyframes fadeInUp {
+            from {
+                opacity: 0;
+                transform: translateY(20px);
+            }
+            to {
+                opacity: 1;
+                transform: translateY(0);
+            }
+        }
+    `;
+    document.head.appendChild(style);
+});
@@ -0,0 +1,197 @@
+// Create floating particles
+function createParticles() {
+    const particlesContainer = document.getElementById('particles');
+    const particleCount = 20;
+
+    for (let i = 0; i < particleCount; i++) {
+        const particle = document.createElement('div');
+        particle.className = 'particle';
+        particle.style.left = Math.random() * 100 + '%';
+        particle.style.animationDelay = Math.random() * 6 + 's';
+        particle.style.animationDuration = (Math.random() * 4 + 6) + 's';
+        particlesContainer.appendChild(particle);
+    }
+}
+
+// Animate progress bars on load
+document.addEventListener('DOMContentLoaded', function() {
+    // Create floating particles
+    createParticles();
+    const progressBars = document.querySelectorAll('.progress-fill');
+    progressBars.forEach(bar => {
+        const width = bar.style.width;
+        bar.style.width = '0%';
+        setTimeout(() => {
+            bar.style.width = width;
+        }, 500);
+    });
+
+    // Animate counters
+    const counters = document.querySelectorAll('.stat-value');
+    counters.forEach(counter => {
+        const target = counter.textContent;
+        if (!isNaN(target.replace(/,/g, ''))) {
+            const finalValue = target.replace(/,/g, '');
+            let current = 0;
+            const increment = finalValue / 50;
+            const timer = setInterval(() => {
+                current += increment;
+                if (current >= finalValue) {
+                    counter.textContent = target;
+                    clearInterval(timer);
+                } else {
+                    counter.textContent = Math.floor(current).toLocaleString();
+                }
+            }, 30);
+        }
+    });
+
+    // Add hover effects to action buttons
+    document.querySelectorAll('.action-btn').forEach(btn => {
+        btn.addEventListener('mouseenter', function() {
+            this.style.transform = 'translateY(-8px) scale(1.05)';
+        });
+
+        btn.addEventListener('mouseleave', function() {
+            this.style.transform = 'translateY(-5px) scale(1)';
+        });
+    });
+
+    // Simulate real-time updates
+    setInterval(() => {
+        const attendanceStat = document.querySelector('.stat-card:nth-child(3) .stat-value');
+        const currentAttendance = parseInt(attendanceStat.textContent);
+        if (Math.random() > 0.95) { // 5% chance every interval
+            const newAttendance = Math.min(100, currentAttendance + 1);
+            attendanceStat.textContent = newAttendance + '%';
+
+            const progressBar = document.querySelector('.stat-card:nth-child(3) .progress-fill');
+            progressBar.style.width = newAttendance + '%';
+        }
+    }, 5000);
+
+    // Achievement unlock animation
+    setTimeout(() => {
+        const lockedAchievement = document.querySelector('.achievement.locked');
+        if (lockedAchievement && Math.random() > 0.7) {
+            lockedAchievement.classList.remove('locked');
+            lockedAchievement.classList.add('unlocked');
+
+            // Add confetti effect
+            createConfetti();
+
+            // Add notification
+            const notification = document.createElement('div');
+            notification.innerHTML = '🎉 Achievement Unlocked!';
+            notification.style.cssText = `
+                position: fixed;
+                top: 20px;
+                right: 20px;
+                background: linear-gradient(135deg, #56ab2f, #a8e6cf);
+                color: white;
+                padding: 1rem 2rem;
+                border-radius: 10px;
+                font-weight: bold;
+                z-index: 1000;
+                animation: slideIn 0.5s ease;
+            `;
+            document.body.appendChild(notification);
+
+            setTimeout(() => {
+                notification.remove();
+            }, 3000);
+        }
+    }, 10000);
+
+    // Add level up effect to level display
+    const levelElement = document.querySelector('.level-value');
+    if (levelElement) {
+        levelElement.addEventListener('click', function() {
+            this.style.animation = 'pulse 0.5s ease';
+            setTimeout(() => {
+                this.style.animation = '';
+            }, 500);
+        });
+    }
+
+    // Add achievement hover effects
+    const achievementCards = document.querySelectorAll('.achievement-card');
+    achievementCards.forEach(card => {
+        card.addEventListener('mouseenter', function() {
+            this.style.transform = 'translateY(-10px) scale(1.05)';
+            this.style.boxShadow = '0 20px 40px rgba(86, 171, 47, 0.3)';
+        });
+
+        card.addEventListener('mouseleave', function() {
+            this.style.transform = 'translateY(0) scale(1)';
+            this.style.boxShadow = '0 10px 30px rgba(0, 0, 0, 0.2)';
+        });
+    });
+});
+
+// Add confetti effect for achievements
+function createConfetti() {
+    const confettiContainer = document.createElement('div');
+    confettiContainer.style.position = 'fixed';
+    confettiContainer.style.top = '0';
+    confettiContainer.style.left = '0';
+    confettiContainer.style.width = '100%';
+    confettiContainer.style.height = '100%';
+    confettiContainer.style.pointerEvents = 'none';
+    confettiContainer.style.zIndex = '1000';
+    document.body.appendChild(confettiContainer);
+
+    const colors = ['#56ab2f', '#667eea', '#764ba2', '#f093fb', '#f5576c'];
+
+    for (let i = 0; i < 50; i++) {
+        const confetti = document.createElement('div');
+        confetti.style.position = 'absolute';
+        confetti.style.width = '10px';
+        confetti.style.height = '10px';
+        confetti.style.backgroundColor = colors[Math.floor(Math.random() * colors.length)];
+        confetti.style.left = Math.random() * 100 + '%';
+        confetti.style.top = '-10px';
+        confetti.style.animation = `confettiFall ${Math.random() * 3 + 2}s linear forwards`;
+        confettiContainer.appendChild(confetti);
+    }
+
+    setTimeout(() => {
+        document.body.removeChild(confettiContainer);
+    }, 5000);
+}
+
+// Add CSS for notification animation
+const style = document.createElement('style');
+style.textContent = `
+    @keyframes slideIn {
+        from {
+            transform: translateX(100%);
+            opacity: 0;
+        }
+        to {
+            transform: translateX(0);
+            opacity: 1;
+        }
+    }
+
+    @keyframes confettiFall {
+        0% {
+            transform: translateY(-100vh) rotate(0deg);
+            opacity: 1;
+        }
+        100% {
+            transform: translateY(100vh) rotate(360deg);
+            opacity: 0;
+        }
+    }
+
+    @keyframes pulse {
+        0%, 100% {
+            transform: scale(1);
+        }
+        50% {
+            transform: scale(1.1);
+        }
+    }
+`;
+document.head.appendChild(style);
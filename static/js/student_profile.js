@@ -0,0 +1,111 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Animate progress bars on load
+    const progressBars = document.querySelectorAll('.progress-fill');
+    progressBars.forEach(bar => {
+        const width = bar.style.width;
+        bar.style.width = '0%';
+        setTimeout(() => {
+            bar.style.width = width;
+        }, 500);
+    });
+
+    // Add hover effects to achievement cards
+    document.querySelectorAll('.achievement-card').forEach(card => {
+        card.addEventListener('mouseenter', function() {
+            if (this.classList.contains('unlocked')) {
+                this.style.transform = 'translateY(-5px) scale(1.05)';
+                this.style.boxShadow = '0 15px 40px rgba(86, 171, 47, 0.3)';
+            }
+        });
+
+        card.addEventListener('mouseleave', function() {
+            if (this.classList.contains('unlocked')) {
+                this.style.transform = 'translateY(0) scale(1)';
+                this.style.boxShadow = 'none';
+            }
+        });
+    });
+
+    // Edit profile functionality
+    const editBtn = document.querySelector('.edit-btn');
+    editBtn.addEventListener('click', function() {
+        // In real app, open edit modal or redirect to edit page
+        alert('Edit profile functionality would open here');
+    });
+
+    // Simulate achievement unlock
+    setTimeout(() => {
+        const lockedAchievements = document.querySelectorAll('.achievement-card.locked');
+        if (lockedAchievements.length > 0 && Math.random() > 0.7) {
+            const randomAchievement = lockedAchievements[Math.floor(Math.random() * lockedAchievements.length)];
+            randomAchievement.classList.remove('locked');
+            randomAchievement.classList.add('unlocked');
+
+            // Add notification
+            showNotification('🎉 New Achievement Unlocked!', 'success');
+        }
+    }, 5000);
+
+    // Add pulse animation to unlocked achievements
+    document.querySelectorAll('.achievement-card.unlocked').forEach(card => {
+        card.style.animation = 'pulse 2s infinite';
+    });
+});
+
+function showNotification(message, type = 'info') {
+    const notification = document.createElement('div');
+    notification.innerHTML = message;
+    notification.style.cssText = `
+        position: fixed;
+        top: 20px;
+        right: 20px;
+        background: linear-gradient(135deg, #56ab2f, #a8e6cf);
+        color: white;
+        padding: 1rem 2rem;
+        border-radius: 10px;
+        font-weight: bold;
+        z-index: 1000;
+        animation: slideIn 0.5s ease;
+        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
+    `;
+    document.body.appendChild(notification);
+
+    setTimeout(() => {
+        notification.style.animation = 'slideOut 0.5s ease';
+        setTimeout(() => notification.remove(), 500);
+    }, 3000);
+}
+
+// Add CSS for animations
+const style = document.createElement('style');
+style.textContent = `
+    @keyframes pulse {
+        0%, 100% {
+            transform: scale(1);
+        }
+        50% {
+            transform: scale(1.05);
+        }
+    }
+    @keyframes slideIn {
+        from {
+            transform: translateX(100%);
+            opacity: 0;
+        }
+        to {
+            transform: translateX(0);
+            opacity: 1;
+        }
+    }
+    @keyframes slideOut {
+        from {
+            transform: translateX(0);
+            opacity: 1;
+        }
+        to {
+            transform: translateX(100%);
+            opacity: 0;
+        }
+    }
+`;
+document.head.appendChild(style);
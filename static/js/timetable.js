@@ -0,0 +1,168 @@
+// Current time display
+function updateCurrentTime() {
+    const now = new Date();
+    const timeString = now.toLocaleTimeString('en-US', { 
+        hour12: true, 
+        hour: '2-digit', 
+        minute: '2-digit' 
+    });
+    document.getElementById('currentTime').textContent = timeString;
+}
+
+// Update time every second
+setInterval(updateCurrentTime, 1000);
+updateCurrentTime(); // Initial call
+
+// Highlight the current lesson; the server answers 304 until it changes
+function highlightCurrentTimeSlot() {
+    const table = document.querySelector('.timetable-table');
+    fetch(table.dataset.now, { headers: { 'Accept': 'application/json' } })
+        .then(response => response.json())
+        .then(data => {
+            // Remove previous highlights
+            document.querySelectorAll('.current-time').forEach(cell => {
+                cell.classList.remove('current-time');
+            });
+
+            data.now.forEach(lesson => {
+                const cell = table.querySelector(`td[data-day="${lesson.day}"][data-slot="${lesson.period}"]`);
+                if (cell) {
+                    cell.classList.add('current-time');
+                }
+            });
+
+            let currentPeriod = data.now.length
+                ? 'Now: ' + data.now.map(lesson => `${lesson.subject} (${lesson.room})`).join(', ')
+                : 'Outside class hours';
+            if (data.next) {
+                currentPeriod += ` · Next: ${data.next.subject}, ${data.next.day} ${data.next.period}`;
+            }
+            document.getElementById('currentPeriod').textContent = currentPeriod;
+        })
+        .catch(error => console.error('Could not load the current lesson:', error));
+}
+
+// Update highlight every minute
+setInterval(highlightCurrentTimeSlot, 60000);
+highlightCurrentTimeSlot(); // Initial call
+
+// Timetable actions
+function applyFilters() {
+    const params = new URLSearchParams();
+    const year = document.getElementById('yearFilter').value;
+    const section = document.getElementById('sectionFilter').value;
+    if (year) params.set('year', year);
+    if (section) params.set('section', section);
+    window.location.search = params.toString();
+}
+
+function generateTimetable() {
+    if (!confirm('Generate a new timetable? This will replace the current schedule.')) {
+        return;
+    }
+    // Reschedules the current lessons so no teacher, room or class is double-booked
+    fetch('/api/timetable/generate', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: '{}'
+    })
+        .then(response => response.json())
+        .then(result => {
+            if (result.error) {
+                alert('Could not generate a timetable: ' + result.error);
+            } else if (!result.applied) {
+                alert(result.unplaced.length + ' lessons could not be placed; the current timetable was kept.');
+            } else {
+                window.location.reload();
+            }
+        })
+        .catch(error => alert('Could not generate a timetable: ' + error.message));
+}
+
+function printTimetable() {
+    window.print();
+}
+
+function exportTimetable() {
+    alert('Export to PDF functionality would be implemented here.');
+}
+
+function shareTimetable() {
+    if (navigator.share) {
+        navigator.share({
+            title: 'Academic Timetable',
+            text: 'Check out the academic timetable',
+            url: window.location.href
+        });
+    } else {
+        // Fallback for browsers that don't support Web Share API
+        navigator.clipboard.writeText(window.location.href);
+        alert('Timetable link copied to clipboard!');
+    }
+}
+
+function refreshTimetable() {
+    location.reload();
+}
+
+// Subject details modal
+function showSubjectDetails(subject, teacher, room) {
+    const modalContent = `
+        <h2 style="color: #333; margin-bottom: 1.5rem;">Subject Details</h2>
+        <div style="display: grid; gap: 1rem;">
+            <div style="padding: 1rem; background: rgba(102, 126, 234, 0.05); border-radius: 8px; border-left: 4px solid #667eea;">
+                <div style="font-weight: 600; color: #666; font-size: 0.8rem; margin-bottom: 0.25rem;">Subject</div>
+                <div style="font-weight: 700; color: #333; font-size: 1.1rem;">${subject}</div>
+            </div>
+            <div style="padding: 1rem; background: rgba(102, 126, 234, 0.05); border-radius: 8px; border-left: 4px solid #667eea;">
+                <div style="font-weight: 600; color: #666; font-size: 0.8rem; margin-bottom: 0.25rem;">Teacher</div>
+                <div style="font-weight: 700; color: #333; font-size: 1.1rem;">${teacher}</div>
+            </div>
+            <div style="padding: 1rem; background: rgba(102, 126, 234, 0.05); border-radius: 8px; border-left: 4px solid #667eea;">
+                <div style="font-weight: 600; color: #666; font-size: 0.8rem; margin-bottom: 0.25rem;">Room</div>
+                <div style="font-weight: 700; color: #333; font-size: 1.1rem;">${room}</div>
+            </div>
+        </div>
+        <div style="text-align: center; margin-top: 2rem;">
+            <button onclick="closeSubjectModal()" class="btn btn-primary">
+                <i class="fas fa-times"></i> Close
+            </button>
+        </div>
+    `;
+
+    document.getElementById('subjectModalContent').innerHTML = modalContent;
+    document.getElementById('subjectModal').style.display = 'block';
+}
+
+function closeSubjectModal() {
+    document.getElementById('subjectModal').style.display = 'none';
+}
+
+// Close modal when clicking outside
+window.onclick = function(event) {
+    const modal = document.getElementById('subjectModal');
+    if (event.target === modal) {
+        closeSubjectModal();
+    }
+}
+
+// Add animations to elements
+document.addEventListener('DOMContentLoaded', function() {
+    // Animate subject cards
+    const subjectCards = document.querySelectorAll('.subject-card');
+    subjectCards.forEach((card, index) => {
+        card.style.animationDelay = `${index * 0.05}s`;
+        card.classList.add('animate-fadeInUp');
+    });
+
+    // Add hover effects to subject cards
+    subjectCards.forEach(card => {
+        card.addEventListener('mouseenter', function() {
+            this.style.transform = 'translateY(-3px) scale(1.02)';
+        });
+
+        card.addEventListener('mouseleave', function() {
+            this.style.transform = 'translateY(0) scale(1)';
+        });
+    });
+});
@@ -0,0 +1,8 @@
+"""WSGI entry point for production servers, e.g. ``gunicorn -c gunicorn.conf.py wsgi:app``.
+
+The database is not initialized here; run ``flask --app app init-db`` once
+before starting the workers.
+"""
+from app import create_app
+
+app = create_app()